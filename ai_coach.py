@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Tuple, Any
 from logging_config import get_logger
 from config import LLM_MODEL_NAME, LLM_API_URL, LLM_TIMEOUT_SEC
 from env_config import OPENAI_API_KEY
+import http_client
 from score_aggregator import get_statistics, compare_to_passing, PASSING_AVERAGES, SCORE_CATEGORIES
 
 # Logger setup
@@ -135,8 +136,10 @@ def _call_llm(prompt: str, system_prompt: str = "") -> Optional[str]:
             "max_tokens": 1500,
         }
 
-        response = requests.post(
+        response = http_client.post(
+            "openai",
             LLM_API_URL,
+            endpoint="chat/completions",
             headers=headers,
             json=payload,
             timeout=LLM_TIMEOUT_SEC
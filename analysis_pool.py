@@ -0,0 +1,315 @@
+# analysis_pool.py
+# CPU 집약 분석 프로세스 풀 - 음성 특성 추출/웹캠 랜드마크 추론을 Streamlit 스크립트 스레드 밖에서 실행
+
+import os
+import sys
+import atexit
+import pickle
+import importlib
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Optional
+
+try:
+    from logging_config import get_logger
+    logger = get_logger(__name__)
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 설정
+# ============================================================
+
+# "auto": Streamlit 런타임 안에서만 사용 / "true": 항상 사용 / "false": 항상 호출 스레드에서 실행
+ANALYSIS_POOL_MODE = os.getenv("ANALYSIS_POOL_ENABLED", "auto").strip().lower()
+# 워커 프로세스 수 (0이면 CPU 수 - 1, 최대 4)
+ANALYSIS_POOL_WORKERS = int(os.getenv("ANALYSIS_POOL_WORKERS", "0"))
+# 실행 중 + 대기 작업 상한 (0이면 워커 수 x 2) - 넘으면 PoolSaturated
+ANALYSIS_POOL_MAX_PENDING = int(os.getenv("ANALYSIS_POOL_MAX_PENDING", "0"))
+# run() 결과 대기 시간 (초)
+ANALYSIS_TASK_TIMEOUT_SECONDS = float(os.getenv("ANALYSIS_TASK_TIMEOUT", "60"))
+# 워커 시작 방식 - 스레드가 많은 Streamlit 프로세스를 fork하면 잠긴 락까지 복제되므로 spawn 기본
+ANALYSIS_POOL_START_METHOD = os.getenv("ANALYSIS_POOL_START_METHOD", "spawn")
+# 워커 시작 시 미리 불러올 모듈 (모듈에 warm_analysis_worker()가 있으면 호출)
+ANALYSIS_POOL_PRELOAD = tuple(
+    name.strip()
+    for name in os.getenv("ANALYSIS_POOL_PRELOAD", "voice_utils,webcam_analyzer").split(",")
+    if name.strip()
+)
+
+
+class PoolSaturated(RuntimeError):
+    """대기 작업 수가 상한에 도달해 새 작업을 받을 수 없음"""
+
+
+def _default_workers() -> int:
+    return max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+def _in_streamlit_runtime() -> bool:
+    """Streamlit 서버 프로세스 안에서 실행 중인지 (bare 스크립트/pytest 제외)"""
+    st = sys.modules.get("streamlit")
+    if st is None:
+        return False
+    try:
+        return bool(st.runtime.exists())
+    except Exception:
+        return False
+
+
+def _warm_worker(modules: Iterable[str]) -> None:
+    """워커 초기화 - 분석 모듈과 모델을 미리 로드해 첫 작업 지연 제거"""
+    for name in modules:
+        try:
+            module = importlib.import_module(name)
+            warm = getattr(module, "warm_analysis_worker", None)
+            if callable(warm):
+                warm()
+        except Exception as e:
+            logger.warning(f"분석 워커 예열 실패 ({name}): {e}")
+
+
+def _record(task: str, outcome: str, pending: Optional[int] = None) -> None:
+    """풀 메트릭 기록"""
+    try:
+        from src.analytics.metrics import metrics_collector
+        metrics_collector.get_or_create_counter(
+            "analysis_pool_tasks_total", "Analysis pool tasks by outcome", ["task", "outcome"]
+        ).inc(task=task, outcome=outcome)
+        if pending is not None:
+            metrics_collector.get_or_create_gauge(
+                "analysis_pool_pending", "Analysis pool tasks running or queued"
+            ).set(pending)
+    except Exception as e:
+        logger.debug(f"분석 풀 메트릭 기록 실패: {e}")
+
+
+# ============================================================
+# 분석 프로세스 풀
+# ============================================================
+
+class AnalysisPool:
+    """
+    CPU 집약 분석용 프로세스 풀
+
+    - 워커는 첫 작업 제출 시 시작되며, 시작할 때 분석 모듈/모델을 미리 로드
+    - 실행 중 + 대기 작업이 max_pending에 도달하면 PoolSaturated (백프레셔)
+    - 워커가 죽으면(BrokenProcessPool) 다음 제출 때 풀을 다시 만듦
+    - run()은 풀을 쓸 수 없으면(비활성/포화/종료) 호출 스레드에서 직접 실행
+
+    작업 함수와 인자는 워커로 pickle되므로 모듈 최상위 함수여야 합니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        max_pending: int = None,
+        enabled: bool = None,
+        preload: Iterable[str] = ANALYSIS_POOL_PRELOAD,
+        start_method: str = None
+    ):
+        self.max_workers = max_workers or ANALYSIS_POOL_WORKERS or _default_workers()
+        self.max_pending = max_pending or ANALYSIS_POOL_MAX_PENDING or self.max_workers * 2
+        self.enabled = enabled  # None이면 ANALYSIS_POOL_MODE에 따름
+        self.preload = tuple(preload)
+        self.start_method = start_method or ANALYSIS_POOL_START_METHOD
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "fallbacks": 0,
+            "restarts": 0,
+        }
+
+    def is_enabled(self) -> bool:
+        """풀 사용 여부"""
+        if self.enabled is not None:
+            return self.enabled
+        if ANALYSIS_POOL_MODE in ("1", "true", "yes", "on"):
+            return True
+        if ANALYSIS_POOL_MODE == "auto":
+            return _in_streamlit_runtime()
+        return False
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """워커 풀 생성 (self._lock 보유 상태에서 호출)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_warm_worker,
+                initargs=(self.preload,),
+            )
+            logger.info(f"분석 프로세스 풀 시작 (workers: {self.max_workers}, max_pending: {self.max_pending})")
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        """
+        깨진 풀 폐기 (self._lock 보유 상태에서 호출)
+
+        깨진 풀은 관리 스레드가 스스로 워커를 정리하므로 참조만 끊습니다.
+        """
+        if self._executor is executor:
+            self._executor = None
+            self._stats["restarts"] += 1
+            logger.warning("분석 프로세스 풀 워커 종료 감지 - 다음 작업에서 재시작")
+
+    def start(self) -> bool:
+        """
+        워커를 미리 띄워 예열 (첫 답변 분석 전에 모델 로드를 끝냄)
+
+        Returns:
+            풀이 활성화되어 워커를 시작했으면 True
+        """
+        if not self.is_enabled():
+            return False
+        with self._lock:
+            if self._executor is not None:
+                return True
+        for _ in range(self.max_workers):
+            try:
+                self.submit(os.getpid)
+            except RuntimeError:
+                break
+        return True
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        작업 제출
+
+        Returns:
+            결과 Future
+
+        Raises:
+            PoolSaturated: 대기 작업이 상한에 도달
+            RuntimeError: 풀이 비활성화되었거나 종료됨
+        """
+        if not self.is_enabled():
+            raise RuntimeError("분석 프로세스 풀이 비활성화되어 있습니다")
+
+        task = getattr(fn, "__name__", "task")
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._stats["rejected"] += 1
+                pending = self._pending
+            else:
+                pending = None
+                executor = self._get_executor()
+                try:
+                    future = executor.submit(fn, *args, **kwargs)
+                except BrokenProcessPool:
+                    # 종료 콜백보다 먼저 제출된 경우 - 새 풀로 한 번 재시도
+                    self._discard_executor(executor)
+                    executor = self._get_executor()
+                    future = executor.submit(fn, *args, **kwargs)
+                self._pending += 1
+                self._stats["submitted"] += 1
+
+        if pending is not None:
+            _record(task, "rejected")
+            raise PoolSaturated(f"분석 대기 작업 {pending}/{self.max_pending}")
+
+        future.add_done_callback(lambda f: self._task_done(task, executor, f))
+        return future
+
+    def _task_done(self, task: str, executor: ProcessPoolExecutor, future: Future) -> None:
+        """작업 종료 콜백 - 슬롯 반환과 통계"""
+        error = None if future.cancelled() else future.exception()
+        with self._lock:
+            self._pending -= 1
+            pending = self._pending
+            if error is None:
+                self._stats["completed"] += 1
+            else:
+                self._stats["failed"] += 1
+                if isinstance(error, BrokenProcessPool):
+                    self._discard_executor(executor)
+        _record(task, "completed" if error is None else "failed", pending)
+
+    def run(self, fn: Callable, *args, timeout: float = None, **kwargs) -> Any:
+        """
+        작업을 풀에서 실행하고 결과 반환 (블로킹)
+
+        풀을 쓸 수 없으면(비활성/포화/깨짐/인자 직렬화 불가) 호출 스레드에서 실행합니다.
+        작업 자체의 예외와 시간 초과(concurrent.futures.TimeoutError)는 그대로 전달됩니다.
+        """
+        if not self.is_enabled():
+            return fn(*args, **kwargs)
+
+        try:
+            future = self.submit(fn, *args, **kwargs)
+        except (RuntimeError, OSError) as e:
+            return self._run_inline(fn, e, *args, **kwargs)
+
+        try:
+            return future.result(timeout=timeout or ANALYSIS_TASK_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+        except (BrokenProcessPool, pickle.PicklingError) as e:
+            return self._run_inline(fn, e, *args, **kwargs)
+
+    def _run_inline(self, fn: Callable, reason: Exception, *args, **kwargs) -> Any:
+        task = getattr(fn, "__name__", "task")
+        with self._lock:
+            self._stats["fallbacks"] += 1
+        logger.info(f"분석 작업 인라인 실행 ({task}): {type(reason).__name__}: {reason}")
+        _record(task, "fallback")
+        return fn(*args, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태/통계"""
+        with self._lock:
+            return {
+                "enabled": self.is_enabled(),
+                "started": self._executor is not None,
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                **self._stats,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """풀 종료 (대기 작업은 취소)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.info("분석 프로세스 풀 종료")
+
+
+# ============================================================
+# 전역 인스턴스 / 편의 함수
+# ============================================================
+
+analysis_pool = AnalysisPool()
+atexit.register(analysis_pool.shutdown, wait=False)
+
+
+def start_analysis_pool() -> bool:
+    """전역 분석 풀 워커 예열"""
+    return analysis_pool.start()
+
+
+def run_analysis(fn: Callable, *args, timeout: float = None, **kwargs) -> Any:
+    """전역 분석 풀에서 실행 (풀을 쓸 수 없으면 인라인)"""
+    return analysis_pool.run(fn, *args, timeout=timeout, **kwargs)
+
+
+def submit_analysis(fn: Callable, *args, **kwargs) -> Future:
+    """전역 분석 풀에 제출"""
+    return analysis_pool.submit(fn, *args, **kwargs)
+
+
+def get_analysis_pool_stats() -> Dict[str, Any]:
+    """전역 분석 풀 통계"""
+    return analysis_pool.get_stats()
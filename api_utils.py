@@ -9,6 +9,7 @@ import streamlit as st
 
 from env_config import OPENAI_API_KEY, check_openai_key, mask_api_key
 from logging_config import get_logger, APIError
+import http_client
 
 # 로거 설정
 logger = get_logger(__name__)
@@ -197,8 +198,10 @@ def call_openai_chat(
         try:
             logger.info(f"OpenAI API 호출 시도 {attempt + 1}/{max_retries}, 모델: {model}")
 
-            response = requests.post(
+            response = http_client.post(
+                "openai",
                 "https://api.openai.com/v1/chat/completions",
+                endpoint="chat/completions",
                 headers=headers,
                 json=payload,
                 timeout=timeout
@@ -13,6 +13,7 @@ from score_aggregator import (
     _load_data,
     _anonymize_user_id,
     get_all_scores,
+    get_user_scores,
     get_statistics,
     get_passing_average,
     calculate_percentile,
@@ -210,10 +211,7 @@ def _get_user_records(user_id: str) -> List[Dict]:
     """
     try:
         anonymous_id = _anonymize_user_id(user_id)
-        data = _load_data()
-        records = data.get("records", [])
-
-        user_records = [r for r in records if r.get("user_id") == anonymous_id]
+        user_records = get_user_scores(user_id)
 
         # Sort by timestamp descending
         user_records.sort(
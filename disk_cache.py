@@ -0,0 +1,306 @@
+# disk_cache.py
+# 디스크 기반 캐시 - SQLite 저장, 프로세스 간 공유, TTL + 크기 제한 LRU
+
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    from logging_config import get_logger
+    logger = get_logger(__name__)
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 설정
+# ============================================================
+
+BASE_DIR = Path(__file__).parent
+CACHE_DIR = BASE_DIR / "data" / "cache"
+
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    value       BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    expires_at  REAL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_cache_lru ON cache_entries (namespace, last_access);
+CREATE INDEX IF NOT EXISTS idx_cache_expiry ON cache_entries (namespace, expires_at);
+"""
+
+
+# ============================================================
+# 디스크 캐시
+# ============================================================
+
+class DiskCache:
+    """
+    SQLite 기반 캐시
+
+    - 항목 단위로 저장 (전체 파일 재작성 없음)
+    - 여러 프로세스가 같은 파일을 공유 (WAL 모드)
+    - bytes 값은 JSON을 거치지 않고 BLOB으로 저장
+    - TTL 만료 + 항목 수/용량 기준 LRU 제거
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        namespace: str = "default",
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            namespace: 같은 파일을 쓰는 캐시끼리 구분하는 이름
+            ttl_seconds: 기본 TTL (None이면 만료 없음)
+            max_entries: 최대 항목 수 (None이면 제한 없음)
+            max_bytes: 최대 저장 용량 (None이면 제한 없음)
+        """
+        self.path = Path(path)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._hits = 0
+        self._misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=SQLITE_BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            self._local.conn = conn
+        return conn
+
+    # -------------------------------------------------------------------------
+    # 직렬화
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _encode(value: Any) -> tuple:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return "bytes", bytes(value)
+        return "json", json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def _decode(kind: str, blob: bytes) -> Any:
+        if kind == "bytes":
+            return bytes(blob)
+        return json.loads(blob.decode("utf-8"))
+
+    # -------------------------------------------------------------------------
+    # 조회/저장
+    # -------------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (없거나 만료되면 None)"""
+        found = self.get_with_expiry(key)
+        return found[0] if found is not None else None
+
+    def get_with_expiry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """값과 만료 시각 조회 (없거나 만료되면 None)"""
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT kind, value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+
+            if row is None:
+                self._misses += 1
+                return None
+
+            kind, blob, expires_at = row
+            now = time.time()
+            if expires_at is not None and expires_at <= now:
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key)
+                )
+                self._misses += 1
+                return None
+
+            conn.execute(
+                "UPDATE cache_entries SET last_access = ? WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key)
+            )
+            self._hits += 1
+            return self._decode(kind, blob), expires_at
+
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"디스크 캐시 조회 실패 ({self.namespace}): {e}")
+            self._misses += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> bool:
+        """값 저장 (용량 초과 시 오래 안 쓴 항목부터 제거)"""
+        try:
+            kind, blob = self._encode(value)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"디스크 캐시 직렬화 불가 ({self.namespace}): {e}")
+            return False
+
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(namespace, key, kind, value, size, created_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, kind, blob, len(blob), now, expires_at, now)
+            )
+            self._enforce_limits(conn)
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"디스크 캐시 저장 실패 ({self.namespace}): {e}")
+            return False
+
+    def delete(self, key: str) -> None:
+        """항목 삭제"""
+        try:
+            self._connect().execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"디스크 캐시 삭제 실패 ({self.namespace}): {e}")
+
+    def keys(self, prefix: str = "") -> List[str]:
+        """키 목록 (접두어 필터)"""
+        try:
+            rows = self._connect().execute(
+                "SELECT key FROM cache_entries WHERE namespace = ? AND substr(key, 1, ?) = ?",
+                (self.namespace, len(prefix), prefix)
+            ).fetchall()
+            return [row[0] for row in rows]
+        except sqlite3.Error as e:
+            logger.warning(f"디스크 캐시 키 조회 실패 ({self.namespace}): {e}")
+            return []
+
+    def delete_prefix(self, prefix: str) -> int:
+        """키 접두어가 일치하는 항목 삭제"""
+        try:
+            cursor = self._connect().execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND substr(key, 1, ?) = ?",
+                (self.namespace, len(prefix), prefix)
+            )
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"디스크 캐시 삭제 실패 ({self.namespace}): {e}")
+            return 0
+
+    def clear(self) -> int:
+        """네임스페이스 전체 삭제"""
+        try:
+            cursor = self._connect().execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"디스크 캐시 초기화 실패 ({self.namespace}): {e}")
+            return 0
+
+    # -------------------------------------------------------------------------
+    # 제거 정책
+    # -------------------------------------------------------------------------
+
+    def purge_expired(self) -> int:
+        """만료 항목 제거"""
+        try:
+            cursor = self._connect().execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+                (self.namespace, time.time())
+            )
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"디스크 캐시 만료 정리 실패 ({self.namespace}): {e}")
+            return 0
+
+    def _enforce_limits(self, conn: sqlite3.Connection) -> None:
+        """항목 수/용량 제한 적용 (LRU)"""
+        if self.max_entries is None and self.max_bytes is None:
+            return
+
+        count, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,)
+        ).fetchone()
+
+        over_count = count > self.max_entries if self.max_entries is not None else False
+        over_bytes = total > self.max_bytes if self.max_bytes is not None else False
+        if not over_count and not over_bytes:
+            return
+
+        self.purge_expired()
+
+        if self.max_entries is not None:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key IN ("
+                "  SELECT key FROM cache_entries WHERE namespace = ? "
+                "  ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.namespace, self.namespace, self.max_entries)
+            )
+
+        if self.max_bytes is not None:
+            # 최근 사용 순으로 누적 용량이 한도를 넘는 지점부터 제거
+            rows = conn.execute(
+                "SELECT key, size FROM cache_entries WHERE namespace = ? ORDER BY last_access DESC",
+                (self.namespace,)
+            ).fetchall()
+            kept = 0
+            evict = []
+            for key, size in rows:
+                kept += size
+                if kept > self.max_bytes:
+                    evict.append((self.namespace, key))
+            if evict:
+                conn.executemany("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", evict)
+
+    # -------------------------------------------------------------------------
+    # 통계
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        try:
+            count, total = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?",
+                (self.namespace,)
+            ).fetchone()
+        except sqlite3.Error:
+            count, total = 0, 0
+
+        requests = self._hits + self._misses
+        return {
+            "entries": count,
+            "size_bytes": total,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": f"{(self._hits / requests * 100) if requests else 0:.1f}%",
+        }
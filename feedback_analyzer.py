@@ -14,6 +14,7 @@ import re
 from typing import Dict, Any, Optional, List, Tuple
 
 import requests
+import http_client
 
 from config import LLM_MODEL_NAME, LLM_TIMEOUT_SEC, LLM_API_URL
 from text_utils import normalize_ws, _fix_particles_after_format, _auto_fix_particles_kor
@@ -476,7 +477,7 @@ def _call_llm_for_analysis(prompt: str) -> Optional[Dict[str, Any]]:
     }
 
     try:
-        r = requests.post(LLM_API_URL, headers=headers, json=payload, timeout=LLM_TIMEOUT_SEC)
+        r = http_client.post("openai", LLM_API_URL, endpoint="chat/completions", headers=headers, json=payload, timeout=LLM_TIMEOUT_SEC)
         r.raise_for_status()
         resp = r.json()
 
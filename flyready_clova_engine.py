@@ -12,6 +12,7 @@ import requests
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from logging_config import get_logger
+import http_client
 
 logger = get_logger(__name__)
 
@@ -878,7 +879,7 @@ class FlyreadyClovaEngine:
 
             endpoint = f"{CLOVA_HOST}/v3/chat-completions/{CLOVA_MODEL}"
 
-            response = requests.post(endpoint, headers=headers, json=payload, timeout=120)
+            response = http_client.post("clova", endpoint, endpoint="chat-completions", headers=headers, json=payload, timeout=120)
 
             if response.status_code != 200:
                 print(f"[CLOVA ERROR] HTTP {response.status_code}: {response.text[:200]}")
@@ -0,0 +1,298 @@
+# http_client.py
+# 공통 HTTP 전송 계층 - 커넥션 풀링, 제공자별 동시성 제한, 엔드포인트별 지연 시간 히스토그램
+
+import time
+import bisect
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:  # FastAPI 측에서만 필요
+    httpx = None
+
+from tracing import NOOP_SPAN, span as trace_span
+
+try:
+    from logging_config import get_logger
+    logger = get_logger(__name__)
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 설정
+# ============================================================
+
+# 호스트당 유지할 keep-alive 연결 수
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# 제공자별 동시 요청 상한 (업스트림 rate limit 보호)
+PROVIDER_CONCURRENCY: Dict[str, int] = {
+    "openai": 16,
+    "clova": 8,
+    "clova_tts": 8,
+    "google_tts": 8,
+}
+DEFAULT_PROVIDER_CONCURRENCY = 8
+
+# 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS: Tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+# ============================================================
+# 지연 시간 히스토그램
+# ============================================================
+
+class LatencyHistogram:
+    """엔드포인트별 지연 시간 히스토그램 (스레드 안전)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._counts: List[int] = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._errors = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += seconds
+            self._count += 1
+            if error:
+                self._errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            total, count, errors = self._sum, self._count, self._errors
+
+        cumulative = 0
+        buckets = {}
+        for bound, n in zip(list(self.buckets) + [float("inf")], counts):
+            cumulative += n
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+
+        return {
+            "count": count,
+            "errors": errors,
+            "sum": round(total, 4),
+            "avg": round(total / count, 4) if count else 0.0,
+            "buckets": buckets,
+        }
+
+
+_histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def _get_histogram(provider: str, endpoint: str) -> LatencyHistogram:
+    key = (provider, endpoint)
+    histogram = _histograms.get(key)
+    if histogram is None:
+        with _histograms_lock:
+            histogram = _histograms.setdefault(key, LatencyHistogram())
+    return histogram
+
+
+def get_latency_stats() -> Dict[str, Dict[str, Any]]:
+    """제공자/엔드포인트별 지연 시간 통계 ("provider:endpoint" 키)"""
+    with _histograms_lock:
+        items = list(_histograms.items())
+    return {f"{provider}:{endpoint}": h.snapshot() for (provider, endpoint), h in items}
+
+
+def reset_latency_stats() -> None:
+    """지연 시간 통계 초기화"""
+    with _histograms_lock:
+        _histograms.clear()
+
+
+# ============================================================
+# 동기 클라이언트 (requests)
+# ============================================================
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+
+def get_session() -> requests.Session:
+    """keep-alive 커넥션 풀을 공유하는 requests 세션"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def _get_semaphore(provider: str) -> threading.BoundedSemaphore:
+    semaphore = _semaphores.get(provider)
+    if semaphore is None:
+        with _session_lock:
+            semaphore = _semaphores.setdefault(
+                provider,
+                threading.BoundedSemaphore(PROVIDER_CONCURRENCY.get(provider, DEFAULT_PROVIDER_CONCURRENCY))
+            )
+    return semaphore
+
+
+@contextmanager
+def _track(provider: str, endpoint: str):
+    """지연 시간 기록 (예외 발생 시 오류로 집계)"""
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except Exception:
+        error = True
+        raise
+    finally:
+        _get_histogram(provider, endpoint).observe(time.perf_counter() - start, error=error)
+
+
+def request(method: str, provider: str, url: str, endpoint: str = None, **kwargs) -> requests.Response:
+    """
+    공유 세션으로 HTTP 요청
+
+    Args:
+        method: HTTP 메서드
+        provider: 제공자 이름 (동시성 제한/통계 구분, 예: "openai", "clova")
+        url: 요청 URL
+        endpoint: 통계용 엔드포인트 이름 (URL에 API 키가 들어가는 경우 반드시 지정)
+        **kwargs: requests 요청 인자 (headers, json, data, files, timeout ...)
+
+    Returns:
+        requests.Response (requests 예외는 그대로 전파)
+    """
+    endpoint = endpoint or url.split("?", 1)[0]
+    with trace_span(f"http {provider}:{endpoint}") as span:
+        wait_start = time.perf_counter()
+        with _get_semaphore(provider):
+            queue_ms = (time.perf_counter() - wait_start) * 1000
+            with _track(provider, endpoint):
+                response = get_session().request(method, url, **kwargs)
+        if span is not NOOP_SPAN:
+            span.set(
+                queue_ms=round(queue_ms, 3),
+                status=response.status_code,
+                response_bytes=_response_size(response, kwargs.get("stream"))
+            )
+        return response
+
+
+def _response_size(response: requests.Response, stream: bool) -> Optional[int]:
+    """응답 크기 (스트리밍 응답은 본문을 읽지 않고 Content-Length 사용)"""
+    if not stream:
+        return len(response.content)
+    length = response.headers.get("Content-Length")
+    return int(length) if length and length.isdigit() else None
+
+
+def post(provider: str, url: str, endpoint: str = None, **kwargs) -> requests.Response:
+    """공유 세션으로 POST 요청"""
+    return request("POST", provider, url, endpoint=endpoint, **kwargs)
+
+
+@contextmanager
+def stream(method: str, provider: str, url: str, endpoint: str = None, **kwargs) -> Iterator[requests.Response]:
+    """
+    스트리밍 요청 (with 블록 동안 제공자 동시성 슬롯과 지연 시간 측정 유지)
+
+    request(..., stream=True)는 응답 헤더까지만 슬롯을 잡으므로, 본문을 나눠 읽는
+    호출은 이 함수를 씁니다. 히스토그램에는 스트림을 다 읽을 때까지의 시간이 기록되고
+    블록 안에서 난 예외는 오류로 집계됩니다. 응답은 블록을 나갈 때 닫힙니다.
+
+    Usage:
+        with http_client.stream("POST", "openai", url, json=payload) as response:
+            for line in response.iter_lines():
+                ...
+    """
+    endpoint = endpoint or url.split("?", 1)[0]
+    with trace_span(f"http {provider}:{endpoint}") as span:
+        wait_start = time.perf_counter()
+        with _get_semaphore(provider):
+            queue_ms = (time.perf_counter() - wait_start) * 1000
+            with _track(provider, endpoint):
+                response = get_session().request(method, url, stream=True, **kwargs)
+                try:
+                    if span is not NOOP_SPAN:
+                        span.set(
+                            queue_ms=round(queue_ms, 3),
+                            status=response.status_code,
+                            response_bytes=_response_size(response, True)
+                        )
+                    yield response
+                finally:
+                    response.close()
+
+
+# ============================================================
+# 비동기 클라이언트 (httpx, FastAPI 측)
+# ============================================================
+
+# 이벤트 루프별 클라이언트/세마포어 (httpx.AsyncClient는 루프에 묶임)
+_async_clients: Dict[int, Any] = {}
+_async_semaphores: Dict[Tuple[int, str], asyncio.Semaphore] = {}
+
+
+def get_async_client() -> "httpx.AsyncClient":
+    """현재 이벤트 루프용 공유 httpx.AsyncClient"""
+    if httpx is None:
+        raise RuntimeError("httpx가 설치되지 않았습니다. `pip install httpx`")
+
+    loop_id = id(asyncio.get_running_loop())
+    client = _async_clients.get(loop_id)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=POOL_MAXSIZE * 2,
+                max_keepalive_connections=POOL_MAXSIZE,
+            ),
+        )
+        _async_clients[loop_id] = client
+    return client
+
+
+async def arequest(method: str, provider: str, url: str, endpoint: str = None, **kwargs) -> "httpx.Response":
+    """공유 httpx 클라이언트로 비동기 HTTP 요청 (httpx 예외는 그대로 전파)"""
+    endpoint = endpoint or url.split("?", 1)[0]
+    loop_id = id(asyncio.get_running_loop())
+    semaphore = _async_semaphores.get((loop_id, provider))
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(PROVIDER_CONCURRENCY.get(provider, DEFAULT_PROVIDER_CONCURRENCY))
+        _async_semaphores[(loop_id, provider)] = semaphore
+
+    client = get_async_client()
+    async with semaphore:
+        with _track(provider, endpoint):
+            return await client.request(method, url, **kwargs)
+
+
+async def apost(provider: str, url: str, endpoint: str = None, **kwargs) -> "httpx.Response":
+    """공유 httpx 클라이언트로 비동기 POST 요청"""
+    return await arequest("POST", provider, url, endpoint=endpoint, **kwargs)
+
+
+async def aclose() -> None:
+    """현재 이벤트 루프의 비동기 클라이언트 종료 (FastAPI shutdown 시 호출)"""
+    loop_id = id(asyncio.get_running_loop())
+    client = _async_clients.pop(loop_id, None)
+    if client is not None:
+        await client.aclose()
+    for key in [k for k in _async_semaphores if k[0] == loop_id]:
+        del _async_semaphores[key]
@@ -7,6 +7,7 @@ import json
 import random
 import time
 import requests
+import http_client
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
@@ -239,7 +240,7 @@ class FollowUpQuestionGenerator:
                 "max_tokens": 500,
             }
 
-            r = requests.post(LLM_API_URL, headers=headers, json=payload, timeout=30)
+            r = http_client.post("openai", LLM_API_URL, endpoint="chat/completions", headers=headers, json=payload, timeout=30)
             r.raise_for_status()
             resp = r.json()
 
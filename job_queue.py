@@ -1,10 +1,12 @@
 # job_queue.py
 # 백그라운드 작업 큐 시스템 - 비동기 작업 처리
 
+import os
 import json
 import uuid
+import heapq
+import itertools
 import threading
-import queue
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -31,10 +33,28 @@ JOBS_DIR = DATA_DIR / "jobs"
 JOBS_DIR.mkdir(parents=True, exist_ok=True)
 
 JOBS_FILE = JOBS_DIR / "jobs.json"
+JOBS_JOURNAL_FILE = JOBS_DIR / "jobs.journal"
+JOBS_ARCHIVE_FILE = JOBS_DIR / "jobs_archive.jsonl"
 MAX_WORKERS = 4
 MAX_RETRIES = 3
 JOB_TIMEOUT_SECONDS = 300
 
+# 재시도 백오프 (지수 증가: base * 2^(retries-1), 최대 max)
+RETRY_BACKOFF_BASE_SECONDS = 2.0
+RETRY_BACKOFF_MAX_SECONDS = 300.0
+
+# 디스패처 최대 대기 시간 (초)
+DISPATCH_POLL_SECONDS = 1.0
+
+# 저장 방식: "journal" (변경분 추가 기록) / "snapshot" (전체 파일 재작성)
+JOB_STORAGE_MODE = os.getenv("JOB_STORAGE_MODE", "journal")
+# 저널 항목이 이 수를 넘으면 스냅샷으로 압축
+JOURNAL_COMPACT_THRESHOLD = 1000
+# 압축 시 메모리/스냅샷에 남길 최근 종료 작업 수 (나머지는 아카이브로 이동)
+ARCHIVE_KEEP_RECENT = 200
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
 
 # ============================================================
 # 데이터 클래스
@@ -94,12 +114,21 @@ class JobRegistry:
 
     def __init__(self):
         self._functions: Dict[str, Callable] = {}
+        self._concurrency: Dict[str, int] = {}
 
-    def register(self, name: str = None):
-        """작업 함수 등록 데코레이터"""
+    def register(self, name: str = None, max_concurrency: int = None):
+        """
+        작업 함수 등록 데코레이터
+
+        Args:
+            name: 등록 이름 (기본: 함수 이름)
+            max_concurrency: 함수별 동시 실행 상한 (None이면 워커 수까지)
+        """
         def decorator(func: Callable):
             func_name = name or func.__name__
             self._functions[func_name] = func
+            if max_concurrency is not None:
+                self._concurrency[func_name] = max(1, int(max_concurrency))
             return func
         return decorator
 
@@ -107,6 +136,10 @@ class JobRegistry:
         """등록된 함수 조회"""
         return self._functions.get(name)
 
+    def get_concurrency_limit(self, name: str) -> Optional[int]:
+        """함수별 동시 실행 상한 조회"""
+        return self._concurrency.get(name)
+
     def list_functions(self) -> List[str]:
         """등록된 함수 목록"""
         return list(self._functions.keys())
@@ -121,22 +154,56 @@ job_registry = JobRegistry()
 # ============================================================
 
 class JobQueue:
-    """백그라운드 작업 큐"""
+    """
+    백그라운드 작업 큐
 
-    def __init__(self, max_workers: int = MAX_WORKERS):
+    - 준비된 작업은 우선순위 힙에서 꺼내 스레드 풀로 디스패치 (N-way 동시 실행)
+    - 함수별 동시 실행 상한을 넘는 작업은 슬롯이 빌 때까지 보류
+    - 예약 작업/재시도 작업은 실행 시각 기준 지연 힙에서 대기
+    """
+
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        concurrency_limits: Dict[str, int] = None,
+        storage_mode: str = None
+    ):
         self.max_workers = max_workers
-        self._queue = queue.PriorityQueue()
+        self.storage_mode = storage_mode or JOB_STORAGE_MODE
+        self.concurrency_limits: Dict[str, int] = dict(concurrency_limits or {})
         self._jobs: Dict[str, Job] = {}
         self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._seq = itertools.count()
+
+        # 실행 대기 힙: (-priority, created_at, seq, job_id)
+        self._ready: List[tuple] = []
+        # 지연 힙: (run_at_timestamp, seq, job_id)
+        self._delayed: List[tuple] = []
+        # 함수별 상한에 걸려 보류된 항목
+        self._blocked: Dict[str, List[tuple]] = {}
+        # 함수별 실행 중 작업 수
+        self._active_by_func: Dict[str, int] = {}
+        self._active = 0
+
         self._executor: Optional[ThreadPoolExecutor] = None
         self._running = False
         self._worker_thread: Optional[threading.Thread] = None
 
+        # 저널 상태
+        self._journal_file = None
+        self._journal_entries = 0
+
         # 저장된 작업 로드
-        self._load_jobs()
+        with self._lock:
+            self._load_jobs()
 
     def _load_jobs(self) -> None:
         """저장된 작업 로드"""
+        if self.storage_mode == "journal":
+            self._load_journaled_jobs()
+            return
+
         try:
             if JOBS_FILE.exists():
                 with open(JOBS_FILE, "r", encoding="utf-8") as f:
@@ -145,29 +212,232 @@ class JobQueue:
                         # pending 작업만 복원
                         if job_data.get("status") == "pending":
                             job = Job(**job_data)
+                            job.args = tuple(job.args)
                             self._jobs[job.id] = job
-                            self._queue.put((-job.priority, job.created_at, job.id))
+                            self._push_job(job)
         except Exception as e:
             logger.error(f"작업 로드 실패: {e}")
 
+    def _load_journaled_jobs(self) -> None:
+        """스냅샷 + 저널 재생으로 작업 복원"""
+        records: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            if JOBS_FILE.exists():
+                with open(JOBS_FILE, "r", encoding="utf-8") as f:
+                    for job_data in json.load(f).get("jobs", []):
+                        records[job_data["id"]] = job_data
+        except Exception as e:
+            logger.error(f"작업 스냅샷 로드 실패: {e}")
+
+        replayed = 0
+        try:
+            if JOBS_JOURNAL_FILE.exists():
+                with open(JOBS_JOURNAL_FILE, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            # 기록 도중 중단된 마지막 줄
+                            continue
+                        if entry.get("op") == "put":
+                            records[entry["job"]["id"]] = entry["job"]
+                        elif entry.get("op") == "set" and entry.get("id") in records:
+                            records[entry["id"]].update(entry.get("fields", {}))
+                        replayed += 1
+        except Exception as e:
+            logger.error(f"작업 저널 재생 실패: {e}")
+
+        interrupted = 0
+        for job_data in records.values():
+            try:
+                job = Job(**job_data)
+            except TypeError as e:
+                logger.error(f"작업 복원 실패: {e}")
+                continue
+            job.args = tuple(job.args)
+            self._jobs[job.id] = job
+            if job.status == "running":
+                # 실행 도중 프로세스가 종료된 작업 - 재시도 횟수를 소모해 다시 대기열로
+                interrupted += 1
+                job.retries += 1
+                job.error = "재시작으로 실행이 중단됨"
+                job.started_at = None
+                if job.retries < job.max_retries:
+                    job.status = "pending"
+                    logger.warning(f"중단된 작업 재대기 ({job.retries}/{job.max_retries}): {job.id}")
+                else:
+                    job.status = "failed"
+                    job.completed_at = datetime.now().isoformat()
+                    logger.error(f"중단된 작업 실패 처리: {job.id}")
+            if job.status == "pending":
+                self._push_job(job)
+
+        # 재생한 저널(과 중단 작업 상태 변경)은 스냅샷으로 흡수해 다음 시작을 빠르게
+        if replayed or interrupted:
+            self._compact_jobs()
+
+    @staticmethod
+    def _job_to_dict(job: Job) -> Dict[str, Any]:
+        """작업 직렬화"""
+        job_dict = asdict(job)
+        # result는 직렬화 불가할 수 있음
+        if job_dict.get("result") is not None:
+            try:
+                json.dumps(job_dict["result"])
+            except:
+                job_dict["result"] = str(job_dict["result"])
+        return job_dict
+
     def _save_jobs(self) -> None:
-        """작업 저장"""
+        """작업 저장 (전체 재작성)"""
         try:
             with open(JOBS_FILE, "w", encoding="utf-8") as f:
-                jobs_data = {"jobs": []}
-                for job in self._jobs.values():
-                    job_dict = asdict(job)
-                    # result는 직렬화 불가할 수 있음
-                    if job_dict.get("result") is not None:
-                        try:
-                            json.dumps(job_dict["result"])
-                        except:
-                            job_dict["result"] = str(job_dict["result"])
-                    jobs_data["jobs"].append(job_dict)
+                jobs_data = {"jobs": [self._job_to_dict(job) for job in self._jobs.values()]}
                 json.dump(jobs_data, f, ensure_ascii=False, indent=2)
         except Exception as e:
             logger.error(f"작업 저장 실패: {e}")
 
+    def _persist(self, job: Job, *fields: str) -> None:
+        """
+        작업 변경 저장 (self._lock 보유 상태에서 호출)
+
+        journal 모드에서는 변경된 필드만 저널에 한 줄 추가하고,
+        fields가 없으면 작업 전체를 기록합니다.
+        """
+        if self.storage_mode != "journal":
+            self._save_jobs()
+            return
+
+        if fields:
+            job_dict = self._job_to_dict(job)
+            entry = {"op": "set", "id": job.id, "fields": {k: job_dict[k] for k in fields}}
+        else:
+            entry = {"op": "put", "job": self._job_to_dict(job)}
+
+        try:
+            if self._journal_file is None:
+                self._journal_file = open(JOBS_JOURNAL_FILE, "a", encoding="utf-8")
+            self._journal_file.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+            self._journal_file.flush()
+            self._journal_entries += 1
+        except Exception as e:
+            logger.error(f"작업 저널 기록 실패: {e}")
+            return
+
+        if self._journal_entries >= JOURNAL_COMPACT_THRESHOLD:
+            self._compact_jobs()
+
+    def _compact_jobs(self) -> None:
+        """
+        저널 압축 (self._lock 보유 상태에서 호출)
+
+        오래된 종료 작업은 아카이브 파일로 옮기고, 남은 작업으로
+        스냅샷을 원자적으로 다시 쓴 뒤 저널을 비웁니다.
+        """
+        try:
+            finished = [j for j in self._jobs.values() if j.status in TERMINAL_STATUSES]
+            finished.sort(key=lambda j: j.completed_at or j.created_at, reverse=True)
+            to_archive = finished[ARCHIVE_KEEP_RECENT:]
+
+            if to_archive:
+                with open(JOBS_ARCHIVE_FILE, "a", encoding="utf-8") as f:
+                    for job in to_archive:
+                        f.write(json.dumps(self._job_to_dict(job), ensure_ascii=False, separators=(",", ":")) + "\n")
+                for job in to_archive:
+                    del self._jobs[job.id]
+
+            temp_path = JOBS_FILE.with_suffix(".json.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"jobs": [self._job_to_dict(job) for job in self._jobs.values()]},
+                    f, ensure_ascii=False, separators=(",", ":")
+                )
+            os.replace(temp_path, JOBS_FILE)
+
+            if self._journal_file is not None:
+                self._journal_file.close()
+                self._journal_file = None
+            open(JOBS_JOURNAL_FILE, "w", encoding="utf-8").close()
+            self._journal_entries = 0
+
+            logger.info(f"작업 저널 압축 (보관: {len(self._jobs)}, 아카이브: {len(to_archive)})")
+        except Exception as e:
+            logger.error(f"작업 저널 압축 실패: {e}")
+
+    def compact(self) -> None:
+        """저널 압축 실행 (journal 모드 전용)"""
+        if self.storage_mode != "journal":
+            return
+        with self._lock:
+            self._compact_jobs()
+
+    # -------------------------------------------------------------------------
+    # 스케줄링 (self._lock 보유 상태에서 호출)
+    # -------------------------------------------------------------------------
+
+    def _push_job(self, job: Job) -> None:
+        """작업을 예약 시각에 따라 실행 대기 힙 또는 지연 힙에 추가"""
+        run_at = None
+        if job.scheduled_at:
+            try:
+                run_at = datetime.fromisoformat(job.scheduled_at).timestamp()
+            except ValueError:
+                run_at = None
+
+        if run_at is not None and run_at > time.time():
+            heapq.heappush(self._delayed, (run_at, next(self._seq), job.id))
+        else:
+            heapq.heappush(self._ready, (-job.priority, job.created_at, next(self._seq), job.id))
+        self._cond.notify()
+
+    def _promote_due_jobs(self) -> None:
+        """실행 시각이 된 지연 작업을 실행 대기 힙으로 이동"""
+        now = time.time()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, job_id = heapq.heappop(self._delayed)
+            job = self._jobs.get(job_id)
+            if job and job.status == "pending":
+                heapq.heappush(self._ready, (-job.priority, job.created_at, next(self._seq), job_id))
+
+    def _get_concurrency_limit(self, func_name: str) -> int:
+        """함수별 동시 실행 상한 (큐 설정 > 레지스트리 설정 > 워커 수)"""
+        limit = self.concurrency_limits.get(func_name)
+        if limit is None:
+            limit = job_registry.get_concurrency_limit(func_name)
+        return limit if limit is not None else self.max_workers
+
+    def _next_dispatchable_job(self) -> Optional[Job]:
+        """디스패치 가능한 다음 작업 (함수별 상한 초과 작업은 보류)"""
+        while self._ready:
+            entry = heapq.heappop(self._ready)
+            job = self._jobs.get(entry[3])
+            if not job or job.status != "pending":
+                continue
+
+            if self._active_by_func.get(job.func_name, 0) >= self._get_concurrency_limit(job.func_name):
+                self._blocked.setdefault(job.func_name, []).append(entry)
+                continue
+
+            return job
+        return None
+
+    def _release_blocked(self, func_name: str) -> None:
+        """함수 슬롯이 비면 보류된 작업을 실행 대기 힙으로 복귀"""
+        for entry in self._blocked.pop(func_name, []):
+            heapq.heappush(self._ready, entry)
+
+    def _wait_timeout(self) -> float:
+        """다음 지연 작업까지 대기 시간"""
+        if self._delayed:
+            return max(0.0, min(self._delayed[0][0] - time.time(), DISPATCH_POLL_SECONDS))
+        return DISPATCH_POLL_SECONDS
+
+    @staticmethod
+    def _retry_delay(retries: int) -> float:
+        """재시도 백오프 시간 (지수 증가)"""
+        return min(RETRY_BACKOFF_BASE_SECONDS * (2 ** max(retries - 1, 0)), RETRY_BACKOFF_MAX_SECONDS)
+
     # -------------------------------------------------------------------------
     # 작업 관리
     # -------------------------------------------------------------------------
@@ -209,8 +479,8 @@ class JobQueue:
             )
 
             self._jobs[job_id] = job
-            self._queue.put((-job.priority, job.created_at, job_id))
-            self._save_jobs()
+            self._push_job(job)
+            self._persist(job)
 
             logger.info(f"작업 추가: {job_id} ({func_name})")
             return job_id
@@ -224,7 +494,7 @@ class JobQueue:
 
             if job.status == "pending":
                 job.status = "cancelled"
-                self._save_jobs()
+                self._persist(job, "status")
                 logger.info(f"작업 취소: {job_id}")
                 return True
 
@@ -262,84 +532,112 @@ class JobQueue:
             return
 
         self._running = True
-        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job-worker")
         self._worker_thread = threading.Thread(target=self._process_queue, daemon=True)
         self._worker_thread.start()
         logger.info(f"작업 큐 시작 (workers: {self.max_workers})")
 
     def stop(self) -> None:
-        """작업 처리 중지"""
-        self._running = False
+        """작업 처리 중지 (실행 중인 작업은 완료까지 대기)"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._worker_thread:
+            self._worker_thread.join(timeout=DISPATCH_POLL_SECONDS * 2)
+            self._worker_thread = None
         if self._executor:
             self._executor.shutdown(wait=True)
             self._executor = None
+        with self._lock:
+            if self._journal_file is not None:
+                self._journal_file.close()
+                self._journal_file = None
         logger.info("작업 큐 중지")
 
     def _process_queue(self) -> None:
-        """큐 처리 루프"""
-        while self._running:
-            try:
-                # 타임아웃으로 큐에서 작업 가져오기
-                try:
-                    _, _, job_id = self._queue.get(timeout=1)
-                except queue.Empty:
+        """디스패치 루프 - 실행 가능한 작업을 스레드 풀에 제출"""
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+
+                self._promote_due_jobs()
+                job = None
+                if self._active < self.max_workers:
+                    job = self._next_dispatchable_job()
+
+                if job is None:
+                    self._cond.wait(timeout=self._wait_timeout())
                     continue
 
-                job = self._jobs.get(job_id)
-                if not job or job.status != "pending":
+                if not job_registry.get(job.func_name):
+                    job.status = "failed"
+                    job.error = f"함수를 찾을 수 없음: {job.func_name}"
+                    job.completed_at = datetime.now().isoformat()
+                    self._persist(job, "status", "error", "completed_at")
                     continue
 
-                # 예약 시간 확인
-                if job.scheduled_at:
-                    scheduled = datetime.fromisoformat(job.scheduled_at)
-                    if datetime.now() < scheduled:
-                        # 아직 시간 안됨, 다시 큐에 넣기
-                        self._queue.put((-job.priority, job.created_at, job_id))
-                        time.sleep(1)
-                        continue
-
-                # 작업 실행
-                self._execute_job(job)
+                job.status = "running"
+                job.started_at = datetime.now().isoformat()
+                self._active += 1
+                self._active_by_func[job.func_name] = self._active_by_func.get(job.func_name, 0) + 1
+                self._persist(job, "status", "started_at")
+                executor = self._executor
 
+            try:
+                executor.submit(self._execute_job, job)
             except Exception as e:
+                # 풀 종료 등으로 제출 실패 - 대기 상태로 되돌림
                 logger.error(f"큐 처리 오류: {e}")
+                with self._cond:
+                    job.status = "pending"
+                    job.started_at = None
+                    self._finish_slot(job.func_name)
+                    self._push_job(job)
+                    self._persist(job, "status", "started_at")
+
+    def _finish_slot(self, func_name: str) -> None:
+        """실행 슬롯 반환 (self._lock 보유 상태에서 호출)"""
+        self._active -= 1
+        self._active_by_func[func_name] = self._active_by_func.get(func_name, 1) - 1
+        self._release_blocked(func_name)
+        self._cond.notify()
 
     def _execute_job(self, job: Job) -> None:
-        """작업 실행"""
+        """작업 실행 (워커 스레드)"""
         func = job_registry.get(job.func_name)
-        if not func:
-            job.status = "failed"
-            job.error = f"함수를 찾을 수 없음: {job.func_name}"
-            self._save_jobs()
-            return
-
-        job.status = "running"
-        job.started_at = datetime.now().isoformat()
-        self._save_jobs()
+        result = None
+        error = None
 
         try:
-            # 실행
+            # 실행 (락 밖에서)
             result = func(*job.args, **job.kwargs)
-            job.status = "completed"
-            job.result = result
-            job.completed_at = datetime.now().isoformat()
-            logger.info(f"작업 완료: {job.id}")
-
         except Exception as e:
-            job.retries += 1
-            if job.retries < job.max_retries:
-                # 재시도
-                job.status = "pending"
-                job.error = str(e)
-                self._queue.put((-job.priority, job.created_at, job.id))
-                logger.warning(f"작업 재시도 ({job.retries}/{job.max_retries}): {job.id}")
-            else:
-                job.status = "failed"
-                job.error = str(e)
-                job.completed_at = datetime.now().isoformat()
-                logger.error(f"작업 실패: {job.id} - {e}")
+            error = e
 
-        self._save_jobs()
+        with self._cond:
+            if error is None:
+                job.status = "completed"
+                job.result = result
+                job.completed_at = datetime.now().isoformat()
+                logger.info(f"작업 완료: {job.id}")
+            else:
+                job.retries += 1
+                job.error = str(error)
+                if job.retries < job.max_retries:
+                    # 백오프 후 재시도
+                    delay = self._retry_delay(job.retries)
+                    job.status = "pending"
+                    job.scheduled_at = datetime.fromtimestamp(time.time() + delay).isoformat()
+                    self._push_job(job)
+                    logger.warning(f"작업 재시도 ({job.retries}/{job.max_retries}, {delay:.1f}s 후): {job.id}")
+                else:
+                    job.status = "failed"
+                    job.completed_at = datetime.now().isoformat()
+                    logger.error(f"작업 실패: {job.id} - {error}")
+
+            self._finish_slot(job.func_name)
+            self._persist(job, "status", "result", "error", "retries", "scheduled_at", "completed_at")
 
     # -------------------------------------------------------------------------
     # 통계
@@ -357,7 +655,9 @@ class JobQueue:
             return {
                 "total_jobs": len(jobs),
                 "by_status": by_status,
-                "queue_size": self._queue.qsize(),
+                "queue_size": len(self._ready) + sum(len(v) for v in self._blocked.values()),
+                "scheduled": len(self._delayed),
+                "active_workers": self._active,
                 "running": self._running,
                 "max_workers": self.max_workers
             }
@@ -386,7 +686,7 @@ def generate_report_job(user_id: str, report_type: str) -> Dict[str, Any]:
     return {"user_id": user_id, "report_type": report_type, "status": "generated"}
 
 
-@job_registry.register("process_audio")
+@job_registry.register("process_audio", max_concurrency=2)
 def process_audio_job(file_path: str) -> Dict[str, Any]:
     """오디오 처리 작업"""
     time.sleep(3)  # 시뮬레이션
@@ -8,11 +8,14 @@ import os
 import json
 import time
 import hashlib
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 
 import requests
 import streamlit as st
 
+import http_client
+from tracing import traced, current_span
+
 from config import (
     ENABLE_PLAN_LIMITS, LLM_MODEL_NAME, LLM_TIMEOUT_SEC,
     LLM_TTL_SEC, LLM_API_URL,
@@ -660,7 +663,7 @@ def _llm_post_chat_completions(api_key: str, messages: List[Dict[str, str]]) ->
         "temperature": 0,
         "response_format": {"type": "json_object"},
     }
-    r = requests.post(LLM_API_URL, headers=headers, json=payload, timeout=LLM_TIMEOUT_SEC)
+    r = http_client.post("openai", LLM_API_URL, endpoint="chat/completions", headers=headers, json=payload, timeout=LLM_TIMEOUT_SEC)
     r.raise_for_status()
     return r.json()
 
@@ -1124,16 +1127,20 @@ def _llm_try_extract_or_reuse(qa_sets: List[Dict[str, str]]) -> Optional[Dict[st
         return None
 
 
+def _q3_from_answer_payload(q2_question: str, user_answer: str) -> Dict[str, Any]:
+    system_prompt = "당신은 항공사 면접관입니다. 지원자의 답변을 듣고 꼬리질문을 해야 합니다."
+    user_prompt = f"면접관 질문: {q2_question}\n지원자 답변: {user_answer}\n\n꼬리질문 1개만 생성하세요."
+    return {"model": LLM_MODEL_NAME, "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}], "temperature": 0.7, "max_tokens": 200}
+
+
 def generate_q3_from_answer(q2_question: str, user_answer: str, essay_context: str = "") -> Optional[str]:
     api_key = os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_APIKEY") or ""
     if not api_key:
         return None
-    system_prompt = "당신은 항공사 면접관입니다. 지원자의 답변을 듣고 꼬리질문을 해야 합니다."
-    user_prompt = f"면접관 질문: {q2_question}\n지원자 답변: {user_answer}\n\n꼬리질문 1개만 생성하세요."
     try:
         headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-        payload = {"model": LLM_MODEL_NAME, "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}], "temperature": 0.7, "max_tokens": 200}
-        r = requests.post(LLM_API_URL, headers=headers, json=payload, timeout=LLM_TIMEOUT_SEC)
+        payload = _q3_from_answer_payload(q2_question, user_answer)
+        r = http_client.post("openai", LLM_API_URL, endpoint="chat/completions", headers=headers, json=payload, timeout=LLM_TIMEOUT_SEC)
         r.raise_for_status()
         resp = r.json()
         content = (resp.get("choices", [{}])[0] or {}).get("message", {}).get("content", "")
@@ -1157,7 +1164,7 @@ def generate_resume_questions(resume_data: dict, airline: str, num_questions: in
     try:
         headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
         payload = {"model": LLM_MODEL_NAME, "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}], "temperature": 0.7, "max_tokens": 400}
-        r = requests.post(LLM_API_URL, headers=headers, json=payload, timeout=LLM_TIMEOUT_SEC)
+        r = http_client.post("openai", LLM_API_URL, endpoint="chat/completions", headers=headers, json=payload, timeout=LLM_TIMEOUT_SEC)
         r.raise_for_status()
         resp = r.json()
         content = (resp.get("choices", [{}])[0] or {}).get("message", {}).get("content", "")
@@ -1305,7 +1312,7 @@ def premium_analyze_resume(question: str, answer: str) -> Optional[Dict[str, Any
 
     for attempt in range(MAX_RETRIES + 1):
         try:
-            r = requests.post(LLM_API_URL, headers=headers, json=payload, timeout=PREMIUM_TIMEOUT_SEC)
+            r = http_client.post("openai", LLM_API_URL, endpoint="chat/completions", headers=headers, json=payload, timeout=PREMIUM_TIMEOUT_SEC)
             r.raise_for_status()
             resp = r.json()
 
@@ -1473,6 +1480,32 @@ SIMPLE_Q3_PROMPT = """당신은 항공사 면접관입니다. Q2 질문에 대
 질문만 출력하세요:"""
 
 
+def _sanitize_simple_followup(content: str) -> Optional[str]:
+    """짧은 꼬리질문 응답 정리 (따옴표/설명 제거, 너무 길면 첫 문장만)"""
+    content = (content or "").strip().strip('"').strip("'").strip()
+    if len(content) > 100:
+        content = content.split("?")[0] + "?"
+    return content or None
+
+
+def _simple_q2_payload(question: str, answer: str, is_soft: bool) -> Dict[str, Any]:
+    tone = "부드럽고 친근하게 질문하세요." if is_soft else "날카롭고 직접적으로 질문하세요."
+    prompt = SIMPLE_Q2_PROMPT.format(
+        question=question[:200],
+        answer=answer[:500],  # 답변 길이 제한으로 속도 향상
+        tone_instruction=tone
+    )
+    return {
+        "model": LLM_MODEL_NAME,
+        "messages": [
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.7,
+        "max_tokens": 100,  # 짧은 응답만 필요
+    }
+
+
+@traced("follow_up")
 def generate_simple_q2(question: str, answer: str, is_soft: bool = False) -> Optional[str]:
     """
     간단하고 빠른 Q2 질문 생성
@@ -1485,42 +1518,25 @@ def generate_simple_q2(question: str, answer: str, is_soft: bool = False) -> Opt
     Returns:
         Q2 질문 문자열 또는 None
     """
+    current_span().set(answer_chars=len(answer or ""))
+
     api_key = os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_APIKEY") or ""
     if not api_key:
         return None
 
-    tone = "부드럽고 친근하게 질문하세요." if is_soft else "날카롭고 직접적으로 질문하세요."
-    prompt = SIMPLE_Q2_PROMPT.format(
-        question=question[:200],
-        answer=answer[:500],  # 답변 길이 제한으로 속도 향상
-        tone_instruction=tone
-    )
-
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
-    payload = {
-        "model": LLM_MODEL_NAME,
-        "messages": [
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": 0.7,
-        "max_tokens": 100,  # 짧은 응답만 필요
-    }
+    payload = _simple_q2_payload(question, answer, is_soft)
 
     try:
-        r = requests.post(LLM_API_URL, headers=headers, json=payload, timeout=10)  # 10초로 단축
+        r = http_client.post("openai", LLM_API_URL, endpoint="chat/completions", headers=headers, json=payload, timeout=10)  # 10초로 단축
         r.raise_for_status()
         resp = r.json()
         content = (resp.get("choices", [{}])[0] or {}).get("message", {}).get("content", "")
         if content:
-            # 불필요한 따옴표/설명 제거
-            content = content.strip().strip('"').strip("'").strip()
-            # 너무 길면 첫 문장만
-            if len(content) > 100:
-                content = content.split("?")[0] + "?"
-            return content
+            return _sanitize_simple_followup(content)
     except Exception as e:
         logger.warning(f"Followup question generation failed: {e}")
         pass
@@ -1528,6 +1544,23 @@ def generate_simple_q2(question: str, answer: str, is_soft: bool = False) -> Opt
     return None
 
 
+def _simple_q3_payload(answer: str, q2_question: str, is_soft: bool) -> Dict[str, Any]:
+    tone = "부드럽게 후속 질문하세요." if is_soft else "날카롭게 압박하는 질문을 하세요."
+    prompt = SIMPLE_Q3_PROMPT.format(
+        answer_summary=answer[:300],
+        q2_question=q2_question,
+        tone_instruction=tone
+    )
+    return {
+        "model": LLM_MODEL_NAME,
+        "messages": [
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.7,
+        "max_tokens": 100,
+    }
+
+
 def generate_simple_q3(answer: str, q2_question: str, is_soft: bool = False) -> Optional[str]:
     """
     간단하고 빠른 Q3 (꼬리질문) 생성
@@ -1544,38 +1577,109 @@ def generate_simple_q3(answer: str, q2_question: str, is_soft: bool = False) ->
     if not api_key:
         return None
 
-    tone = "부드럽게 후속 질문하세요." if is_soft else "날카롭게 압박하는 질문을 하세요."
-    prompt = SIMPLE_Q3_PROMPT.format(
-        answer_summary=answer[:300],
-        q2_question=q2_question,
-        tone_instruction=tone
-    )
-
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
-    payload = {
-        "model": LLM_MODEL_NAME,
-        "messages": [
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": 0.7,
-        "max_tokens": 100,
-    }
+    payload = _simple_q3_payload(answer, q2_question, is_soft)
 
     try:
-        r = requests.post(LLM_API_URL, headers=headers, json=payload, timeout=10)  # 10초로 단축
+        r = http_client.post("openai", LLM_API_URL, endpoint="chat/completions", headers=headers, json=payload, timeout=10)  # 10초로 단축
         r.raise_for_status()
         resp = r.json()
         content = (resp.get("choices", [{}])[0] or {}).get("message", {}).get("content", "")
         if content:
-            content = content.strip().strip('"').strip("'").strip()
-            if len(content) > 100:
-                content = content.split("?")[0] + "?"
-            return content
+            return _sanitize_simple_followup(content)
     except Exception as e:
         logger.warning(f"Alternative followup generation failed: {e}")
         pass
 
     return None
+
+
+# ============================================================
+# 꼬리질문 스트리밍 - 첫 토큰부터 화면에 표시
+# ============================================================
+
+def _iter_sse_deltas(response) -> Iterator[str]:
+    """
+    OpenAI SSE 스트리밍 응답에서 텍스트 조각 추출
+
+    data: {"choices": [{"delta": {"content": ...}}]} ... data: [DONE]
+    """
+    response.encoding = "utf-8"  # text/event-stream 기본 인코딩(ISO-8859-1)으로 한글이 깨지지 않도록
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+
+        data = line[5:].strip()
+        if data == "[DONE]":
+            break
+        try:
+            chunk = json.loads(data)
+        except json.JSONDecodeError:
+            continue
+
+        delta = ((chunk.get("choices") or [{}])[0] or {}).get("delta", {}).get("content")
+        if delta:
+            yield delta
+
+
+class FollowupStream:
+    """
+    꼬리질문 스트리밍 결과
+
+    반복하면 생성 중인 텍스트 조각을 내보내고 (st.write_stream에 바로 전달 가능),
+    끝까지 읽은 뒤 `result`에 비스트리밍 함수와 같은 정리를 거친 최종 질문이 담깁니다.
+    API 키가 없거나 호출이 실패하면 `result`는 None입니다. 일부 조각을 받은 뒤
+    끊긴 경우(시간 초과/연결 끊김)에도 잘린 질문을 쓰지 않도록 None이며 `error`에 원인이 남습니다.
+    """
+
+    def __init__(self, payload: Dict[str, Any], timeout: float, sanitizer, label: str):
+        self._payload = payload
+        self._timeout = timeout
+        self._sanitizer = sanitizer
+        self._label = label
+        self._parts: List[str] = []
+        self.result: Optional[str] = None
+        self.error: Optional[str] = None
+        self.done = False
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 원문"""
+        return "".join(self._parts)
+
+    def __iter__(self):
+        if self.done:
+            return
+
+        api_key = os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_APIKEY") or ""
+        try:
+            if not api_key:
+                return
+            headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+            # 스트림을 다 읽을 때까지 openai 동시성 슬롯을 잡고 전체 시간을 기록
+            with http_client.stream(
+                "POST", "openai", LLM_API_URL, endpoint="chat/completions:stream",
+                headers=headers, json=dict(self._payload, stream=True),
+                timeout=self._timeout,  # 청크 간 대기 시간 기준 (첫 토큰까지 포함)
+            ) as response:
+                response.raise_for_status()
+                for delta in _iter_sse_deltas(response):
+                    self._parts.append(delta)
+                    yield delta
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            logger.warning(f"{self._label} streaming failed after {len(self._parts)} chunks: {e}")
+        finally:
+            self.result = self._sanitizer(self.text) if self._parts and self.error is None else None
+            self.done = True
+
+
+def stream_q3_from_answer(q2_question: str, user_answer: str) -> FollowupStream:
+    """generate_q3_from_answer의 스트리밍 버전"""
+    return FollowupStream(
+        _q3_from_answer_payload(q2_question, user_answer), timeout=LLM_TIMEOUT_SEC,
+        sanitizer=lambda content: content.strip() or None, label="Q3 from answer"
+    )
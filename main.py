@@ -9,8 +9,9 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from src.analytics.metrics import PROMETHEUS_CONTENT_TYPE, metrics_collector
 from src.config.settings import get_settings
 from src.utils.logging import setup_logging
 from src.api.v1.router import api_router
@@ -21,6 +22,8 @@ from src.api.v1.middleware import (
 )
 from src.api.v1.middleware.error_handler import setup_exception_handlers
 from src.infrastructure.container import get_container, Container
+from src.realtime.websocket import ws_manager
+import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Debug mode: {settings.debug}")
 
+    # SQL profiling by statement fingerprint (DB_PROFILE_QUERIES)
+    if settings.database.profile_queries:
+        from src.database.query_optimizer import setup_query_profiler
+        setup_query_profiler()
+
+    # WebSocket heartbeat and cross-worker fan-out (WS_BACKPLANE)
+    await ws_manager.start()
+
     # Additional startup tasks can go here
     # - Database connections
     # - Cache initialization
@@ -55,7 +66,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     logger.info("Shutting down FlyReady Lab API...")
 
     # Cleanup tasks
+    await ws_manager.stop()
     Container.reset()
+    await http_client.aclose()
 
     logger.info("Application shutdown complete")
 
@@ -101,6 +114,11 @@ def create_application() -> FastAPI:
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(ErrorHandlerMiddleware)
 
+    # Per-request query grouping for N+1 detection
+    if settings.database.profile_queries:
+        from src.api.v1.middleware.query_profiler import QueryProfilingMiddleware
+        app.add_middleware(QueryProfilingMiddleware)
+
     # Setup exception handlers
     setup_exception_handlers(app)
 
@@ -120,6 +138,12 @@ def create_application() -> FastAPI:
             "environment": settings.environment
         }
 
+    # Prometheus scrape endpoint (per worker process)
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Application metrics in Prometheus text format."""
+        return Response(metrics_collector.to_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
     # Root endpoint
     @app.get("/", tags=["Root"])
     async def root():
@@ -11,6 +11,7 @@ from datetime import datetime, date, timedelta
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sidebar_common import init_page, end_page
+from announcement_scripts import ANNOUNCEMENTS, ANNOUNCEMENT_TTS_VOICES, ANNOUNCEMENT_TTS_MODEL
 
 init_page(
     title="기내방송 연습",
@@ -34,6 +35,20 @@ def get_openai_client():
 client = get_openai_client()
 API_AVAILABLE = client is not None
 
+# 긴 방송문은 무음 구간별로 나눠 병렬 인식 (중간 결과 표시)
+try:
+    from voice_utils import transcribe_audio_chunked
+    CHUNKED_STT_AVAILABLE = True
+except ImportError:
+    CHUNKED_STT_AVAILABLE = False
+
+# 모범 음성은 TTS 오디오 캐시를 거쳐 생성 (같은 방송/목소리는 재생성하지 않음)
+try:
+    from voice_utils import generate_openai_tts
+    CACHED_TTS_AVAILABLE = True
+except ImportError:
+    CACHED_TTS_AVAILABLE = False
+
 # ========================================
 # 데이터 관리
 # ========================================
@@ -63,9 +78,12 @@ def save_practice(data):
         pass
 
 
-def transcribe_audio(audio_bytes, language="ko"):
+def transcribe_audio(audio_bytes, language="ko", on_partial=None):
     if not API_AVAILABLE:
         return None
+    if CHUNKED_STT_AVAILABLE:
+        result = transcribe_audio_chunked(audio_bytes, language=language, on_partial=on_partial)
+        return result["text"] if result else "오류: 음성을 인식하지 못했습니다"
     try:
         temp_path = os.path.join(DATA_DIR, "temp_audio.wav")
         os.makedirs(DATA_DIR, exist_ok=True)
@@ -131,9 +149,11 @@ def analyze_announcement(original_script, user_transcript, language, ann_type):
 def generate_tts(text, voice="nova"):
     if not API_AVAILABLE:
         return None
+    if CACHED_TTS_AVAILABLE:
+        return generate_openai_tts(text, voice=voice, model=ANNOUNCEMENT_TTS_MODEL)
     try:
         response = client.audio.speech.create(
-            model="tts-1",
+            model=ANNOUNCEMENT_TTS_MODEL,
             voice=voice,
             input=text
         )
@@ -142,512 +162,6 @@ def generate_tts(text, voice="nova"):
         return None
 
 
-# ========================================
-# 스크립트 데이터 (15개, 난이도별)
-# ========================================
-ANNOUNCEMENTS = {
-    # === 초급 (기본 방송) ===
-    "탑승 환영": {
-        "level": "초급",
-        "category": "기본",
-        "target_time_kr": 35,
-        "target_time_en": 30,
-        "korean": """안녕하십니까, 고객 여러분.
-대한항공 KE001편에 탑승해 주셔서 감사합니다.
-본 항공편은 인천에서 뉴욕까지 운항하며,
-예정 비행시간은 약 14시간입니다.
-
-좌석 상단의 선반에 짐을 넣으실 때는
-다른 승객분들을 배려하여 한 칸씩만 사용해 주시기 바랍니다.
-잠시 후 안전에 관한 안내방송이 있겠습니다.
-편안한 여행 되시기 바랍니다. 감사합니다.""",
-        "english": """Good morning, ladies and gentlemen.
-Welcome aboard Korean Air flight KE001,
-with service from Incheon to New York.
-Our flight time will be approximately 14 hours.
-
-Please store your carry-on items in the overhead bin
-or under the seat in front of you.
-Shortly, we will be showing our safety demonstration.
-Thank you for flying with us today.""",
-        "tips": ["밝고 따뜻한 톤으로", "적절한 속도 (너무 빠르지 않게)", "숫자는 또박또박", "미소 띤 목소리"],
-        "key_points": ["환영 인사", "편명/목적지", "비행시간", "짐 정리 안내"],
-        "pronunciation_kr": {"탑승해": "탑-승-해 또박또박", "비행시간": "비-행-시-간 천천히"},
-        "pronunciation_en": {"approximately": "uh-PROK-suh-muht-lee", "overhead": "OH-ver-hed"},
-    },
-
-    "안전 안내": {
-        "level": "초급",
-        "category": "안전",
-        "target_time_kr": 40,
-        "target_time_en": 35,
-        "korean": """고객 여러분, 잠시 안전에 관한 안내 말씀 드리겠습니다.
-
-좌석벨트는 비행 중 항상 착용해 주시고,
-벨트 사인이 켜지면 좌석에 앉아 주시기 바랍니다.
-
-비상구는 기내 앞쪽과 뒤쪽, 그리고 날개 위에 있으며,
-좌석 앞 주머니에 있는 안전 카드를 참고해 주시기 바랍니다.
-
-화장실 내 흡연은 법으로 금지되어 있습니다.
-안전한 여행을 위해 협조해 주셔서 감사합니다.""",
-        "english": """Ladies and gentlemen, may I have your attention please.
-
-Please keep your seatbelt fastened at all times while seated.
-When the seatbelt sign is on, please return to your seat.
-
-Emergency exits are located at the front and rear of the cabin,
-as well as over the wings.
-Please take a moment to review the safety card
-in the seat pocket in front of you.
-
-Smoking is prohibited in the lavatories.
-Thank you for your attention.""",
-        "tips": ["명확하고 차분하게", "중요한 부분 강조", "적절한 포즈 (쉼)", "안전 관련은 진지하게"],
-        "key_points": ["좌석벨트", "비상구 위치", "안전 카드", "흡연 금지"],
-        "pronunciation_kr": {"비상구": "비-상-구 강조", "착용": "차-겅 (X) → 착-용 (O)"},
-        "pronunciation_en": {"lavatories": "LAV-uh-tor-eez", "prohibited": "proh-HIB-ih-tid"},
-    },
-
-    "이륙 전": {
-        "level": "초급",
-        "category": "기본",
-        "target_time_kr": 30,
-        "target_time_en": 28,
-        "korean": """고객 여러분, 곧 이륙하겠습니다.
-
-좌석 테이블과 등받이를 원위치해 주시고,
-좌석벨트를 착용해 주시기 바랍니다.
-휴대전화를 포함한 모든 전자기기는
-비행기 모드로 전환하거나 전원을 꺼 주시기 바랍니다.
-
-창문 덮개는 열어 주시기 바랍니다.
-협조해 주셔서 감사합니다.""",
-        "english": """Ladies and gentlemen, we will be taking off shortly.
-
-Please make sure your seat back is upright,
-your tray table is stowed,
-and your seatbelt is securely fastened.
-
-All electronic devices, including mobile phones,
-must be switched to airplane mode or turned off.
-
-Please open your window shades.
-Thank you for your cooperation.""",
-        "tips": ["단호하지만 친절하게", "각 항목 끊어 읽기", "적절한 속도 유지"],
-        "key_points": ["테이블/등받이", "좌석벨트", "전자기기", "창문 덮개"],
-        "pronunciation_kr": {"원위치": "원-위-치 또박또박", "전환": "전-환"},
-        "pronunciation_en": {"securely": "sih-KYOOR-lee", "cooperation": "koh-op-er-AY-shun"},
-    },
-
-    # === 중급 ===
-    "식음료 서비스": {
-        "level": "중급",
-        "category": "서비스",
-        "target_time_kr": 35,
-        "target_time_en": 30,
-        "korean": """고객 여러분, 잠시 후 식음료 서비스를 시작하겠습니다.
-
-오늘 준비된 음료는 커피, 차, 주스, 그리고 생수가 있습니다.
-식사로는 불고기 덮밥과 해산물 파스타를 준비했습니다.
-
-서비스 중에는 좌석벨트를 착용한 상태로
-좌석에 앉아 계시기 바랍니다.
-서비스 카트가 지나갈 때 통로 쪽으로
-몸이나 손을 내밀지 않도록 주의해 주십시오.
-
-감사합니다.""",
-        "english": """Ladies and gentlemen,
-we will now begin our in-flight service.
-
-Today we have coffee, tea, juice, and water available.
-For your meal, we are serving Bulgogi rice bowl and Seafood pasta.
-
-Please remain seated with your seatbelt fastened
-during the service.
-Please be careful not to extend your arms or legs
-into the aisle as the cart passes.
-
-Thank you.""",
-        "tips": ["메뉴 설명은 천천히", "서비스 안내 시 미소", "감사 인사 진심으로"],
-        "key_points": ["음료 종류", "기내식 메뉴", "안전 안내", "통로 주의"],
-        "pronunciation_kr": {"해산물": "해-산-물 명확히", "내밀지": "내-밀-지"},
-        "pronunciation_en": {"Bulgogi": "Bool-GO-gee", "aisle": "AYL (s 묵음)"},
-    },
-
-    "착륙 전": {
-        "level": "중급",
-        "category": "기본",
-        "target_time_kr": 40,
-        "target_time_en": 35,
-        "korean": """고객 여러분, 곧 뉴욕 JFK 공항에 착륙하겠습니다.
-현재 뉴욕의 기온은 섭씨 15도이며,
-현지 시각은 오후 3시입니다.
-
-좌석벨트를 착용하시고,
-좌석 테이블과 등받이를 원위치해 주시기 바랍니다.
-휴대전화와 전자기기는 비행기 모드를 유지해 주시고,
-착륙 후 벨트 사인이 꺼질 때까지
-좌석에 앉아 계시기 바랍니다.
-
-대한항공을 이용해 주셔서 감사합니다.""",
-        "english": """Ladies and gentlemen,
-we will be landing at New York JFK Airport shortly.
-The current temperature is 15 degrees Celsius,
-and the local time is 3 PM.
-
-Please fasten your seatbelt,
-stow your tray table, and return your seat to the upright position.
-
-Please keep your electronic devices in airplane mode.
-For your safety, please remain seated
-until the seatbelt sign has been turned off.
-
-Thank you for flying with Korean Air.""",
-        "tips": ["도착지 정보 정확히", "숫자 또박또박", "감사 인사 따뜻하게"],
-        "key_points": ["도착지/기온/시간", "좌석벨트/테이블", "전자기기", "착석 유지"],
-        "pronunciation_kr": {"섭씨": "섭-씨 명확히", "유지해": "유-지-해"},
-        "pronunciation_en": {"Celsius": "SEL-see-us", "upright": "UP-ryt"},
-    },
-
-    "착륙 후": {
-        "level": "초급",
-        "category": "기본",
-        "target_time_kr": 35,
-        "target_time_en": 30,
-        "korean": """고객 여러분, 뉴욕 JFK 공항에 도착했습니다.
-
-좌석벨트 사인이 꺼질 때까지 좌석에 앉아 계시기 바랍니다.
-선반을 여실 때는 짐이 떨어질 수 있으니 주의해 주시고,
-내리실 때 휴대품을 다시 한 번 확인해 주시기 바랍니다.
-
-오늘 대한항공을 이용해 주셔서 진심으로 감사드립니다.
-즐거운 하루 되시기 바랍니다.
-다음에도 대한항공을 이용해 주시기 바랍니다.
-감사합니다.""",
-        "english": """Ladies and gentlemen,
-welcome to New York JFK Airport.
-
-Please remain seated until the seatbelt sign has been turned off.
-Please use caution when opening the overhead bins,
-as items may have shifted during the flight.
-Please make sure to take all your personal belongings with you.
-
-Thank you for choosing Korean Air today.
-We hope you have a pleasant day,
-and we look forward to seeing you again soon.
-Thank you.""",
-        "tips": ["환영하는 느낌으로", "감사 인사 진심을 담아", "다음 이용 권유는 밝게"],
-        "key_points": ["도착 환영", "안전 주의", "소지품 확인", "감사 인사"],
-        "pronunciation_kr": {"진심으로": "진-심-으-로 강조", "휴대품": "휴-대-품"},
-        "pronunciation_en": {"belongings": "bih-LONG-ingz", "pleasant": "PLEZ-uhnt"},
-    },
-
-    # === 중급 (추가) ===
-    "난기류 안내": {
-        "level": "중급",
-        "category": "안전",
-        "target_time_kr": 30,
-        "target_time_en": 28,
-        "korean": """고객 여러분, 기장입니다.
-현재 기체가 약간의 흔들림이 있을 수 있습니다.
-
-좌석벨트 착용 사인을 켜겠습니다.
-화장실 이용 중이신 분은 빠르게 좌석으로 돌아가 주시고,
-좌석벨트를 단단히 착용해 주시기 바랍니다.
-
-머리 위 선반의 짐이 떨어질 수 있으니
-선반을 열지 말아 주시기 바랍니다.
-흔들림이 멈추면 다시 안내 드리겠습니다.
-감사합니다.""",
-        "english": """Ladies and gentlemen, this is your captain speaking.
-We are experiencing some turbulence.
-
-The seatbelt sign has been turned on.
-If you are in the lavatory, please return to your seat immediately
-and fasten your seatbelt securely.
-
-Please do not open the overhead bins
-as items may fall out.
-We will let you know when it is safe to move about.
-Thank you.""",
-        "tips": ["차분하지만 단호하게", "긴급감 있되 패닉은 X", "천천히 명확하게"],
-        "key_points": ["벨트 사인 ON", "좌석 복귀", "선반 열지 말 것", "추후 안내 예고"],
-        "pronunciation_kr": {"흔들림": "흔-들-림 차분히", "단단히": "단-단-히 강조"},
-        "pronunciation_en": {"turbulence": "TUR-byuh-lunts", "immediately": "ih-MEE-dee-uht-lee"},
-    },
-
-    "면세품 안내": {
-        "level": "중급",
-        "category": "서비스",
-        "target_time_kr": 30,
-        "target_time_en": 28,
-        "korean": """고객 여러분, 잠시 후 기내 면세품 판매를 시작하겠습니다.
-
-오늘 준비된 면세품은 향수, 화장품, 주류, 담배, 기념품 등이 있습니다.
-좌석 앞 주머니에 있는 면세품 카탈로그를 참고해 주시기 바랍니다.
-
-결제는 현금 및 신용카드 모두 가능하며,
-한국 원화, 미국 달러, 유로가 가능합니다.
-
-면세품 구매를 원하시는 분은
-승무원에게 말씀해 주시기 바랍니다. 감사합니다.""",
-        "english": """Ladies and gentlemen,
-we will shortly begin our duty-free sales service.
-
-We have a selection of perfumes, cosmetics,
-liquor, cigarettes, and souvenirs available.
-Please refer to the duty-free catalog
-in the seat pocket in front of you.
-
-We accept both cash and credit cards.
-Korean Won, US Dollars, and Euros are accepted.
-
-If you wish to make a purchase,
-please let a crew member know. Thank you.""",
-        "tips": ["밝고 활기찬 톤", "상품명 명확히", "결제 수단 천천히"],
-        "key_points": ["면세품 종류", "카탈로그 안내", "결제 수단", "구매 방법"],
-        "pronunciation_kr": {"면세품": "면-세-품", "카탈로그": "카-탈-로-그"},
-        "pronunciation_en": {"duty-free": "DOO-tee free", "cosmetics": "koz-MET-iks"},
-    },
-
-    "환승 안내": {
-        "level": "중급",
-        "category": "기본",
-        "target_time_kr": 35,
-        "target_time_en": 30,
-        "korean": """고객 여러분, 인천공항에서 환승하시는 분들께 안내 말씀 드립니다.
-
-환승 절차는 다음과 같습니다.
-기내에서 내리신 후 환승 표지판을 따라 이동해 주시고,
-보안 검색을 받으신 후 해당 탑승구로 이동해 주시기 바랍니다.
-
-환승 시간이 촉박하신 분은
-내리실 때 승무원에게 말씀해 주시면
-안내해 드리겠습니다.
-
-환승 게이트 정보는 공항 모니터에서 확인하실 수 있습니다.
-감사합니다.""",
-        "english": """For passengers connecting to another flight at Incheon Airport,
-please note the following transfer procedures.
-
-After deplaning, please follow the transfer signs
-and proceed through security screening
-to your departure gate.
-
-If you have a tight connection,
-please inform a crew member as you deplane
-and we will assist you.
-
-Connecting gate information is available on airport monitors.
-Thank you.""",
-        "tips": ["환승객 주의 끌기", "절차 순서대로 명확히", "도움 제공 강조"],
-        "key_points": ["환승 절차", "보안 검색", "촉박한 환승", "게이트 정보"],
-        "pronunciation_kr": {"환승": "환-승 강조", "촉박": "촉-박"},
-        "pronunciation_en": {"deplaning": "dee-PLAYN-ing", "connection": "kuh-NEK-shun"},
-    },
-
-    "기장 인사": {
-        "level": "초급",
-        "category": "기본",
-        "target_time_kr": 30,
-        "target_time_en": 28,
-        "korean": """안녕하십니까, 고객 여러분.
-본 항공편의 기장 홍길동입니다.
-
-현재 비행 고도는 약 35,000피트이며,
-순조롭게 비행하고 있습니다.
-목적지 뉴욕까지 남은 비행시간은 약 10시간입니다.
-
-현재 기상 상태는 양호하며,
-도착 예정 시각은 현지 시간 오후 3시입니다.
-
-편안한 비행 되시기를 바랍니다.
-감사합니다.""",
-        "english": """Good afternoon, ladies and gentlemen.
-This is your captain, Hong Gil-dong, speaking.
-
-We are currently cruising at an altitude of approximately 35,000 feet,
-and the flight is progressing smoothly.
-Our estimated remaining flight time to New York is about 10 hours.
-
-Weather conditions are favorable,
-and we expect to arrive at approximately 3 PM local time.
-
-We hope you enjoy the rest of your flight.
-Thank you.""",
-        "tips": ["차분하고 안정된 목소리", "숫자 정보 또박또박", "자신감 있게"],
-        "key_points": ["기장 소개", "비행 고도", "남은 시간", "기상/도착 예정"],
-        "pronunciation_kr": {"35,000피트": "삼만오천피트", "순조롭게": "순-조-롭-게"},
-        "pronunciation_en": {"altitude": "AL-tih-tood", "approximately": "uh-PROK-suh-muht-lee"},
-    },
-
-    # === 고급 (긴급/특수) ===
-    "지연 안내": {
-        "level": "고급",
-        "category": "특수",
-        "target_time_kr": 35,
-        "target_time_en": 30,
-        "korean": """고객 여러분, 불편을 끼쳐드려 대단히 죄송합니다.
-
-현재 공항 혼잡으로 인해 출발이 약 30분 지연되고 있습니다.
-안전을 위해 잠시만 기다려 주시기 바랍니다.
-
-기내에서 편하게 대기해 주시고,
-화장실 이용은 가능합니다.
-추가 안내 사항이 있으면 다시 방송 드리겠습니다.
-
-불편을 끼쳐드려 다시 한 번 사과드립니다.
-양해해 주셔서 감사합니다.""",
-        "english": """Ladies and gentlemen, we sincerely apologize for the inconvenience.
-
-Due to airport congestion, our departure will be delayed
-by approximately 30 minutes.
-We ask for your patience as we wait for clearance.
-
-Please feel free to remain comfortable in your seat.
-Lavatory use is permitted during this time.
-We will provide an update as soon as we have more information.
-
-Once again, we apologize for the delay.
-Thank you for your understanding.""",
-        "tips": ["진심으로 사과하는 톤", "이유 명확히", "편의 제공 강조", "사과 반복"],
-        "key_points": ["사과", "지연 사유", "지연 시간", "편의 안내", "재사과"],
-        "pronunciation_kr": {"끼쳐드려": "끼-쳐-드-려 정중히", "양해": "양-해"},
-        "pronunciation_en": {"inconvenience": "in-kun-VEEN-yunts", "congestion": "kun-JES-chun"},
-    },
-
-    "의료 도움 요청": {
-        "level": "고급",
-        "category": "안전",
-        "target_time_kr": 25,
-        "target_time_en": 22,
-        "korean": """고객 여러분, 안내 말씀 드리겠습니다.
-
-기내에 의사 또는 간호사 자격이 있으신 분께서
-계시면 승무원에게 알려 주시기 바랍니다.
-의료 도움이 필요한 상황입니다.
-
-협조해 주셔서 감사합니다.""",
-        "english": """Ladies and gentlemen, may I have your attention please.
-
-If there is a doctor or nurse on board,
-could you please identify yourself to a crew member.
-We have a passenger who requires medical assistance.
-
-Thank you for your cooperation.""",
-        "tips": ["긴급하지만 침착하게", "패닉 유발 X", "간결하고 명확하게"],
-        "key_points": ["의사/간호사 호출", "승무원 알림", "의료 상황"],
-        "pronunciation_kr": {"의료": "의-료 명확히"},
-        "pronunciation_en": {"identify": "eye-DEN-tih-fye", "assistance": "uh-SIS-tunts"},
-    },
-
-    "비상 착륙 안내": {
-        "level": "고급",
-        "category": "안전",
-        "target_time_kr": 40,
-        "target_time_en": 35,
-        "korean": """고객 여러분, 기장입니다. 안전에 관한 중요한 안내입니다.
-
-현재 기체 점검을 위해 가까운 공항에 비상 착륙을 실시합니다.
-침착하게 승무원의 안내에 따라 주시기 바랍니다.
-
-좌석벨트를 단단히 착용해 주시고,
-안경, 볼펜 등 날카로운 물건은 주머니에서 빼 주십시오.
-높은 굽의 구두는 벗어 주시기 바랍니다.
-
-비상 착륙 자세를 안내 드리겠습니다.
-허리를 숙이고 양손으로 뒷목을 감싸 주십시오.
-승무원의 구령에 따라 주시기 바랍니다.
-
-침착하게 행동해 주시면 안전하게 도착할 수 있습니다.
-감사합니다.""",
-        "english": """Ladies and gentlemen, this is your captain.
-This is an important safety announcement.
-
-We will be making an emergency landing
-at the nearest airport for a precautionary inspection.
-Please remain calm and follow the crew's instructions.
-
-Please fasten your seatbelt securely.
-Remove any sharp objects such as glasses or pens from your pockets.
-Please remove high-heeled shoes.
-
-I will now explain the brace position.
-Please bend forward and place your hands behind your neck.
-Follow the crew's commands.
-
-Please remain calm. We will land safely.
-Thank you.""",
-        "tips": ["매우 차분하고 단호하게", "패닉 방지", "안심시키면서 지시", "속도 조절 중요"],
-        "key_points": ["비상착륙 사유", "침착 유지", "벨트/날카로운 물건", "비상 착륙 자세", "안심"],
-        "pronunciation_kr": {"비상": "비-상 강조", "침착하게": "침-착-하-게 차분히"},
-        "pronunciation_en": {"precautionary": "prih-KAW-shun-air-ee", "emergency": "ih-MUR-juhn-see"},
-    },
-
-    "기내 소등 안내": {
-        "level": "초급",
-        "category": "서비스",
-        "target_time_kr": 20,
-        "target_time_en": 18,
-        "korean": """고객 여러분, 잠시 후 기내 조명을 낮추겠습니다.
-
-편안한 휴식을 위해 창문 덮개를 내려 주시기 바랍니다.
-개인 독서등은 사용하실 수 있습니다.
-
-도움이 필요하시면 좌석 위의 호출 버튼을 눌러 주십시오.
-편안한 휴식 되시기 바랍니다.""",
-        "english": """Ladies and gentlemen,
-we will be dimming the cabin lights shortly.
-
-For your comfort, please lower your window shades.
-Individual reading lights are available for your use.
-
-If you need any assistance,
-please press the call button above your seat.
-We hope you have a restful flight.""",
-        "tips": ["부드럽고 조용한 톤", "속삭이듯 천천히", "편안함 전달"],
-        "key_points": ["소등 예고", "창문 덮개", "독서등", "호출 버튼"],
-        "pronunciation_kr": {"조명": "조-명", "독서등": "독-서-등"},
-        "pronunciation_en": {"dimming": "DIM-ing", "assistance": "uh-SIS-tunts"},
-    },
-
-    "입국서류 안내": {
-        "level": "중급",
-        "category": "서비스",
-        "target_time_kr": 30,
-        "target_time_en": 25,
-        "korean": """고객 여러분, 입국 서류에 대해 안내 말씀 드리겠습니다.
-
-미국 입국 시 세관신고서 작성이 필요합니다.
-승무원이 서류를 배부해 드리겠습니다.
-
-가족 단위로 한 장만 작성하시면 되며,
-여권 번호와 체류 주소를 미리 확인해 주시기 바랍니다.
-작성하실 때 검정색 볼펜을 사용해 주십시오.
-
-도움이 필요하시면 승무원에게 말씀해 주시기 바랍니다.
-감사합니다.""",
-        "english": """Ladies and gentlemen,
-we would like to inform you about entry documents.
-
-A customs declaration form is required for entry into the United States.
-Our crew will be distributing the forms shortly.
-
-Only one form per family is needed.
-Please have your passport number and accommodation address ready.
-Please use a black ink pen when filling out the form.
-
-If you need any help, please ask a crew member.
-Thank you.""",
-        "tips": ["안내하듯 친절하게", "중요 사항 강조", "서류 관련 정보 정확히"],
-        "key_points": ["세관신고서", "가족 1장", "여권번호/주소", "검정 볼펜"],
-        "pronunciation_kr": {"세관신고서": "세-관-신-고-서", "배부": "배-부"},
-        "pronunciation_en": {"declaration": "dek-luh-RAY-shun", "distributing": "dih-STRIB-yoo-ting"},
-    },
-}
-
-
 # ========================================
 # CSS
 # ========================================
@@ -805,7 +319,12 @@ with tab2:
                 with st.spinner("음성 분석 중... (Whisper → GPT-4o-mini)"):
                     audio_bytes = audio_value.getvalue()
                     lang_code = "ko" if practice_lang == "한국어" else "en"
-                    transcript = transcribe_audio(audio_bytes, lang_code)
+                    partial_box = st.empty()
+                    transcript = transcribe_audio(
+                        audio_bytes, lang_code,
+                        on_partial=lambda text, done, total: partial_box.caption(f"인식 중 ({done}/{total}) {text}")
+                    )
+                    partial_box.empty()
 
                     if transcript and not transcript.startswith("오류"):
                         st.markdown("---")
@@ -1044,12 +563,7 @@ with tab4:
     st.markdown("#### 음성 설정")
 
     # 음성 스타일 (세련된 한국어 이름)
-    voice_options = {
-        "서연 (여성, 따뜻한 톤)": "nova",
-        "민지 (여성, 차분한 톤)": "alloy",
-        "하늘 (여성, 밝은 톤)": "shimmer",
-        "준혁 (남성, 중후한 톤)": "onyx",
-    }
+    voice_options = ANNOUNCEMENT_TTS_VOICES
 
     col1, col2 = st.columns(2)
     with col1:
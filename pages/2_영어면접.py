@@ -33,7 +33,7 @@ from english_interview_data import (
 try:
     from voice_utils import (
         generate_tts_audio, get_audio_player_html, transcribe_audio,
-        get_loud_audio_component, analyze_voice_complete
+        transcribe_audio_chunked, get_loud_audio_component, analyze_voice_complete
     )
     VOICE_AVAILABLE = True
 except ImportError:
@@ -494,7 +494,15 @@ elif st.session_state.eng_mode == "practice":
 
                                 if st.button("음성 변환", key=f"submit_voice_practice_{selected_cat_key}_{i}", type="primary"):
                                     with st.spinner("음성 인식 중..."):
-                                        transcription = transcribe_audio(audio_bytes, language="en")
+                                        # 긴 답변은 구간별로 인식하며 중간 결과 표시
+                                        partial_box = st.empty()
+                                        transcription = transcribe_audio_chunked(
+                                            audio_bytes, language="en",
+                                            on_partial=lambda text, done, total: partial_box.caption(
+                                                f"인식 중 ({done}/{total}) {text}"
+                                            )
+                                        )
+                                        partial_box.empty()
                                         if transcription and transcription.get("text"):
                                             recognized_text = transcription["text"]
                                             st.session_state[transcription_key] = recognized_text
@@ -721,7 +729,15 @@ elif st.session_state.eng_mode == "mock":
 
                                 if st.button("음성 변환", key=f"submit_voice_{current_idx}", type="primary"):
                                     with st.spinner("음성 인식 중..."):
-                                        transcription = transcribe_audio(audio_bytes, language="en")
+                                        # 긴 답변은 구간별로 인식하며 중간 결과 표시
+                                        partial_box = st.empty()
+                                        transcription = transcribe_audio_chunked(
+                                            audio_bytes, language="en",
+                                            on_partial=lambda text, done, total: partial_box.caption(
+                                                f"인식 중 ({done}/{total}) {text}"
+                                            )
+                                        )
+                                        partial_box.empty()
                                         if transcription and transcription.get("text"):
                                             recognized_text = transcription["text"]
                                             st.session_state[mock_transcription_key] = recognized_text
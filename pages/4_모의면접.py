@@ -140,6 +140,7 @@ WEBCAM_AVAILABLE = False
 
 # Use new layout system
 from sidebar_common import init_page, end_page
+from tracing import trace, span as trace_span
 
 # 공용 유틸리티 (Stage 2)
 try:
@@ -827,7 +828,7 @@ elif not st.session_state.mock_completed:
         # TTS로 질문 읽기 (옵션)
         if st.session_state.mock_mode == "voice" and VIDEO_UTILS_AVAILABLE:
             if st.button("질문 다시 듣기"):
-                with st.spinner("음성 생성 중..."):
+                with st.spinner("음성 생성 중..."), trace("mock_interview.question_tts", question_idx=current_idx):
                     audio_bytes = generate_tts_audio(question, voice="alloy", speed=0.85)
                     if audio_bytes:
                         get_loud_audio_component(audio_bytes, autoplay=True, gain=5.0)
@@ -918,7 +919,14 @@ elif not st.session_state.mock_completed:
                         audio_hash = hashlib.md5(audio_bytes).hexdigest()
 
                     if audio_hash != st.session_state.mock_processed_audio_hash:
-                        with st.spinner("음성 인식 중..."):
+                        # 한 턴 전체를 트레이스로 기록 (관리자 > 시스템 모니터링 > 트레이스)
+                        with st.spinner("음성 인식 중..."), trace(
+                            "mock_interview.turn",
+                            user_id=st.session_state.get("user_id", "anonymous"),
+                            question_idx=current_idx,
+                            airline=airline,
+                            audio_bytes=len(audio_bytes)
+                        ):
 
                             # STT (음성 → 텍스트)
                             result = transcribe_audio(audio_bytes, language="ko")
@@ -936,7 +944,8 @@ elif not st.session_state.mock_completed:
 
                                 # 개별 음성 분석
                                 try:
-                                    voice_analysis = analyze_voice_quality(result, expected_duration_range=(30, 90))
+                                    with trace_span("voice_quality"):
+                                        voice_analysis = analyze_voice_quality(result, expected_duration_range=(30, 90))
                                 except Exception as e:
                                     voice_analysis = {"total_score": 70, "error": str(e)}
 
@@ -986,13 +995,14 @@ elif not st.session_state.mock_completed:
                                 if INTERVIEW_ENHANCER_AVAILABLE:
                                     try:
                                         interviewer_type = st.session_state.get("mock_interviewer_type", "neutral")
-                                        enhanced_analysis = analyze_interview_answer(
-                                            question=question,
-                                            answer=transcribed_text,
-                                            elapsed_seconds=elapsed,
-                                            airline=airline,
-                                            interviewer_type=interviewer_type
-                                        )
+                                        with trace_span("follow_up"):
+                                            enhanced_analysis = analyze_interview_answer(
+                                                question=question,
+                                                answer=transcribed_text,
+                                                elapsed_seconds=elapsed,
+                                                airline=airline,
+                                                interviewer_type=interviewer_type
+                                            )
                                         st.session_state.mock_enhanced_analyses.append(enhanced_analysis)
                                         st.session_state.mock_keyword_scores.append(
                                             enhanced_analysis.get("keyword_analysis", {}).get("keyword_score", 0)
@@ -19,6 +19,7 @@ from logging_config import get_logger
 from monitoring import get_monitoring, health_check, get_error_summary, get_metrics_summary
 from analytics import get_analytics, get_summary_stats
 from health_check import run_health_check, HealthStatus
+from tracing import tracer
 
 logger = get_logger(__name__)
 
@@ -624,7 +625,7 @@ with tab5:
     st.caption("Stage 4: Enterprise Monitoring & Analytics")
 
     # 서브탭
-    mon_tab1, mon_tab2, mon_tab3, mon_tab4 = st.tabs(["시스템 상태", "에러 로그", "사용자 분석", "성능 메트릭"])
+    mon_tab1, mon_tab2, mon_tab3, mon_tab4, mon_tab5 = st.tabs(["시스템 상태", "에러 로그", "사용자 분석", "성능 메트릭", "트레이스"])
 
     # === 시스템 상태 ===
     with mon_tab1:
@@ -840,3 +841,88 @@ with tab5:
 
         except Exception as e:
             st.error(f"성능 메트릭 조회 실패: {e}")
+
+    # === 트레이스 (모의면접 턴 단계별 지연) ===
+    with mon_tab5:
+        st.markdown("### 모의면접 턴 트레이스")
+        st.caption("STT → 내용 채점 → 음성 분석 → 꼬리질문 → TTS 단계별 소요 시간 (logs/traces/traces.jsonl)")
+
+        try:
+            col1, col2, col3 = st.columns([2, 2, 1])
+            with col1:
+                trace_limit = st.slider("조회할 트레이스 수", 10, 500, 100, step=10, key="trace_limit")
+            with col3:
+                if st.button("새로고침", key="refresh_traces"):
+                    st.rerun()
+
+            # 파일 기준 조회 (재시작 이전 기록 포함)
+            traces = tracer.load_traces(limit=trace_limit) or tracer.get_recent_traces(limit=trace_limit)
+
+            # 사용자별 조회 (루트 스팬의 user_id)
+            trace_users = sorted({str(t.get("attributes", {}).get("user_id")) for t in traces if t.get("attributes", {}).get("user_id")})
+            with col2:
+                trace_user = st.selectbox("사용자", ["전체"] + trace_users, key="trace_user")
+            if trace_user != "전체":
+                traces = [t for t in traces if str(t.get("attributes", {}).get("user_id")) == trace_user]
+
+            if not traces:
+                st.info("기록된 트레이스 없음 - 모의면접에서 음성 답변을 제출하면 기록됩니다")
+            else:
+                turns = [t for t in traces if t.get("name") == "mock_interview.turn"]
+                turn_ms = sorted(t["duration_ms"] for t in turns)
+
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("트레이스", f"{len(traces)}건")
+                with col2:
+                    st.metric("턴 평균", f"{sum(turn_ms) / len(turn_ms) / 1000:.2f}s" if turn_ms else "-")
+                with col3:
+                    st.metric("턴 P95", f"{turn_ms[min(len(turn_ms) - 1, int(len(turn_ms) * 0.95))] / 1000:.2f}s" if turn_ms else "-")
+                with col4:
+                    st.metric("오류 포함", f"{sum(1 for t in traces if t.get('status') == 'error')}건")
+
+                st.markdown("---")
+
+                # 단계별 통계
+                st.markdown("### 단계별 소요 시간")
+                stage_stats = tracer.get_stage_stats(turns or traces)
+                st.dataframe(
+                    [
+                        {
+                            "단계": name,
+                            "횟수": s["count"],
+                            "평균(ms)": s["avg_ms"],
+                            "P50(ms)": s["p50_ms"],
+                            "P95(ms)": s["p95_ms"],
+                            "최대(ms)": s["max_ms"],
+                            "턴 대비 비중": f"{s['share'] * 100:.1f}%",
+                            "오류": s["errors"],
+                            "캐시 히트/미스": f"{s['cache_hits']}/{s['cache_misses']}",
+                        }
+                        for name, s in stage_stats.items()
+                    ],
+                    use_container_width=True,
+                    hide_index=True
+                )
+
+                st.markdown("---")
+
+                # 개별 트레이스 (스팬 트리)
+                st.markdown("### 최근 트레이스")
+                for t in traces[:20]:
+                    started = datetime.fromtimestamp(t["start"]).strftime("%m-%d %H:%M:%S")
+                    status_icon = "" if t.get("status") == "ok" else "[오류] "
+                    trace_owner = t.get("attributes", {}).get("user_id", "-")
+                    with st.expander(f"{status_icon}{started} · {t['name']} · {trace_owner} · {t['duration_ms'] / 1000:.2f}s · {t['trace_id']}"):
+                        spans = t.get("spans", [])
+                        depth = {}
+                        for s in spans:
+                            depth[s["span_id"]] = depth.get(s.get("parent_id"), -1) + 1
+                            attrs = ", ".join(f"{k}={v}" for k, v in s.get("attributes", {}).items())
+                            error = f" — {s['error']}" if s.get("error") else ""
+                            st.text(f"{'  ' * depth[s['span_id']]}{s['name']}  {s['duration_ms']:.1f}ms  {attrs}{error}")
+                        if t.get("dropped_spans"):
+                            st.caption(f"생략된 스팬: {t['dropped_spans']}개")
+
+        except Exception as e:
+            st.error(f"트레이스 조회 실패: {e}")
@@ -1,14 +1,10 @@
 # performance_monitor.py
-# 성능 모니터링 시스템 - Prometheus 메트릭 형식 지원
+# 성능 모니터링 시스템 - Prometheus 메트릭 형식 지원 (공용 계측 코어 어댑터)
 
 import time
-import threading
 import psutil
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
-from collections import defaultdict
 from functools import wraps
 
 try:
@@ -30,69 +26,64 @@ class MetricType:
     SUMMARY = "summary"
 
 
-@dataclass
-class Metric:
-    """메트릭 정의"""
-    name: str
-    type: str
-    description: str
-    value: float = 0
-    labels: Dict[str, str] = None
-    buckets: List[float] = None  # histogram용
-    observations: List[float] = None  # summary용
-
-    def __post_init__(self):
-        if self.labels is None:
-            self.labels = {}
-        if self.buckets is None:
-            self.buckets = [0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
-        if self.observations is None:
-            self.observations = []
-
-
 # ============================================================
 # 성능 모니터
 # ============================================================
 
 class PerformanceMonitor:
-    """성능 메트릭 수집 및 모니터링"""
-
-    def __init__(self):
-        self._lock = threading.Lock()
-        self._metrics: Dict[str, Metric] = {}
-        self._histogram_buckets: Dict[str, Dict[float, int]] = defaultdict(lambda: defaultdict(int))
-        self._start_time = time.time()
+    """
+    성능 메트릭 수집 및 모니터링
 
-        # 기본 메트릭 등록
-        self._register_default_metrics()
+    값은 src.analytics.metrics.metrics_collector(공용 계측 코어)에 기록되므로
+    FastAPI /metrics, Streamlit 메트릭 서버와 같은 데이터를 봅니다.
+    """
 
-    def _register_default_metrics(self) -> None:
-        """기본 메트릭 등록"""
+    # 기본 메트릭: 이름 -> (타입, 설명, 라벨 이름)
+    DEFAULT_METRICS = {
         # 요청 메트릭
-        self.register("http_requests_total", MetricType.COUNTER, "Total HTTP requests")
-        self.register("http_request_duration_seconds", MetricType.HISTOGRAM, "HTTP request duration")
-        self.register("http_requests_in_progress", MetricType.GAUGE, "HTTP requests in progress")
-
+        "http_requests_total": (MetricType.COUNTER, "Total HTTP requests", ["method", "endpoint", "status"]),
+        "http_request_duration_seconds": (MetricType.HISTOGRAM, "HTTP request duration", ["method", "endpoint"]),
+        "http_requests_in_progress": (MetricType.GAUGE, "HTTP requests in progress", []),
         # API 메트릭
-        self.register("api_calls_total", MetricType.COUNTER, "Total API calls")
-        self.register("api_call_duration_seconds", MetricType.HISTOGRAM, "API call duration")
-        self.register("api_errors_total", MetricType.COUNTER, "Total API errors")
-
+        "api_calls_total": (MetricType.COUNTER, "Total API calls", ["api"]),
+        "api_call_duration_seconds": (MetricType.HISTOGRAM, "API call duration", ["api"]),
+        "api_errors_total": (MetricType.COUNTER, "Total API errors", ["api"]),
         # 시스템 메트릭
-        self.register("system_cpu_percent", MetricType.GAUGE, "CPU usage percent")
-        self.register("system_memory_percent", MetricType.GAUGE, "Memory usage percent")
-        self.register("system_disk_percent", MetricType.GAUGE, "Disk usage percent")
-
+        "system_cpu_percent": (MetricType.GAUGE, "CPU usage percent", []),
+        "system_memory_percent": (MetricType.GAUGE, "Memory usage percent", []),
+        "system_disk_percent": (MetricType.GAUGE, "Disk usage percent", []),
         # 앱 메트릭
-        self.register("app_uptime_seconds", MetricType.GAUGE, "Application uptime")
-        self.register("active_users", MetricType.GAUGE, "Active users")
-        self.register("cache_hits_total", MetricType.COUNTER, "Cache hits")
-        self.register("cache_misses_total", MetricType.COUNTER, "Cache misses")
+        "app_uptime_seconds": (MetricType.GAUGE, "Application uptime", []),
+        "active_users": (MetricType.GAUGE, "Active users", []),
+        "cache_hits_total": (MetricType.COUNTER, "Cache hits", []),
+        "cache_misses_total": (MetricType.COUNTER, "Cache misses", []),
+    }
+
+    def __init__(self, collector=None):
+        from src.analytics.metrics import metrics_collector
+
+        self._collector = collector or metrics_collector
+        self._start_time = time.time()
+
+        # 기본 메트릭 등록
+        for name, (metric_type, description, label_names) in self.DEFAULT_METRICS.items():
+            self._metric(name, metric_type, description, label_names)
+
+        # 스크레이프 시 시스템 메트릭 갱신
+        self._collector.register_collector("system", self._refresh_system_metrics)
 
     # -------------------------------------------------------------------------
     # 메트릭 관리
     # -------------------------------------------------------------------------
 
+    def _metric(self, name: str, metric_type: str, description: str = "", label_names: List[str] = None):
+        """공용 코어의 메트릭 조회/생성"""
+        if metric_type == MetricType.COUNTER:
+            return self._collector.get_or_create_counter(name, description, label_names)
+        if metric_type == MetricType.GAUGE:
+            return self._collector.get_or_create_gauge(name, description, label_names)
+        return self._collector.get_or_create_histogram(name, description, label_names)
+
     def register(
         self,
         name: str,
@@ -101,22 +92,7 @@ class PerformanceMonitor:
         labels: Dict[str, str] = None
     ) -> None:
         """메트릭 등록"""
-        with self._lock:
-            key = self._make_key(name, labels)
-            if key not in self._metrics:
-                self._metrics[key] = Metric(
-                    name=name,
-                    type=metric_type,
-                    description=description,
-                    labels=labels or {}
-                )
-
-    def _make_key(self, name: str, labels: Dict[str, str] = None) -> str:
-        """메트릭 키 생성"""
-        if not labels:
-            return name
-        label_str = ",".join(f'{k}="{v}"' for k, v in sorted(labels.items()))
-        return f"{name}{{{label_str}}}"
+        self._metric(name, metric_type, description, sorted(labels or {}))
 
     # -------------------------------------------------------------------------
     # Counter
@@ -124,11 +100,8 @@ class PerformanceMonitor:
 
     def inc(self, name: str, value: float = 1, labels: Dict[str, str] = None) -> None:
         """카운터 증가"""
-        with self._lock:
-            key = self._make_key(name, labels)
-            if key not in self._metrics:
-                self.register(name, MetricType.COUNTER, "", labels)
-            self._metrics[key].value += value
+        labels = labels or {}
+        self._metric(name, MetricType.COUNTER, label_names=sorted(labels)).inc(value, **labels)
 
     # -------------------------------------------------------------------------
     # Gauge
@@ -136,27 +109,18 @@ class PerformanceMonitor:
 
     def set(self, name: str, value: float, labels: Dict[str, str] = None) -> None:
         """게이지 설정"""
-        with self._lock:
-            key = self._make_key(name, labels)
-            if key not in self._metrics:
-                self.register(name, MetricType.GAUGE, "", labels)
-            self._metrics[key].value = value
+        labels = labels or {}
+        self._metric(name, MetricType.GAUGE, label_names=sorted(labels)).set(value, **labels)
 
     def inc_gauge(self, name: str, value: float = 1, labels: Dict[str, str] = None) -> None:
         """게이지 증가"""
-        with self._lock:
-            key = self._make_key(name, labels)
-            if key not in self._metrics:
-                self.register(name, MetricType.GAUGE, "", labels)
-            self._metrics[key].value += value
+        labels = labels or {}
+        self._metric(name, MetricType.GAUGE, label_names=sorted(labels)).inc(value, **labels)
 
     def dec_gauge(self, name: str, value: float = 1, labels: Dict[str, str] = None) -> None:
         """게이지 감소"""
-        with self._lock:
-            key = self._make_key(name, labels)
-            if key not in self._metrics:
-                self.register(name, MetricType.GAUGE, "", labels)
-            self._metrics[key].value -= value
+        labels = labels or {}
+        self._metric(name, MetricType.GAUGE, label_names=sorted(labels)).dec(value, **labels)
 
     # -------------------------------------------------------------------------
     # Histogram
@@ -164,32 +128,23 @@ class PerformanceMonitor:
 
     def observe(self, name: str, value: float, labels: Dict[str, str] = None) -> None:
         """히스토그램 관측"""
-        with self._lock:
-            key = self._make_key(name, labels)
-            if key not in self._metrics:
-                self.register(name, MetricType.HISTOGRAM, "", labels)
-
-            metric = self._metrics[key]
-            metric.observations.append(value)
-
-            # 버킷 업데이트
-            for bucket in metric.buckets:
-                if value <= bucket:
-                    self._histogram_buckets[key][bucket] += 1
-
-            # 최근 1000개만 유지
-            if len(metric.observations) > 1000:
-                metric.observations = metric.observations[-1000:]
+        labels = labels or {}
+        self._metric(name, MetricType.HISTOGRAM, label_names=sorted(labels)).observe(value, **labels)
 
     # -------------------------------------------------------------------------
     # 시스템 메트릭 수집
     # -------------------------------------------------------------------------
 
-    def collect_system_metrics(self) -> None:
-        """시스템 메트릭 수집"""
+    def collect_system_metrics(self, cpu_interval: Optional[float] = 0.1) -> None:
+        """
+        시스템 메트릭 수집
+
+        Args:
+            cpu_interval: CPU 측정 구간(초). None이면 직전 호출 이후 값을 즉시 반환
+        """
         try:
             # CPU
-            cpu = psutil.cpu_percent(interval=0.1)
+            cpu = psutil.cpu_percent(interval=cpu_interval)
             self.set("system_cpu_percent", cpu)
 
             # Memory
@@ -206,75 +161,54 @@ class PerformanceMonitor:
         except Exception as e:
             logger.error(f"시스템 메트릭 수집 실패: {e}")
 
+    def _refresh_system_metrics(self) -> list:
+        """스크레이프용 수집기 (게이지만 갱신, 블로킹 없음)"""
+        self.collect_system_metrics(cpu_interval=None)
+        return []
+
     # -------------------------------------------------------------------------
     # 메트릭 조회
     # -------------------------------------------------------------------------
 
     def get(self, name: str, labels: Dict[str, str] = None) -> Optional[float]:
-        """메트릭 값 조회"""
-        with self._lock:
-            key = self._make_key(name, labels)
-            metric = self._metrics.get(key)
-            return metric.value if metric else None
+        """
+        메트릭 값 조회
+
+        labels를 생략하면 모든 라벨 값의 합계를 반환합니다.
+        """
+        metric = self._collector.counter(name) or self._collector.gauge(name)
+        if metric is None:
+            return None
+        if labels is None:
+            return self._collector.total(name)
+        return metric.get(**labels)
 
     def get_all(self) -> Dict[str, Any]:
         """모든 메트릭 조회"""
-        with self._lock:
-            result = {}
-            for key, metric in self._metrics.items():
-                result[key] = {
-                    "name": metric.name,
-                    "type": metric.type,
-                    "value": metric.value,
-                    "labels": metric.labels
-                }
-            return result
+        result = {}
+        for metric_type, registry in (
+            (MetricType.COUNTER, self._collector._counters),
+            (MetricType.GAUGE, self._collector._gauges),
+        ):
+            for name, metric in registry.items():
+                for value in metric.collect():
+                    label_str = ",".join(f'{k}="{v}"' for k, v in sorted(value.labels.items()))
+                    key = f"{name}{{{label_str}}}" if label_str else name
+                    result[key] = {
+                        "name": name,
+                        "type": metric_type,
+                        "value": value.value,
+                        "labels": value.labels
+                    }
+        return result
 
     # -------------------------------------------------------------------------
     # Prometheus 형식 출력
     # -------------------------------------------------------------------------
 
     def export_prometheus(self) -> str:
-        """Prometheus 형식으로 메트릭 내보내기"""
-        self.collect_system_metrics()
-
-        lines = []
-        with self._lock:
-            # 메트릭별로 그룹화
-            by_name = defaultdict(list)
-            for key, metric in self._metrics.items():
-                by_name[metric.name].append((key, metric))
-
-            for name, metrics in sorted(by_name.items()):
-                first_metric = metrics[0][1]
-
-                # HELP
-                if first_metric.description:
-                    lines.append(f"# HELP {name} {first_metric.description}")
-
-                # TYPE
-                lines.append(f"# TYPE {name} {first_metric.type}")
-
-                # Values
-                for key, metric in metrics:
-                    if metric.labels:
-                        label_str = ",".join(f'{k}="{v}"' for k, v in metric.labels.items())
-                        lines.append(f"{name}{{{label_str}}} {metric.value}")
-                    else:
-                        lines.append(f"{name} {metric.value}")
-
-                    # Histogram 버킷
-                    if metric.type == MetricType.HISTOGRAM and metric.observations:
-                        for bucket in metric.buckets:
-                            count = self._histogram_buckets[key].get(bucket, 0)
-                            lines.append(f'{name}_bucket{{le="{bucket}"}} {count}')
-                        lines.append(f'{name}_bucket{{le="+Inf"}} {len(metric.observations)}')
-                        lines.append(f"{name}_count {len(metric.observations)}")
-                        lines.append(f"{name}_sum {sum(metric.observations)}")
-
-                lines.append("")
-
-        return "\n".join(lines)
+        """Prometheus 형식으로 메트릭 내보내기 (공용 코어 전체)"""
+        return self._collector.to_prometheus()
 
     # -------------------------------------------------------------------------
     # 대시보드 데이터
@@ -284,28 +218,27 @@ class PerformanceMonitor:
         """대시보드용 데이터"""
         self.collect_system_metrics()
 
-        with self._lock:
-            return {
-                "system": {
-                    "cpu": self.get("system_cpu_percent") or 0,
-                    "memory": self.get("system_memory_percent") or 0,
-                    "disk": self.get("system_disk_percent") or 0,
-                    "uptime": self.get("app_uptime_seconds") or 0
-                },
-                "requests": {
-                    "total": self.get("http_requests_total") or 0,
-                    "in_progress": self.get("http_requests_in_progress") or 0
-                },
-                "api": {
-                    "total_calls": self.get("api_calls_total") or 0,
-                    "errors": self.get("api_errors_total") or 0
-                },
-                "cache": {
-                    "hits": self.get("cache_hits_total") or 0,
-                    "misses": self.get("cache_misses_total") or 0
-                },
-                "timestamp": datetime.now().isoformat()
-            }
+        return {
+            "system": {
+                "cpu": self.get("system_cpu_percent") or 0,
+                "memory": self.get("system_memory_percent") or 0,
+                "disk": self.get("system_disk_percent") or 0,
+                "uptime": self.get("app_uptime_seconds") or 0
+            },
+            "requests": {
+                "total": self.get("http_requests_total") or 0,
+                "in_progress": self.get("http_requests_in_progress") or 0
+            },
+            "api": {
+                "total_calls": self.get("api_calls_total") or 0,
+                "errors": self.get("api_errors_total") or 0
+            },
+            "cache": {
+                "hits": self.get("cache_hits_total") or 0,
+                "misses": self.get("cache_misses_total") or 0
+            },
+            "timestamp": datetime.now().isoformat()
+        }
 
 
 # 전역 인스턴스
@@ -321,11 +254,11 @@ def track_time(metric_name: str, labels: Dict[str, str] = None):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start = time.time()
+            start = time.perf_counter()
             try:
                 return func(*args, **kwargs)
             finally:
-                duration = time.time() - start
+                duration = time.perf_counter() - start
                 monitor.observe(metric_name, duration, labels)
         return wrapper
     return decorator
@@ -10,8 +10,8 @@ import weakref
 import gc
 import functools
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Callable, List, TypeVar, Generic
-from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, List, TypeVar, Generic, Deque
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 import logging
 
@@ -51,7 +51,9 @@ class PerformanceMonitor:
         if self._initialized:
             return
 
-        self._metrics: List[PerformanceMetric] = []
+        from src.analytics.metrics import metrics_collector
+
+        self._metrics: Deque[PerformanceMetric] = deque(maxlen=1000)
         self._timers: Dict[str, float] = {}
         self._thresholds = {
             "page_load": 2000,      # 페이지 로딩 2초
@@ -59,7 +61,12 @@ class PerformanceMonitor:
             "database": 1000,       # DB 쿼리 1초
             "render": 500,          # UI 렌더링 500ms
         }
-        self._max_metrics = 1000
+        # 공용 계측 코어 (/metrics 로 노출)
+        self._histogram = metrics_collector.get_or_create_histogram(
+            "operation_duration_seconds",
+            "Duration of measured app operations",
+            ["category", "name"]
+        )
         self._initialized = True
 
     def start_timer(self, name: str):
@@ -68,38 +75,31 @@ class PerformanceMonitor:
 
     def stop_timer(self, name: str, category: str = "general", metadata: Dict = None) -> float:
         """타이머 종료 및 기록"""
-        if name not in self._timers:
+        start = self._timers.pop(name, None)
+        if start is None:
             return 0
 
-        end_time = time.perf_counter() * 1000
-        duration = end_time - self._timers[name]
-        del self._timers[name]
+        duration = time.perf_counter() * 1000 - start
+        self.record(name, duration, category, metadata)
+        return duration
 
-        metric = PerformanceMetric(
+    def record(self, name: str, duration_ms: float, category: str = "general", metadata: Dict = None) -> None:
+        """측정값 기록 (로컬 이력 + 공용 계측 코어)"""
+        self._metrics.append(PerformanceMetric(
             name=name,
-            duration_ms=duration,
+            duration_ms=duration_ms,
             category=category,
             metadata=metadata or {}
-        )
-        self._record_metric(metric)
+        ))
+        self._histogram.observe(duration_ms / 1000, category=category, name=name)
 
         # 임계값 초과 경고
         threshold = self._thresholds.get(category, 3000)
-        if duration > threshold:
+        if duration_ms > threshold:
             logger.warning(
-                f"성능 경고: {name} ({category}) - {duration:.1f}ms > {threshold}ms"
+                f"성능 경고: {name} ({category}) - {duration_ms:.1f}ms > {threshold}ms"
             )
 
-        return duration
-
-    def _record_metric(self, metric: PerformanceMetric):
-        """메트릭 기록"""
-        self._metrics.append(metric)
-
-        # 최대 개수 유지
-        if len(self._metrics) > self._max_metrics:
-            self._metrics = self._metrics[-self._max_metrics:]
-
     def measure(self, name: str, category: str = "general"):
         """측정 데코레이터/컨텍스트 매니저"""
         return _PerformanceMeasure(self, name, category)
@@ -108,27 +108,27 @@ class PerformanceMonitor:
         """성능 통계"""
         cutoff = datetime.now() - timedelta(minutes=minutes)
         filtered = [
-            m for m in self._metrics
+            m for m in list(self._metrics)
             if m.timestamp > cutoff and (category is None or m.category == category)
         ]
 
         if not filtered:
             return {"count": 0}
 
-        durations = [m.duration_ms for m in filtered]
+        durations = sorted(m.duration_ms for m in filtered)
 
         return {
             "count": len(filtered),
             "avg_ms": sum(durations) / len(durations),
-            "min_ms": min(durations),
-            "max_ms": max(durations),
-            "p50_ms": sorted(durations)[len(durations) // 2],
-            "p95_ms": sorted(durations)[int(len(durations) * 0.95)] if len(durations) >= 20 else max(durations),
+            "min_ms": durations[0],
+            "max_ms": durations[-1],
+            "p50_ms": durations[len(durations) // 2],
+            "p95_ms": durations[int(len(durations) * 0.95)] if len(durations) >= 20 else durations[-1],
         }
 
     def get_slow_operations(self, limit: int = 10) -> List[Dict]:
         """느린 작업 목록"""
-        sorted_metrics = sorted(self._metrics, key=lambda m: m.duration_ms, reverse=True)
+        sorted_metrics = sorted(list(self._metrics), key=lambda m: m.duration_ms, reverse=True)
         return [
             {
                 "name": m.name,
@@ -145,30 +145,34 @@ class PerformanceMonitor:
 
 
 class _PerformanceMeasure:
-    """성능 측정 컨텍스트 매니저"""
+    """성능 측정 컨텍스트 매니저 (시작 시각을 자체 보관하므로 스레드 간 이름 충돌 없음)"""
 
     def __init__(self, monitor: PerformanceMonitor, name: str, category: str):
         self.monitor = monitor
         self.name = name
         self.category = category
+        self.duration = 0.0
 
     def __enter__(self):
-        self.monitor.start_timer(self.name)
+        self._start = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.duration = self.monitor.stop_timer(self.name, self.category)
+        self.duration = (time.perf_counter() - self._start) * 1000
+        self.monitor.record(self.name, self.duration, self.category)
         return False
 
     def __call__(self, func: Callable) -> Callable:
         """데코레이터로 사용"""
+        name = self.name or func.__name__
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            self.monitor.start_timer(self.name or func.__name__)
+            start = time.perf_counter()
             try:
                 return func(*args, **kwargs)
             finally:
-                self.monitor.stop_timer(self.name or func.__name__, self.category)
+                self.monitor.record(name, (time.perf_counter() - start) * 1000, self.category)
         return wrapper
 
 
@@ -439,6 +439,17 @@ def lazy_load(cache_key: Optional[str] = None):
 # 성능 메트릭스
 # =============================================================================
 
+def _operation_histogram():
+    """공용 계측 코어의 작업 시간 히스토그램 (performance_optimizer와 공유)"""
+    from src.analytics.metrics import metrics_collector
+
+    return metrics_collector.get_or_create_histogram(
+        "operation_duration_seconds",
+        "Duration of measured app operations",
+        ["category", "name"]
+    )
+
+
 @dataclass
 class PerformanceMetrics:
     """성능 메트릭스 수집"""
@@ -448,15 +459,16 @@ class PerformanceMetrics:
 
     def start_timer(self, name: str):
         """타이머 시작"""
-        self._start_times[name] = time.time()
+        self._start_times[name] = time.perf_counter()
 
     def stop_timer(self, name: str) -> float:
-        """타이머 종료 및 시간 반환"""
-        if name not in self._start_times:
+        """타이머 종료 및 시간 반환 (공용 계측 코어에도 기록)"""
+        start = self._start_times.pop(name, None)
+        if start is None:
             return 0.0
 
-        elapsed = time.time() - self._start_times[name]
-        del self._start_times[name]
+        elapsed = time.perf_counter() - start
+        _operation_histogram().observe(elapsed, category="timed", name=name)
 
         if name not in self._metrics:
             self._metrics[name] = []
@@ -1,11 +1,10 @@
 # rate_limiter.py
 # API Rate Limiting - 사용자별 API 호출 제한 (DDoS 방지)
 
+import os
 import time
 import threading
-from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, Tuple
-from collections import defaultdict
 from functools import wraps
 
 try:
@@ -35,24 +34,225 @@ GLOBAL_LIMITS = {
     "whisper": {"requests": 200, "window_seconds": 60},
 }
 
+# 카운터 저장소 ("memory": 프로세스 내, "redis": 워커 간 공유)
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# 사용자별 잠금 분할 수 / 유휴 사용자 항목 제거 기준 (초)
+RATE_LIMIT_LOCK_STRIPES = 64
+RATE_LIMIT_IDLE_SECONDS = float(os.getenv("RATE_LIMIT_IDLE_SECONDS", "600"))
+
 
 # ============================================================
-# Rate Limiter 클래스
+# 카운터 저장소
 # ============================================================
 
-class RateLimiter:
-    """슬라이딩 윈도우 기반 Rate Limiter"""
+class _WindowCounter:
+    """슬라이딩 윈도우 카운터 (현재/직전 고정 윈도우 카운트만 보관, O(1))"""
+
+    __slots__ = ("window", "index", "current", "previous", "last_seen")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.index = 0
+        self.current = 0
+        self.previous = 0
+        self.last_seen = 0.0
+
+    def _roll(self, now: float) -> None:
+        index = int(now // self.window)
+        if index != self.index:
+            self.previous = self.current if index == self.index + 1 else 0
+            self.current = 0
+            self.index = index
+        self.last_seen = now
+
+    def estimate(self, now: float) -> float:
+        """최근 window초 요청 수 추정 (직전 윈도우는 겹치는 비율만큼 반영)"""
+        self._roll(now)
+        elapsed_ratio = (now % self.window) / self.window
+        return self.previous * (1 - elapsed_ratio) + self.current
+
+    def add(self, now: float) -> None:
+        self._roll(now)
+        self.current += 1
+
+
+class _Stripe:
+    """사용자 일부를 담당하는 잠금 단위"""
+
+    __slots__ = ("lock", "counters", "blocked", "last_sweep")
 
     def __init__(self):
-        self._user_requests: Dict[str, Dict[str, list]] = defaultdict(lambda: defaultdict(list))
-        self._global_requests: Dict[str, list] = defaultdict(list)
-        self._lock = threading.Lock()
-        self._blocked_users: Dict[str, datetime] = {}
+        self.lock = threading.Lock()
+        self.counters: Dict[str, Dict[str, _WindowCounter]] = {}
+        self.blocked: Dict[str, float] = {}
+        self.last_sweep = time.time()
+
+
+class MemoryRateLimitBackend:
+    """
+    프로세스 내 저장소
+
+    - 사용자 ID 해시로 나눈 잠금(lock striping)으로 사용자 간 경합 최소화
+    - RATE_LIMIT_IDLE_SECONDS 동안 요청이 없던 사용자 항목은 주기적으로 제거
+    """
+
+    def __init__(self, stripes: int = RATE_LIMIT_LOCK_STRIPES, idle_seconds: float = RATE_LIMIT_IDLE_SECONDS):
+        self._stripes = [_Stripe() for _ in range(stripes)]
+        self.idle_seconds = idle_seconds
+
+    def _stripe(self, scope: str) -> _Stripe:
+        return self._stripes[hash(scope) % len(self._stripes)]
+
+    def _sweep(self, stripe: _Stripe, now: float) -> None:
+        """유휴 항목 제거 (stripe.lock 보유 상태, 최대 idle_seconds/4 마다 1회)"""
+        if now - stripe.last_sweep < self.idle_seconds / 4:
+            return
+        stripe.last_sweep = now
+        cutoff = now - self.idle_seconds
+        for scope in [s for s, c in stripe.counters.items()
+                      if all(counter.last_seen < cutoff for counter in c.values())]:
+            del stripe.counters[scope]
+        for scope in [s for s, until in stripe.blocked.items() if until <= now]:
+            del stripe.blocked[scope]
+
+    def _counter(self, stripe: _Stripe, scope: str, api_type: str, window: int) -> _WindowCounter:
+        counters = stripe.counters.setdefault(scope, {})
+        counter = counters.get(api_type)
+        if counter is None or counter.window != window:
+            counter = counters[api_type] = _WindowCounter(window)
+        return counter
+
+    def estimate(self, scope: str, api_type: str, window: int, now: float) -> float:
+        stripe = self._stripe(scope)
+        with stripe.lock:
+            counters = stripe.counters.get(scope)
+            counter = counters.get(api_type) if counters else None
+            if counter is None or counter.window != window:
+                return 0.0
+            return counter.estimate(now)
+
+    def add(self, scope: str, api_type: str, window: int, now: float) -> None:
+        stripe = self._stripe(scope)
+        with stripe.lock:
+            self._counter(stripe, scope, api_type, window).add(now)
+            self._sweep(stripe, now)
+
+    def get_block(self, scope: str, now: float) -> Optional[float]:
+        stripe = self._stripe(scope)
+        with stripe.lock:
+            until = stripe.blocked.get(scope)
+            if until is not None and until <= now:
+                del stripe.blocked[scope]
+                return None
+            return until
+
+    def set_block(self, scope: str, until: float) -> None:
+        stripe = self._stripe(scope)
+        with stripe.lock:
+            stripe.blocked[scope] = until
+
+    def counts(self, scope: str, now: float) -> Dict[str, float]:
+        stripe = self._stripe(scope)
+        with stripe.lock:
+            return {api_type: counter.estimate(now)
+                    for api_type, counter in stripe.counters.get(scope, {}).items()}
+
+    def reset(self, scope: str) -> None:
+        stripe = self._stripe(scope)
+        with stripe.lock:
+            stripe.counters.pop(scope, None)
+            stripe.blocked.pop(scope, None)
+
+    def size(self) -> int:
+        """추적 중인 사용자 수"""
+        return sum(len(stripe.counters) for stripe in self._stripes)
+
+
+class RedisRateLimitBackend:
+    """
+    Redis 저장소 (여러 앱 워커가 같은 한도를 공유)
+
+    윈도우별 카운터 키에 INCR + EXPIRE를 사용하므로 유휴 항목은 Redis TTL로 정리된다.
+    """
 
-    def _clean_old_requests(self, requests: list, window_seconds: int) -> list:
-        """오래된 요청 기록 제거"""
-        cutoff = time.time() - window_seconds
-        return [t for t in requests if t > cutoff]
+    def __init__(self, url: str = RATE_LIMIT_REDIS_URL, prefix: str = "flyready:ratelimit"):
+        import redis  # 선택 의존성
+
+        self._client = redis.Redis.from_url(url)
+        self._client.ping()
+        self.prefix = prefix
+
+    def _key(self, scope: str, api_type: str, window: int, index: int) -> str:
+        return f"{self.prefix}:{scope}:{api_type}:{window}:{index}"
+
+    def estimate(self, scope: str, api_type: str, window: int, now: float) -> float:
+        index = int(now // window)
+        current, previous = self._client.mget(
+            self._key(scope, api_type, window, index),
+            self._key(scope, api_type, window, index - 1),
+        )
+        elapsed_ratio = (now % window) / window
+        return int(previous or 0) * (1 - elapsed_ratio) + int(current or 0)
+
+    def add(self, scope: str, api_type: str, window: int, now: float) -> None:
+        key = self._key(scope, api_type, window, int(now // window))
+        pipe = self._client.pipeline()
+        pipe.incr(key)
+        pipe.expire(key, window * 2)
+        pipe.execute()
+
+    def get_block(self, scope: str, now: float) -> Optional[float]:
+        value = self._client.get(f"{self.prefix}:block:{scope}")
+        return float(value) if value is not None else None
+
+    def set_block(self, scope: str, until: float) -> None:
+        seconds = max(1, int(until - time.time()))
+        self._client.set(f"{self.prefix}:block:{scope}", until, ex=seconds)
+
+    def counts(self, scope: str, now: float) -> Dict[str, float]:
+        result = {}
+        for key in self._client.scan_iter(match=f"{self.prefix}:{scope}:*"):
+            api_type, window = key.decode().rsplit(":", 3)[1:3]
+            result[api_type] = self.estimate(scope, api_type, int(window), now)
+        return result
+
+    def reset(self, scope: str) -> None:
+        keys = list(self._client.scan_iter(match=f"{self.prefix}:{scope}:*"))
+        self._client.delete(f"{self.prefix}:block:{scope}", *keys)
+
+    def size(self) -> int:
+        return -1  # Redis 측에서 관리
+
+
+def _create_backend():
+    """RATE_LIMIT_BACKEND 설정에 따른 저장소 (Redis 사용 불가 시 메모리)"""
+    if RATE_LIMIT_BACKEND == "redis":
+        try:
+            return RedisRateLimitBackend()
+        except Exception as e:
+            logger.warning(f"Redis rate limit backend unavailable, using memory: {e}")
+    return MemoryRateLimitBackend()
+
+
+# ============================================================
+# Rate Limiter 클래스
+# ============================================================
+
+# 전역 제한 카운터의 scope 이름
+_GLOBAL_SCOPE = "__global__"
+
+
+class RateLimiter:
+    """슬라이딩 윈도우 카운터 기반 Rate Limiter (체크/기록 모두 O(1))"""
+
+    def __init__(self, backend=None):
+        """
+        Args:
+            backend: 카운터 저장소 (기본: MemoryRateLimitBackend)
+        """
+        self._backend = backend or MemoryRateLimitBackend()
 
     def check_rate_limit(
         self,
@@ -71,101 +271,93 @@ class RateLimiter:
         Returns:
             (allowed: bool, info: dict)
         """
-        with self._lock:
-            # 차단된 사용자 확인
-            if user_id in self._blocked_users:
-                if datetime.now() < self._blocked_users[user_id]:
-                    remaining = (self._blocked_users[user_id] - datetime.now()).seconds
-                    return False, {
-                        "error": "rate_limit_exceeded",
-                        "message": f"너무 많은 요청입니다. {remaining}초 후 다시 시도하세요.",
-                        "retry_after": remaining
-                    }
-                else:
-                    del self._blocked_users[user_id]
-
-            # 제한 설정 가져오기
-            limit = custom_limit or DEFAULT_LIMITS.get(api_type, DEFAULT_LIMITS["general"])
-            max_requests = limit["requests"]
-            window = limit["window_seconds"]
-
-            # 사용자별 요청 기록 정리
-            user_requests = self._user_requests[user_id][api_type]
-            user_requests = self._clean_old_requests(user_requests, window)
-            self._user_requests[user_id][api_type] = user_requests
-
-            # 전역 요청 기록 정리
-            if api_type in GLOBAL_LIMITS:
-                global_requests = self._global_requests[api_type]
-                global_requests = self._clean_old_requests(global_requests, GLOBAL_LIMITS[api_type]["window_seconds"])
-                self._global_requests[api_type] = global_requests
-
-                # 전역 제한 체크
-                if len(global_requests) >= GLOBAL_LIMITS[api_type]["requests"]:
-                    return False, {
-                        "error": "global_rate_limit",
-                        "message": "서비스가 일시적으로 혼잡합니다. 잠시 후 다시 시도하세요.",
-                        "retry_after": 10
-                    }
-
-            # 사용자 제한 체크
-            current_count = len(user_requests)
-            if current_count >= max_requests:
-                # 차단 시간 설정 (반복 위반시 증가)
-                block_duration = min(60 * (current_count // max_requests), 300)  # 최대 5분
-                self._blocked_users[user_id] = datetime.now() + timedelta(seconds=block_duration)
-
-                logger.warning(f"Rate limit exceeded: user={user_id}, api={api_type}, count={current_count}")
+        now = time.time()
+
+        # 차단된 사용자 확인
+        blocked_until = self._backend.get_block(user_id, now)
+        if blocked_until is not None:
+            remaining = int(blocked_until - now)
+            return False, {
+                "error": "rate_limit_exceeded",
+                "message": f"너무 많은 요청입니다. {remaining}초 후 다시 시도하세요.",
+                "retry_after": remaining
+            }
 
+        # 제한 설정 가져오기
+        limit = custom_limit or DEFAULT_LIMITS.get(api_type, DEFAULT_LIMITS["general"])
+        max_requests = limit["requests"]
+        window = limit["window_seconds"]
+
+        # 전역 제한 체크
+        if api_type in GLOBAL_LIMITS:
+            global_limit = GLOBAL_LIMITS[api_type]
+            global_count = self._backend.estimate(_GLOBAL_SCOPE, api_type, global_limit["window_seconds"], now)
+            if global_count >= global_limit["requests"]:
                 return False, {
-                    "error": "rate_limit_exceeded",
-                    "message": f"요청 한도 초과 ({max_requests}회/{window}초). {block_duration}초 후 다시 시도하세요.",
-                    "retry_after": block_duration,
-                    "current": current_count,
-                    "limit": max_requests
+                    "error": "global_rate_limit",
+                    "message": "서비스가 일시적으로 혼잡합니다. 잠시 후 다시 시도하세요.",
+                    "retry_after": 10
                 }
 
-            return True, {
-                "allowed": True,
+        # 사용자 제한 체크
+        estimate = self._backend.estimate(user_id, api_type, window, now)
+        current_count = int(estimate)
+        if estimate >= max_requests:
+            # 차단 시간 설정 (반복 위반시 증가)
+            block_duration = min(60 * (current_count // max_requests), 300)  # 최대 5분
+            self._backend.set_block(user_id, now + block_duration)
+
+            logger.warning(f"Rate limit exceeded: user={user_id}, api={api_type}, count={current_count}")
+
+            return False, {
+                "error": "rate_limit_exceeded",
+                "message": f"요청 한도 초과 ({max_requests}회/{window}초). {block_duration}초 후 다시 시도하세요.",
+                "retry_after": block_duration,
                 "current": current_count,
-                "limit": max_requests,
-                "remaining": max_requests - current_count - 1
+                "limit": max_requests
             }
 
-    def record_request(self, user_id: str, api_type: str = "general") -> None:
-        """요청 기록"""
-        with self._lock:
-            self._user_requests[user_id][api_type].append(time.time())
+        return True, {
+            "allowed": True,
+            "current": current_count,
+            "limit": max_requests,
+            "remaining": max_requests - current_count - 1
+        }
+
+    def record_request(self, user_id: str, api_type: str = "general", custom_limit: Dict[str, int] = None) -> None:
+        """요청 기록 (custom_limit은 check_rate_limit에 넘긴 것과 같아야 함)"""
+        now = time.time()
+        limit = custom_limit or DEFAULT_LIMITS.get(api_type, DEFAULT_LIMITS["general"])
+        self._backend.add(user_id, api_type, limit["window_seconds"], now)
 
-            if api_type in GLOBAL_LIMITS:
-                self._global_requests[api_type].append(time.time())
+        if api_type in GLOBAL_LIMITS:
+            self._backend.add(_GLOBAL_SCOPE, api_type, GLOBAL_LIMITS[api_type]["window_seconds"], now)
 
     def get_user_stats(self, user_id: str) -> Dict[str, Any]:
         """사용자별 요청 통계"""
-        with self._lock:
-            stats = {}
-            for api_type, requests in self._user_requests[user_id].items():
-                limit = DEFAULT_LIMITS.get(api_type, DEFAULT_LIMITS["general"])
-                cleaned = self._clean_old_requests(requests, limit["window_seconds"])
-                stats[api_type] = {
-                    "current": len(cleaned),
-                    "limit": limit["requests"],
-                    "remaining": max(0, limit["requests"] - len(cleaned))
-                }
-            return stats
+        stats = {}
+        for api_type, estimate in self._backend.counts(user_id, time.time()).items():
+            limit = DEFAULT_LIMITS.get(api_type, DEFAULT_LIMITS["general"])
+            current = int(estimate)
+            stats[api_type] = {
+                "current": current,
+                "limit": limit["requests"],
+                "remaining": max(0, limit["requests"] - current)
+            }
+        return stats
 
     def reset_user(self, user_id: str) -> None:
         """사용자 제한 리셋"""
-        with self._lock:
-            if user_id in self._user_requests:
-                del self._user_requests[user_id]
-            if user_id in self._blocked_users:
-                del self._blocked_users[user_id]
-            logger.info(f"Rate limit reset: user={user_id}")
+        self._backend.reset(user_id)
+        logger.info(f"Rate limit reset: user={user_id}")
+
+    def tracked_users(self) -> int:
+        """메모리에 추적 중인 사용자 수 (Redis 저장소는 -1)"""
+        return self._backend.size()
 
 
 # 전역 Rate Limiter 인스턴스
-rate_limiter = RateLimiter()
+rate_limiter = RateLimiter(_create_backend())
 
 
 # ============================================================
@@ -1,10 +1,14 @@
 # response_cache.py
 # LLM 응답 캐싱 시스템 - API 비용 절감
 
+import os
+import sys
 import hashlib
 import json
 import time
+import sqlite3
 import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Optional, Callable
@@ -17,6 +21,8 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+from disk_cache import DiskCache
+
 
 # ============================================================
 # 설정
@@ -29,7 +35,14 @@ CACHE_DIR.mkdir(parents=True, exist_ok=True)
 # 캐시 설정
 DEFAULT_TTL_SECONDS = 3600  # 1시간
 MAX_CACHE_SIZE_MB = 100  # 최대 캐시 크기
-MAX_CACHE_ENTRIES = 1000  # 최대 캐시 항목 수
+MAX_CACHE_ENTRIES = 1000  # 최대 캐시 항목 수 (메모리)
+
+# 디스크 백엔드 ("sqlite": 항목 단위 SQLite 저장, "memory": 메모리 전용)
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "sqlite")
+RESPONSE_CACHE_DB = CACHE_DIR / "response_cache.sqlite3"
+
+# 동일 키 동시 요청 병합 시 대기자의 최대 대기 시간 (초과 시 직접 호출)
+SINGLE_FLIGHT_TIMEOUT_SECONDS = float(os.getenv("SINGLE_FLIGHT_TIMEOUT_SECONDS", "60"))
 
 # 캐시 가능한 API 유형
 CACHEABLE_APIS = {
@@ -41,24 +54,72 @@ CACHEABLE_APIS = {
 }
 
 
+# ============================================================
+# 동시 요청 병합 (single-flight)
+# ============================================================
+
+class _InFlightCall:
+    """진행 중인 호출 (첫 호출자가 실행, 나머지는 결과 대기)"""
+
+    __slots__ = ("event", "result", "error", "abandoned", "waiters")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        # 첫 호출자가 Exception이 아닌 이유(스크립트 중단/재실행, KeyboardInterrupt)로 빠짐
+        self.abandoned = False
+        self.waiters = 0
+
+
 # ============================================================
 # 캐시 클래스
 # ============================================================
 
 class ResponseCache:
-    """LLM 응답 캐시 (메모리 + 파일)"""
+    """
+    LLM 응답 캐시 (메모리 LRU + SQLite 디스크)
 
-    def __init__(self, max_entries: int = MAX_CACHE_ENTRIES):
+    - 메모리: OrderedDict 기반 O(1) LRU, 항목 수/용량(MAX_CACHE_SIZE_MB) 제한
+    - 디스크: 항목 단위 SQLite 저장 (disk_path 지정 시), 프로세스 간 공유
+    - bytes 응답(TTS 오디오 등)은 JSON을 거치지 않고 BLOB으로 저장
+    """
+
+    def __init__(
+        self,
+        max_entries: int = MAX_CACHE_ENTRIES,
+        max_size_mb: float = MAX_CACHE_SIZE_MB,
+        disk_path: Optional[Path] = None
+    ):
+        """
+        Args:
+            max_entries: 메모리 최대 항목 수
+            max_size_mb: 메모리/디스크 각각의 최대 용량 (MB)
+            disk_path: SQLite 파일 경로 (None이면 메모리 전용)
+        """
         self.max_entries = max_entries
-        self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self._memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._memory_bytes = 0
         self._lock = threading.Lock()
         self._stats = {
             "hits": 0,
             "misses": 0,
-            "saved_calls": 0
+            "saved_calls": 0,
+            "coalesced": 0,
+            "coalesce_timeouts": 0
         }
+        self._inflight: Dict[str, _InFlightCall] = {}
+        self._inflight_lock = threading.Lock()
 
-        # 파일 캐시 로드
+        self._disk: Optional[DiskCache] = None
+        if disk_path is not None:
+            try:
+                self._disk = DiskCache(disk_path, namespace="response_cache", max_bytes=self.max_bytes)
+            except sqlite3.Error as e:
+                logger.error(f"디스크 캐시 초기화 실패, 메모리 전용으로 동작: {e}")
+
+        # 파일 캐시 로드 (이전 JSON 형식)
         self._load_file_cache()
 
     def _generate_key(self, api_type: str, params: Dict[str, Any]) -> str:
@@ -68,6 +129,54 @@ class ResponseCache:
         combined = f"{api_type}:{sorted_params}"
         return hashlib.sha256(combined.encode()).hexdigest()[:32]
 
+    @staticmethod
+    def _disk_key(api_type: str, key: str) -> str:
+        """디스크 키 (api_type 접두어로 유형별 무효화 지원)"""
+        return f"{api_type}:{key}"
+
+    @staticmethod
+    def _estimate_size(response: Any) -> int:
+        """응답 크기 추정 (바이트)"""
+        if isinstance(response, (bytes, bytearray, memoryview)):
+            return len(response)
+        if isinstance(response, str):
+            return len(response.encode("utf-8"))
+        try:
+            return len(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+        except (TypeError, ValueError):
+            return sys.getsizeof(response)
+
+    # -------------------------------------------------------------------------
+    # 메모리 LRU (self._lock 보유 상태에서 호출)
+    # -------------------------------------------------------------------------
+
+    def _remove_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._memory_cache.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry.get("size", 0)
+        return entry
+
+    def _put_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        self._remove_entry(key)
+        if entry["size"] > self.max_bytes:
+            return
+        self._memory_cache[key] = entry
+        self._memory_bytes += entry["size"]
+        while len(self._memory_cache) > self.max_entries or self._memory_bytes > self.max_bytes:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        """가장 오래 사용되지 않은 항목 제거 (LRU, O(1))"""
+        if not self._memory_cache:
+            return
+
+        _, entry = self._memory_cache.popitem(last=False)
+        self._memory_bytes -= entry.get("size", 0)
+
+    # -------------------------------------------------------------------------
+    # 조회/저장
+    # -------------------------------------------------------------------------
+
     def get(self, api_type: str, params: Dict[str, Any]) -> Optional[Any]:
         """
         캐시에서 응답 가져오기
@@ -82,21 +191,39 @@ class ResponseCache:
         key = self._generate_key(api_type, params)
 
         with self._lock:
-            if key in self._memory_cache:
-                entry = self._memory_cache[key]
-
+            entry = self._memory_cache.get(key)
+            if entry is not None:
                 # TTL 확인
                 if time.time() < entry["expires_at"]:
+                    self._memory_cache.move_to_end(key)
                     self._stats["hits"] += 1
                     self._stats["saved_calls"] += 1
                     logger.debug(f"Cache HIT: {api_type} (key={key[:8]}...)")
                     return entry["response"]
-                else:
-                    # 만료된 항목 제거
-                    del self._memory_cache[key]
+                # 만료된 항목 제거
+                self._remove_entry(key)
+
+        # 메모리 미스 → 디스크 조회 (다른 프로세스가 저장한 항목 포함)
+        if self._disk is not None:
+            found = self._disk.get_with_expiry(self._disk_key(api_type, key))
+            if found is not None:
+                response, expires_at = found
+                with self._lock:
+                    self._put_entry(key, {
+                        "api_type": api_type,
+                        "response": response,
+                        "created_at": time.time(),
+                        "expires_at": expires_at if expires_at is not None else float("inf"),
+                        "size": self._estimate_size(response),
+                    })
+                    self._stats["hits"] += 1
+                    self._stats["saved_calls"] += 1
+                logger.debug(f"Cache HIT (disk): {api_type} (key={key[:8]}...)")
+                return response
 
+        with self._lock:
             self._stats["misses"] += 1
-            return None
+        return None
 
     def set(
         self,
@@ -119,32 +246,106 @@ class ResponseCache:
             ttl = CACHEABLE_APIS.get(api_type, {}).get("ttl", DEFAULT_TTL_SECONDS)
 
         key = self._generate_key(api_type, params)
+        now = time.time()
 
         with self._lock:
-            # 최대 항목 수 체크
-            if len(self._memory_cache) >= self.max_entries:
-                self._evict_oldest()
-
-            self._memory_cache[key] = {
+            self._put_entry(key, {
                 "api_type": api_type,
                 "response": response,
-                "created_at": time.time(),
-                "expires_at": time.time() + ttl,
-                "params_hash": hashlib.md5(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
-            }
+                "created_at": now,
+                "expires_at": now + ttl,
+                "size": self._estimate_size(response),
+            })
 
-            logger.debug(f"Cache SET: {api_type} (key={key[:8]}..., ttl={ttl}s)")
+        # 디스크에 항목 단위로 기록 (직렬화 불가 응답은 메모리에만 유지)
+        if self._disk is not None:
+            self._disk.set(self._disk_key(api_type, key), response, ttl_seconds=ttl)
 
-    def _evict_oldest(self) -> None:
-        """가장 오래된 항목 제거 (LRU)"""
-        if not self._memory_cache:
-            return
+        logger.debug(f"Cache SET: {api_type} (key={key[:8]}..., ttl={ttl}s)")
+
+    def get_or_call(
+        self,
+        api_type: str,
+        params: Dict[str, Any],
+        call_func: Callable[[], Any],
+        ttl: int = None,
+        wait_timeout: float = None
+    ) -> Any:
+        """
+        캐시 조회, 미스 시 호출 (동일 키 동시 호출은 한 번만 실행)
 
-        oldest_key = min(
-            self._memory_cache.keys(),
-            key=lambda k: self._memory_cache[k]["created_at"]
-        )
-        del self._memory_cache[oldest_key]
+        같은 키로 진행 중인 호출이 있으면 새로 호출하지 않고 그 결과를 기다려 공유한다.
+        진행 중인 호출이 예외(Exception)로 끝나면 대기자에게도 같은 예외가 전파된다.
+        Streamlit StopException/RerunException 등 BaseException은 첫 호출자의 세션에만
+        해당하므로 대기자에게 전파하지 않고, 대기자가 직접 다시 호출한다.
+
+        Args:
+            api_type: API 유형
+            params: 파라미터
+            call_func: 캐시 미스 시 호출할 함수
+            ttl: 캐시 유효 시간
+            wait_timeout: 대기 상한 (초, 초과 시 직접 호출). None이면 SINGLE_FLIGHT_TIMEOUT_SECONDS
+
+        Returns:
+            캐시된 또는 새로운 응답
+        """
+        cached_response = self.get(api_type, params)
+        if cached_response is not None:
+            return cached_response
+
+        key = f"{api_type}:{self._generate_key(api_type, params)}"
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlightCall()
+                self._inflight[key] = call
+            else:
+                call.waiters += 1
+
+        if not leader:
+            timeout = SINGLE_FLIGHT_TIMEOUT_SECONDS if wait_timeout is None else wait_timeout
+            if call.event.wait(timeout):
+                if call.abandoned:
+                    logger.debug(f"Single-flight leader abandoned, retrying: {api_type}")
+                    return self.get_or_call(api_type, params, call_func, ttl, wait_timeout)
+                with self._lock:
+                    self._stats["coalesced"] += 1
+                    self._stats["saved_calls"] += 1
+                if call.error is not None:
+                    raise call.error
+                return call.result
+
+            # 진행 중인 호출이 너무 오래 걸림 - 직접 호출
+            with self._lock:
+                self._stats["coalesce_timeouts"] += 1
+            logger.warning(f"Single-flight wait timed out after {timeout}s: {api_type}")
+            response = call_func()
+            if response is not None:
+                self.set(api_type, params, response, ttl)
+            return response
+
+        try:
+            # 조회 직후 다른 호출이 끝났을 수 있으므로 재확인
+            response = self.get(api_type, params)
+            if response is None:
+                response = call_func()
+                if response is not None:
+                    self.set(api_type, params, response, ttl)
+            call.result = response
+            return response
+        except Exception as e:
+            call.error = e
+            raise
+        except BaseException:
+            call.abandoned = True
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            call.event.set()
+            if call.waiters:
+                logger.debug(f"Single-flight shared: {api_type} (waiters={call.waiters})")
 
     def invalidate(self, api_type: str = None, key: str = None) -> int:
         """
@@ -157,13 +358,20 @@ class ResponseCache:
         Returns:
             삭제된 항목 수
         """
-        with self._lock:
-            if key:
-                if key in self._memory_cache:
-                    del self._memory_cache[key]
-                    return 1
-                return 0
+        if key:
+            with self._lock:
+                entry = self._remove_entry(key)
+            removed = {key} if entry is not None else set()
+            if self._disk is not None:
+                # api_type을 모르면 키 접미어로 찾음
+                suffix = f":{key}"
+                for disk_key in self._disk.keys(f"{entry['api_type']}:" if entry else ""):
+                    if disk_key.endswith(suffix):
+                        self._disk.delete(disk_key)
+                        removed.add(key)
+            return len(removed)
 
+        with self._lock:
             if api_type:
                 keys_to_delete = [
                     k for k, v in self._memory_cache.items()
@@ -173,10 +381,19 @@ class ResponseCache:
                 keys_to_delete = list(self._memory_cache.keys())
 
             for k in keys_to_delete:
-                del self._memory_cache[k]
+                self._remove_entry(k)
+
+        removed = set(keys_to_delete)
+        if self._disk is not None:
+            prefix = f"{api_type}:" if api_type else ""
+            removed.update(k.split(":")[-1] for k in self._disk.keys(prefix))
+            if api_type:
+                self._disk.delete_prefix(prefix)
+            else:
+                self._disk.clear()
 
-            logger.info(f"Cache invalidated: {len(keys_to_delete)} entries")
-            return len(keys_to_delete)
+        logger.info(f"Cache invalidated: {len(removed)} entries")
+        return len(removed)
 
     def cleanup_expired(self) -> int:
         """만료된 항목 정리"""
@@ -185,12 +402,17 @@ class ResponseCache:
             expired = [k for k, v in self._memory_cache.items() if now >= v["expires_at"]]
 
             for k in expired:
-                del self._memory_cache[k]
+                self._remove_entry(k)
 
-            if expired:
-                logger.info(f"Cache cleanup: {len(expired)} expired entries removed")
+        removed = len(expired)
+        if self._disk is not None:
+            # 메모리 항목은 디스크에도 있으므로 큰 쪽을 정리 건수로 봄
+            removed = max(removed, self._disk.purge_expired())
 
-            return len(expired)
+        if removed:
+            logger.info(f"Cache cleanup: {removed} expired entries removed")
+
+        return removed
 
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계"""
@@ -198,47 +420,89 @@ class ResponseCache:
             total = self._stats["hits"] + self._stats["misses"]
             hit_rate = (self._stats["hits"] / total * 100) if total > 0 else 0
 
-            return {
+            stats = {
                 "entries": len(self._memory_cache),
                 "max_entries": self.max_entries,
+                "size_mb": round(self._memory_bytes / (1024 * 1024), 2),
+                "max_size_mb": round(self.max_bytes / (1024 * 1024), 2),
                 "hits": self._stats["hits"],
                 "misses": self._stats["misses"],
                 "hit_rate": f"{hit_rate:.1f}%",
                 "saved_api_calls": self._stats["saved_calls"],
+                "coalesced_calls": self._stats["coalesced"],
+                "coalesce_timeouts": self._stats["coalesce_timeouts"],
+                "in_flight": len(self._inflight),
                 "estimated_savings": f"${self._stats['saved_calls'] * 0.002:.2f}"  # ~$0.002/call
             }
 
+        if self._disk is not None:
+            disk_stats = self._disk.stats()
+            stats["disk_entries"] = disk_stats["entries"]
+            stats["disk_size_mb"] = round(disk_stats["size_bytes"] / (1024 * 1024), 2)
+
+        return stats
+
     def _load_file_cache(self) -> None:
-        """파일 캐시 로드 (시작 시)"""
+        """이전 JSON 파일 캐시 로드 (시작 시, 디스크 사용 시 SQLite로 이전)"""
         cache_file = CACHE_DIR / "response_cache.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+        if not cache_file.exists():
+            return
 
-                # 만료되지 않은 항목만 로드
-                now = time.time()
-                for key, entry in data.items():
-                    if entry.get("expires_at", 0) > now:
-                        self._memory_cache[key] = entry
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load cache file: {e}")
+            return
 
-                logger.info(f"Loaded {len(self._memory_cache)} cache entries from file")
-            except Exception as e:
-                logger.error(f"Failed to load cache file: {e}")
+        # 만료되지 않은 항목만 로드
+        now = time.time()
+        loaded = 0
+        for key, entry in data.items():
+            expires_at = entry.get("expires_at", 0)
+            if expires_at <= now:
+                continue
+            response = entry.get("response")
+            api_type = entry.get("api_type", "")
+            if self._disk is not None:
+                self._disk.set(self._disk_key(api_type, key), response, ttl_seconds=expires_at - now)
+            else:
+                with self._lock:
+                    self._put_entry(key, {
+                        "api_type": api_type,
+                        "response": response,
+                        "created_at": entry.get("created_at", now),
+                        "expires_at": expires_at,
+                        "size": self._estimate_size(response),
+                    })
+            loaded += 1
+
+        logger.info(f"Loaded {loaded} cache entries from file")
+
+        if self._disk is not None:
+            # 이전 완료 - 다음 시작부터는 SQLite만 사용
+            try:
+                cache_file.rename(cache_file.with_suffix(".json.migrated"))
+            except OSError as e:
+                logger.warning(f"Failed to rename legacy cache file: {e}")
 
     def save_to_file(self) -> None:
-        """캐시를 파일에 저장"""
+        """캐시를 파일에 저장 (디스크 백엔드 사용 시 항목 단위로 이미 저장됨)"""
+        if self._disk is not None:
+            logger.debug("Response cache is persisted per entry; save_to_file skipped")
+            return
+
         cache_file = CACHE_DIR / "response_cache.json"
         try:
             with self._lock:
-                # 직렬화 가능한 항목만 저장
+                # 직렬화 가능한 항목만 저장 (bytes 등은 제외)
                 serializable = {}
                 for key, entry in self._memory_cache.items():
                     try:
-                        json.dumps(entry)
-                        serializable[key] = entry
-                    except:
-                        pass
+                        json.dumps(entry["response"])
+                    except (TypeError, ValueError):
+                        continue
+                    serializable[key] = {k: v for k, v in entry.items() if k != "size"}
 
                 with open(cache_file, 'w', encoding='utf-8') as f:
                     json.dump(serializable, f, ensure_ascii=False)
@@ -248,22 +512,25 @@ class ResponseCache:
             logger.error(f"Failed to save cache file: {e}")
 
 
-# 전역 캐시 인스턴스
-response_cache = ResponseCache()
+# 전역 캐시 인스턴스 (RESPONSE_CACHE_BACKEND=memory 이면 메모리 전용)
+response_cache = ResponseCache(
+    disk_path=RESPONSE_CACHE_DB if RESPONSE_CACHE_BACKEND == "sqlite" else None
+)
 
 
 # ============================================================
 # 데코레이터
 # ============================================================
 
-def cached(api_type: str, ttl: int = None, key_params: list = None):
+def cached(api_type: str, ttl: int = None, key_params: list = None, wait_timeout: float = None):
     """
-    응답 캐싱 데코레이터
+    응답 캐싱 데코레이터 (동일 인자 동시 호출은 한 번만 실행)
 
     Args:
         api_type: API 유형
         ttl: 캐시 유효 시간 (초)
         key_params: 캐시 키에 포함할 파라미터 이름 리스트
+        wait_timeout: 동시 호출 대기 상한 (초)
 
     Usage:
         @cached("question_generation", ttl=3600)
@@ -283,19 +550,9 @@ def cached(api_type: str, ttl: int = None, key_params: list = None):
             if args:
                 params["_args"] = str(args)
 
-            # 캐시 확인
-            cached_response = response_cache.get(api_type, params)
-            if cached_response is not None:
-                return cached_response
-
-            # 실제 함수 호출
-            response = func(*args, **kwargs)
-
-            # 캐시 저장 (None이 아닌 경우만)
-            if response is not None:
-                response_cache.set(api_type, params, response, ttl)
-
-            return response
+            return response_cache.get_or_call(
+                api_type, params, lambda: func(*args, **kwargs), ttl, wait_timeout
+            )
 
         return wrapper
     return decorator
@@ -309,33 +566,25 @@ def get_cached_or_call(
     api_type: str,
     params: Dict[str, Any],
     call_func: Callable,
-    ttl: int = None
+    ttl: int = None,
+    wait_timeout: float = None
 ) -> Any:
     """
     캐시된 응답 가져오거나 함수 호출
 
+    동일 키로 진행 중인 호출이 있으면 그 결과를 기다려 공유한다 (예외도 공유).
+
     Args:
         api_type: API 유형
         params: 파라미터
         call_func: 캐시 미스 시 호출할 함수
         ttl: 캐시 유효 시간
+        wait_timeout: 동시 호출 대기 상한 (초, 초과 시 직접 호출)
 
     Returns:
         캐시된 또는 새로운 응답
     """
-    # 캐시 확인
-    cached = response_cache.get(api_type, params)
-    if cached is not None:
-        return cached
-
-    # 함수 호출
-    response = call_func()
-
-    # 캐시 저장
-    if response is not None:
-        response_cache.set(api_type, params, response, ttl)
-
-    return response
+    return response_cache.get_or_call(api_type, params, call_func, ttl, wait_timeout)
 
 
 def clear_cache(api_type: str = None) -> int:
@@ -3,7 +3,9 @@
 
 import os
 import json
+import bisect
 import hashlib
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
@@ -21,6 +23,8 @@ logger = get_logger(__name__)
 # Data file path
 DATA_DIR = Path(__file__).parent / "data"
 SCORE_AGGREGATE_FILE = DATA_DIR / "score_aggregate.json"
+# Append-only log of records added since the last snapshot (one JSON per line)
+SCORE_LOG_FILE = DATA_DIR / "score_aggregate.jsonl"
 
 # Score categories
 SCORE_CATEGORIES = ["음성점수", "내용점수", "감정점수", "종합점수"]
@@ -100,12 +104,12 @@ def _ensure_data_dir() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _load_data() -> Dict:
+def _read_snapshot() -> Dict:
     """
-    Load score aggregate data from JSON file.
+    Load the score snapshot file (records compacted so far).
 
     Returns:
-        Dictionary containing all score records
+        Dictionary containing snapshot score records
     """
     _ensure_data_dir()
 
@@ -135,8 +139,10 @@ def _save_data(data: Dict) -> bool:
 
     try:
         data["last_updated"] = datetime.now().isoformat()
-        with open(SCORE_AGGREGATE_FILE, "w", encoding="utf-8") as f:
+        temp_path = SCORE_AGGREGATE_FILE.with_suffix(".json.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, SCORE_AGGREGATE_FILE)
         logger.debug(f"Saved {len(data.get('records', []))} score records")
         return True
     except Exception as e:
@@ -144,6 +150,240 @@ def _save_data(data: Dict) -> bool:
         return False
 
 
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of a file, or None if missing."""
+    try:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+def _week_key(timestamp: datetime) -> Tuple[int, int]:
+    """ISO (year, week) partition key - Monday to Sunday."""
+    iso = timestamp.isocalendar()
+    return iso[0], iso[1]
+
+
+def _month_key(timestamp: datetime) -> Tuple[int, int]:
+    """Calendar (year, month) partition key."""
+    return timestamp.year, timestamp.month
+
+
+class ScoreStore:
+    """
+    Indexed, incremental score store.
+
+    Records live in a snapshot file plus an append-only log. The store keeps
+    them resident with these indexes:
+    - sorted score arrays per (airline, category), airline None = all airlines,
+      so percentiles are a bisect in O(log n)
+    - weekly / monthly partitions for rankings
+    - records per user
+
+    Appends write one line to the log instead of rewriting history. Other
+    processes' appends are picked up by tailing the log from the last read
+    offset; a changed snapshot (compaction) triggers a full reload.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._records: List[Dict] = []
+        self._sorted_scores: Dict[Tuple[Optional[str], str], List[float]] = {}
+        self._by_airline: Dict[str, List[Dict]] = {}
+        self._by_user: Dict[str, List[Dict]] = {}
+        self._by_week: Dict[Tuple[int, int], List[Dict]] = {}
+        self._by_month: Dict[Tuple[int, int], List[Dict]] = {}
+        self._last_updated: Optional[str] = None
+        self._snapshot_sig: Optional[Tuple[int, int]] = None
+        self._log_offset = 0
+        self._loaded = False
+
+    # ----------------------
+    # Indexing
+    # ----------------------
+
+    def _index(self, record: Dict) -> None:
+        """Add one record to every index."""
+        self._records.append(record)
+
+        airline = record.get("airline")
+        self._by_airline.setdefault(airline, []).append(record)
+        self._by_user.setdefault(record.get("user_id", ""), []).append(record)
+
+        for category, score in record.get("scores", {}).items():
+            if score is None:
+                continue
+            bisect.insort(self._sorted_scores.setdefault((None, category), []), score)
+            bisect.insort(self._sorted_scores.setdefault((airline, category), []), score)
+
+        try:
+            timestamp = datetime.fromisoformat(record.get("timestamp", ""))
+        except (ValueError, TypeError):
+            return
+        self._by_week.setdefault(_week_key(timestamp), []).append(record)
+        self._by_month.setdefault(_month_key(timestamp), []).append(record)
+
+    def _tail_log(self) -> None:
+        """Index log lines appended since the last read."""
+        if not SCORE_LOG_FILE.exists():
+            return
+
+        with open(SCORE_LOG_FILE, "rb") as f:
+            f.seek(self._log_offset)
+            chunk = f.read()
+
+        # Only consume complete lines; a partial last line is read next time
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return
+
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._index(json.loads(line))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping corrupt score log line: {e}")
+        self._log_offset += end + 1
+
+    def _full_load(self) -> None:
+        """Rebuild every index from snapshot + log."""
+        self._reset()
+        self._snapshot_sig = _file_signature(SCORE_AGGREGATE_FILE)
+        data = _read_snapshot()
+        self._last_updated = data.get("last_updated")
+        for record in data.get("records", []):
+            self._index(record)
+        self._tail_log()
+        self._loaded = True
+
+    def refresh(self) -> None:
+        """Sync with disk: full reload if the snapshot changed, else tail the log."""
+        with self._lock:
+            log_sig = _file_signature(SCORE_LOG_FILE)
+            if (
+                not self._loaded
+                or _file_signature(SCORE_AGGREGATE_FILE) != self._snapshot_sig
+                or (log_sig is not None and log_sig[1] < self._log_offset)
+                or (log_sig is None and self._log_offset > 0)
+            ):
+                self._full_load()
+            elif log_sig is not None and log_sig[1] > self._log_offset:
+                self._tail_log()
+
+    # ----------------------
+    # Writes
+    # ----------------------
+
+    def append(self, record: Dict) -> bool:
+        """Append one record to the log and the indexes."""
+        with self._lock:
+            self.refresh()
+            try:
+                _ensure_data_dir()
+                line = json.dumps(record, ensure_ascii=False) + "\n"
+                with open(SCORE_LOG_FILE, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except Exception as e:
+                logger.error(f"Error appending score record: {e}")
+                return False
+
+            # Pick up our own line (plus any other process' lines before it)
+            self._tail_log()
+            self._last_updated = record.get("timestamp")
+            return True
+
+    def compact(self, records: Optional[List[Dict]] = None) -> bool:
+        """
+        Fold the log into the snapshot and truncate the log.
+
+        Args:
+            records: Replacement record list (default: all current records)
+
+        Note: appends from other processes made during compaction may be lost,
+        so run this from maintenance paths only.
+        """
+        with self._lock:
+            self.refresh()
+            data = {"records": list(self._records) if records is None else records}
+            if not _save_data(data):
+                return False
+            try:
+                open(SCORE_LOG_FILE, "w", encoding="utf-8").close()
+            except Exception as e:
+                logger.error(f"Error truncating score log: {e}")
+            self._full_load()
+            return True
+
+    # ----------------------
+    # Reads
+    # ----------------------
+
+    def records(self, airline: Optional[str] = None) -> List[Dict]:
+        """All records, optionally for one airline."""
+        with self._lock:
+            self.refresh()
+            if airline:
+                return list(self._by_airline.get(airline, []))
+            return list(self._records)
+
+    def user_records(self, anonymous_id: str) -> List[Dict]:
+        """Records of one (anonymized) user."""
+        with self._lock:
+            self.refresh()
+            return list(self._by_user.get(anonymous_id, []))
+
+    def sorted_scores(self, category: str, airline: Optional[str] = None) -> List[float]:
+        """Sorted score array for a category. Do not mutate the result."""
+        with self._lock:
+            self.refresh()
+            return self._sorted_scores.get((airline or None, category), [])
+
+    def week_records(self, timestamp: datetime, airline: Optional[str] = None) -> List[Dict]:
+        """Records in the ISO week containing timestamp."""
+        with self._lock:
+            self.refresh()
+            records = self._by_week.get(_week_key(timestamp), [])
+            if airline:
+                return [r for r in records if r.get("airline") == airline]
+            return list(records)
+
+    def month_records(self, timestamp: datetime, airline: Optional[str] = None) -> List[Dict]:
+        """Records in the calendar month containing timestamp."""
+        with self._lock:
+            self.refresh()
+            records = self._by_month.get(_month_key(timestamp), [])
+            if airline:
+                return [r for r in records if r.get("airline") == airline]
+            return list(records)
+
+    def count(self) -> int:
+        with self._lock:
+            self.refresh()
+            return len(self._records)
+
+    @property
+    def last_updated(self) -> Optional[str]:
+        return self._last_updated
+
+
+_store = ScoreStore()
+
+
+def _load_data() -> Dict:
+    """
+    Load all score aggregate data (snapshot + appended log records).
+
+    Returns:
+        Dictionary containing all score records
+    """
+    return {"records": _store.records(), "last_updated": _store.last_updated}
+
+
 def _anonymize_user_id(user_id: str) -> str:
     """
     Create anonymous hash of user ID.
@@ -203,11 +443,8 @@ def add_score(
             "year": datetime.now().year,
         }
 
-        # Load, append, and save
-        data = _load_data()
-        data["records"].append(record)
-
-        if _save_data(data):
+        # Append without rewriting history
+        if _store.append(record):
             logger.info(f"Added score record for airline={airline}, type={question_type}")
             return True
         return False
@@ -232,11 +469,7 @@ def get_all_scores(
         List of score records matching filters
     """
     try:
-        data = _load_data()
-        records = data.get("records", [])
-
-        if airline:
-            records = [r for r in records if r.get("airline") == airline]
+        records = _store.records(airline)
 
         if question_type:
             records = [r for r in records if r.get("question_type") == question_type]
@@ -249,6 +482,24 @@ def get_all_scores(
         return []
 
 
+def get_user_scores(user_id: str, anonymous: bool = True) -> List[Dict]:
+    """
+    Get all score records of one user.
+
+    Args:
+        user_id: User identifier
+        anonymous: Whether records were stored with an anonymized user_id (default: True)
+
+    Returns:
+        List of the user's score records
+    """
+    try:
+        return _store.user_records(_anonymize_user_id(user_id) if anonymous else user_id)
+    except Exception as e:
+        logger.error(f"Error getting user scores: {e}")
+        return []
+
+
 def get_score_count() -> int:
     """
     Get total number of recorded scores.
@@ -257,8 +508,7 @@ def get_score_count() -> int:
         Total count of score records
     """
     try:
-        data = _load_data()
-        count = len(data.get("records", []))
+        count = _store.count()
         logger.debug(f"Total score count: {count}")
         return count
     except Exception as e:
@@ -291,25 +541,14 @@ def calculate_percentile(
             logger.warning(f"Invalid category: {category}")
             return -1.0
 
-        records = get_all_scores(airline=airline)
-
-        if not records:
-            logger.debug("No records for percentile calculation")
-            return -1.0
-
-        # Extract scores for the category
-        all_scores = [
-            r["scores"].get(category)
-            for r in records
-            if r.get("scores", {}).get(category) is not None
-        ]
+        all_scores = _store.sorted_scores(category, airline)
 
         if len(all_scores) < 5:  # Need minimum records for meaningful percentile
             logger.debug(f"Insufficient data for percentile: {len(all_scores)} records")
             return -1.0
 
-        # Calculate percentile
-        count_below = sum(1 for s in all_scores if s < score)
+        # Calculate percentile (scores strictly below, via bisect)
+        count_below = bisect.bisect_left(all_scores, score)
         percentile = (count_below / len(all_scores)) * 100
 
         logger.debug(f"Percentile for {score} in {category}: {percentile:.1f}%")
@@ -340,17 +579,7 @@ def get_statistics(
             logger.warning(f"Invalid category: {category}")
             return {}
 
-        records = get_all_scores(airline=airline)
-
-        if not records:
-            return {}
-
-        # Extract scores
-        all_scores = [
-            r["scores"].get(category)
-            for r in records
-            if r.get("scores", {}).get(category) is not None
-        ]
+        all_scores = _store.sorted_scores(category, airline)
 
         if len(all_scores) < 2:
             return {}
@@ -359,8 +588,8 @@ def get_statistics(
             "mean": round(statistics.mean(all_scores), 2),
             "median": round(statistics.median(all_scores), 2),
             "std": round(statistics.stdev(all_scores), 2) if len(all_scores) > 1 else 0.0,
-            "min": round(min(all_scores), 2),
-            "max": round(max(all_scores), 2),
+            "min": round(all_scores[0], 2),
+            "max": round(all_scores[-1], 2),
             "count": len(all_scores),
         }
 
@@ -394,17 +623,7 @@ def get_score_distribution(
             logger.warning(f"Invalid category: {category}")
             return {}
 
-        records = get_all_scores(airline=airline)
-
-        if not records:
-            return {}
-
-        # Extract scores
-        all_scores = [
-            r["scores"].get(category)
-            for r in records
-            if r.get("scores", {}).get(category) is not None
-        ]
+        all_scores = _store.sorted_scores(category, airline)
 
         if not all_scores:
             return {}
@@ -455,7 +674,7 @@ def _get_records_in_period(
     Returns:
         List of records within the period
     """
-    records = get_all_scores(airline=airline)
+    records = _store.records(airline)
 
     filtered = []
     for record in records:
@@ -506,13 +725,8 @@ def get_weekly_ranking(
         List of top score records with rank
     """
     try:
-        now = datetime.now()
-        # Get start of current week (Monday)
-        start_of_week = now - timedelta(days=now.weekday())
-        start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_week = start_of_week + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-        records = _get_records_in_period(start_of_week, end_of_week, airline)
+        # Current ISO week partition (Monday to Sunday)
+        records = _store.week_records(datetime.now(), airline)
 
         if not records:
             logger.debug("No records for weekly ranking")
@@ -562,16 +776,8 @@ def get_monthly_ranking(
         List of top score records with rank
     """
     try:
-        now = datetime.now()
-        # Get start of current month
-        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        # Get end of current month
-        if now.month == 12:
-            end_of_month = now.replace(year=now.year + 1, month=1, day=1) - timedelta(seconds=1)
-        else:
-            end_of_month = now.replace(month=now.month + 1, day=1) - timedelta(seconds=1)
-
-        records = _get_records_in_period(start_of_month, end_of_month, airline)
+        # Current calendar month partition
+        records = _store.month_records(datetime.now(), airline)
 
         if not records:
             logger.debug("No records for monthly ranking")
@@ -625,21 +831,11 @@ def get_user_rank(
 
         # Get weekly ranking
         now = datetime.now()
-        start_of_week = now - timedelta(days=now.weekday())
-        start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_week = start_of_week + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-        weekly_records = _get_records_in_period(start_of_week, end_of_week, airline)
+        weekly_records = _store.week_records(now, airline)
         weekly_user_best = _aggregate_user_scores(weekly_records)
 
         # Get monthly ranking
-        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        if now.month == 12:
-            end_of_month = now.replace(year=now.year + 1, month=1, day=1) - timedelta(seconds=1)
-        else:
-            end_of_month = now.replace(month=now.month + 1, day=1) - timedelta(seconds=1)
-
-        monthly_records = _get_records_in_period(start_of_month, end_of_month, airline)
+        monthly_records = _store.month_records(now, airline)
         monthly_user_best = _aggregate_user_scores(monthly_records)
 
         # Sort and find user's rank
@@ -848,8 +1044,7 @@ def clear_old_records(days: int = 365) -> int:
         Number of records removed
     """
     try:
-        data = _load_data()
-        records = data.get("records", [])
+        records = _store.records()
 
         cutoff = datetime.now() - timedelta(days=days)
 
@@ -866,8 +1061,7 @@ def clear_old_records(days: int = 365) -> int:
             except (ValueError, TypeError):
                 new_records.append(record)  # Keep records with invalid timestamps
 
-        data["records"] = new_records
-        _save_data(data)
+        _store.compact(new_records)
 
         logger.info(f"Cleared {removed_count} old records (older than {days} days)")
         return removed_count
@@ -16,10 +16,14 @@ import json
 import time
 import hashlib
 import re
+import threading
 import requests
-from typing import Dict, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from logging_config import get_logger
+from disk_cache import DiskCache, CACHE_DIR
+import http_client
 
 logger = get_logger(__name__)
 
@@ -31,6 +35,17 @@ CLOVA_REQUEST_ID = os.getenv("CLOVA_REQUEST_ID", "331785bac0c64228ac15f5616d9082
 CLOVA_HOST = "https://clovastudio.stream.ntruss.com"
 CLOVA_MODEL = "HCX-005"  # 서비스 앱에서 승인된 모델
 
+# 문항 병렬 처리 설정
+PIPELINE_MAX_PARALLEL_ITEMS = int(os.getenv("PIPELINE_MAX_PARALLEL_ITEMS", "4"))  # 1이면 순차 처리
+PIPELINE_ITEM_DEADLINE_SECONDS = float(os.getenv("PIPELINE_ITEM_DEADLINE_SECONDS", "120"))  # 문항별 처리 제한 시간
+
+# 결과 캐시 설정 (메모리 LRU + 프로세스 간 공유 디스크 캐시)
+PIPELINE_CACHE_VERSION = "v1"  # 프롬프트/검증 로직 변경 시 올려서 기존 캐시 무효화
+PIPELINE_CACHE_FILE = CACHE_DIR / "sharp_questions.sqlite3"
+PIPELINE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+PIPELINE_CACHE_MAX_ENTRIES = 2000
+PIPELINE_MEMORY_CACHE_SIZE = 64
+
 
 # ===========================================
 # STEP 1: 자소서 파싱 프롬프트
@@ -812,7 +827,7 @@ def _call_llm(system: str, user: str, temperature: float = 0.3) -> Optional[Dict
 
         endpoint = f"{CLOVA_HOST}/v3/chat-completions/{CLOVA_MODEL}"
 
-        response = requests.post(endpoint, headers=headers, json=payload, timeout=90)
+        response = http_client.post("clova", endpoint, endpoint="chat-completions", headers=headers, json=payload, timeout=90)
 
         if response.status_code != 200:
             print(f"[LLM ERROR] HTTP {response.status_code}: {response.text}")
@@ -1030,15 +1045,71 @@ def calculate_sharpness(question_text: str, q_type: str) -> int:
 class InterviewQuestionPipeline:
     """5단계 GATE 검증이 통합된 면접 질문 생성 파이프라인"""
 
-    def __init__(self, airline: str = ""):
+    def __init__(self, airline: str = "", max_parallel_items: int = None,
+                 item_deadline: float = None, use_disk_cache: bool = True):
         self.airline = airline
-        self._cache = {}
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # 싱글톤 파이프라인을 여러 세션 스레드가 공유하므로 메모리 LRU는 락으로 보호
+        self._cache_lock = threading.Lock()
         self.max_regeneration_attempts = 0  # 재생성 비활성화 (속도 최적화)
+        self.max_parallel_items = max_parallel_items or PIPELINE_MAX_PARALLEL_ITEMS
+        self.item_deadline = item_deadline or PIPELINE_ITEM_DEADLINE_SECONDS
+
+        self._disk_cache: Optional[DiskCache] = None
+        if use_disk_cache:
+            try:
+                self._disk_cache = DiskCache(
+                    PIPELINE_CACHE_FILE,
+                    namespace="sharp_pipeline",
+                    ttl_seconds=PIPELINE_CACHE_TTL_SECONDS,
+                    max_entries=PIPELINE_CACHE_MAX_ENTRIES
+                )
+            except Exception as e:
+                logger.warning(f"디스크 캐시 사용 불가, 메모리 캐시만 사용: {e}")
 
     def _get_cache_key(self, qa_pairs: List[Dict]) -> str:
-        """캐시 키 생성"""
+        """캐시 키 생성 (자소서 전체)"""
         content = json.dumps(qa_pairs, ensure_ascii=False, sort_keys=True)
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+        digest = hashlib.sha256(f"{PIPELINE_CACHE_VERSION}:{CLOVA_MODEL}:{content}".encode("utf-8")).hexdigest()
+        return f"result:{digest[:32]}"
+
+    def _get_item_cache_key(self, question_text: str, answer_text: str) -> str:
+        """캐시 키 생성 (문항 단위) - 답변 하나만 고치면 그 문항만 재분석"""
+        content = json.dumps([question_text, answer_text], ensure_ascii=False)
+        digest = hashlib.sha256(f"{PIPELINE_CACHE_VERSION}:{CLOVA_MODEL}:{content}".encode("utf-8")).hexdigest()
+        return f"item:{digest[:32]}"
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (메모리 → 디스크)"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if time.time() - stored_at <= PIPELINE_CACHE_TTL_SECONDS:
+                    self._cache.move_to_end(key)
+                    return value
+                del self._cache[key]
+
+        if self._disk_cache is not None:
+            value = self._disk_cache.get(key)
+            if value is not None:
+                self._memory_cache_set(key, value)
+                return value
+        return None
+
+    def _memory_cache_set(self, key: str, value: Any) -> None:
+        """메모리 LRU 저장"""
+        with self._cache_lock:
+            self._cache[key] = (time.time(), value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > PIPELINE_MEMORY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _cache_set(self, key: str, value: Any) -> None:
+        """캐시 저장 (메모리 + 디스크)"""
+        self._memory_cache_set(key, value)
+        if self._disk_cache is not None:
+            self._disk_cache.set(key, value)
 
     # -----------------------------------------
     # STEP 1: 자소서 파싱
@@ -1399,6 +1470,81 @@ JSON 형식으로만 응답하세요."""
             "rejected_questions": rejected_questions
         }
 
+    # -----------------------------------------
+    # 문항 병렬 처리
+    # -----------------------------------------
+    @staticmethod
+    def _failed_item_result(item: Dict, error: str) -> Dict:
+        """시간 초과/오류 문항의 빈 결과"""
+        return {
+            "q_num": item["q_num"],
+            "question_text": item["question_text"],
+            "validated_questions": [],
+            "rejected_questions": [],
+            "error": error
+        }
+
+    def _process_items(self, parsed: List[Dict]) -> List[Dict]:
+        """
+        문항별 처리 (max_parallel_items개까지 동시 실행)
+
+        - 결과는 입력 문항 순서 유지
+        - 시작 후 item_deadline을 넘긴 문항은 "시간 초과" 결과로 대체
+          (나머지 문항 결과는 그대로 반환)
+        - 예외가 난 문항도 오류 결과로 대체
+        """
+        if self.max_parallel_items <= 1 or len(parsed) <= 1:
+            results = []
+            for item in parsed:
+                try:
+                    results.append(self.process_single_item(
+                        item["q_num"], item["question_text"], item["answer_text"]
+                    ))
+                except Exception as e:
+                    print(f"[ERROR] 문항 {item['q_num']} 처리 실패: {e}")
+                    results.append(self._failed_item_result(item, str(e)))
+            return results
+
+        results: List[Optional[Dict]] = [None] * len(parsed)
+        started_at: Dict[int, float] = {}
+
+        def run(index: int, item: Dict) -> Dict:
+            started_at[index] = time.time()
+            return self.process_single_item(item["q_num"], item["question_text"], item["answer_text"])
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_parallel_items, len(parsed)),
+            thread_name_prefix="sharp-q-item"
+        )
+        try:
+            futures = {executor.submit(run, i, item): i for i, item in enumerate(parsed)}
+            pending = set(futures)
+
+            while pending:
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    index = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        print(f"[ERROR] 문항 {parsed[index]['q_num']} 처리 실패: {e}")
+                        results[index] = self._failed_item_result(parsed[index], str(e))
+
+                now = time.time()
+                for future in list(pending):
+                    index = futures[future]
+                    if index in started_at and now - started_at[index] > self.item_deadline:
+                        print(f"[TIMEOUT] 문항 {parsed[index]['q_num']} {self.item_deadline:.0f}초 초과 - 부분 결과 반환")
+                        future.cancel()
+                        pending.discard(future)
+                        results[index] = self._failed_item_result(parsed[index], "시간 초과")
+        finally:
+            # 시간 초과 문항의 스레드는 백그라운드에서 끝나도록 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
     # -----------------------------------------
     # 전체 처리
     # -----------------------------------------
@@ -1406,9 +1552,10 @@ JSON 형식으로만 응답하세요."""
         """전체 자소서 처리"""
 
         cache_key = self._get_cache_key(qa_pairs)
-        if cache_key in self._cache:
+        cached_result = self._cache_get(cache_key)
+        if cached_result is not None:
             print("[CACHE HIT] 캐시된 결과 반환")
-            return self._cache[cache_key]
+            return cached_result
 
         print("\n" + "=" * 60)
         print("면접 질문 생성 파이프라인 v2.0 시작")
@@ -1420,18 +1567,34 @@ JSON 형식으로만 응답하세요."""
         parsed = self.step1_parse_resume(qa_pairs)
         print(f"[STEP 1] 문항 {len(parsed)}개 파싱 완료")
 
-        # 각 문항 처리
-        all_results = []
-        all_questions = []
+        # 문항 단위 캐시 확인 - 바뀐 문항만 처리
+        item_keys = [self._get_item_cache_key(item["question_text"], item["answer_text"]) for item in parsed]
+        all_results: List[Optional[Dict]] = []
+        to_process = []
+        for item, item_key in zip(parsed, item_keys):
+            cached_item = self._cache_get(item_key)
+            if cached_item is not None:
+                all_results.append(dict(cached_item, q_num=item["q_num"]))
+            else:
+                all_results.append(None)
+                to_process.append(item)
+        if len(to_process) < len(parsed):
+            print(f"[CACHE HIT] 문항 {len(parsed) - len(to_process)}개 캐시 재사용")
+
+        # 각 문항 처리 (병렬, 순서 유지)
+        processed = iter(self._process_items(to_process))
+        for i, item_key in enumerate(item_keys):
+            if all_results[i] is None:
+                result = next(processed)
+                all_results[i] = result
+                if not result.get("error"):
+                    self._cache_set(item_key, result)
 
-        for item in parsed:
-            result = self.process_single_item(
-                item["q_num"],
-                item["question_text"],
-                item["answer_text"]
-            )
-            all_results.append(result)
+        all_questions = []
+        for result in all_results:
             all_questions.extend(result.get("validated_questions", []))
+        incomplete = [r["q_num"] for r in all_results if r.get("error") == "시간 초과"]
+        failed = [r["q_num"] for r in all_results if r.get("error") and r["q_num"] not in incomplete]
 
         # 다양성 검증
         diversity = check_question_diversity(all_questions)
@@ -1445,12 +1608,15 @@ JSON 형식으로만 응답하세요."""
                 "total_items": len(parsed),
                 "total_validated": len(all_questions),
                 "total_rejected": sum(len(r.get("rejected_questions", [])) for r in all_results),
+                "timed_out_items": incomplete,
+                "failed_items": failed,
                 "processing_time": time.time() - start_time
             }
         }
 
-        # 캐시 저장
-        self._cache[cache_key] = final_result
+        # 캐시 저장 (시간 초과/실패 문항이 있는 부분 결과는 저장하지 않음 - 일시 장애가 7일간 남지 않도록)
+        if not incomplete and not failed:
+            self._cache_set(cache_key, final_result)
 
         print("\n" + "=" * 60)
         print(f"파이프라인 완료! 총 {time.time() - start_time:.1f}초")
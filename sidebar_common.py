@@ -10,6 +10,23 @@ try:
 except ImportError:
     ADMIN_PASSWORD = "admin123"
 
+# Prometheus /metrics 엔드포인트 (Streamlit 프로세스당 1회, METRICS_PORT 기본 9464)
+try:
+    if st.runtime.exists():
+        from src.analytics.metrics import start_metrics_server
+        start_metrics_server()
+        # 시스템 메트릭(CPU/메모리/디스크) 수집기 등록 - 관리자 페이지를 열기 전에도 스크레이프에 포함
+        import performance_monitor  # noqa: F401
+except Exception:
+    pass
+
+# CPU 집약 분석 프로세스 풀 예열 (ANALYSIS_POOL_ENABLED=auto면 Streamlit 안에서만)
+try:
+    from analysis_pool import start_analysis_pool
+    start_analysis_pool()
+except Exception:
+    pass
+
 # Enhancement modules - 비활성화 (안정성 문제)
 ENHANCEMENT_AVAILABLE = False
 MODULES_AVAILABLE = {}
@@ -16,6 +16,8 @@ from src.analytics.metrics import (
     Counter,
     Gauge,
     Histogram,
+    MetricFamily,
+    QuantileSketch,
 )
 from src.analytics.dashboard import (
     AnalyticsDashboard,
@@ -45,6 +47,8 @@ __all__ = [
     "Counter",
     "Gauge",
     "Histogram",
+    "MetricFamily",
+    "QuantileSketch",
     # Dashboard
     "AnalyticsDashboard",
     "DashboardWidget",
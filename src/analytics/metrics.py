@@ -1,16 +1,28 @@
 """
 Metrics Collector.
 
-Prometheus-compatible metrics collection.
+Prometheus-compatible metrics collection. This is the single
+instrumentation core: the FastAPI app serves it on ``/metrics`` and the
+Streamlit app through start_metrics_server(); the legacy
+performance_monitor / performance_optimizer / performance_utils helpers
+record into it.
+
+Set METRICS_ENABLED=false to turn every inc/set/observe/timer into a no-op.
 """
 
+import bisect
+import itertools
 import logging
+import math
+import os
+import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -31,146 +43,434 @@ class MetricValue:
     timestamp: float = field(default_factory=time.time)
 
 
-class Counter:
+@dataclass
+class MetricFamily:
     """
-    Counter metric - monotonically increasing value.
+    Metric samples produced on demand by a registered collector.
 
-    Use for: requests, errors, items processed
+    Samples are (suffix, labels, value); suffix is appended to the family
+    name, e.g. "_sum" / "_count" for summaries.
     """
+    name: str
+    type: MetricType
+    description: str
+    samples: List[Tuple[str, Dict[str, str], float]] = field(default_factory=list)
+
+    def add(self, value: float, suffix: str = "", **labels) -> None:
+        """Add a sample."""
+        self.samples.append((suffix, {k: str(v) for k, v in labels.items()}, value))
+
+
+# Default per-metric limit on distinct label combinations
+DEFAULT_MAX_SERIES = 1000
+
+# Label value used once a metric has reached its series limit
+OVERFLOW_LABEL = "__overflow__"
+
+
+class _Switch:
+    """Process-wide instrumentation switch."""
+
+    enabled = os.getenv("METRICS_ENABLED", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+_switch = _Switch()
+
+
+def set_enabled(enabled: bool) -> None:
+    """Enable or disable recording for every metric in the process."""
+    _switch.enabled = bool(enabled)
+
+
+def is_enabled() -> bool:
+    """Whether metrics are being recorded."""
+    return _switch.enabled
+
+
+class _LabeledMetric:
+    """Shared label handling: series keys, cardinality limit, lock."""
 
-    def __init__(self, name: str, description: str, labels: Optional[List[str]] = None):
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Optional[List[str]] = None,
+        max_series: int = DEFAULT_MAX_SERIES
+    ):
         self.name = name
         self.description = description
         self.labels = labels or []
+        self.max_series = max_series
+        self.overflowed = 0
+        self._lock = threading.Lock()
+
+    def _key(self, label_values: Dict[str, Any]) -> Tuple:
+        return tuple(label_values.get(l, "") for l in self.labels)
+
+    def _series_key(self, label_values: Dict[str, Any], series: Dict[Tuple, Any]) -> Tuple:
+        """Key for a write; new series beyond max_series share one overflow series."""
+        key = self._key(label_values)
+        if key in series or len(series) < self.max_series or not self.labels:
+            return key
+        self.overflowed += 1
+        if self.overflowed == 1:
+            logger.warning(
+                f"Metric {self.name} reached {self.max_series} label sets; "
+                f"new label values are recorded as {OVERFLOW_LABEL}"
+            )
+        return tuple(OVERFLOW_LABEL for _ in self.labels)
+
+
+class Counter(_LabeledMetric):
+    """
+    Counter metric - monotonically increasing value.
+
+    Use for: requests, errors, items processed
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Optional[List[str]] = None,
+        max_series: int = DEFAULT_MAX_SERIES
+    ):
+        super().__init__(name, description, labels, max_series)
         self._values: Dict[Tuple, float] = defaultdict(float)
 
     def inc(self, amount: float = 1, **label_values) -> None:
         """Increment counter."""
-        key = tuple(label_values.get(l, "") for l in self.labels)
-        self._values[key] += amount
+        if not _switch.enabled:
+            return
+        with self._lock:
+            self._values[self._series_key(label_values, self._values)] += amount
 
     def get(self, **label_values) -> float:
         """Get current value."""
-        key = tuple(label_values.get(l, "") for l in self.labels)
-        return self._values[key]
+        return self._values.get(self._key(label_values), 0.0)
 
     def collect(self) -> List[MetricValue]:
         """Collect all values."""
-        result = []
-        for key, value in self._values.items():
-            labels = dict(zip(self.labels, key))
-            result.append(MetricValue(value=value, labels=labels))
-        return result
+        with self._lock:
+            items = list(self._values.items())
+        return [MetricValue(value=value, labels=dict(zip(self.labels, key))) for key, value in items]
 
 
-class Gauge:
+class Gauge(_LabeledMetric):
     """
     Gauge metric - value that can go up and down.
 
     Use for: temperature, memory usage, active connections
     """
 
-    def __init__(self, name: str, description: str, labels: Optional[List[str]] = None):
-        self.name = name
-        self.description = description
-        self.labels = labels or []
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Optional[List[str]] = None,
+        max_series: int = DEFAULT_MAX_SERIES
+    ):
+        super().__init__(name, description, labels, max_series)
         self._values: Dict[Tuple, float] = defaultdict(float)
 
     def set(self, value: float, **label_values) -> None:
         """Set gauge value."""
-        key = tuple(label_values.get(l, "") for l in self.labels)
-        self._values[key] = value
+        if not _switch.enabled:
+            return
+        with self._lock:
+            self._values[self._series_key(label_values, self._values)] = value
 
     def inc(self, amount: float = 1, **label_values) -> None:
         """Increment gauge."""
-        key = tuple(label_values.get(l, "") for l in self.labels)
-        self._values[key] += amount
+        if not _switch.enabled:
+            return
+        with self._lock:
+            self._values[self._series_key(label_values, self._values)] += amount
 
     def dec(self, amount: float = 1, **label_values) -> None:
         """Decrement gauge."""
-        key = tuple(label_values.get(l, "") for l in self.labels)
-        self._values[key] -= amount
+        if not _switch.enabled:
+            return
+        with self._lock:
+            self._values[self._series_key(label_values, self._values)] -= amount
 
     def get(self, **label_values) -> float:
         """Get current value."""
-        key = tuple(label_values.get(l, "") for l in self.labels)
-        return self._values[key]
+        return self._values.get(self._key(label_values), 0.0)
 
     def collect(self) -> List[MetricValue]:
         """Collect all values."""
-        result = []
-        for key, value in self._values.items():
-            labels = dict(zip(self.labels, key))
-            result.append(MetricValue(value=value, labels=labels))
-        return result
+        with self._lock:
+            items = list(self._values.items())
+        return [MetricValue(value=value, labels=dict(zip(self.labels, key))) for key, value in items]
 
 
-class Histogram:
+class QuantileSketch:
+    """
+    Streaming quantile sketch with bounded relative error (DDSketch).
+
+    Values fall into logarithmic bins of ratio gamma = (1 + a) / (1 - a), so
+    any reported quantile is within relative accuracy ``a`` of the true
+    value. Sketches merge by adding bin counts, which is how sliding
+    windows are assembled.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048, min_value: float = 1e-9):
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _bin_value(self, index: int) -> float:
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value (count times)."""
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        if abs(value) < self.min_value:
+            self.zero_count += count
+            return
+        bins = self._positive if value > 0 else self._negative
+        index = self._index(abs(value))
+        bins[index] = bins.get(index, 0) + count
+        if len(bins) > self.max_bins:
+            self._collapse(bins)
+
+    def _collapse(self, bins: Dict[int, int]) -> None:
+        """Fold the lowest bins together (loses accuracy only at the low end)."""
+        ordered = sorted(bins)
+        excess = ordered[:len(ordered) - self.max_bins + 1]
+        target = ordered[len(excess)]
+        for index in excess:
+            bins[target] += bins.pop(index)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add another sketch's values (same relative accuracy)."""
+        if other.count == 0:
+            return
+        for mine, theirs in ((self._positive, other._positive), (self._negative, other._negative)):
+            for index, count in theirs.items():
+                mine[index] = mine.get(index, 0) + count
+            if len(mine) > self.max_bins:
+                self._collapse(mine)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated value at quantile q (0..1), or None when empty."""
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = 0
+
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                return max(self.min, -self._bin_value(index))
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._positive):
+            seen += self._positive[index]
+            if seen > rank:
+                return min(self.max, self._bin_value(index))
+        return self.max
+
+
+class _SlidingSketch:
+    """Quantile sketch over the last ``window`` seconds, kept in time slots."""
+
+    def __init__(self, window: float, slots: int, relative_accuracy: float):
+        self.window = window
+        self.slot_width = window / slots
+        self.relative_accuracy = relative_accuracy
+        self._slots: Deque[Tuple[int, QuantileSketch]] = deque()
+
+    def _expire(self, now: float) -> None:
+        oldest = int((now - self.window) // self.slot_width)
+        while self._slots and self._slots[0][0] < oldest:
+            self._slots.popleft()
+
+    def add(self, value: float, now: float) -> None:
+        slot = int(now // self.slot_width)
+        if not self._slots or self._slots[-1][0] != slot:
+            self._expire(now)
+            self._slots.append((slot, QuantileSketch(self.relative_accuracy)))
+        self._slots[-1][1].add(value)
+
+    def snapshot(self, now: float) -> QuantileSketch:
+        """Merged sketch of the window (covers up to one extra slot)."""
+        self._expire(now)
+        merged = QuantileSketch(self.relative_accuracy)
+        for _, sketch in self._slots:
+            merged.merge(sketch)
+        return merged
+
+
+def _window_label(seconds: float) -> str:
+    """60 -> "1m", 3600 -> "1h", 90 -> "90s"."""
+    for unit, size in (("h", 3600), ("m", 60)):
+        if seconds >= size and seconds % size == 0:
+            return f"{int(seconds // size)}{unit}"
+    return f"{int(seconds)}s"
+
+
+class _HistogramSeries:
+    """State of one label combination."""
+
+    def __init__(self, bucket_count: int, windows: Tuple[float, ...], slots: int, relative_accuracy: float):
+        self.bucket_counts = [0] * bucket_count
+        self.sum = 0.0
+        self.count = 0
+        self.sketch = QuantileSketch(relative_accuracy)
+        self.windows = {w: _SlidingSketch(w, slots, relative_accuracy) for w in windows}
+
+
+class Histogram(_LabeledMetric):
     """
     Histogram metric - distribution of values.
 
+    Keeps Prometheus buckets (bisect lookup, O(log buckets) per observe)
+    plus a quantile sketch over all observations and over sliding time
+    windows, so p95/p99 are available without choosing buckets up front.
+
     Use for: request duration, response size
     """
 
     DEFAULT_BUCKETS = (
         0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0, float("inf")
     )
+    DEFAULT_WINDOWS = (60.0, 300.0, 3600.0)
+    DEFAULT_QUANTILES = (0.5, 0.9, 0.95, 0.99)
 
     def __init__(
         self,
         name: str,
         description: str,
         labels: Optional[List[str]] = None,
-        buckets: Optional[Tuple[float, ...]] = None
+        buckets: Optional[Tuple[float, ...]] = None,
+        windows: Optional[Tuple[float, ...]] = None,
+        relative_accuracy: float = 0.01,
+        window_slots: int = 12,
+        max_series: int = DEFAULT_MAX_SERIES,
+        clock: Callable[[], float] = time.monotonic
     ):
-        self.name = name
-        self.description = description
-        self.labels = labels or []
-        self.buckets = buckets or self.DEFAULT_BUCKETS
-
-        self._bucket_counts: Dict[Tuple, Dict[float, int]] = defaultdict(
-            lambda: {b: 0 for b in self.buckets}
-        )
-        self._sums: Dict[Tuple, float] = defaultdict(float)
-        self._counts: Dict[Tuple, int] = defaultdict(int)
+        super().__init__(name, description, labels, max_series)
+        self.buckets = tuple(sorted(buckets or self.DEFAULT_BUCKETS))
+        if self.buckets[-1] != float("inf"):
+            self.buckets += (float("inf"),)
+        self.windows = tuple(windows if windows is not None else self.DEFAULT_WINDOWS)
+        self.relative_accuracy = relative_accuracy
+        self.window_slots = window_slots
+        self._clock = clock
+        self._series: Dict[Tuple, _HistogramSeries] = {}
 
     def observe(self, value: float, **label_values) -> None:
         """Observe a value."""
-        key = tuple(label_values.get(l, "") for l in self.labels)
-
-        self._sums[key] += value
-        self._counts[key] += 1
-
-        for bucket in self.buckets:
-            if value <= bucket:
-                self._bucket_counts[key][bucket] += 1
+        if not _switch.enabled:
+            return
+        now = self._clock()
+        with self._lock:
+            key = self._series_key(label_values, self._series)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(
+                    len(self.buckets), self.windows, self.window_slots, self.relative_accuracy
+                )
+
+            series.sum += value
+            series.count += 1
+            series.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+            series.sketch.add(value)
+            for window in series.windows.values():
+                window.add(value, now)
+
+    def _cumulative_buckets(self, series: _HistogramSeries) -> Dict[float, int]:
+        return dict(zip(self.buckets, itertools.accumulate(series.bucket_counts)))
+
+    def _describe(self, series: _HistogramSeries, now: float, quantiles: Tuple[float, ...]) -> Dict[str, Any]:
+        """Quantiles over all observations and per window (call under lock)."""
+        result = {"quantiles": {q: series.sketch.quantile(q) for q in quantiles}, "windows": {}}
+        for seconds, window in series.windows.items():
+            sketch = window.snapshot(now)
+            result["windows"][_window_label(seconds)] = {
+                "count": sketch.count,
+                "sum": sketch.sum,
+                "quantiles": {q: sketch.quantile(q) for q in quantiles},
+            }
+        return result
 
-    def get_summary(self, **label_values) -> Dict[str, float]:
+    def quantile(self, q: float, window: Optional[float] = None, **label_values) -> Optional[float]:
+        """
+        Estimated quantile for a label combination.
+
+        Args:
+            q: Quantile (0..1)
+            window: One of the configured windows in seconds (None: all time)
+        """
+        with self._lock:
+            series = self._series.get(self._key(label_values))
+            if series is None:
+                return None
+            if window is None:
+                return series.sketch.quantile(q)
+            return series.windows[window].snapshot(self._clock()).quantile(q)
+
+    def get_summary(self, **label_values) -> Dict[str, Any]:
         """Get histogram summary."""
-        key = tuple(label_values.get(l, "") for l in self.labels)
-
-        count = self._counts[key]
-        if count == 0:
-            return {"count": 0, "sum": 0, "avg": 0}
-
-        return {
-            "count": count,
-            "sum": self._sums[key],
-            "avg": self._sums[key] / count,
-            "buckets": dict(self._bucket_counts[key])
-        }
+        with self._lock:
+            series = self._series.get(self._key(label_values))
+            if series is None or series.count == 0:
+                return {"count": 0, "sum": 0, "avg": 0}
+
+            described = self._describe(series, self._clock(), self.DEFAULT_QUANTILES)
+            summary = {
+                "count": series.count,
+                "sum": series.sum,
+                "avg": series.sum / series.count,
+                "buckets": self._cumulative_buckets(series),
+                "windows": described["windows"],
+            }
+        for q, value in described["quantiles"].items():
+            summary[f"p{q * 100:g}"] = value
+        return summary
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def collect(self, quantiles: Optional[Tuple[float, ...]] = None) -> List[Dict[str, Any]]:
         """Collect all histogram data."""
+        quantiles = quantiles or self.DEFAULT_QUANTILES
+        now = self._clock()
         result = []
-        for key in self._counts.keys():
-            labels = dict(zip(self.labels, key))
-            result.append({
-                "labels": labels,
-                "count": self._counts[key],
-                "sum": self._sums[key],
-                "buckets": dict(self._bucket_counts[key])
-            })
+        with self._lock:
+            for key, series in self._series.items():
+                result.append({
+                    "labels": dict(zip(self.labels, key)),
+                    "count": series.count,
+                    "sum": series.sum,
+                    "buckets": self._cumulative_buckets(series),
+                    **self._describe(series, now, quantiles),
+                })
         return result
 
 
@@ -185,6 +485,7 @@ class MetricsCollector:
         self._counters: Dict[str, Counter] = {}
         self._gauges: Dict[str, Gauge] = {}
         self._histograms: Dict[str, Histogram] = {}
+        self._collectors: Dict[str, Callable[[], List[MetricFamily]]] = {}
 
         # Pre-defined metrics
         self._setup_default_metrics()
@@ -257,10 +558,11 @@ class MetricsCollector:
         self,
         name: str,
         description: str,
-        labels: Optional[List[str]] = None
+        labels: Optional[List[str]] = None,
+        max_series: int = DEFAULT_MAX_SERIES
     ) -> Counter:
         """Create and register a counter."""
-        counter = Counter(name, description, labels)
+        counter = Counter(name, description, labels, max_series=max_series)
         self._counters[name] = counter
         return counter
 
@@ -268,10 +570,11 @@ class MetricsCollector:
         self,
         name: str,
         description: str,
-        labels: Optional[List[str]] = None
+        labels: Optional[List[str]] = None,
+        max_series: int = DEFAULT_MAX_SERIES
     ) -> Gauge:
         """Create and register a gauge."""
-        gauge = Gauge(name, description, labels)
+        gauge = Gauge(name, description, labels, max_series=max_series)
         self._gauges[name] = gauge
         return gauge
 
@@ -280,13 +583,82 @@ class MetricsCollector:
         name: str,
         description: str,
         labels: Optional[List[str]] = None,
-        buckets: Optional[Tuple[float, ...]] = None
+        buckets: Optional[Tuple[float, ...]] = None,
+        windows: Optional[Tuple[float, ...]] = None,
+        max_series: int = DEFAULT_MAX_SERIES
     ) -> Histogram:
-        """Create and register a histogram."""
-        histogram = Histogram(name, description, labels, buckets)
+        """
+        Create and register a histogram.
+
+        Args:
+            windows: Sliding quantile windows in seconds (default 1m, 5m, 1h)
+            max_series: Label combinations kept before folding into __overflow__
+        """
+        histogram = Histogram(name, description, labels, buckets, windows=windows, max_series=max_series)
         self._histograms[name] = histogram
         return histogram
 
+    def _ensure(self, name: str, registry: Dict[str, Any], create: Callable[[], Any]):
+        metric = registry.get(name)
+        if metric is not None:
+            return metric
+        for other in (self._counters, self._gauges, self._histograms):
+            if other is not registry and name in other:
+                raise ValueError(f"Metric {name} is already registered with another type")
+        return create()
+
+    def get_or_create_counter(
+        self,
+        name: str,
+        description: str = "",
+        labels: Optional[List[str]] = None
+    ) -> Counter:
+        """Registered counter, created on first use."""
+        return self._ensure(name, self._counters, lambda: self.create_counter(name, description or name, labels))
+
+    def get_or_create_gauge(
+        self,
+        name: str,
+        description: str = "",
+        labels: Optional[List[str]] = None
+    ) -> Gauge:
+        """Registered gauge, created on first use."""
+        return self._ensure(name, self._gauges, lambda: self.create_gauge(name, description or name, labels))
+
+    def get_or_create_histogram(
+        self,
+        name: str,
+        description: str = "",
+        labels: Optional[List[str]] = None,
+        buckets: Optional[Tuple[float, ...]] = None
+    ) -> Histogram:
+        """Registered histogram, created on first use."""
+        return self._ensure(
+            name, self._histograms, lambda: self.create_histogram(name, description or name, labels, buckets)
+        )
+
+    def register_collector(self, name: str, collect: Callable[[], List[MetricFamily]]) -> None:
+        """
+        Register a callback whose metric families are exported on demand.
+
+        Use for components that keep their own statistics (e.g. the query
+        profiler) instead of updating metrics on every event.
+        """
+        self._collectors[name] = collect
+
+    def unregister_collector(self, name: str) -> None:
+        """Remove a registered collector."""
+        self._collectors.pop(name, None)
+
+    def _collect_families(self) -> List[MetricFamily]:
+        families = []
+        for name, collect in list(self._collectors.items()):
+            try:
+                families.extend(collect())
+            except Exception as e:
+                logger.error(f"Metrics collector {name} failed: {e}")
+        return families
+
     # =========================================================================
     # Metric Access
     # =========================================================================
@@ -303,12 +675,38 @@ class MetricsCollector:
         """Get histogram by name."""
         return self._histograms.get(name)
 
+    def total(self, name: str) -> float:
+        """Sum of a counter or gauge over all label sets (0 if unknown)."""
+        metric = self._counters.get(name) or self._gauges.get(name)
+        if metric is None:
+            return 0.0
+        return sum(value.value for value in metric.collect())
+
+    def timer(self, histogram_name: str, description: str = "", **label_values) -> "Timer":
+        """
+        Time a block or function into a histogram, in seconds.
+
+        Usage:
+            with metrics_collector.timer("tts_duration_seconds", provider="google") as t:
+                synthesize()
+            t.elapsed  # seconds
+
+            @metrics_collector.timer("report_seconds", report="weekly")
+            def build_report(): ...
+        """
+        if not _switch.enabled:
+            return _NULL_TIMER
+        histogram = self.get_or_create_histogram(histogram_name, description, sorted(label_values))
+        return Timer(histogram, label_values)
+
     # =========================================================================
     # Collection & Export
     # =========================================================================
 
     def collect_all(self) -> Dict[str, Any]:
         """Collect all metrics."""
+        # Collectors run first: some refresh shared gauges (system metrics)
+        families = self._collect_families()
         return {
             "counters": {
                 name: counter.collect()
@@ -321,6 +719,15 @@ class MetricsCollector:
             "histograms": {
                 name: histogram.collect()
                 for name, histogram in self._histograms.items()
+            },
+            "overflowed_series": {
+                metric.name: metric.overflowed
+                for metric in [*self._counters.values(), *self._gauges.values(), *self._histograms.values()]
+                if metric.overflowed
+            },
+            "collected": {
+                family.name: family.samples
+                for family in families
             }
         }
 
@@ -328,6 +735,9 @@ class MetricsCollector:
         """Export metrics in Prometheus format."""
         lines = []
 
+        # Collectors run first: some refresh shared gauges (system metrics)
+        families = self._collect_families()
+
         # Counters
         for name, counter in self._counters.items():
             lines.append(f"# HELP {name} {counter.description}")
@@ -351,33 +761,194 @@ class MetricsCollector:
             lines.append(f"# HELP {name} {histogram.description}")
             lines.append(f"# TYPE {name} histogram")
 
-            for data in histogram.collect():
+            collected = histogram.collect()
+            for data in collected:
                 label_str = self._format_labels(data["labels"])
 
                 # Buckets
                 for bucket, count in data["buckets"].items():
-                    bucket_labels = {**data["labels"], "le": str(bucket)}
+                    bucket_labels = {**data["labels"], "le": self._format_bound(bucket)}
                     bucket_label_str = self._format_labels(bucket_labels)
                     lines.append(f"{name}_bucket{bucket_label_str} {count}")
 
                 lines.append(f"{name}_sum{label_str} {data['sum']}")
                 lines.append(f"{name}_count{label_str} {data['count']}")
 
-        return "\n".join(lines)
+            # Sliding-window quantiles (a separate family: histograms cannot carry quantiles)
+            window_lines = []
+            for data in collected:
+                for window, stats in data["windows"].items():
+                    for q, value in stats["quantiles"].items():
+                        if value is None:
+                            continue
+                        labels = {**data["labels"], "window": window, "quantile": f"{q:g}"}
+                        window_lines.append(f"{name}_window_quantile{self._format_labels(labels)} {value}")
+            if window_lines:
+                lines.append(f"# HELP {name}_window_quantile {histogram.description} (sliding-window quantiles)")
+                lines.append(f"# TYPE {name}_window_quantile gauge")
+                lines.extend(window_lines)
+
+        # Registered collectors
+        for family in families:
+            lines.append(f"# HELP {family.name} {family.description}")
+            lines.append(f"# TYPE {family.name} {family.type.value}")
+
+            for suffix, labels, value in family.samples:
+                label_str = self._format_labels(labels)
+                lines.append(f"{family.name}{suffix}{label_str} {value}")
+
+        return "\n".join(lines) + "\n"
 
     def _format_labels(self, labels: Dict[str, str]) -> str:
         """Format labels for Prometheus."""
         if not labels:
             return ""
 
-        parts = [f'{k}="{v}"' for k, v in labels.items()]
+        parts = [f'{k}="{self._escape_label(v)}"' for k, v in labels.items()]
         return "{" + ",".join(parts) + "}"
 
+    @staticmethod
+    def _format_bound(bound: float) -> str:
+        """Bucket bound as Prometheus expects it ("+Inf" for infinity)."""
+        return "+Inf" if bound == float("inf") else str(bound)
+
+    @staticmethod
+    def _escape_label(value: Any) -> str:
+        """Escape a label value (backslash, quote, newline)."""
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Timer:
+    """Context manager / decorator recording elapsed seconds into a histogram."""
+
+    __slots__ = ("histogram", "labels", "elapsed", "_start")
+
+    def __init__(self, histogram: Optional[Histogram], labels: Dict[str, Any]):
+        self.histogram = histogram
+        self.labels = labels
+        self.elapsed = 0.0
+        self._start = 0.0
+
+    def __enter__(self) -> "Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.elapsed = time.perf_counter() - self._start
+        if self.histogram is not None:
+            self.histogram.observe(self.elapsed, **self.labels)
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        histogram, labels = self.histogram, self.labels
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if not _switch.enabled:
+                return await func(*args, **kwargs)
+            with Timer(histogram, labels):
+                return await func(*args, **kwargs)
+
+        @wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            if not _switch.enabled:
+                return func(*args, **kwargs)
+            with Timer(histogram, labels):
+                return func(*args, **kwargs)
+
+        import asyncio
+        if asyncio.iscoroutinefunction(func):
+            return async_wrapper
+        return sync_wrapper
+
+
+# Shared no-op timer returned while metrics are disabled
+_NULL_TIMER = Timer(None, {})
+
 
 # Singleton instance
 metrics_collector = MetricsCollector()
 
 
+def timer(histogram_name: str, description: str = "", **label_values) -> Timer:
+    """Shortcut for metrics_collector.timer()."""
+    return metrics_collector.timer(histogram_name, description, **label_values)
+
+
+# =========================================================================
+# Exporter
+# =========================================================================
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves metrics_collector on GET /metrics."""
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = metrics_collector.to_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def start_metrics_server(port: Optional[int] = None, host: str = "0.0.0.0") -> Optional[int]:
+    """
+    Serve /metrics from a background thread.
+
+    For processes without their own HTTP app (the Streamlit app). Safe to
+    call repeatedly; only the first call starts a server.
+
+    Args:
+        port: Listen port (default: METRICS_PORT or 9464; 0 disables)
+        host: Listen address
+
+    Returns:
+        Bound port, or None when disabled or the port is unavailable
+    """
+    global _server
+
+    if port is None:
+        port = int(os.getenv("METRICS_PORT", "9464"))
+    if port <= 0:
+        return None
+
+    with _server_lock:
+        if _server is not None:
+            return _server.server_address[1]
+        try:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError as e:
+            logger.warning(f"Metrics server not started on {host}:{port}: {e}")
+            return None
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+        logger.info(f"Metrics server listening on {host}:{_server.server_address[1]}/metrics")
+        return _server.server_address[1]
+
+
+def stop_metrics_server() -> None:
+    """Stop the background metrics server."""
+    global _server
+
+    with _server_lock:
+        if _server is not None:
+            _server.shutdown()
+            _server.server_close()
+            _server = None
+
+
 # =========================================================================
 # Decorators
 # =========================================================================
@@ -395,22 +966,22 @@ def measure_time(histogram_name: str, **label_values):
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
             histogram = metrics_collector.histogram(histogram_name)
-            start = time.time()
+            start = time.perf_counter()
             try:
                 return await func(*args, **kwargs)
             finally:
                 if histogram:
-                    histogram.observe(time.time() - start, **label_values)
+                    histogram.observe(time.perf_counter() - start, **label_values)
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
             histogram = metrics_collector.histogram(histogram_name)
-            start = time.time()
+            start = time.perf_counter()
             try:
                 return func(*args, **kwargs)
             finally:
                 if histogram:
-                    histogram.observe(time.time() - start, **label_values)
+                    histogram.observe(time.perf_counter() - start, **label_values)
 
         import asyncio
         if asyncio.iscoroutinefunction(func):
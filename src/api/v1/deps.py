@@ -17,6 +17,7 @@ from src.infrastructure.container import (
     get_job_service,
     get_recommendation_service
 )
+from src.infrastructure.async_dispatch import AsyncServiceFacade, async_facade
 from src.services.auth_service import AuthService
 from src.services.user_service import UserService
 from src.services.payment_service import PaymentService
@@ -138,3 +139,20 @@ def job_service() -> JobService:
 
 def recommendation_service() -> RecommendationService:
     return get_recommendation_service()
+
+
+# Awaitable service dependencies for async endpoints (calls run on worker threads)
+def async_user_service() -> AsyncServiceFacade[UserService]:
+    return async_facade(get_user_service())
+
+
+def async_mentor_service() -> AsyncServiceFacade[MentorService]:
+    return async_facade(get_mentor_service())
+
+
+def async_job_service() -> AsyncServiceFacade[JobService]:
+    return async_facade(get_job_service())
+
+
+def async_recommendation_service() -> AsyncServiceFacade[RecommendationService]:
+    return async_facade(get_recommendation_service())
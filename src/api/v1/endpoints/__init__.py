@@ -6,7 +6,8 @@ from src.api.v1.endpoints import (
     payments,
     mentors,
     jobs,
-    recommendations
+    recommendations,
+    admin
 )
 
 __all__ = [
@@ -15,5 +16,6 @@ __all__ = [
     "payments",
     "mentors",
     "jobs",
-    "recommendations"
+    "recommendations",
+    "admin"
 ]
@@ -0,0 +1,60 @@
+"""
+Admin endpoints.
+
+Operational views for administrators (query profiling).
+Prometheus metrics are served on the application's /metrics route.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.api.v1.deps import get_admin_user
+from src.config.settings import get_settings
+from src.core.models.user import User
+
+router = APIRouter()
+
+
+def _get_query_profiler():
+    """Query profiler, imported only when enabled (SQLAlchemy is optional)."""
+    if not get_settings().database.profile_queries:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Query profiling is disabled (set DB_PROFILE_QUERIES=true)"
+        )
+    from src.database.query_optimizer import query_profiler
+    return query_profiler
+
+
+@router.get("/queries")
+async def get_query_profile(
+    limit: int = Query(50, ge=1, le=500),
+    order_by: str = Query("total_ms", pattern="^(total_ms|count|avg_ms|p95_ms|p99_ms|max_ms|rows)$"),
+    admin_user: User = Depends(get_admin_user)
+):
+    """Get SQL statistics by normalized statement and N+1 findings (admin only)."""
+    query_profiler = _get_query_profiler()
+    return {
+        "summary": query_profiler.get_summary(),
+        "fingerprints": query_profiler.get_fingerprint_stats(limit=limit, order_by=order_by),
+        "n_plus_one": query_profiler.get_n_plus_one(limit=limit),
+        "slow_queries": [
+            {
+                "query": s.query,
+                "fingerprint": s.fingerprint,
+                "duration_ms": round(s.duration_ms, 3),
+                "rows_affected": s.rows_affected,
+                "timestamp": s.timestamp,
+            }
+            for s in query_profiler.get_slow_queries()[-limit:]
+        ],
+    }
+
+
+@router.delete("/queries")
+async def reset_query_profile(
+    admin_user: User = Depends(get_admin_user)
+):
+    """Reset query profiling statistics (admin only)."""
+    _get_query_profiler().clear()
+    return {"message": "Query statistics cleared"}
+
@@ -13,8 +13,9 @@ from src.api.v1.deps import (
     get_current_user,
     get_current_active_user,
     get_admin_user,
-    job_service
+    async_job_service
 )
+from src.infrastructure.async_dispatch import AsyncServiceFacade
 from src.services.job_service import JobService
 from src.core.models.job import JobType, RecruitmentStatus, JobSearchCriteria
 from src.core.models.user import User
@@ -88,7 +89,7 @@ async def list_jobs(
     is_domestic: Optional[bool] = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    job_svc: JobService = Depends(job_service)
+    job_svc: AsyncServiceFacade[JobService] = Depends(async_job_service)
 ):
     """List job postings with filters."""
     criteria = JobSearchCriteria(
@@ -100,7 +101,7 @@ async def list_jobs(
         page_size=page_size
     )
 
-    result = job_svc.search_jobs(criteria)
+    result = await job_svc.search_jobs(criteria)
 
     items = []
     for job in result["items"]:
@@ -131,10 +132,10 @@ async def list_jobs(
 
 @router.get("/open")
 async def get_open_jobs(
-    job_svc: JobService = Depends(job_service)
+    job_svc: AsyncServiceFacade[JobService] = Depends(async_job_service)
 ):
     """Get all currently open job postings."""
-    jobs = job_svc.get_open_jobs()
+    jobs = await job_svc.get_open_jobs()
     items = []
     for job in jobs:
         airline_name = job_svc.AIRLINE_NAMES.get(job.airline_code, job.airline_code)
@@ -159,10 +160,10 @@ async def get_open_jobs(
 @router.get("/upcoming-deadlines")
 async def get_upcoming_deadlines(
     days: int = Query(7, ge=1, le=30),
-    job_svc: JobService = Depends(job_service)
+    job_svc: AsyncServiceFacade[JobService] = Depends(async_job_service)
 ):
     """Get jobs with deadlines within N days."""
-    jobs = job_svc.get_upcoming_deadlines(days)
+    jobs = await job_svc.get_upcoming_deadlines(days)
     items = []
     for job in jobs:
         airline_name = job_svc.AIRLINE_NAMES.get(job.airline_code, job.airline_code)
@@ -186,10 +187,10 @@ async def get_upcoming_deadlines(
 
 @router.get("/airlines", response_model=List[AirlineSummaryResponse])
 async def get_airline_summary(
-    job_svc: JobService = Depends(job_service)
+    job_svc: AsyncServiceFacade[JobService] = Depends(async_job_service)
 ):
     """Get summary of job postings by airline."""
-    summary = job_svc.get_airline_summary()
+    summary = await job_svc.get_airline_summary()
     return [
         AirlineSummaryResponse(
             code=data["code"],
@@ -204,11 +205,11 @@ async def get_airline_summary(
 @router.get("/{job_id}", response_model=JobPostingResponse)
 async def get_job(
     job_id: str,
-    job_svc: JobService = Depends(job_service)
+    job_svc: AsyncServiceFacade[JobService] = Depends(async_job_service)
 ):
     """Get job posting details."""
     try:
-        job = job_svc.get_job(job_id)
+        job = await job_svc.get_job(job_id)
         airline_name = job_svc.AIRLINE_NAMES.get(job.airline_code, job.airline_code)
         return JobPostingResponse(
             id=job.id,
@@ -239,10 +240,10 @@ async def get_job(
 @router.get("/alerts/my", response_model=Optional[JobAlertResponse])
 async def get_my_alert(
     current_user: User = Depends(get_current_active_user),
-    job_svc: JobService = Depends(job_service)
+    job_svc: AsyncServiceFacade[JobService] = Depends(async_job_service)
 ):
     """Get current user's job alert preferences."""
-    alert = job_svc.get_user_alert(current_user.id)
+    alert = await job_svc.get_user_alert(current_user.id)
     if not alert:
         return None
 
@@ -261,7 +262,7 @@ async def get_my_alert(
 async def save_my_alert(
     request: JobAlertRequest,
     current_user: User = Depends(get_current_active_user),
-    job_svc: JobService = Depends(job_service)
+    job_svc: AsyncServiceFacade[JobService] = Depends(async_job_service)
 ):
     """Save current user's job alert preferences."""
     alert_data = {
@@ -273,7 +274,7 @@ async def save_my_alert(
         "notify_deadline_1_day": request.notify_deadline_1_day
     }
 
-    alert = job_svc.save_user_alert(current_user.id, alert_data)
+    alert = await job_svc.save_user_alert(current_user.id, alert_data)
 
     return JobAlertResponse(
         id=alert.id,
@@ -293,27 +294,27 @@ async def save_my_alert(
 @router.get("/stats")
 async def get_job_stats(
     admin_user: User = Depends(get_admin_user),
-    job_svc: JobService = Depends(job_service)
+    job_svc: AsyncServiceFacade[JobService] = Depends(async_job_service)
 ):
     """Get job posting statistics (admin only)."""
-    return job_svc.get_stats()
+    return await job_svc.get_stats()
 
 
 @router.post("/close-expired")
 async def close_expired_jobs(
     admin_user: User = Depends(get_admin_user),
-    job_svc: JobService = Depends(job_service)
+    job_svc: AsyncServiceFacade[JobService] = Depends(async_job_service)
 ):
     """Close expired job postings (admin only)."""
-    count = job_svc.close_expired_jobs()
+    count = await job_svc.close_expired_jobs()
     return {"message": f"Closed {count} expired job postings"}
 
 
 @router.post("/process-alerts")
 async def process_deadline_alerts(
     admin_user: User = Depends(get_admin_user),
-    job_svc: JobService = Depends(job_service)
+    job_svc: AsyncServiceFacade[JobService] = Depends(async_job_service)
 ):
     """Process and send deadline alerts (admin only)."""
-    results = job_svc.process_deadline_alerts()
+    results = await job_svc.process_deadline_alerts()
     return results
@@ -14,8 +14,9 @@ from src.api.v1.deps import (
     get_current_active_user,
     get_premium_user,
     get_admin_user,
-    mentor_service
+    async_mentor_service
 )
+from src.infrastructure.async_dispatch import AsyncServiceFacade, run_blocking
 from src.services.mentor_service import MentorService
 from src.core.models.mentor import (
     MentorCreate, SessionCreate, MentorType, SessionType, SessionStatus
@@ -115,13 +116,13 @@ async def search_mentors(
     max_rate: Optional[int] = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Search mentors with filters."""
     mentor_type_enum = MentorType(mentor_type) if mentor_type else None
     session_type_enum = SessionType(session_type) if session_type else None
 
-    result = mentor_svc.search_mentors(
+    result = await mentor_svc.search_mentors(
         query=query,
         mentor_type=mentor_type_enum,
         airline=airline,
@@ -163,10 +164,10 @@ async def search_mentors(
 async def get_recommended_mentors(
     limit: int = Query(5, ge=1, le=20),
     current_user: User = Depends(get_current_active_user),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Get recommended mentors for current user."""
-    mentors = mentor_svc.get_recommended_mentors(current_user.id, limit)
+    mentors = await mentor_svc.get_recommended_mentors(current_user.id, limit)
     return [
         MentorResponse(
             id=m.id,
@@ -191,11 +192,11 @@ async def get_recommended_mentors(
 @router.get("/{mentor_id}", response_model=MentorResponse)
 async def get_mentor(
     mentor_id: str,
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Get mentor details."""
     try:
-        mentor = mentor_svc.get_mentor(mentor_id)
+        mentor = await mentor_svc.get_mentor(mentor_id)
         return MentorResponse(
             id=mentor.id,
             user_id=mentor.user_id,
@@ -223,12 +224,12 @@ async def get_mentor(
 async def get_mentor_availability(
     mentor_id: str,
     target_date: str = Query(..., description="Date in YYYY-MM-DD format"),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Get available time slots for a mentor on a specific date."""
     try:
         parsed_date = date.fromisoformat(target_date)
-        slots = mentor_svc.get_available_slots(mentor_id, parsed_date)
+        slots = await mentor_svc.get_available_slots(mentor_id, parsed_date)
         return {"date": target_date, "available_slots": slots}
     except NotFoundError:
         raise HTTPException(
@@ -246,7 +247,7 @@ async def get_mentor_availability(
 async def register_as_mentor(
     request: MentorCreateRequest,
     current_user: User = Depends(get_current_active_user),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Register current user as a mentor."""
     try:
@@ -263,7 +264,7 @@ async def register_as_mentor(
             available_days=request.available_days,
             available_times=request.available_times
         )
-        mentor = mentor_svc.register_mentor(mentor_data)
+        mentor = await mentor_svc.register_mentor(mentor_data)
         return MentorResponse(
             id=mentor.id,
             user_id=mentor.user_id,
@@ -295,7 +296,7 @@ async def register_as_mentor(
 async def create_session(
     request: SessionCreateRequest,
     current_user: User = Depends(get_premium_user),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Book a mentoring session (premium users only)."""
     try:
@@ -308,7 +309,7 @@ async def create_session(
             duration_minutes=request.duration_minutes,
             notes=request.notes
         )
-        session = mentor_svc.create_session(session_data)
+        session = await mentor_svc.create_session(session_data)
         return SessionResponse(
             id=session.id,
             mentor_id=session.mentor_id,
@@ -334,11 +335,11 @@ async def get_my_sessions(
     is_mentor: bool = Query(False),
     session_status: Optional[str] = None,
     current_user: User = Depends(get_current_active_user),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Get current user's sessions."""
     status_enum = SessionStatus(session_status) if session_status else None
-    sessions = mentor_svc.get_user_sessions(current_user.id, is_mentor, status_enum)
+    sessions = await mentor_svc.get_user_sessions(current_user.id, is_mentor, status_enum)
     return [
         SessionResponse(
             id=s.id,
@@ -361,10 +362,10 @@ async def get_my_sessions(
 async def get_upcoming_sessions(
     is_mentor: bool = Query(False),
     current_user: User = Depends(get_current_active_user),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Get upcoming sessions."""
-    sessions = mentor_svc.get_upcoming_sessions(current_user.id, is_mentor)
+    sessions = await mentor_svc.get_upcoming_sessions(current_user.id, is_mentor)
     return [
         SessionResponse(
             id=s.id,
@@ -387,18 +388,18 @@ async def get_upcoming_sessions(
 async def confirm_session(
     session_id: str,
     current_user: User = Depends(get_current_active_user),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Confirm a session (mentor action)."""
     try:
         # Get mentor profile for current user
-        mentor = mentor_svc.mentor_repo.get_by_user_id(current_user.id)
+        mentor = await run_blocking(mentor_svc.mentor_repo.get_by_user_id, current_user.id)
         if not mentor:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not a mentor"
             )
-        session = mentor_svc.confirm_session(session_id, mentor.id)
+        session = await mentor_svc.confirm_session(session_id, mentor.id)
         return {"message": "Session confirmed", "meeting_link": session.meeting_link}
     except (AuthorizationError, BookingError) as e:
         raise HTTPException(
@@ -412,11 +413,11 @@ async def cancel_session(
     session_id: str,
     request: SessionCancelRequest,
     current_user: User = Depends(get_current_active_user),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Cancel a session."""
     try:
-        session = mentor_svc.cancel_session(session_id, current_user.id, request.reason)
+        session = await mentor_svc.cancel_session(session_id, current_user.id, request.reason)
         return {"message": "Session cancelled"}
     except CancellationNotAllowedError as e:
         raise HTTPException(
@@ -429,11 +430,11 @@ async def cancel_session(
 async def complete_session(
     session_id: str,
     current_user: User = Depends(get_current_active_user),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Mark session as completed (mentor action)."""
     try:
-        session = mentor_svc.complete_session(session_id)
+        session = await mentor_svc.complete_session(session_id)
         return {"message": "Session completed"}
     except BookingError as e:
         raise HTTPException(
@@ -447,7 +448,7 @@ async def review_session(
     session_id: str,
     request: ReviewRequest,
     current_user: User = Depends(get_current_active_user),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Add review for a completed session."""
     try:
@@ -456,7 +457,7 @@ async def review_session(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Rating must be between 1 and 5"
             )
-        session = mentor_svc.add_review(
+        session = await mentor_svc.add_review(
             session_id,
             current_user.id,
             request.rating,
@@ -478,11 +479,11 @@ async def review_session(
 async def verify_mentor(
     mentor_id: str,
     admin_user: User = Depends(get_admin_user),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Verify a mentor (admin only)."""
     try:
-        mentor = mentor_svc.verify_mentor(mentor_id, admin_user.id)
+        mentor = await mentor_svc.verify_mentor(mentor_id, admin_user.id)
         return {"message": "Mentor verified"}
     except NotFoundError:
         raise HTTPException(
@@ -494,7 +495,7 @@ async def verify_mentor(
 @router.get("/stats")
 async def get_mentor_stats(
     admin_user: User = Depends(get_admin_user),
-    mentor_svc: MentorService = Depends(mentor_service)
+    mentor_svc: AsyncServiceFacade[MentorService] = Depends(async_mentor_service)
 ):
     """Get mentor and session statistics (admin only)."""
-    return mentor_svc.get_stats()
+    return await mentor_svc.get_stats()
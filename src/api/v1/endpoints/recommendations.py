@@ -12,8 +12,9 @@ from src.api.v1.deps import (
     get_current_user,
     get_current_active_user,
     get_premium_user,
-    recommendation_service
+    async_recommendation_service
 )
+from src.infrastructure.async_dispatch import AsyncServiceFacade
 from src.services.recommendation_service import RecommendationService
 from src.core.models.recommendation import (
     SkillCategory, ContentType, DifficultyLevel, LearningActivity
@@ -104,10 +105,10 @@ class StudyPlanResponse(BaseModel):
 @router.get("/profile", response_model=SkillSummaryResponse)
 async def get_skill_profile(
     current_user: User = Depends(get_current_active_user),
-    rec_svc: RecommendationService = Depends(recommendation_service)
+    rec_svc: AsyncServiceFacade[RecommendationService] = Depends(async_recommendation_service)
 ):
     """Get current user's skill profile summary."""
-    summary = rec_svc.get_skill_summary(current_user.id)
+    summary = await rec_svc.get_skill_summary(current_user.id)
     return SkillSummaryResponse(
         readiness_score=summary["readiness_score"],
         skills=summary["skills"],
@@ -124,7 +125,7 @@ async def get_skill_profile(
 async def update_skill(
     request: SkillUpdateRequest,
     current_user: User = Depends(get_current_active_user),
-    rec_svc: RecommendationService = Depends(recommendation_service)
+    rec_svc: AsyncServiceFacade[RecommendationService] = Depends(async_recommendation_service)
 ):
     """Update a specific skill score."""
     try:
@@ -134,7 +135,7 @@ async def update_skill(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Score must be between 0 and 100"
             )
-        profile = rec_svc.update_skill(current_user.id, skill, request.score)
+        profile = await rec_svc.update_skill(current_user.id, skill, request.score)
         return {"message": "Skill updated", "new_score": request.score}
     except ValueError:
         raise HTTPException(
@@ -147,7 +148,7 @@ async def update_skill(
 async def record_activity(
     request: ActivityRecordRequest,
     current_user: User = Depends(get_current_active_user),
-    rec_svc: RecommendationService = Depends(recommendation_service)
+    rec_svc: AsyncServiceFacade[RecommendationService] = Depends(async_recommendation_service)
 ):
     """Record a learning activity."""
     try:
@@ -159,7 +160,7 @@ async def record_activity(
             completed=request.completed,
             score=request.score
         )
-        profile = rec_svc.record_activity(activity)
+        profile = await rec_svc.record_activity(activity)
         return {"message": "Activity recorded"}
     except ValueError as e:
         raise HTTPException(
@@ -177,14 +178,14 @@ async def get_recommendations(
     limit: int = Query(5, ge=1, le=20),
     include_premium: bool = Query(False),
     current_user: User = Depends(get_current_active_user),
-    rec_svc: RecommendationService = Depends(recommendation_service)
+    rec_svc: AsyncServiceFacade[RecommendationService] = Depends(async_recommendation_service)
 ):
     """Get personalized learning recommendations."""
     # Premium content for premium users only
     if include_premium and current_user.subscription_tier.value == "free":
         include_premium = False
 
-    recs = rec_svc.get_recommendations(
+    recs = await rec_svc.get_recommendations(
         current_user.id,
         limit=limit,
         include_premium=include_premium
@@ -209,10 +210,10 @@ async def get_recommendations(
 @router.get("/daily-missions", response_model=List[RecommendationResponse])
 async def get_daily_missions(
     current_user: User = Depends(get_current_active_user),
-    rec_svc: RecommendationService = Depends(recommendation_service)
+    rec_svc: AsyncServiceFacade[RecommendationService] = Depends(async_recommendation_service)
 ):
     """Get today's learning missions."""
-    missions = rec_svc.get_daily_missions(current_user.id)
+    missions = await rec_svc.get_daily_missions(current_user.id)
     return [
         RecommendationResponse(
             content_id=m.content_id,
@@ -234,10 +235,10 @@ async def generate_study_plan(
     weeks: int = Query(4, ge=1, le=12),
     target_airline: Optional[str] = None,
     current_user: User = Depends(get_premium_user),
-    rec_svc: RecommendationService = Depends(recommendation_service)
+    rec_svc: AsyncServiceFacade[RecommendationService] = Depends(async_recommendation_service)
 ):
     """Generate a personalized study plan (premium only)."""
-    plan = rec_svc.generate_study_plan(
+    plan = await rec_svc.generate_study_plan(
         current_user.id,
         weeks=weeks,
         target_airline=target_airline
@@ -282,14 +283,14 @@ async def search_content(
     difficulty: Optional[str] = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    rec_svc: RecommendationService = Depends(recommendation_service)
+    rec_svc: AsyncServiceFacade[RecommendationService] = Depends(async_recommendation_service)
 ):
     """Search learning content."""
     skill_enum = SkillCategory(skill) if skill else None
     type_enum = ContentType(content_type) if content_type else None
     diff_enum = DifficultyLevel(difficulty) if difficulty else None
 
-    result = rec_svc.search_content(
+    result = await rec_svc.search_content(
         query=query,
         skill=skill_enum,
         content_type=type_enum,
@@ -325,10 +326,10 @@ async def search_content(
 @router.get("/content/{content_id}", response_model=ContentResponse)
 async def get_content(
     content_id: str,
-    rec_svc: RecommendationService = Depends(recommendation_service)
+    rec_svc: AsyncServiceFacade[RecommendationService] = Depends(async_recommendation_service)
 ):
     """Get learning content details."""
-    content = rec_svc.get_content(content_id)
+    content = await rec_svc.get_content(content_id)
     if not content:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
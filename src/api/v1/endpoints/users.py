@@ -12,8 +12,9 @@ from src.api.v1.deps import (
     get_current_user,
     get_current_active_user,
     get_admin_user,
-    user_service
+    async_user_service
 )
+from src.infrastructure.async_dispatch import AsyncServiceFacade
 from src.services.user_service import UserService
 from src.core.models.user import User
 from src.core.exceptions import NotFoundError, ValidationError
@@ -78,7 +79,7 @@ class UserListResponse(BaseModel):
 @router.get("/me", response_model=UserProfileResponse)
 async def get_my_profile(
     current_user: User = Depends(get_current_active_user),
-    user_svc: UserService = Depends(user_service)
+    user_svc: AsyncServiceFacade[UserService] = Depends(async_user_service)
 ):
     """Get current user's full profile."""
     return UserProfileResponse(
@@ -100,12 +101,12 @@ async def get_my_profile(
 async def update_my_profile(
     request: UserUpdateRequest,
     current_user: User = Depends(get_current_active_user),
-    user_svc: UserService = Depends(user_service)
+    user_svc: AsyncServiceFacade[UserService] = Depends(async_user_service)
 ):
     """Update current user's profile."""
     try:
         updates = request.model_dump(exclude_unset=True)
-        updated_user = user_svc.update_profile(current_user.id, updates)
+        updated_user = await user_svc.update_profile(current_user.id, updates)
         return UserProfileResponse(
             id=updated_user.id,
             email=updated_user.email,
@@ -129,21 +130,21 @@ async def update_my_profile(
 @router.get("/me/usage", response_model=UsageStatsResponse)
 async def get_my_usage(
     current_user: User = Depends(get_current_active_user),
-    user_svc: UserService = Depends(user_service)
+    user_svc: AsyncServiceFacade[UserService] = Depends(async_user_service)
 ):
     """Get current user's usage statistics."""
-    limits = user_svc.get_usage_limits(current_user.id)
+    limits = await user_svc.get_usage_limits(current_user.id)
     return UsageStatsResponse(**limits)
 
 
 @router.post("/me/usage/interview")
 async def record_interview_usage(
     current_user: User = Depends(get_current_active_user),
-    user_svc: UserService = Depends(user_service)
+    user_svc: AsyncServiceFacade[UserService] = Depends(async_user_service)
 ):
     """Record an interview session usage."""
     try:
-        user_svc.record_interview_session(current_user.id)
+        await user_svc.record_interview_session(current_user.id)
         return {"message": "Usage recorded"}
     except ValidationError as e:
         raise HTTPException(
@@ -155,10 +156,10 @@ async def record_interview_usage(
 @router.delete("/me")
 async def delete_my_account(
     current_user: User = Depends(get_current_active_user),
-    user_svc: UserService = Depends(user_service)
+    user_svc: AsyncServiceFacade[UserService] = Depends(async_user_service)
 ):
     """Delete current user's account."""
-    user_svc.delete_user(current_user.id)
+    await user_svc.delete_user(current_user.id)
     return {"message": "Account deleted successfully"}
 
 
@@ -172,10 +173,10 @@ async def list_users(
     page_size: int = Query(20, ge=1, le=100),
     query: Optional[str] = None,
     admin_user: User = Depends(get_admin_user),
-    user_svc: UserService = Depends(user_service)
+    user_svc: AsyncServiceFacade[UserService] = Depends(async_user_service)
 ):
     """List all users (admin only)."""
-    result = user_svc.search_users(
+    result = await user_svc.search_users(
         query=query,
         page=page,
         page_size=page_size
@@ -210,11 +211,11 @@ async def list_users(
 async def get_user(
     user_id: str,
     admin_user: User = Depends(get_admin_user),
-    user_svc: UserService = Depends(user_service)
+    user_svc: AsyncServiceFacade[UserService] = Depends(async_user_service)
 ):
     """Get specific user (admin only)."""
     try:
-        user = user_svc.get_user(user_id)
+        user = await user_svc.get_user(user_id)
         return UserProfileResponse(
             id=user.id,
             email=user.email,
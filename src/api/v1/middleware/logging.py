@@ -11,6 +11,8 @@ from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.analytics.metrics import metrics_collector
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +51,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             # Log exception
             duration = time.perf_counter() - start_time
+            self._record_metrics(request, 500, duration)
             logger.error(
                 f"Request failed [{request_id}]",
                 extra={
@@ -62,14 +65,27 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         # Calculate duration
         duration = time.perf_counter() - start_time
 
-        # Log response
+        # Log response and record metrics
         self._log_response(request, response, request_id, duration)
+        self._record_metrics(request, response.status_code, duration)
 
         # Add request ID to response headers
         response.headers["X-Request-ID"] = request_id
 
         return response
 
+    def _record_metrics(self, request: Request, status_code: int, duration: float) -> None:
+        """Record request count and latency, labelled by route template."""
+        route = request.scope.get("route")
+        endpoint = getattr(route, "path", None) or "<unmatched>"
+
+        metrics_collector.counter("http_requests_total").inc(
+            method=request.method, endpoint=endpoint, status=str(status_code)
+        )
+        metrics_collector.histogram("http_request_duration_seconds").observe(
+            duration, method=request.method, endpoint=endpoint
+        )
+
     async def _log_request(self, request: Request, request_id: str) -> None:
         """Log incoming request details."""
         # Get safe headers
@@ -0,0 +1,35 @@
+"""
+Query Profiling Middleware.
+
+Groups the SQL statements of each request for N+1 detection.
+"""
+
+from typing import Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.database.query_optimizer import query_profiler
+
+
+class QueryProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware opening a query_profiler request scope per HTTP request.
+
+    Findings are labelled with the route template (``/mentors/{mentor_id}``)
+    rather than the raw path, to keep metric cardinality bounded.
+    """
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable
+    ) -> Response:
+        with query_profiler.request_scope(f"{request.method} {request.url.path}") as scope:
+            response = await call_next(request)
+
+            route = request.scope.get("route")
+            if route is not None and getattr(route, "path", None):
+                scope.name = f"{request.method} {route.path}"
+
+        return response
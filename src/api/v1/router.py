@@ -12,7 +12,8 @@ from src.api.v1.endpoints import (
     payments,
     mentors,
     jobs,
-    recommendations
+    recommendations,
+    admin
 )
 
 api_router = APIRouter()
@@ -53,3 +54,9 @@ api_router.include_router(
     prefix="/recommendations",
     tags=["Recommendations"]
 )
+
+api_router.include_router(
+    admin.router,
+    prefix="/admin",
+    tags=["Admin"]
+)
@@ -38,6 +38,10 @@ class CacheConfig:
     socket_timeout: float = 5.0
     socket_connect_timeout: float = 5.0
 
+    # Pub/sub subscriptions sit idle between messages, so they use their own
+    # connections without socket_timeout and PING at this interval instead
+    pubsub_health_check_interval: int = 30
+
     # Default TTL
     default_ttl: int = 3600  # 1 hour
 
@@ -69,6 +73,8 @@ class RedisCache:
         self.config = config or CacheConfig()
         self._pool: Optional[ConnectionPool] = None
         self._client: Optional[Redis] = None
+        self._pubsub_pool: Optional[ConnectionPool] = None
+        self._pubsub_client: Optional[Redis] = None
         self._connected = False
         self._lock = asyncio.Lock()
 
@@ -82,26 +88,7 @@ class RedisCache:
                 return
 
             try:
-                if self.config.url:
-                    self._pool = ConnectionPool.from_url(
-                        self.config.url,
-                        max_connections=self.config.max_connections,
-                        socket_timeout=self.config.socket_timeout,
-                        socket_connect_timeout=self.config.socket_connect_timeout,
-                        retry_on_timeout=self.config.retry_on_timeout,
-                    )
-                else:
-                    self._pool = ConnectionPool(
-                        host=self.config.host,
-                        port=self.config.port,
-                        db=self.config.db,
-                        password=self.config.password,
-                        max_connections=self.config.max_connections,
-                        socket_timeout=self.config.socket_timeout,
-                        socket_connect_timeout=self.config.socket_connect_timeout,
-                        retry_on_timeout=self.config.retry_on_timeout,
-                    )
-
+                self._pool = self._create_pool()
                 self._client = Redis(connection_pool=self._pool)
 
                 # Test connection
@@ -114,12 +101,35 @@ class RedisCache:
                 self._connected = False
                 raise
 
+    def _create_pool(self, **overrides) -> ConnectionPool:
+        """Create a connection pool from the config (overrides win)."""
+        options = dict(
+            max_connections=self.config.max_connections,
+            socket_timeout=self.config.socket_timeout,
+            socket_connect_timeout=self.config.socket_connect_timeout,
+            retry_on_timeout=self.config.retry_on_timeout,
+        )
+        options.update(overrides)
+        if self.config.url:
+            return ConnectionPool.from_url(self.config.url, **options)
+        return ConnectionPool(
+            host=self.config.host,
+            port=self.config.port,
+            db=self.config.db,
+            password=self.config.password,
+            **options,
+        )
+
     async def disconnect(self) -> None:
         """Close Redis connection."""
         if self._client:
             await self._client.close()
         if self._pool:
             await self._pool.disconnect()
+        if self._pubsub_pool:
+            await self._pubsub_pool.disconnect()
+            self._pubsub_pool = None
+            self._pubsub_client = None
         self._connected = False
         logger.info("Redis cache disconnected")
 
@@ -604,6 +614,43 @@ class RedisCache:
             logger.warning(f"Lock release error: {e}")
             return False
 
+    # =========================================================================
+    # Pub/Sub Operations
+    # =========================================================================
+
+    async def publish(self, channel: str, message: Union[str, bytes]) -> int:
+        """Publish message to a channel (channel name gets the key prefix)."""
+        if not self._connected:
+            await self.connect()
+
+        try:
+            return await self._client.publish(self._make_key(channel), message)
+        except Exception as e:
+            logger.warning(f"Cache publish error: {e}")
+            return 0
+
+    async def subscribe(self, *channels: str):
+        """
+        Subscribe to channels.
+
+        Returns:
+            redis.asyncio PubSub object (iterate with ``listen()``, close when done)
+        """
+        if not self._connected:
+            await self.connect()
+
+        if self._pubsub_client is None:
+            # A shared-pool connection would hit socket_timeout while idle in listen()
+            self._pubsub_pool = self._create_pool(
+                socket_timeout=None,
+                health_check_interval=self.config.pubsub_health_check_interval,
+            )
+            self._pubsub_client = Redis(connection_pool=self._pubsub_pool)
+
+        pubsub = self._pubsub_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(*[self._make_key(channel) for channel in channels])
+        return pubsub
+
     # =========================================================================
     # Cache Stats
     # =========================================================================
@@ -26,9 +26,26 @@ class DatabaseSettings(BaseSettings):
     name: str = Field(default="flyready", description="Database name")
     user: Optional[str] = Field(default=None, description="Database user")
     password: Optional[str] = Field(default=None, description="Database password")
+    url: Optional[str] = Field(default=None, description="Full database URL (overrides host/port/name)")
 
     # JSON file database paths
     data_dir: str = Field(default="data", description="Data directory for JSON storage")
+    json_mode: str = Field(default="indexed", description="JSON storage mode: file, indexed")
+    json_write_delay: float = Field(default=0.0, description="Seconds to batch JSON writes in indexed mode")
+    read_url: Optional[str] = Field(default=None, description="Read-only/replica database URL for reporting queries")
+
+    # SQLite connection tuning
+    sqlite_pool_size: int = Field(default=10, description="Pooled SQLite connections kept open")
+    sqlite_max_overflow: int = Field(default=20, description="Extra SQLite connections allowed under load")
+    sqlite_busy_timeout_ms: int = Field(default=5000, description="Milliseconds to wait on a locked SQLite database")
+    sqlite_mmap_size: int = Field(default=256 * 1024 * 1024, description="SQLite memory-mapped I/O size in bytes (0 disables)")
+    sqlite_cache_size_kb: int = Field(default=16384, description="SQLite page cache per connection in KiB")
+    sqlite_synchronous: str = Field(default="NORMAL", description="SQLite synchronous mode: OFF, NORMAL, FULL")
+
+    # Query profiling
+    profile_queries: bool = Field(default=False, description="Profile SQL statements and export them as metrics")
+    slow_query_ms: float = Field(default=100.0, description="Log statements slower than this (ms)")
+    n_plus_one_threshold: int = Field(default=5, description="Flag a statement repeated this often in one request")
 
     @property
     def connection_string(self) -> Optional[str]:
@@ -274,6 +291,10 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(default=8000, description="Server port")
     workers: int = Field(default=4, description="Number of workers")
+    blocking_io_threads: int = Field(
+        default=40,
+        description="Threads per worker for blocking service calls from async endpoints"
+    )
 
     # Base paths
     base_dir: Path = Field(default_factory=lambda: Path(__file__).parent.parent.parent)
@@ -294,6 +315,12 @@ class Settings(BaseSettings):
     rate_limit_requests: int = Field(default=100, description="Requests per window")
     rate_limit_window: int = Field(default=60, description="Window in seconds")
 
+    # WebSocket fan-out
+    ws_backplane: str = Field(default="local", description="Cross-worker fan-out: local, redis")
+    ws_redis_url: Optional[str] = Field(default=None, description="Redis URL for the redis backplane")
+    ws_send_queue_size: int = Field(default=256, description="Outbound messages buffered per connection")
+    ws_send_timeout: float = Field(default=10.0, description="Seconds a single send may take before the client is dropped")
+
     # Nested settings
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     auth: AuthSettings = Field(default_factory=AuthSettings)
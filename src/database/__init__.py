@@ -6,8 +6,11 @@ SQLAlchemy database configuration and session management.
 
 from src.database.session import (
     engine,
+    read_engine,
     SessionLocal,
+    ReadSessionLocal,
     get_db,
+    get_read_db,
     init_db,
     Base
 )
@@ -25,8 +28,11 @@ from src.database.models import (
 
 __all__ = [
     "engine",
+    "read_engine",
     "SessionLocal",
+    "ReadSessionLocal",
     "get_db",
+    "get_read_db",
     "init_db",
     "Base",
     "UserModel",
@@ -4,12 +4,18 @@ Query Optimizer.
 Advanced query optimization utilities for SQLAlchemy.
 """
 
+import contextvars
+import hashlib
 import logging
+import math
+import re
+import threading
 import time
+from collections import Counter as TallyCounter, deque
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Type, TypeVar
 
 from sqlalchemy import event, text
 from sqlalchemy.engine import Engine
@@ -29,88 +35,377 @@ class QueryStats:
     rows_affected: int
     timestamp: float = field(default_factory=time.time)
     explain_plan: Optional[str] = None
+    fingerprint: Optional[str] = None
+
+
+# =============================================================================
+# Fingerprinting
+# =============================================================================
+
+_FINGERPRINT_RULES = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),                          # string literals
+    (re.compile(r"%\(\w+\)s|%s|(?<![:\w]):\w+|\$\d+"), "?"),          # bind parameters
+    (re.compile(r"\b\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", re.I), "?"),     # numeric literals
+    (re.compile(r"\s+"), " "),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(?+)"),              # IN (?, ?, ...) / VALUES (...)
+    (re.compile(r"(\(\?\+\))(?:\s*,\s*\(\?\+\))+"), r"\1"),          # multi-row VALUES
+]
+
+
+def fingerprint_query(statement: str) -> str:
+    """
+    Normalize a SQL statement into a parameter-stripped fingerprint.
+
+    Literals and bind parameters become ``?`` and variable-length lists
+    collapse, so ``IN (1, 2)`` and ``IN (3, 4, 5)`` share one fingerprint.
+    """
+    normalized = statement.strip()
+    for pattern, replacement in _FINGERPRINT_RULES:
+        normalized = pattern.sub(replacement, normalized)
+    return normalized.strip()
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of a sorted list."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class FingerprintStats:
+    """Aggregated statistics for one query fingerprint."""
+    fingerprint: str
+    query_id: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+    last_seen: float = 0.0
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def record(self, duration_ms: float, rows: int) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.rows += max(rows, 0)
+        self.last_seen = time.time()
+        self.samples.append(duration_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "query_id": self.query_id,
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(_percentile(ordered, 0.50), 3),
+            "p95_ms": round(_percentile(ordered, 0.95), 3),
+            "p99_ms": round(_percentile(ordered, 0.99), 3),
+            "max_ms": round(self.max_ms, 3),
+            "rows": self.rows,
+        }
+
+
+@dataclass
+class NPlusOneFinding:
+    """A fingerprint repeated within a single request."""
+    endpoint: str
+    query_id: str
+    fingerprint: str
+    count: int
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "query_id": self.query_id,
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "timestamp": self.timestamp,
+        }
+
+
+class RequestQueryScope:
+    """Queries issued while handling one request."""
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.fingerprints: TallyCounter = TallyCounter()
+
+    @property
+    def total(self) -> int:
+        return sum(self.fingerprints.values())
+
+
+_request_scope: contextvars.ContextVar[Optional[RequestQueryScope]] = contextvars.ContextVar(
+    "query_profiler_request_scope", default=None
+)
 
 
 class QueryProfiler:
     """
     Query profiler for monitoring and optimization.
 
-    Tracks query execution times and identifies slow queries.
+    Tracks query execution times and identifies slow queries. Statements are
+    aggregated by fingerprint (count, total time, p50/p95/p99, rows), and
+    fingerprints repeated at least ``n_plus_one_threshold`` times inside one
+    request_scope() are reported as N+1 candidates.
     """
 
-    def __init__(self, slow_query_threshold_ms: float = 100.0):
+    OTHER_FINGERPRINT = "<other>"
+
+    def __init__(
+        self,
+        slow_query_threshold_ms: float = 100.0,
+        n_plus_one_threshold: int = 5,
+        max_fingerprints: int = 500,
+        history_size: int = 1000
+    ):
         self.slow_query_threshold = slow_query_threshold_ms
-        self._stats: List[QueryStats] = []
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.max_fingerprints = max_fingerprints
+        self._stats: Deque[QueryStats] = deque(maxlen=history_size)
+        self._fingerprints: Dict[str, FingerprintStats] = {}
+        self._fingerprint_cache: Dict[str, str] = {}
+        self._n_plus_one: Deque[NPlusOneFinding] = deque(maxlen=200)
+        self._n_plus_one_counts: TallyCounter = TallyCounter()
+        self._lock = threading.Lock()
+        self._engines: set = set()
         self._enabled = False
 
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
     def enable(self, engine: Engine) -> None:
-        """Enable query profiling."""
-        if self._enabled:
+        """Enable query profiling (listeners are attached once per engine)."""
+        self._enabled = True
+        if id(engine) in self._engines:
             return
 
         @event.listens_for(engine, "before_cursor_execute")
         def before_execute(conn, cursor, statement, parameters, context, executemany):
-            conn.info.setdefault("query_start_time", []).append(time.time())
+            conn.info.setdefault("query_start_time", []).append(time.perf_counter())
 
         @event.listens_for(engine, "after_cursor_execute")
         def after_execute(conn, cursor, statement, parameters, context, executemany):
             start_time = conn.info["query_start_time"].pop(-1)
-            duration = (time.time() - start_time) * 1000
+            if self._enabled:
+                duration = (time.perf_counter() - start_time) * 1000
+                self.record(statement, duration, cursor.rowcount)
 
-            stats = QueryStats(
-                query=statement[:500],  # Truncate long queries
-                duration_ms=duration,
-                rows_affected=cursor.rowcount
-            )
-            self._stats.append(stats)
-
-            # Log slow queries
-            if duration > self.slow_query_threshold:
-                logger.warning(
-                    f"Slow query detected ({duration:.2f}ms): {statement[:200]}..."
-                )
-
-        self._enabled = True
+        self._engines.add(id(engine))
         logger.info("Query profiler enabled")
 
     def disable(self) -> None:
         """Disable query profiling."""
         self._enabled = False
 
+    def record(self, statement: str, duration_ms: float, rows: int = -1) -> QueryStats:
+        """Record one executed statement."""
+        fingerprint = self._fingerprint_cache.get(statement)
+        if fingerprint is None:
+            fingerprint = fingerprint_query(statement)
+            if len(self._fingerprint_cache) < 10000:
+                self._fingerprint_cache[statement] = fingerprint
+
+        stats = QueryStats(
+            query=statement[:500],  # Truncate long queries
+            duration_ms=duration_ms,
+            rows_affected=rows,
+            fingerprint=fingerprint
+        )
+
+        with self._lock:
+            self._stats.append(stats)
+            entry = self._fingerprints.get(fingerprint)
+            if entry is None:
+                if len(self._fingerprints) >= self.max_fingerprints:
+                    fingerprint = self.OTHER_FINGERPRINT
+                entry = self._fingerprints.get(fingerprint)
+                if entry is None:
+                    entry = self._fingerprints[fingerprint] = FingerprintStats(
+                        fingerprint=fingerprint,
+                        query_id=hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:12]
+                    )
+            entry.record(duration_ms, rows)
+
+        scope = _request_scope.get()
+        if scope is not None:
+            scope.fingerprints[fingerprint] += 1
+
+        # Log slow queries
+        if duration_ms > self.slow_query_threshold:
+            logger.warning(
+                f"Slow query detected ({duration_ms:.2f}ms): {statement[:200]}..."
+            )
+
+        return stats
+
+    @contextmanager
+    def request_scope(self, name: str = "") -> Iterator[RequestQueryScope]:
+        """
+        Group the queries of one request for N+1 detection.
+
+        The scope name may be set after the request has been routed.
+
+        Usage:
+            with query_profiler.request_scope() as scope:
+                response = await call_next(request)
+                scope.name = "GET /api/v1/mentors"
+        """
+        scope = RequestQueryScope(name)
+        token = _request_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _request_scope.reset(token)
+            self._check_n_plus_one(scope)
+
+    def _check_n_plus_one(self, scope: RequestQueryScope) -> None:
+        for fingerprint, count in scope.fingerprints.items():
+            if count < self.n_plus_one_threshold or fingerprint == self.OTHER_FINGERPRINT:
+                continue
+            with self._lock:
+                entry = self._fingerprints.get(fingerprint)
+                query_id = entry.query_id if entry else ""
+                finding = NPlusOneFinding(scope.name, query_id, fingerprint, count)
+                self._n_plus_one.append(finding)
+                self._n_plus_one_counts[(scope.name, query_id)] += 1
+            logger.warning(
+                f"Possible N+1 in {scope.name or 'request'}: "
+                f"{count}x {fingerprint[:200]}"
+            )
+
     def get_stats(self, limit: int = 100) -> List[QueryStats]:
         """Get recent query statistics."""
-        return self._stats[-limit:]
+        with self._lock:
+            return list(self._stats)[-limit:]
 
     def get_slow_queries(self, threshold_ms: Optional[float] = None) -> List[QueryStats]:
         """Get slow queries above threshold."""
         threshold = threshold_ms or self.slow_query_threshold
-        return [s for s in self._stats if s.duration_ms > threshold]
+        with self._lock:
+            return [s for s in self._stats if s.duration_ms > threshold]
+
+    def get_fingerprint_stats(self, limit: int = 50, order_by: str = "total_ms") -> List[Dict[str, Any]]:
+        """
+        Per-fingerprint statistics.
+
+        Args:
+            limit: Maximum number of fingerprints
+            order_by: Sort key, descending (total_ms, count, p95_ms, p99_ms, max_ms, rows)
+        """
+        with self._lock:
+            rows = [entry.to_dict() for entry in self._fingerprints.values()]
+        rows.sort(key=lambda row: row.get(order_by, 0), reverse=True)
+        return rows[:limit]
+
+    def get_n_plus_one(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent N+1 findings, newest first."""
+        with self._lock:
+            findings = list(self._n_plus_one)
+        return [f.to_dict() for f in reversed(findings)][:limit]
 
     def get_summary(self) -> Dict[str, Any]:
         """Get profiling summary."""
-        if not self._stats:
-            return {"total_queries": 0}
+        with self._lock:
+            entries = list(self._fingerprints.values())
+            n_plus_one = sum(self._n_plus_one_counts.values())
 
-        durations = [s.duration_ms for s in self._stats]
+        total_queries = sum(e.count for e in entries)
+        if not total_queries:
+            return {"total_queries": 0, "enabled": self._enabled}
+
+        total_time = sum(e.total_ms for e in entries)
 
         return {
-            "total_queries": len(self._stats),
-            "total_time_ms": sum(durations),
-            "avg_time_ms": sum(durations) / len(durations),
-            "max_time_ms": max(durations),
-            "min_time_ms": min(durations),
+            "enabled": self._enabled,
+            "total_queries": total_queries,
+            "total_time_ms": total_time,
+            "avg_time_ms": total_time / total_queries,
+            "max_time_ms": max(e.max_ms for e in entries),
             "slow_queries": len(self.get_slow_queries()),
+            "fingerprints": len(entries),
+            "n_plus_one_findings": n_plus_one,
         }
 
+    def collect_metrics(self) -> list:
+        """Metric families for MetricsCollector.to_prometheus()."""
+        from src.analytics.metrics import MetricFamily, MetricType
+
+        with self._lock:
+            entries = [(e.query_id, e.fingerprint, e.to_dict()) for e in self._fingerprints.values()]
+            n_plus_one = list(self._n_plus_one_counts.items())
+
+        durations = MetricFamily(
+            "db_query_fingerprint_duration_ms", MetricType.SUMMARY,
+            "Query duration by normalized statement (ms)"
+        )
+        rows = MetricFamily(
+            "db_query_fingerprint_rows_total", MetricType.COUNTER,
+            "Rows affected by normalized statement"
+        )
+        for query_id, fingerprint, data in entries:
+            labels = {"query_id": query_id, "fingerprint": fingerprint[:200]}
+            for quantile, key in (("0.5", "p50_ms"), ("0.95", "p95_ms"), ("0.99", "p99_ms")):
+                durations.add(data[key], quantile=quantile, **labels)
+            durations.add(data["total_ms"], suffix="_sum", **labels)
+            durations.add(data["count"], suffix="_count", **labels)
+            rows.add(data["rows"], **labels)
+
+        repeats = MetricFamily(
+            "db_n_plus_one_total", MetricType.COUNTER,
+            "Requests repeating one statement at least the N+1 threshold"
+        )
+        for (endpoint, query_id), count in n_plus_one:
+            repeats.add(count, endpoint=endpoint, query_id=query_id)
+
+        return [durations, rows, repeats]
+
     def clear(self) -> None:
         """Clear statistics."""
-        self._stats.clear()
+        with self._lock:
+            self._stats.clear()
+            self._fingerprints.clear()
+            self._n_plus_one.clear()
+            self._n_plus_one_counts.clear()
 
 
 # Singleton profiler
 query_profiler = QueryProfiler()
 
 
+def setup_query_profiler(engines: Optional[List[Engine]] = None) -> QueryProfiler:
+    """
+    Enable the singleton profiler from settings and export it.
+
+    Attaches to the primary and read-only engines by default and registers
+    the profiler with src.analytics.metrics.metrics_collector.
+
+    Args:
+        engines: Engines to profile (default: src.database.session engines)
+    """
+    from src.analytics.metrics import metrics_collector
+    from src.config.settings import get_settings
+
+    db = get_settings().database
+    query_profiler.slow_query_threshold = db.slow_query_ms
+    query_profiler.n_plus_one_threshold = db.n_plus_one_threshold
+
+    if engines is None:
+        from src.database.session import engine, read_engine
+        engines = [engine] if read_engine is engine else [engine, read_engine]
+
+    for profiled in engines:
+        query_profiler.enable(profiled)
+    metrics_collector.register_collector("query_profiler", query_profiler.collect_metrics)
+    return query_profiler
+
+
 class QueryBuilder:
     """
     Fluent query builder with optimization hints.
@@ -475,13 +770,14 @@ def explain_query(session: Session, query: Query) -> str:
     return "\n".join(row[0] for row in explain)
 
 
-def create_indexes_sql(table_name: str, indexes: List[Dict]) -> List[str]:
+def create_indexes_sql(table_name: str, indexes: List[Dict], dialect: str = "postgresql") -> List[str]:
     """
     Generate CREATE INDEX SQL statements.
 
     Args:
         table_name: Name of the table
         indexes: List of index definitions
+        dialect: Target SQL dialect (USING is only emitted for postgresql)
 
     Index definition format:
         {
@@ -498,12 +794,12 @@ def create_indexes_sql(table_name: str, indexes: List[Dict]) -> List[str]:
 
     for idx in indexes:
         unique = "UNIQUE " if idx.get("unique") else ""
-        using = idx.get("using", "btree")
+        using = f"USING {idx.get('using', 'btree')} " if dialect == "postgresql" else ""
         columns = ", ".join(idx["columns"])
 
         sql = (
             f"CREATE {unique}INDEX IF NOT EXISTS {idx['name']} "
-            f"ON {table_name} USING {using} ({columns})"
+            f"ON {table_name} {using}({columns})"
         )
         statements.append(sql)
 
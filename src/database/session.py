@@ -5,14 +5,15 @@ Handles database connections, session lifecycle, and initialization.
 """
 
 import logging
-from typing import Generator
+from typing import Generator, Optional
 from contextlib import contextmanager
 
 from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 
-from src.config.settings import get_settings
+from src.config.settings import DatabaseSettings, get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -22,28 +23,132 @@ settings = get_settings()
 # Determine database URL
 if settings.database.url:
     DATABASE_URL = settings.database.url
+elif settings.database.type == "postgresql":
+    DATABASE_URL = settings.database.connection_string
 else:
     # Use SQLite as default
     db_path = settings.base_dir / settings.database.data_dir / "flyready.db"
     db_path.parent.mkdir(parents=True, exist_ok=True)
     DATABASE_URL = f"sqlite:///{db_path}"
 
-# Create engine with appropriate settings
-if DATABASE_URL.startswith("sqlite"):
-    # SQLite-specific configuration
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        echo=settings.debug
-    )
 
-    # Enable foreign keys for SQLite
-    @event.listens_for(engine, "connect")
+# =============================================================================
+# SQLite
+# =============================================================================
+
+def sqlite_path(url: str) -> Optional[str]:
+    """
+    Database file of a SQLite URL.
+
+    Returns:
+        File path, or None for non-SQLite and in-memory databases
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return None
+    database = parsed.database or ""
+    if database in ("", ":memory:") or parsed.query.get("mode") == "memory":
+        return None
+    if database.startswith("file:"):
+        database = database[len("file:"):]
+    return database
+
+
+def sqlite_pragmas(db: DatabaseSettings, read_only: bool = False) -> list:
+    """
+    PRAGMA statements run on every new SQLite connection.
+
+    WAL lets readers proceed while a writer commits; synchronous=NORMAL is
+    durable across application crashes under WAL (only an OS crash can lose
+    the last transactions). busy_timeout makes a writer wait for the lock
+    instead of failing with "database is locked".
+    """
+    pragmas = [
+        f"PRAGMA busy_timeout={int(db.sqlite_busy_timeout_ms)}",
+        f"PRAGMA cache_size={-int(db.sqlite_cache_size_kb)}",
+        f"PRAGMA mmap_size={int(db.sqlite_mmap_size)}",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA foreign_keys=ON",
+    ]
+    if read_only:
+        # journal_mode is stored in the file; a read-only handle cannot change it
+        pragmas.append("PRAGMA query_only=ON")
+    else:
+        pragmas[:0] = ["PRAGMA journal_mode=WAL", f"PRAGMA synchronous={db.sqlite_synchronous.upper()}"]
+    return pragmas
+
+
+def create_sqlite_engine(
+    url: str,
+    db: Optional[DatabaseSettings] = None,
+    read_only: bool = False,
+    echo: bool = False
+) -> Engine:
+    """
+    Create a pooled SQLite engine.
+
+    Each checkout hands the calling thread its own connection (QueuePool);
+    connections are never shared by two threads at once, so concurrent
+    requests no longer serialise on a single StaticPool connection.
+    In-memory databases keep StaticPool, since every new connection would
+    see an empty database.
+
+    Args:
+        url: sqlite:/// URL
+        db: Database settings (default: application settings)
+        read_only: Open the file with mode=ro and query_only for reporting
+        echo: Log SQL statements
+    """
+    db = db or get_settings().database
+    path = sqlite_path(url)
+    connect_args: dict = {
+        # Pooled connections move between threads, but only one uses them at a time
+        "check_same_thread": False,
+        "timeout": db.sqlite_busy_timeout_ms / 1000,
+    }
+
+    if path is None:
+        new_engine = create_engine(url, connect_args=connect_args, poolclass=StaticPool, echo=echo)
+    else:
+        if read_only:
+            url = f"sqlite:///file:{path}?mode=ro&uri=true"
+        new_engine = create_engine(
+            url,
+            connect_args=connect_args,
+            poolclass=QueuePool,
+            pool_size=db.sqlite_pool_size,
+            max_overflow=db.sqlite_max_overflow,
+            echo=echo
+        )
+
+    pragmas = sqlite_pragmas(db, read_only=read_only)
+
+    @event.listens_for(new_engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):
         cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return new_engine
+
+
+def _create_read_engine() -> Engine:
+    """Engine for reporting queries (falls back to the primary engine)."""
+    if settings.database.read_url:
+        if sqlite_path(settings.database.read_url):
+            return create_sqlite_engine(settings.database.read_url, read_only=True, echo=settings.debug)
+        return create_engine(settings.database.read_url, pool_pre_ping=True, echo=settings.debug)
+    if sqlite_path(DATABASE_URL):
+        return create_sqlite_engine(DATABASE_URL, read_only=True, echo=settings.debug)
+    return engine
+
+
+# Create engine with appropriate settings
+if DATABASE_URL.startswith("sqlite"):
+    engine = create_sqlite_engine(DATABASE_URL, echo=settings.debug)
 else:
     # PostgreSQL/MySQL configuration
     engine = create_engine(
@@ -54,13 +159,22 @@ else:
         echo=settings.debug
     )
 
-# Session factory
+# Read-only engine for reporting/analytics queries
+read_engine = _create_read_engine()
+
+# Session factories
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine
 )
 
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=read_engine
+)
+
 # Base class for models
 Base = declarative_base()
 
@@ -101,6 +215,37 @@ def get_db_context() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Read-only session dependency for reporting endpoints.
+
+    Runs on the read-only pool, so long reports do not hold connections
+    that writers need. Any write raises an error.
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@contextmanager
+def get_read_db_context() -> Generator[Session, None, None]:
+    """
+    Read-only session context manager.
+
+    Usage:
+        with get_read_db_context() as db:
+            total = db.query(User).count()
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.rollback()
+        db.close()
+
+
 def init_db() -> None:
     """
     Initialize database tables.
@@ -165,7 +310,7 @@ class DatabaseManager:
     def get_table_stats() -> dict:
         """Get table row counts."""
         stats = {}
-        with get_db_context() as db:
+        with get_read_db_context() as db:
             for table in Base.metadata.tables.keys():
                 try:
                     result = db.execute(text(f"SELECT COUNT(*) FROM {table}"))
@@ -182,11 +327,27 @@ class DatabaseManager:
         Args:
             filepath: Path to backup file
         """
-        import shutil
+        import sqlite3
 
-        if DATABASE_URL.startswith("sqlite"):
-            db_path = DATABASE_URL.replace("sqlite:///", "")
-            shutil.copy2(db_path, filepath)
-            logger.info(f"Database backed up to {filepath}")
-        else:
+        db_path = sqlite_path(DATABASE_URL)
+        if db_path is None:
             raise NotImplementedError("Backup only supported for SQLite")
+
+        # The online backup API includes pages still in the WAL file,
+        # which a plain file copy would miss
+        source = engine.raw_connection()
+        target = sqlite3.connect(filepath)
+        try:
+            source.driver_connection.backup(target)
+        finally:
+            target.close()
+            source.close()
+        logger.info(f"Database backed up to {filepath}")
+
+    @staticmethod
+    def checkpoint() -> None:
+        """Fold the WAL file back into the database (SQLite only)."""
+        if sqlite_path(DATABASE_URL):
+            with engine.connect() as conn:
+                conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+                logger.info("WAL checkpoint completed")
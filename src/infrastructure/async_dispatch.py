@@ -0,0 +1,166 @@
+"""
+Async dispatch for blocking service calls.
+
+Services and repositories are synchronous (file I/O under locks, SQL
+round-trips). Calling them directly from ``async def`` endpoints blocks the
+event loop for every other request and websocket on the worker. The facade
+below runs each call on a worker thread with a dedicated capacity limiter,
+so blocking calls cannot starve the threads Starlette uses for sync
+endpoints and file responses. ``BLOCKING_IO_THREADS=0`` calls inline on the
+event loop (the previous behaviour, kept for A/B load tests).
+
+Usage:
+    mentor_svc = AsyncServiceFacade(get_mentor_service())
+    result = await mentor_svc.search_mentors(query="KE")
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+import anyio
+import anyio.to_thread
+
+from src.config.settings import get_settings
+
+S = TypeVar("S")
+R = TypeVar("R")
+
+
+class _DispatchStats:
+    """Counters for blocking calls (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def started(self, waited: float) -> None:
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def finished(self, error: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if error:
+                self.errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "avg_wait_ms": round(self.total_wait / self.calls * 1000, 3) if self.calls else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+_stats = _DispatchStats()
+
+# Limiters are bound to an event loop; uvicorn runs one loop per worker
+_limiters: Dict[int, anyio.CapacityLimiter] = {}
+
+
+def _get_limiter(max_threads: int) -> anyio.CapacityLimiter:
+    loop_id = id(asyncio.get_running_loop())
+    limiter = _limiters.get(loop_id)
+    if limiter is None:
+        limiter = anyio.CapacityLimiter(max_threads)
+        _limiters[loop_id] = limiter
+    return limiter
+
+
+async def run_blocking(func: Callable[..., R], *args, **kwargs) -> R:
+    """
+    Run a blocking callable on a worker thread.
+
+    Args:
+        func: Synchronous function to call
+        *args, **kwargs: Arguments for func
+
+    Returns:
+        func's return value (exceptions propagate unchanged)
+    """
+    queued_at = time.perf_counter()
+    max_threads = get_settings().blocking_io_threads
+
+    def call() -> R:
+        _stats.started(time.perf_counter() - queued_at)
+        error = True
+        try:
+            result = func(*args, **kwargs)
+            error = False
+            return result
+        finally:
+            _stats.finished(error)
+
+    if max_threads <= 0:
+        return call()
+    return await anyio.to_thread.run_sync(call, limiter=_get_limiter(max_threads))
+
+
+def get_dispatch_stats() -> Dict[str, Any]:
+    """Blocking-call counters; wait is the time spent queued for a thread."""
+    stats = _stats.snapshot()
+    stats["max_threads"] = get_settings().blocking_io_threads
+    return stats
+
+
+class AsyncServiceFacade(Generic[S]):
+    """
+    Awaitable view of a synchronous service.
+
+    Method calls are dispatched through run_blocking(); non-callable
+    attributes (constants such as ``AIRLINE_NAMES``) are returned as-is.
+    """
+
+    def __init__(self, service: S):
+        self._service = service
+        self._methods: Dict[str, Callable[..., Any]] = {}
+
+    @property
+    def sync(self) -> S:
+        """The wrapped synchronous service."""
+        return self._service
+
+    def __getattr__(self, name: str) -> Any:
+        method = self._methods.get(name)
+        if method is not None:
+            return method
+
+        attr = getattr(self._service, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def dispatch(*args, **kwargs):
+            return await run_blocking(attr, *args, **kwargs)
+
+        self._methods[name] = dispatch
+        return dispatch
+
+    def __repr__(self) -> str:
+        return f"AsyncServiceFacade({self._service!r})"
+
+
+_facades: Dict[int, AsyncServiceFacade] = {}
+
+
+def async_facade(service: S) -> AsyncServiceFacade[S]:
+    """Facade for a (singleton) service instance, reused across requests."""
+    facade: Optional[AsyncServiceFacade] = _facades.get(id(service))
+    if facade is None or facade.sync is not service:
+        facade = _facades[id(service)] = AsyncServiceFacade(service)
+    return facade
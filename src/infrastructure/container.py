@@ -37,6 +37,8 @@ class Container:
         """Initialize container with settings."""
         self._settings = settings or get_settings()
         self._data_dir = str(self._settings.base_dir / self._settings.database.data_dir)
+        self._repo_classes = self._select_repository_classes()
+        self._repo_options = self._repository_options()
 
         # Repository instances (lazy)
         self._user_repo: Optional[UserRepository] = None
@@ -57,6 +59,34 @@ class Container:
 
         logger.info("Container initialized")
 
+    def _select_repository_classes(self) -> dict:
+        """Repository implementations for the configured storage (DB_TYPE)."""
+        if self._settings.database.type == "json":
+            return {
+                "users": UserRepository,
+                "payments": PaymentRepository,
+                "subscriptions": SubscriptionRepository,
+                "mentors": MentorRepository,
+                "sessions": SessionRepository,
+                "jobs": JobRepository,
+                "job_alerts": JobAlertRepository,
+            }
+
+        # SQLAlchemy is only needed for SQL storage
+        from src.repositories.sql_repository import SQL_REPOSITORIES
+        return dict(SQL_REPOSITORIES)
+
+    def _repository_options(self) -> dict:
+        """Constructor options shared by all repositories."""
+        if self._settings.database.type == "json":
+            return {
+                "indexed": self._settings.database.json_mode == "indexed",
+                "write_delay": self._settings.database.json_write_delay,
+            }
+
+        from src.database.session import engine
+        return {"engine": engine}
+
     @classmethod
     def get_instance(cls, settings: Optional[Settings] = None) -> "Container":
         """Get or create singleton container instance."""
@@ -86,49 +116,49 @@ class Container:
     def user_repository(self) -> UserRepository:
         """Get user repository instance."""
         if self._user_repo is None:
-            self._user_repo = UserRepository(self._data_dir)
+            self._user_repo = self._repo_classes["users"](self._data_dir, **self._repo_options)
         return self._user_repo
 
     @property
     def payment_repository(self) -> PaymentRepository:
         """Get payment repository instance."""
         if self._payment_repo is None:
-            self._payment_repo = PaymentRepository(self._data_dir)
+            self._payment_repo = self._repo_classes["payments"](self._data_dir, **self._repo_options)
         return self._payment_repo
 
     @property
     def subscription_repository(self) -> SubscriptionRepository:
         """Get subscription repository instance."""
         if self._subscription_repo is None:
-            self._subscription_repo = SubscriptionRepository(self._data_dir)
+            self._subscription_repo = self._repo_classes["subscriptions"](self._data_dir, **self._repo_options)
         return self._subscription_repo
 
     @property
     def mentor_repository(self) -> MentorRepository:
         """Get mentor repository instance."""
         if self._mentor_repo is None:
-            self._mentor_repo = MentorRepository(self._data_dir)
+            self._mentor_repo = self._repo_classes["mentors"](self._data_dir, **self._repo_options)
         return self._mentor_repo
 
     @property
     def session_repository(self) -> SessionRepository:
         """Get session repository instance."""
         if self._session_repo is None:
-            self._session_repo = SessionRepository(self._data_dir)
+            self._session_repo = self._repo_classes["sessions"](self._data_dir, **self._repo_options)
         return self._session_repo
 
     @property
     def job_repository(self) -> JobRepository:
         """Get job repository instance."""
         if self._job_repo is None:
-            self._job_repo = JobRepository(self._data_dir)
+            self._job_repo = self._repo_classes["jobs"](self._data_dir, **self._repo_options)
         return self._job_repo
 
     @property
     def job_alert_repository(self) -> JobAlertRepository:
         """Get job alert repository instance."""
         if self._job_alert_repo is None:
-            self._job_alert_repo = JobAlertRepository(self._data_dir)
+            self._job_alert_repo = self._repo_classes["job_alerts"](self._data_dir, **self._repo_options)
         return self._job_alert_repo
 
     # =====================
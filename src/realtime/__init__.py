@@ -5,12 +5,17 @@ WebSocket-based real-time features.
 """
 
 from src.realtime.websocket import WebSocketManager, ConnectionManager
+from src.realtime.backplane import Backplane, InMemoryBackplane, InMemoryHub, RedisBackplane
 from src.realtime.events import EventType, Event
 from src.realtime.notifications import NotificationService
 
 __all__ = [
     "WebSocketManager",
     "ConnectionManager",
+    "Backplane",
+    "InMemoryBackplane",
+    "InMemoryHub",
+    "RedisBackplane",
     "EventType",
     "Event",
     "NotificationService"
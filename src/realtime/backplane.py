@@ -0,0 +1,166 @@
+"""
+WebSocket Backplane.
+
+Pub/sub channel that relays fan-out messages between API worker processes,
+so a room or broadcast message reaches sockets held by every worker.
+
+Backends:
+- InMemoryBackplane: single process (default); instances sharing an
+  InMemoryHub behave like separate workers, which is how tests use it
+- RedisBackplane: Redis pub/sub through src.cache.redis_cache.RedisCache
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Pause before re-reading after a pub/sub error (redis-py resubscribes on the next read)
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+class Backplane(ABC):
+    """
+    Abstract pub/sub backplane.
+
+    Each published message is delivered to the handler of every *other*
+    subscriber; the publisher delivers to its own sockets directly.
+    """
+
+    def __init__(self):
+        self.node_id = uuid.uuid4().hex
+        self._handler: Optional[MessageHandler] = None
+
+    async def start(self, handler: MessageHandler) -> None:
+        """Start receiving messages from other nodes."""
+        self._handler = handler
+
+    async def stop(self) -> None:
+        """Stop receiving messages."""
+        self._handler = None
+
+    @abstractmethod
+    async def publish(self, message: Dict[str, Any]) -> None:
+        """Publish a message to the other nodes."""
+        pass
+
+    async def _dispatch(self, message: Dict[str, Any]) -> None:
+        """Hand a received message to the handler (skips own messages)."""
+        if self._handler is None or message.get("origin") == self.node_id:
+            return
+        try:
+            await self._handler(message)
+        except Exception as e:
+            logger.error(f"Backplane handler error: {e}")
+
+
+class InMemoryHub:
+    """Shared channel for InMemoryBackplane instances in one process."""
+
+    def __init__(self):
+        self.subscribers: List["InMemoryBackplane"] = []
+
+
+class InMemoryBackplane(Backplane):
+    """In-process backplane."""
+
+    def __init__(self, hub: Optional[InMemoryHub] = None):
+        super().__init__()
+        self.hub = hub or InMemoryHub()
+
+    async def start(self, handler: MessageHandler) -> None:
+        await super().start(handler)
+        if self not in self.hub.subscribers:
+            self.hub.subscribers.append(self)
+
+    async def stop(self) -> None:
+        if self in self.hub.subscribers:
+            self.hub.subscribers.remove(self)
+        await super().stop()
+
+    async def publish(self, message: Dict[str, Any]) -> None:
+        message = dict(message, origin=self.node_id)
+        for subscriber in list(self.hub.subscribers):
+            if subscriber is not self:
+                await subscriber._dispatch(message)
+
+
+class RedisBackplane(Backplane):
+    """Redis pub/sub backplane."""
+
+    def __init__(self, cache=None, channel: str = "ws:fanout"):
+        """
+        Args:
+            cache: RedisCache instance (default: src.cache.redis_cache.cache_manager)
+            channel: Pub/sub channel name
+        """
+        super().__init__()
+        if cache is None:
+            from src.cache.redis_cache import cache_manager as cache
+        self.cache = cache
+        self.channel = channel
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+
+    async def start(self, handler: MessageHandler) -> None:
+        await super().start(handler)
+        if self._reader is None:
+            self._pubsub = await self.cache.subscribe(self.channel)
+            self._reader = asyncio.create_task(self._read_loop())
+            logger.info(f"Redis backplane subscribed to {self.channel}")
+
+    async def stop(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._pubsub is not None:
+            close = getattr(self._pubsub, "aclose", None) or self._pubsub.close
+            try:
+                await close()
+            except Exception as e:
+                logger.debug(f"Backplane pubsub close error: {e}")
+            self._pubsub = None
+        await super().stop()
+
+    async def publish(self, message: Dict[str, Any]) -> None:
+        payload = json.dumps(dict(message, origin=self.node_id), ensure_ascii=False, default=str)
+        await self.cache.publish(self.channel, payload)
+
+    async def _read_loop(self) -> None:
+        while True:
+            try:
+                async for item in self._pubsub.listen():
+                    if item.get("type") != "message":
+                        continue
+                    try:
+                        message = json.loads(item["data"])
+                    except (TypeError, ValueError) as e:
+                        logger.warning(f"Invalid backplane message: {e}")
+                        continue
+                    await self._dispatch(message)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Backplane read error: {e}")
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+
+def create_backplane(kind: str = "local", redis_url: Optional[str] = None) -> Backplane:
+    """
+    Create a backplane.
+
+    Args:
+        kind: "local" or "redis"
+        redis_url: Redis URL (default: RedisCache default config)
+    """
+    if kind == "redis":
+        from src.cache.redis_cache import RedisCache, CacheConfig, cache_manager
+        cache = RedisCache(CacheConfig(url=redis_url)) if redis_url else cache_manager
+        return RedisBackplane(cache)
+    return InMemoryBackplane()
@@ -14,12 +14,14 @@ from dataclasses import dataclass, field
 from fastapi import WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
+from src.config.settings import get_settings
+from src.realtime.backplane import Backplane, InMemoryBackplane, create_backplane
 from src.realtime.events import Event, EventType
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(eq=False)
 class Connection:
     """Represents a WebSocket connection."""
 
@@ -29,10 +31,15 @@ class Connection:
     rooms: Set[str] = field(default_factory=set)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Outbound buffer drained by a per-connection sender task
+    queue: Optional[asyncio.Queue] = None
+    sender: Optional[asyncio.Task] = None
+    closed: bool = False
+
     @property
     def is_active(self) -> bool:
         """Check if connection is still active."""
-        return self.websocket.client_state == WebSocketState.CONNECTED
+        return not self.closed and self.websocket.client_state == WebSocketState.CONNECTED
 
 
 class ConnectionManager:
@@ -40,9 +47,27 @@ class ConnectionManager:
     Manages WebSocket connections.
 
     Handles user connections, room subscriptions, and message routing.
+
+    Sends are non-blocking: each event is serialized once and queued on
+    every target connection, and a sender task per connection writes its
+    queue. A client whose queue fills up, or whose single send exceeds
+    send_timeout, is dropped instead of stalling the others. Fan-out is
+    also published on the backplane so sockets held by other worker
+    processes receive it; counts returned are for this process only.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        backplane: Optional[Backplane] = None,
+        queue_size: int = 256,
+        send_timeout: float = 10.0
+    ):
+        """
+        Args:
+            backplane: Cross-process pub/sub (default: in-process only)
+            queue_size: Outbound messages buffered per connection
+            send_timeout: Seconds a single send may take before dropping the client
+        """
         # user_id -> Set[Connection] (one user can have multiple connections)
         self._connections: Dict[str, Set[Connection]] = {}
 
@@ -52,6 +77,32 @@ class ConnectionManager:
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
 
+        self._backplane = backplane or InMemoryBackplane()
+        self._queue_size = queue_size
+        self._send_timeout = send_timeout
+        self._started = False
+        self._closing: Set[asyncio.Task] = set()
+
+        self._messages_sent = 0
+        self._slow_consumers_dropped = 0
+        self._remote_messages = 0
+
+    async def start(self) -> None:
+        """Start receiving fan-out from other processes."""
+        if not self._started:
+            await self._backplane.start(self._handle_remote)
+            self._started = True
+
+    async def stop(self) -> None:
+        """Stop the backplane subscription and all sender tasks."""
+        if self._started:
+            await self._backplane.stop()
+            self._started = False
+        for connections in list(self._connections.values()):
+            for connection in list(connections):
+                if connection.sender is not None:
+                    connection.sender.cancel()
+
     async def connect(
         self,
         websocket: WebSocket,
@@ -74,8 +125,10 @@ class ConnectionManager:
         connection = Connection(
             websocket=websocket,
             user_id=user_id,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            queue=asyncio.Queue(maxsize=self._queue_size)
         )
+        connection.sender = asyncio.create_task(self._send_loop(connection))
 
         async with self._lock:
             if user_id not in self._connections:
@@ -101,6 +154,10 @@ class ConnectionManager:
             connection: Connection to disconnect
         """
         user_id = connection.user_id
+        connection.closed = True
+
+        if connection.sender is not None and connection.sender is not asyncio.current_task():
+            connection.sender.cancel()
 
         async with self._lock:
             # Remove from user connections
@@ -150,6 +207,115 @@ class ConnectionManager:
                 del self._rooms[room_id]
         connection.rooms.discard(room_id)
 
+    # =====================
+    # Outbound Queues
+    # =====================
+
+    @staticmethod
+    def _encode(event: Event) -> str:
+        """Serialize an event once for all recipients."""
+        return json.dumps(event.model_dump(mode="json"), ensure_ascii=False)
+
+    def _enqueue(self, connection: Connection, payload: str) -> bool:
+        """Queue a payload without waiting; drops the client if its queue is full."""
+        if not connection.is_active or connection.queue is None:
+            return False
+        try:
+            connection.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            logger.warning(f"Dropping slow consumer {connection.user_id}: {self._queue_size} messages queued")
+            self._drop(connection, "Slow consumer")
+            return False
+
+    def _drop(self, connection: Connection, reason: str) -> None:
+        """Close a client that cannot keep up."""
+        if connection.closed:
+            return
+        connection.closed = True
+        self._slow_consumers_dropped += 1
+        task = asyncio.ensure_future(self._close(connection, reason))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close(self, connection: Connection, reason: str) -> None:
+        await self.disconnect(connection)
+        try:
+            await connection.websocket.close(code=1013, reason=reason)
+        except Exception as e:
+            logger.debug(f"Close after drop failed: {e}")
+
+    async def _send_loop(self, connection: Connection) -> None:
+        """Write queued payloads to one connection."""
+        try:
+            while True:
+                payload = await connection.queue.get()
+                try:
+                    await asyncio.wait_for(connection.websocket.send_text(payload), self._send_timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Dropping slow consumer {connection.user_id}: send exceeded {self._send_timeout}s")
+                    self._drop(connection, "Slow consumer")
+                    return
+                except Exception as e:
+                    logger.error(f"Failed to send to connection: {e}")
+                    await self.disconnect(connection)
+                    return
+                self._messages_sent += 1
+        except asyncio.CancelledError:
+            pass
+
+    # =====================
+    # Local Fan-out
+    # =====================
+
+    def _deliver_to_user(self, user_id: str, payload: str) -> int:
+        return sum(
+            1 for connection in list(self._connections.get(user_id, ()))
+            if self._enqueue(connection, payload)
+        )
+
+    def _deliver_to_room(self, room_id: str, payload: str, exclude: Set[str]) -> int:
+        return sum(
+            self._deliver_to_user(user_id, payload)
+            for user_id in list(self._rooms.get(room_id, ()))
+            if user_id not in exclude
+        )
+
+    def _deliver_broadcast(self, payload: str, exclude: Set[str]) -> int:
+        return sum(
+            self._deliver_to_user(user_id, payload)
+            for user_id in list(self._connections)
+            if user_id not in exclude
+        )
+
+    # =====================
+    # Backplane
+    # =====================
+
+    async def _publish(self, message: Dict[str, Any]) -> None:
+        try:
+            await self._backplane.publish(message)
+        except Exception as e:
+            logger.error(f"Backplane publish failed: {e}")
+
+    async def _handle_remote(self, message: Dict[str, Any]) -> None:
+        """Deliver fan-out published by another process to local sockets."""
+        self._remote_messages += 1
+        target = message.get("target")
+        payload = message.get("payload", "")
+        exclude = set(message.get("exclude") or ())
+
+        if target == "user":
+            self._deliver_to_user(message["key"], payload)
+        elif target == "room":
+            self._deliver_to_room(message["key"], payload, exclude)
+        elif target == "broadcast":
+            self._deliver_broadcast(payload, exclude)
+
+    # =====================
+    # Sending
+    # =====================
+
     async def send_to_connection(self, connection: Connection, event: Event) -> bool:
         """
         Send event to a specific connection.
@@ -159,15 +325,9 @@ class ConnectionManager:
             event: Event to send
 
         Returns:
-            True if sent successfully
+            True if queued for sending
         """
-        try:
-            if connection.is_active:
-                await connection.websocket.send_json(event.model_dump())
-                return True
-        except Exception as e:
-            logger.error(f"Failed to send to connection: {e}")
-        return False
+        return self._enqueue(connection, self._encode(event))
 
     async def send_to_user(self, user_id: str, event: Event) -> int:
         """
@@ -178,15 +338,11 @@ class ConnectionManager:
             event: Event to send
 
         Returns:
-            Number of connections sent to
+            Number of connections sent to (this process)
         """
-        sent_count = 0
-        connections = self._connections.get(user_id, set())
-
-        for connection in list(connections):
-            if await self.send_to_connection(connection, event):
-                sent_count += 1
-
+        payload = self._encode(event)
+        sent_count = self._deliver_to_user(user_id, payload)
+        await self._publish({"target": "user", "key": user_id, "payload": payload})
         return sent_count
 
     async def send_to_room(self, room_id: str, event: Event, exclude: Set[str] = None) -> int:
@@ -199,37 +355,31 @@ class ConnectionManager:
             exclude: User IDs to exclude
 
         Returns:
-            Number of users sent to
+            Number of connections sent to (this process)
         """
         exclude = exclude or set()
-        sent_count = 0
-
-        user_ids = self._rooms.get(room_id, set())
-
-        for user_id in user_ids:
-            if user_id not in exclude:
-                sent_count += await self.send_to_user(user_id, event)
-
+        payload = self._encode(event)
+        sent_count = self._deliver_to_room(room_id, payload, exclude)
+        await self._publish({"target": "room", "key": room_id, "exclude": list(exclude), "payload": payload})
         return sent_count
 
-    async def broadcast(self, event: Event, exclude: Set[str] = None) -> int:
+    async def broadcast(self, event: Event, exclude: Set[str] = None, local_only: bool = False) -> int:
         """
         Broadcast event to all connected users.
 
         Args:
             event: Event to broadcast
             exclude: User IDs to exclude
+            local_only: Only this process's connections (e.g. heartbeats)
 
         Returns:
-            Number of users sent to
+            Number of connections sent to (this process)
         """
         exclude = exclude or set()
-        sent_count = 0
-
-        for user_id in list(self._connections.keys()):
-            if user_id not in exclude:
-                sent_count += await self.send_to_user(user_id, event)
-
+        payload = self._encode(event)
+        sent_count = self._deliver_broadcast(payload, exclude)
+        if not local_only:
+            await self._publish({"target": "broadcast", "exclude": list(exclude), "payload": payload})
         return sent_count
 
     def get_user_connections(self, user_id: str) -> List[Connection]:
@@ -263,7 +413,17 @@ class ConnectionManager:
             "room_stats": {
                 room_id: len(users)
                 for room_id, users in self._rooms.items()
-            }
+            },
+            "backplane": type(self._backplane).__name__,
+            "messages_sent": self._messages_sent,
+            "queued_messages": sum(
+                connection.queue.qsize()
+                for connections in self._connections.values()
+                for connection in connections
+                if connection.queue is not None
+            ),
+            "slow_consumers_dropped": self._slow_consumers_dropped,
+            "remote_messages": self._remote_messages,
         }
 
 
@@ -277,7 +437,12 @@ class WebSocketManager:
     _instance: Optional["WebSocketManager"] = None
 
     def __init__(self):
-        self.connection_manager = ConnectionManager()
+        settings = get_settings()
+        self.connection_manager = ConnectionManager(
+            backplane=create_backplane(settings.ws_backplane, settings.ws_redis_url),
+            queue_size=settings.ws_send_queue_size,
+            send_timeout=settings.ws_send_timeout
+        )
         self._heartbeat_task: Optional[asyncio.Task] = None
         self._heartbeat_interval = 30  # seconds
 
@@ -290,6 +455,7 @@ class WebSocketManager:
 
     async def start(self) -> None:
         """Start the WebSocket manager."""
+        await self.connection_manager.start()
         if self._heartbeat_task is None:
             self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
             logger.info("WebSocket manager started")
@@ -299,7 +465,8 @@ class WebSocketManager:
         if self._heartbeat_task:
             self._heartbeat_task.cancel()
             self._heartbeat_task = None
-            logger.info("WebSocket manager stopped")
+        await self.connection_manager.stop()
+        logger.info("WebSocket manager stopped")
 
     async def _heartbeat_loop(self) -> None:
         """Send periodic heartbeat to all connections."""
@@ -313,7 +480,8 @@ class WebSocketManager:
                     data={"timestamp": datetime.utcnow().isoformat()}
                 )
 
-                await self.connection_manager.broadcast(heartbeat)
+                # Every worker runs its own heartbeat loop
+                await self.connection_manager.broadcast(heartbeat, local_only=True)
 
             except asyncio.CancelledError:
                 break
@@ -4,13 +4,17 @@ Base repository implementations.
 Provides abstract base class and JSON file-based implementation.
 """
 
+import atexit
 import json
+import operator
 import os
 import threading
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
 from pathlib import Path
-from typing import TypeVar, Generic, Optional, List, Dict, Any, Type, Callable
+from typing import TypeVar, Generic, Optional, List, Dict, Any, Type, Callable, Iterable, Sequence, Set, Tuple
 import logging
 
 from src.core.models.base import BaseModel, Entity
@@ -20,6 +24,15 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=Entity)
 
+# Comparison suffixes accepted by query(), e.g. rating__gte=4
+QUERY_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "contains": lambda items, value: isinstance(items, list) and value in items,
+}
+
 
 class BaseRepository(ABC, Generic[T]):
     """
@@ -80,14 +93,29 @@ class JSONRepository(BaseRepository[T]):
 
     Thread-safe implementation for development and small-scale deployments.
     For production, replace with database-backed implementations.
+
+    In indexed mode the parsed collection stays resident:
+    - primary-key dict plus declared secondary indexes for find()/count()
+    - validated entities are cached, so rows are not re-validated per read
+    - the file is re-read only when its mtime/size changes (other processes)
+    - writes go through an atomic temp-file rename, optionally batched
+
+    Subclasses declare search_fields for query(text=...) and numeric_fields
+    for values serialized as strings (Decimal) that must compare as numbers.
     """
 
+    search_fields: Sequence[str] = ()
+    numeric_fields: Sequence[str] = ()
+
     def __init__(
         self,
         data_dir: str,
         filename: str,
         entity_class: Type[T],
-        id_field: str = "id"
+        id_field: str = "id",
+        indexed: bool = False,
+        indexes: Sequence[str] = (),
+        write_delay: float = 0.0
     ):
         """
         Initialize JSON repository.
@@ -97,16 +125,34 @@ class JSONRepository(BaseRepository[T]):
             filename: JSON file name
             entity_class: Pydantic model class for entities
             id_field: Name of the ID field
+            indexed: Keep the collection resident with in-memory indexes
+            indexes: Fields to maintain secondary indexes on (indexed mode)
+            write_delay: Seconds to batch writes before flushing (indexed mode, 0 = immediate)
         """
         self.data_dir = Path(data_dir)
         self.filename = filename
         self.entity_class = entity_class
         self.id_field = id_field
         self.file_path = self.data_dir / filename
+        self.indexed = indexed
+        self.index_fields = tuple(indexes)
+        self.write_delay = write_delay
 
         # Thread safety
         self._lock = threading.RLock()
 
+        # Indexed mode state
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._entities: Dict[str, T] = {}
+        self._position: Dict[str, int] = {}
+        self._next_position = 0
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = {f: {} for f in self.index_fields}
+        self._unindexed: Dict[str, Set[str]] = {f: set() for f in self.index_fields}
+        self._search_text: Dict[str, str] = {}
+        self._file_signature: Optional[tuple] = None
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+
         # Ensure directory exists
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -114,7 +160,10 @@ class JSONRepository(BaseRepository[T]):
         if not self.file_path.exists():
             self._write_data([])
 
-        logger.debug(f"Initialized JSONRepository: {self.file_path}")
+        if self.indexed and self.write_delay > 0:
+            atexit.register(self.flush)
+
+        logger.debug(f"Initialized JSONRepository: {self.file_path} (indexed={indexed})")
 
     def _read_data(self) -> List[Dict[str, Any]]:
         """Read data from JSON file."""
@@ -140,9 +189,184 @@ class JSONRepository(BaseRepository[T]):
         """Convert entity to dictionary."""
         return entity.model_dump(mode="json")
 
+    @staticmethod
+    def _matches(item: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
+        """Check whether a raw row matches all criteria."""
+        for key, value in criteria.items():
+            if key not in item:
+                return False
+
+            item_value = item[key]
+
+            # Handle list membership
+            if isinstance(value, list):
+                if item_value not in value:
+                    return False
+            # Handle callable predicates
+            elif callable(value):
+                if not value(item_value):
+                    return False
+            # Direct comparison
+            elif item_value != value:
+                return False
+
+        return True
+
+    # =====================
+    # Indexed Mode
+    # =====================
+
+    @staticmethod
+    def _index_key(value: Any) -> Any:
+        """Normalize a lookup value to the form stored in JSON rows."""
+        return value.value if isinstance(value, Enum) else value
+
+    def _file_stat(self) -> Optional[tuple]:
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _ensure_loaded(self) -> None:
+        """(Re)load the resident collection if the file changed on disk."""
+        signature = self._file_stat()
+        if signature == self._file_signature:
+            return
+        if self._dirty:
+            # Pending local writes win; they are flushed over the file shortly
+            return
+
+        self._rows = {}
+        self._entities = {}
+        self._position = {}
+        self._next_position = 0
+        self._indexes = {f: {} for f in self.index_fields}
+        self._unindexed = {f: set() for f in self.index_fields}
+        self._search_text = {}
+
+        for item in self._read_data():
+            entity_id = item.get(self.id_field)
+            if entity_id is not None:
+                self._put_row(entity_id, item)
+
+        self._file_signature = signature
+        logger.debug(f"Loaded {len(self._rows)} rows from {self.file_path}")
+
+    def _put_row(self, entity_id: str, row: Dict[str, Any]) -> None:
+        """Insert or replace a row and update indexes."""
+        if entity_id in self._rows:
+            self._unindex_row(entity_id, self._rows[entity_id])
+        else:
+            self._position[entity_id] = self._next_position
+            self._next_position += 1
+
+        self._rows[entity_id] = row
+        self._entities.pop(entity_id, None)
+        self._search_text.pop(entity_id, None)
+
+        for field in self.index_fields:
+            if field not in row:
+                continue
+            try:
+                self._indexes[field].setdefault(row[field], set()).add(entity_id)
+            except TypeError:  # unhashable (list/dict) values are always scanned
+                self._unindexed[field].add(entity_id)
+
+    def _unindex_row(self, entity_id: str, row: Dict[str, Any]) -> None:
+        for field in self.index_fields:
+            if field not in row:
+                continue
+            self._unindexed[field].discard(entity_id)
+            try:
+                ids = self._indexes[field].get(row[field])
+            except TypeError:
+                continue
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del self._indexes[field][row[field]]
+
+    def _remove_row(self, entity_id: str) -> None:
+        row = self._rows.pop(entity_id)
+        self._unindex_row(entity_id, row)
+        self._entities.pop(entity_id, None)
+        self._search_text.pop(entity_id, None)
+        self._position.pop(entity_id, None)
+
+    def _candidate_ids(self, criteria: Dict[str, Any]) -> Iterable[str]:
+        """Narrow row IDs through secondary indexes (rows still need _matches)."""
+        candidates: Optional[Set[str]] = None
+
+        for key, value in criteria.items():
+            if key not in self._indexes or callable(value):
+                continue
+
+            index = self._indexes[key]
+            found = set(self._unindexed[key])
+            try:
+                for v in (value if isinstance(value, list) else [value]):
+                    found |= index.get(self._index_key(v), set())
+            except TypeError:
+                continue
+
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                return []
+
+        if candidates is None:
+            return list(self._rows)
+        return sorted(candidates, key=self._position.__getitem__)
+
+    def _get_entity(self, entity_id: str) -> Optional[T]:
+        """Validated entity for a resident row (a copy callers may mutate)."""
+        row = self._rows.get(entity_id)
+        if row is None:
+            return None
+        entity = self._entities.get(entity_id)
+        if entity is None:
+            entity = self._entities[entity_id] = self._to_entity(row)
+        return entity.model_copy(deep=True)
+
+    def _mark_dirty(self) -> None:
+        """Write immediately, or schedule a batched flush."""
+        self._dirty = True
+        if self.write_delay <= 0:
+            self._flush_locked()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.write_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_locked(self) -> None:
+        if not self._dirty:
+            return
+        self._write_atomic(list(self._rows.values()))
+        self._dirty = False
+        self._file_signature = self._file_stat()
+
+    def _write_atomic(self, data: List[Dict[str, Any]]) -> None:
+        """Write data to a temp file and rename it over the target."""
+        tmp_path = self.file_path.with_name(f"{self.file_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, self.file_path)
+
+    def flush(self) -> None:
+        """Flush pending batched writes (indexed mode)."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._flush_locked()
+
     def get_by_id(self, entity_id: str) -> Optional[T]:
         """Get entity by ID."""
         with self._lock:
+            if self.indexed:
+                self._ensure_loaded()
+                return self._get_entity(entity_id)
+
             data = self._read_data()
             for item in data:
                 if item.get(self.id_field) == entity_id:
@@ -152,6 +376,10 @@ class JSONRepository(BaseRepository[T]):
     def get_all(self) -> List[T]:
         """Get all entities."""
         with self._lock:
+            if self.indexed:
+                self._ensure_loaded()
+                return [self._get_entity(entity_id) for entity_id in self._rows]
+
             data = self._read_data()
             return [self._to_entity(item) for item in data]
 
@@ -166,37 +394,16 @@ class JSONRepository(BaseRepository[T]):
             List of matching entities
         """
         with self._lock:
-            data = self._read_data()
-            results = []
+            if self.indexed:
+                self._ensure_loaded()
+                return [
+                    self._get_entity(entity_id)
+                    for entity_id in self._candidate_ids(criteria)
+                    if self._matches(self._rows[entity_id], criteria)
+                ]
 
-            for item in data:
-                match = True
-                for key, value in criteria.items():
-                    if key not in item:
-                        match = False
-                        break
-
-                    item_value = item[key]
-
-                    # Handle list membership
-                    if isinstance(value, list):
-                        if item_value not in value:
-                            match = False
-                            break
-                    # Handle callable predicates
-                    elif callable(value):
-                        if not value(item_value):
-                            match = False
-                            break
-                    # Direct comparison
-                    elif item_value != value:
-                        match = False
-                        break
-
-                if match:
-                    results.append(self._to_entity(item))
-
-            return results
+            data = self._read_data()
+            return [self._to_entity(item) for item in data if self._matches(item, criteria)]
 
     def find_one(self, **criteria) -> Optional[T]:
         """Find single entity matching criteria."""
@@ -206,9 +413,19 @@ class JSONRepository(BaseRepository[T]):
     def create(self, entity: T) -> T:
         """Create new entity."""
         with self._lock:
-            data = self._read_data()
             entity_id = getattr(entity, self.id_field)
 
+            if self.indexed:
+                self._ensure_loaded()
+                if entity_id in self._rows:
+                    raise AlreadyExistsError(self.entity_class.__name__, entity_id)
+                self._put_row(entity_id, self._to_dict(entity))
+                self._mark_dirty()
+                logger.debug(f"Created {self.entity_class.__name__}: {entity_id}")
+                return entity
+
+            data = self._read_data()
+
             # Check for duplicate
             for item in data:
                 if item.get(self.id_field) == entity_id:
@@ -226,8 +443,19 @@ class JSONRepository(BaseRepository[T]):
     def update(self, entity: T) -> T:
         """Update existing entity."""
         with self._lock:
-            data = self._read_data()
             entity_id = getattr(entity, self.id_field)
+
+            if self.indexed:
+                self._ensure_loaded()
+                if entity_id not in self._rows:
+                    raise NotFoundError(self.entity_class.__name__, entity_id)
+                entity.touch()  # Update timestamp
+                self._put_row(entity_id, self._to_dict(entity))
+                self._mark_dirty()
+                logger.debug(f"Updated {self.entity_class.__name__}: {entity_id}")
+                return entity
+
+            data = self._read_data()
             entity.touch()  # Update timestamp
 
             for i, item in enumerate(data):
@@ -249,6 +477,15 @@ class JSONRepository(BaseRepository[T]):
     def delete(self, entity_id: str) -> bool:
         """Delete entity by ID."""
         with self._lock:
+            if self.indexed:
+                self._ensure_loaded()
+                if entity_id not in self._rows:
+                    return False
+                self._remove_row(entity_id)
+                self._mark_dirty()
+                logger.debug(f"Deleted {self.entity_class.__name__}: {entity_id}")
+                return True
+
             data = self._read_data()
             initial_count = len(data)
 
@@ -263,10 +500,24 @@ class JSONRepository(BaseRepository[T]):
 
     def exists(self, entity_id: str) -> bool:
         """Check if entity exists."""
+        if self.indexed:
+            with self._lock:
+                self._ensure_loaded()
+                return entity_id in self._rows
         return self.get_by_id(entity_id) is not None
 
     def count(self, **criteria) -> int:
         """Count entities matching criteria."""
+        if self.indexed:
+            with self._lock:
+                self._ensure_loaded()
+                if not criteria:
+                    return len(self._rows)
+                return sum(
+                    1 for entity_id in self._candidate_ids(criteria)
+                    if self._matches(self._rows[entity_id], criteria)
+                )
+
         if not criteria:
             with self._lock:
                 return len(self._read_data())
@@ -275,9 +526,179 @@ class JSONRepository(BaseRepository[T]):
     def clear(self) -> None:
         """Clear all entities (use with caution)."""
         with self._lock:
+            if self.indexed:
+                self._ensure_loaded()
+                for entity_id in list(self._rows):
+                    self._remove_row(entity_id)
+                self._mark_dirty()
+                logger.warning(f"Cleared all data in {self.file_path}")
+                return
+
             self._write_data([])
             logger.warning(f"Cleared all data in {self.file_path}")
 
+    # =====================
+    # Query Support
+    # =====================
+
+    @staticmethod
+    def _json_value(value: Any) -> Any:
+        """Convert a query value to the form stored in JSON rows."""
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return float(value)
+        return value
+
+    @staticmethod
+    def _split_operators(criteria: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Tuple[str, str, Any]]]:
+        """Separate ``field__op`` comparisons from plain find() criteria."""
+        plain = {}
+        comparisons = []
+        for key, value in criteria.items():
+            field, sep, op = key.rpartition("__")
+            if sep and op in QUERY_OPERATORS:
+                comparisons.append((field, op, value))
+            else:
+                plain[key] = value
+        return plain, comparisons
+
+    def _field_value(self, row: Dict[str, Any], field: str) -> Any:
+        value = row.get(field)
+        if field in self.numeric_fields and isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                return None
+        return value
+
+    def _compare(self, row: Dict[str, Any], comparisons: List[Tuple[str, str, Any]]) -> bool:
+        for field, op, bound in comparisons:
+            value = self._field_value(row, field)
+            if value is None:
+                return False
+            try:
+                if not QUERY_OPERATORS[op](value, self._json_value(bound)):
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    def _row_search_text(self, row: Dict[str, Any]) -> str:
+        """Lower-cased text of search_fields (cached per row in indexed mode)."""
+        entity_id = row.get(self.id_field)
+        if self.indexed and entity_id in self._search_text:
+            return self._search_text[entity_id]
+
+        parts = []
+        for field in self.search_fields:
+            value = row.get(field)
+            if isinstance(value, list):
+                parts.extend(str(v) for v in value)
+            elif value is not None:
+                parts.append(str(value))
+        text = "\n".join(parts).lower()
+
+        if self.indexed and entity_id in self._rows:
+            self._search_text[entity_id] = text
+        return text
+
+    def _filter_rows(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        criteria: Dict[str, Any],
+        comparisons: List[Tuple[str, str, Any]],
+        text: Optional[str],
+        order_by: Sequence[Tuple[str, bool]]
+    ) -> List[Dict[str, Any]]:
+        """Filter, search and sort raw rows without building entities."""
+        needle = text.lower() if text else None
+        matched = [
+            row for row in rows
+            if self._matches(row, criteria)
+            and self._compare(row, comparisons)
+            and (needle is None or needle in self._row_search_text(row))
+        ]
+
+        # Stable multi-key sort, last key first; None sorts last either way
+        for field, descending in reversed(list(order_by)):
+            if descending:
+                matched.sort(key=lambda r: (self._field_value(r, field) is not None, self._field_value(r, field)),
+                             reverse=True)
+            else:
+                matched.sort(key=lambda r: (self._field_value(r, field) is None, self._field_value(r, field)))
+
+        return matched
+
+    def query(
+        self,
+        text: Optional[str] = None,
+        order_by: Sequence[Tuple[str, bool]] = (),
+        offset: int = 0,
+        limit: Optional[int] = None,
+        **criteria
+    ) -> Tuple[List[T], int]:
+        """
+        Filter, search, sort and slice in the storage layer.
+
+        Only the returned page is converted to entities.
+
+        Args:
+            text: Case-insensitive substring to look for in search_fields
+            order_by: (field, descending) pairs
+            offset: Matches to skip
+            limit: Maximum number of entities to return
+            **criteria: find() criteria, plus ``field__lt``, ``__lte``, ``__gt``,
+                ``__gte`` comparisons and ``field__contains`` for list fields
+
+        Returns:
+            Tuple of (entities, total number of matches)
+        """
+        plain, comparisons = self._split_operators(criteria)
+        offset = max(offset, 0)
+        end = offset + limit if limit is not None else None
+
+        with self._lock:
+            if self.indexed:
+                self._ensure_loaded()
+                rows = (self._rows[entity_id] for entity_id in self._candidate_ids(plain))
+                matched = self._filter_rows(rows, plain, comparisons, text, order_by)
+                return [self._get_entity(row[self.id_field]) for row in matched[offset:end]], len(matched)
+
+            matched = self._filter_rows(self._read_data(), plain, comparisons, text, order_by)
+            return [self._to_entity(row) for row in matched[offset:end]], len(matched)
+
+    def query_page(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        text: Optional[str] = None,
+        order_by: Sequence[Tuple[str, bool]] = (),
+        **criteria
+    ) -> Dict[str, Any]:
+        """
+        Paginated query().
+
+        Returns:
+            Dict with items, total, page, page_size, total_pages
+        """
+        items, total = self.query(
+            text=text,
+            order_by=order_by,
+            offset=(page - 1) * page_size,
+            limit=page_size,
+            **criteria
+        )
+        return {
+            "items": items,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size
+        }
+
     # =====================
     # Pagination Support
     # =====================
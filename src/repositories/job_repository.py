@@ -12,11 +12,24 @@ from src.core.models.job import JobPosting, JobType, RecruitmentStatus, JobAlert
 class JobRepository(JSONRepository[JobPosting]):
     """Repository for JobPosting entities."""
 
-    def __init__(self, data_dir: str = "data"):
+    search_fields = ("title", "airline_name", "description")
+
+    SORT_FIELDS = {
+        "deadline": "end_date",
+        "posted": "announcement_date",
+        "airline": "airline_name",
+    }
+
+    def __init__(self, data_dir: str = "data", **options):
         super().__init__(
             data_dir=data_dir,
             filename="job_postings.json",
-            entity_class=JobPosting
+            entity_class=JobPosting,
+            indexes=(
+                "airline_code", "status", "job_type", "content_hash",
+                "airline_name", "announcement_date", "end_date",
+            ),
+            **options
         )
 
     def get_open_jobs(self) -> List[JobPosting]:
@@ -58,56 +71,33 @@ class JobRepository(JSONRepository[JobPosting]):
         Returns:
             Paginated results
         """
-        jobs = self.get_all()
+        filters = {}
 
-        # Apply filters
         if criteria.airline_codes:
-            jobs = [j for j in jobs if j.airline_code in criteria.airline_codes]
+            filters["airline_code"] = list(criteria.airline_codes)
 
         if criteria.job_types:
-            type_values = [t.value for t in criteria.job_types]
-            jobs = [j for j in jobs if j.job_type in type_values]
+            filters["job_type"] = [t.value for t in criteria.job_types]
 
         if criteria.status:
-            status_values = [s.value for s in criteria.status]
-            jobs = [j for j in jobs if j.status in status_values]
+            filters["status"] = [s.value for s in criteria.status]
 
         if criteria.deadline_within_days:
-            deadline = date.today() + timedelta(days=criteria.deadline_within_days)
-            jobs = [j for j in jobs if j.end_date and j.end_date <= deadline]
+            filters["end_date__lte"] = date.today() + timedelta(days=criteria.deadline_within_days)
 
         if criteria.posted_after:
-            jobs = [j for j in jobs if j.announcement_date and j.announcement_date >= criteria.posted_after]
-
-        if criteria.query:
-            query_lower = criteria.query.lower()
-            jobs = [
-                j for j in jobs
-                if query_lower in j.title.lower()
-                or query_lower in j.airline_name.lower()
-                or (j.description and query_lower in j.description.lower())
-            ]
-
-        # Sort
-        if criteria.sort_by == "deadline":
-            jobs.sort(key=lambda j: j.end_date or date.max, reverse=(criteria.sort_order == "desc"))
-        elif criteria.sort_by == "posted":
-            jobs.sort(key=lambda j: j.announcement_date or date.min, reverse=(criteria.sort_order == "desc"))
-        elif criteria.sort_by == "airline":
-            jobs.sort(key=lambda j: j.airline_name, reverse=(criteria.sort_order == "desc"))
-
-        # Paginate
-        total = len(jobs)
-        start = (criteria.page - 1) * criteria.page_size
-        end = start + criteria.page_size
+            filters["announcement_date__gte"] = criteria.posted_after
 
-        return {
-            "items": jobs[start:end],
-            "total": total,
-            "page": criteria.page,
-            "page_size": criteria.page_size,
-            "total_pages": (total + criteria.page_size - 1) // criteria.page_size
-        }
+        sort_field = self.SORT_FIELDS.get(criteria.sort_by)
+        order_by = ((sort_field, criteria.sort_order == "desc"),) if sort_field else ()
+
+        return self.query_page(
+            page=criteria.page,
+            page_size=criteria.page_size,
+            text=criteria.query,
+            order_by=order_by,
+            **filters
+        )
 
     def get_by_content_hash(self, content_hash: str) -> Optional[JobPosting]:
         """Find job posting by content hash (for deduplication)."""
@@ -163,12 +153,14 @@ class JobRepository(JSONRepository[JobPosting]):
 class JobAlertRepository(JSONRepository[JobAlert]):
     """Repository for JobAlert preferences."""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", **options):
         super().__init__(
             data_dir=data_dir,
             filename="job_alerts.json",
             entity_class=JobAlert,
-            id_field="user_id"
+            id_field="user_id",
+            indexes=("is_active",),
+            **options
         )
 
     def get_by_user(self, user_id: str) -> Optional[JobAlert]:
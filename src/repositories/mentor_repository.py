@@ -15,11 +15,27 @@ from src.core.models.mentor import (
 class MentorRepository(JSONRepository[Mentor]):
     """Repository for Mentor entities."""
 
-    def __init__(self, data_dir: str = "data"):
+    search_fields = ("name", "bio", "specialties")
+    numeric_fields = ("hourly_rate",)
+
+    SORT_ORDERS = {
+        "rating": (("rating", True), ("total_reviews", True)),
+        "sessions": (("total_sessions", True),),
+        "rate_low": (("hourly_rate", False),),
+        "rate_high": (("hourly_rate", True),),
+    }
+
+    def __init__(self, data_dir: str = "data", **options):
         super().__init__(
             data_dir=data_dir,
             filename="mentors.json",
-            entity_class=Mentor
+            entity_class=Mentor,
+            indexes=(
+                "user_id", "status", "mentor_type", "verified",
+                "airlines", "session_types",
+                "hourly_rate", "rating", "total_reviews", "total_sessions",
+            ),
+            **options
         )
 
     def get_by_user_id(self, user_id: str) -> Optional[Mentor]:
@@ -36,8 +52,12 @@ class MentorRepository(JSONRepository[Mentor]):
 
     def get_by_airline(self, airline_code: str) -> List[Mentor]:
         """Get mentors who worked at a specific airline."""
-        mentors = self.get_active_mentors()
-        return [m for m in mentors if airline_code in m.airlines]
+        mentors, _ = self.query(
+            status=MentorStatus.ACTIVE.value,
+            verified=True,
+            airlines__contains=airline_code
+        )
+        return mentors
 
     def get_by_specialty(self, specialty: str) -> List[Mentor]:
         """Get mentors with a specific specialty."""
@@ -77,61 +97,40 @@ class MentorRepository(JSONRepository[Mentor]):
         Returns:
             Paginated results
         """
-        mentors = self.get_active_mentors()
+        criteria = {"status": MentorStatus.ACTIVE.value, "verified": True}
 
-        # Apply filters
         if mentor_type:
-            mentors = [m for m in mentors if m.mentor_type == mentor_type]
+            criteria["mentor_type"] = mentor_type.value
 
         if airline:
-            mentors = [m for m in mentors if airline in m.airlines]
+            criteria["airlines__contains"] = airline
 
         if session_type:
-            mentors = [m for m in mentors if session_type in m.session_types]
+            criteria["session_types__contains"] = session_type.value
 
         if max_rate:
-            mentors = [m for m in mentors if m.hourly_rate <= max_rate]
+            criteria["hourly_rate__lte"] = max_rate
 
         if min_rating:
-            mentors = [m for m in mentors if m.rating >= min_rating]
-
-        if query:
-            query_lower = query.lower()
-            mentors = [
-                m for m in mentors
-                if query_lower in m.name.lower()
-                or query_lower in m.bio.lower()
-                or any(query_lower in s.lower() for s in m.specialties)
-            ]
-
-        # Sort
-        if sort_by == "rating":
-            mentors.sort(key=lambda m: (m.rating, m.total_reviews), reverse=True)
-        elif sort_by == "sessions":
-            mentors.sort(key=lambda m: m.total_sessions, reverse=True)
-        elif sort_by == "rate_low":
-            mentors.sort(key=lambda m: m.hourly_rate)
-        elif sort_by == "rate_high":
-            mentors.sort(key=lambda m: m.hourly_rate, reverse=True)
-
-        # Paginate
-        total = len(mentors)
-        start = (page - 1) * page_size
-        end = start + page_size
-
-        return {
-            "items": mentors[start:end],
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": (total + page_size - 1) // page_size
-        }
+            criteria["rating__gte"] = min_rating
+
+        return self.query_page(
+            page=page,
+            page_size=page_size,
+            text=query,
+            order_by=self.SORT_ORDERS.get(sort_by, ()),
+            **criteria
+        )
 
     def get_top_rated(self, limit: int = 10) -> List[Mentor]:
         """Get top-rated mentors."""
-        mentors = self.get_active_mentors()
-        mentors.sort(key=lambda m: (m.rating, m.total_reviews), reverse=True)
-        return mentors[:limit]
+        mentors, _ = self.query(
+            order_by=self.SORT_ORDERS["rating"],
+            limit=limit,
+            status=MentorStatus.ACTIVE.value,
+            verified=True
+        )
+        return mentors
 
     def get_stats(self) -> dict:
         """Get mentor statistics."""
@@ -162,11 +161,13 @@ class MentorRepository(JSONRepository[Mentor]):
 class SessionRepository(JSONRepository[MentoringSession]):
     """Repository for MentoringSession entities."""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", **options):
         super().__init__(
             data_dir=data_dir,
             filename="mentoring_sessions.json",
-            entity_class=MentoringSession
+            entity_class=MentoringSession,
+            indexes=("mentor_id", "mentee_id", "status", "scheduled_date"),
+            **options
         )
 
     def get_by_mentor(self, mentor_id: str, status: Optional[SessionStatus] = None) -> List[MentoringSession]:
@@ -197,8 +198,7 @@ class SessionRepository(JSONRepository[MentoringSession]):
 
     def get_sessions_on_date(self, mentor_id: str, session_date: date) -> List[MentoringSession]:
         """Get sessions for a mentor on a specific date."""
-        sessions = self.get_by_mentor(mentor_id)
-        return [s for s in sessions if s.scheduled_date == session_date]
+        return self.find(mentor_id=mentor_id, scheduled_date=session_date.isoformat())
 
     def get_pending_confirmation(self, mentor_id: str) -> List[MentoringSession]:
         """Get sessions pending confirmation."""
@@ -13,11 +13,13 @@ from src.core.models.payment import Payment, PaymentStatus, PaymentMethod, Subsc
 class PaymentRepository(JSONRepository[Payment]):
     """Repository for Payment entities."""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", **options):
         super().__init__(
             data_dir=data_dir,
             filename="payments.json",
-            entity_class=Payment
+            entity_class=Payment,
+            indexes=("user_id", "order_id", "status"),
+            **options
         )
 
     def get_by_order_id(self, order_id: str) -> Optional[Payment]:
@@ -75,11 +77,13 @@ class PaymentRepository(JSONRepository[Payment]):
 class SubscriptionRepository(JSONRepository[Subscription]):
     """Repository for Subscription entities."""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", **options):
         super().__init__(
             data_dir=data_dir,
             filename="subscriptions.json",
-            entity_class=Subscription
+            entity_class=Subscription,
+            indexes=("user_id", "status", "auto_renew"),
+            **options
         )
 
     def get_active_subscription(self, user_id: str) -> Optional[Subscription]:
@@ -0,0 +1,551 @@
+"""
+SQL-backed repository implementations.
+
+Stores each entity as a JSON document row alongside typed columns for the
+repository's declared index fields, so every existing repository query keeps
+working while filters on indexed fields run in the database. query() pushes
+comparisons, text search (a lower-cased ``search_text`` column matched with
+LIKE), ordering and LIMIT/OFFSET into SQL. Selected by the container when
+``DB_TYPE`` is ``sqlite`` or ``postgresql``.
+
+Bulk import of the existing ``data/*.json`` files:
+
+    python -m src.repositories.sql_repository --data-dir data
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+import logging
+
+from sqlalchemy import (
+    Boolean, Column, Float, Integer, MetaData, String, Table, Text,
+    and_, delete, func, insert, select, text, update,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.types import TypeEngine
+
+from src.core.exceptions import NotFoundError, AlreadyExistsError
+from src.database.query_optimizer import create_indexes_sql
+from src.repositories.base import JSONRepository, QUERY_OPERATORS, T
+from src.repositories.user_repository import UserRepository
+from src.repositories.payment_repository import PaymentRepository, SubscriptionRepository
+from src.repositories.mentor_repository import MentorRepository, SessionRepository
+from src.repositories.job_repository import JobRepository, JobAlertRepository
+
+logger = logging.getLogger(__name__)
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+# Delimiter for list columns, stored as "<sep>a<sep>b<sep>" so LIKE matches whole items
+_LIST_SEPARATOR = "\x1f"
+
+
+class SQLDocumentRepository(JSONRepository[T]):
+    """
+    SQLAlchemy document-table repository.
+
+    Drop-in replacement for JSONRepository storage: same criteria semantics
+    (equality, list membership, callable predicates), same entity mapping.
+    Criteria on declared index columns become SQL WHERE clauses; anything
+    else (callables, non-indexed fields) is applied to the decoded rows.
+    """
+
+    # Column types for index fields that are not strings
+    sql_column_types: Dict[str, TypeEngine] = {}
+
+    # Additional multi-column indexes
+    sql_composite_indexes: Sequence[Tuple[str, ...]] = ()
+
+    # Index fields holding lists of scalars (support ``field__contains``)
+    sql_list_fields: Sequence[str] = ()
+
+    def __init__(
+        self,
+        data_dir: str,
+        filename: str,
+        entity_class: Type[T],
+        id_field: str = "id",
+        indexes: Sequence[str] = (),
+        engine: Optional[Engine] = None,
+        **_json_options
+    ):
+        """
+        Initialize SQL repository.
+
+        Args:
+            data_dir: Directory of the JSON file this table replaces (used for import)
+            filename: JSON file name; the table is named ``doc_<stem>``
+            entity_class: Pydantic model class for entities
+            id_field: Name of the ID field
+            indexes: Fields stored as indexed columns
+            engine: SQLAlchemy engine (default: src.database.session.engine)
+        """
+        if engine is None:
+            from src.database.session import engine
+
+        self.data_dir = Path(data_dir)
+        self.filename = filename
+        self.file_path = self.data_dir / filename
+        self.entity_class = entity_class
+        self.id_field = id_field
+        self.index_fields = tuple(indexes)
+        self.indexed = False
+        self.engine = engine
+
+        columns = [Column("id", String(64), primary_key=True)]
+        for field in self.index_fields:
+            default_type = Text() if field in self.sql_list_fields else String(255)
+            columns.append(Column(field, self.sql_column_types.get(field, default_type)))
+        if self.search_fields:
+            columns.append(Column("search_text", Text))
+        columns.append(Column("data", Text, nullable=False))
+        columns.append(Column("inserted_at", Float, nullable=False))
+
+        metadata = MetaData()
+        self._table = Table(f"doc_{Path(filename).stem}", metadata, *columns)
+        metadata.create_all(engine, checkfirst=True)
+        self._create_indexes()
+
+        logger.debug(f"Initialized SQLDocumentRepository: {self._table.name}")
+
+    def _create_indexes(self) -> None:
+        table = self._table.name
+        definitions = [
+            {"name": f"idx_{table}_{field}", "columns": [field]}
+            for field in self.index_fields
+            if field not in self.sql_list_fields
+        ]
+        definitions.append({"name": f"idx_{table}_order", "columns": ["inserted_at", "id"]})
+        for columns in self.sql_composite_indexes:
+            definitions.append({"name": f"idx_{table}_{'_'.join(columns)}", "columns": list(columns)})
+
+        with self.engine.begin() as conn:
+            for statement in create_indexes_sql(table, definitions, dialect=self.engine.dialect.name):
+                conn.execute(text(statement))
+
+    # =====================
+    # Row Mapping
+    # =====================
+
+    def _coerce(self, field: str, value: Any) -> Any:
+        """Convert a JSON value to the column's Python type (None if not scalar)."""
+        if field in self.sql_list_fields:
+            if not isinstance(value, list):
+                return None
+            items = [str(self._json_value(v)) for v in value]
+            return _LIST_SEPARATOR + _LIST_SEPARATOR.join(items) + _LIST_SEPARATOR
+
+        value = self._json_value(value)
+        if value is None:
+            return None
+        if not isinstance(value, _SCALAR_TYPES):
+            return None
+        python_type = self._table.c[field].type.python_type
+        if isinstance(value, python_type):
+            return value
+        try:
+            return python_type(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _row_values(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        values = {field: self._coerce(field, row.get(field)) for field in self.index_fields}
+        values["id"] = row[self.id_field]
+        if self.search_fields:
+            values["search_text"] = self._row_search_text(row)
+        values["data"] = json.dumps(row, ensure_ascii=False, default=str)
+        return values
+
+    def _split_criteria(self, criteria: Dict[str, Any]) -> Tuple[list, Dict[str, Any]]:
+        """Split criteria into SQL clauses and the remainder to check in Python."""
+        clauses = []
+        remaining = {}
+
+        for key, value in criteria.items():
+            if key not in self.index_fields or key in self.sql_list_fields or callable(value):
+                remaining[key] = value
+                continue
+
+            column = self._table.c[key]
+            if isinstance(value, list):
+                values = [self._coerce(key, v) for v in value]
+                if any(v is None for v in values):
+                    remaining[key] = value
+                    continue
+                clauses.append(column.in_(values))
+            elif self._index_key(value) is None:
+                clauses.append(column.is_(None))
+            else:
+                coerced = self._coerce(key, value)
+                if coerced is None:
+                    remaining[key] = value
+                    continue
+                clauses.append(column == coerced)
+
+        return clauses, remaining
+
+    def _comparison_clause(self, field: str, op: str, bound: Any):
+        """SQL clause for a ``field__op`` comparison (None if it must run in Python)."""
+        if field not in self.index_fields:
+            return None
+
+        column = self._table.c[field]
+        if op == "contains":
+            value = self._json_value(bound)
+            if field not in self.sql_list_fields or not isinstance(value, _SCALAR_TYPES):
+                return None
+            return column.contains(f"{_LIST_SEPARATOR}{value}{_LIST_SEPARATOR}", autoescape=True)
+
+        if field in self.sql_list_fields:
+            return None
+        value = self._coerce(field, bound)
+        if value is None:
+            return None
+        return QUERY_OPERATORS[op](column, value)
+
+    def _select_rows(self, criteria: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        clauses, remaining = self._split_criteria(criteria)
+        query = select(self._table.c.data).order_by(self._table.c.inserted_at, self._table.c.id)
+        if clauses:
+            query = query.where(and_(*clauses))
+        if limit is not None and not remaining:
+            query = query.limit(limit)
+
+        with self.engine.connect() as conn:
+            rows = (json.loads(data) for (data,) in conn.execute(query))
+            matched = [row for row in rows if not remaining or self._matches(row, remaining)]
+
+        return matched[:limit] if limit is not None else matched
+
+    # =====================
+    # Repository Interface
+    # =====================
+
+    def get_by_id(self, entity_id: str) -> Optional[T]:
+        """Get entity by ID."""
+        with self.engine.connect() as conn:
+            data = conn.execute(
+                select(self._table.c.data).where(self._table.c.id == entity_id)
+            ).scalar()
+        return self._to_entity(json.loads(data)) if data is not None else None
+
+    def get_all(self) -> List[T]:
+        """Get all entities."""
+        return [self._to_entity(row) for row in self._select_rows({})]
+
+    def find(self, **criteria) -> List[T]:
+        """Find entities matching criteria."""
+        return [self._to_entity(row) for row in self._select_rows(criteria)]
+
+    def find_one(self, **criteria) -> Optional[T]:
+        """Find single entity matching criteria."""
+        rows = self._select_rows(criteria, limit=1)
+        return self._to_entity(rows[0]) if rows else None
+
+    def create(self, entity: T) -> T:
+        """Create new entity."""
+        entity_id = getattr(entity, self.id_field)
+        values = self._row_values(self._to_dict(entity))
+        values["inserted_at"] = time.time()
+
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(insert(self._table).values(**values))
+        except IntegrityError:
+            raise AlreadyExistsError(self.entity_class.__name__, entity_id)
+
+        logger.debug(f"Created {self.entity_class.__name__}: {entity_id}")
+        return entity
+
+    def update(self, entity: T) -> T:
+        """Update existing entity."""
+        entity_id = getattr(entity, self.id_field)
+        entity.touch()  # Update timestamp
+        values = self._row_values(self._to_dict(entity))
+
+        with self.engine.begin() as conn:
+            updated = conn.execute(
+                update(self._table).where(self._table.c.id == entity_id).values(**values)
+            ).rowcount
+
+        if updated == 0:
+            raise NotFoundError(self.entity_class.__name__, entity_id)
+
+        logger.debug(f"Updated {self.entity_class.__name__}: {entity_id}")
+        return entity
+
+    def delete(self, entity_id: str) -> bool:
+        """Delete entity by ID."""
+        with self.engine.begin() as conn:
+            deleted = conn.execute(delete(self._table).where(self._table.c.id == entity_id)).rowcount
+        return deleted > 0
+
+    def exists(self, entity_id: str) -> bool:
+        """Check if entity exists."""
+        with self.engine.connect() as conn:
+            return conn.execute(
+                select(self._table.c.id).where(self._table.c.id == entity_id)
+            ).first() is not None
+
+    def count(self, **criteria) -> int:
+        """Count entities matching criteria."""
+        clauses, remaining = self._split_criteria(criteria)
+        if remaining:
+            return len(self._select_rows(criteria))
+
+        query = select(func.count()).select_from(self._table)
+        if clauses:
+            query = query.where(and_(*clauses))
+        with self.engine.connect() as conn:
+            return conn.execute(query).scalar() or 0
+
+    def query(
+        self,
+        text: Optional[str] = None,
+        order_by: Sequence[Tuple[str, bool]] = (),
+        offset: int = 0,
+        limit: Optional[int] = None,
+        **criteria
+    ) -> Tuple[List[T], int]:
+        """
+        Filter, search, sort and slice in SQL.
+
+        Falls back to finishing in Python (over the SQL-filtered rows) when a
+        criterion or sort field has no column.
+        """
+        plain, comparisons = self._split_operators(criteria)
+        clauses, remaining = self._split_criteria(plain)
+
+        remaining_comparisons = []
+        for field, op, bound in comparisons:
+            clause = self._comparison_clause(field, op, bound)
+            if clause is None:
+                remaining_comparisons.append((field, op, bound))
+            else:
+                clauses.append(clause)
+
+        if text and self.search_fields:
+            clauses.append(self._table.c.search_text.contains(text.lower(), autoescape=True))
+            text = None
+
+        offset = max(offset, 0)
+        sortable = all(
+            field in self.index_fields and field not in self.sql_list_fields
+            for field, _ in order_by
+        )
+
+        table = self._table
+        if remaining or remaining_comparisons or text or not sortable:
+            query = select(table.c.data).order_by(table.c.inserted_at, table.c.id)
+            if clauses:
+                query = query.where(and_(*clauses))
+            with self.engine.connect() as conn:
+                rows = [json.loads(data) for (data,) in conn.execute(query)]
+
+            matched = self._filter_rows(rows, remaining, remaining_comparisons, text, order_by)
+            end = offset + limit if limit is not None else None
+            return [self._to_entity(row) for row in matched[offset:end]], len(matched)
+
+        ordering = []
+        for field, descending in order_by:
+            column = table.c[field]
+            ordering.append(column.is_(None))  # NULLs last
+            ordering.append(column.desc() if descending else column.asc())
+        ordering.extend([table.c.inserted_at, table.c.id])
+
+        page_query = select(table.c.data).order_by(*ordering).offset(offset)
+        count_query = select(func.count()).select_from(table)
+        if clauses:
+            page_query = page_query.where(and_(*clauses))
+            count_query = count_query.where(and_(*clauses))
+        if limit is not None:
+            page_query = page_query.limit(limit)
+
+        with self.engine.connect() as conn:
+            total = conn.execute(count_query).scalar() or 0
+            rows = [json.loads(data) for (data,) in conn.execute(page_query)]
+
+        return [self._to_entity(row) for row in rows], total
+
+    def clear(self) -> None:
+        """Clear all entities (use with caution)."""
+        with self.engine.begin() as conn:
+            conn.execute(delete(self._table))
+        logger.warning(f"Cleared all data in {self._table.name}")
+
+    def flush(self) -> None:
+        """Writes are committed immediately."""
+
+    # =====================
+    # Bulk Import
+    # =====================
+
+    def bulk_import(self, rows: Iterable[Dict[str, Any]], replace: bool = False, batch_size: int = 500) -> int:
+        """
+        Insert raw JSON rows in batches (rows are validated through the entity model).
+
+        Args:
+            rows: Rows as stored in the JSON file
+            replace: Overwrite rows whose ID already exists (default: skip them)
+            batch_size: Rows per INSERT batch
+
+        Returns:
+            Number of rows written
+        """
+        with self.engine.connect() as conn:
+            existing = {row_id for (row_id,) in conn.execute(select(self._table.c.id))}
+
+        batch: List[Dict[str, Any]] = []
+        written = 0
+        base_time = time.time()
+
+        def write(batch_rows: List[Dict[str, Any]]) -> None:
+            with self.engine.begin() as conn:
+                if replace:
+                    ids = [r["id"] for r in batch_rows]
+                    conn.execute(delete(self._table).where(self._table.c.id.in_(ids)))
+                conn.execute(insert(self._table), batch_rows)
+
+        for position, raw in enumerate(rows):
+            try:
+                row = self._to_dict(self._to_entity(raw))
+            except Exception as e:
+                logger.warning(f"Skipping invalid {self.entity_class.__name__} row: {e}")
+                continue
+
+            entity_id = row.get(self.id_field)
+            if entity_id is None or (entity_id in existing and not replace):
+                continue
+            existing.add(entity_id)
+
+            values = self._row_values(row)
+            values["inserted_at"] = base_time + position * 1e-6  # keep file order
+            batch.append(values)
+
+            if len(batch) >= batch_size:
+                write(batch)
+                written += len(batch)
+                batch = []
+
+        if batch:
+            write(batch)
+            written += len(batch)
+
+        return written
+
+
+# =============================================================================
+# Domain Repositories
+# =============================================================================
+
+class SQLUserRepository(UserRepository, SQLDocumentRepository):
+    """UserRepository on SQL storage."""
+
+
+class SQLPaymentRepository(PaymentRepository, SQLDocumentRepository):
+    """PaymentRepository on SQL storage."""
+
+
+class SQLSubscriptionRepository(SubscriptionRepository, SQLDocumentRepository):
+    """SubscriptionRepository on SQL storage."""
+
+    sql_column_types = {"auto_renew": Boolean()}
+
+
+class SQLMentorRepository(MentorRepository, SQLDocumentRepository):
+    """MentorRepository on SQL storage."""
+
+    sql_column_types = {
+        "verified": Boolean(),
+        "hourly_rate": Float(),
+        "rating": Float(),
+        "total_reviews": Integer(),
+        "total_sessions": Integer(),
+    }
+    sql_list_fields = ("airlines", "session_types")
+    sql_composite_indexes = (("status", "verified", "mentor_type"), ("status", "verified", "rating"))
+
+
+class SQLSessionRepository(SessionRepository, SQLDocumentRepository):
+    """SessionRepository on SQL storage."""
+
+    sql_column_types = {"scheduled_date": String(10)}
+    sql_composite_indexes = (("mentor_id", "scheduled_date"),)
+
+
+class SQLJobRepository(JobRepository, SQLDocumentRepository):
+    """JobRepository on SQL storage."""
+
+    sql_composite_indexes = (("status", "airline_code"), ("status", "end_date"))
+
+
+class SQLJobAlertRepository(JobAlertRepository, SQLDocumentRepository):
+    """JobAlertRepository on SQL storage."""
+
+    sql_column_types = {"is_active": Boolean()}
+
+
+SQL_REPOSITORIES: Dict[str, Type[SQLDocumentRepository]] = {
+    "users": SQLUserRepository,
+    "payments": SQLPaymentRepository,
+    "subscriptions": SQLSubscriptionRepository,
+    "mentors": SQLMentorRepository,
+    "sessions": SQLSessionRepository,
+    "jobs": SQLJobRepository,
+    "job_alerts": SQLJobAlertRepository,
+}
+
+
+def migrate_json_to_sql(
+    data_dir: str = "data",
+    engine: Optional[Engine] = None,
+    replace: bool = False,
+    batch_size: int = 500
+) -> Dict[str, int]:
+    """
+    Import every repository's JSON file into its SQL table.
+
+    Args:
+        data_dir: Directory containing the JSON files
+        engine: Target engine (default: src.database.session.engine)
+        replace: Overwrite rows that were already imported
+        batch_size: Rows per INSERT batch
+
+    Returns:
+        Rows written per repository
+    """
+    results = {}
+    for name, repo_class in SQL_REPOSITORIES.items():
+        repo = repo_class(data_dir, engine=engine)
+        if not repo.file_path.exists():
+            results[name] = 0
+            continue
+
+        try:
+            with open(repo.file_path, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in {repo.file_path}: {e}")
+            results[name] = 0
+            continue
+
+        results[name] = repo.bulk_import(rows, replace=replace, batch_size=batch_size)
+        logger.info(f"Imported {results[name]}/{len(rows)} rows from {repo.file_path}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import data/*.json into the SQL repositories")
+    parser.add_argument("--data-dir", default="data", help="Directory containing the JSON files")
+    parser.add_argument("--replace", action="store_true", help="Overwrite rows that already exist")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    for name, count in migrate_json_to_sql(args.data_dir, replace=args.replace, batch_size=args.batch_size).items():
+        print(f"{name}: {count}")
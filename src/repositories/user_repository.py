@@ -15,11 +15,13 @@ class UserRepository(JSONRepository[User]):
     Provides user-specific query methods.
     """
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", **options):
         super().__init__(
             data_dir=data_dir,
             filename="users.json",
-            entity_class=User
+            entity_class=User,
+            indexes=("email", "provider_id", "status", "subscription_tier"),
+            **options
         )
 
     def get_by_email(self, email: str) -> Optional[User]:
@@ -0,0 +1,136 @@
+"""
+Blocking I/O Event Loop Benchmark.
+
+Models the async endpoints that call synchronous JSON-file services: each
+catalog request reads and parses a JSON file under a lock (as the file
+repositories do), plus optional storage latency. Concurrent clients run the
+calls either inline on the event loop (BLOCKING_IO_THREADS=0) or on a
+bounded thread pool (the run_blocking() dispatch), while a probe measures
+how late a no-I/O request such as /health gets scheduled.
+
+Uses only asyncio, so it runs without the API stack; the locust recipe in
+tests/load/README.md measures the real endpoints.
+
+Usage:
+    python tests/load/blocking_io_benchmark.py
+    python tests/load/blocking_io_benchmark.py --clients 200 --seconds 10 --io-latency-ms 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+
+def make_catalog(path: str, records: int) -> None:
+    """Mentor-like records, roughly the size of a busy data/*.json file."""
+    data = [
+        {
+            "id": f"mentor_{i}",
+            "name": f"Mentor {i}",
+            "airline": ["KE", "OZ", "7C", "LJ"][i % 4],
+            "bio": "Former cabin crew. " * 10,
+            "rating": 3.5 + (i % 15) / 10,
+            "tags": ["interview", "english", "image"],
+        }
+        for i in range(records)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+class FileCatalog:
+    """Synchronous service: load the JSON file under a lock and filter."""
+
+    def __init__(self, path: str, io_latency: float):
+        self.path = path
+        self.io_latency = io_latency
+        self._lock = threading.Lock()
+
+    def search(self, airline: str) -> int:
+        with self._lock:
+            if self.io_latency:
+                time.sleep(self.io_latency)
+            with open(self.path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        return sum(1 for r in records if r["airline"] == airline)
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+async def run(catalog: FileCatalog, clients: int, seconds: float, threads: int) -> Dict[str, List[float]]:
+    executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=threads) if threads > 0 else None
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + seconds
+    catalog_ms: List[float] = []
+    health_ms: List[float] = []
+
+    async def client(n: int) -> None:
+        airline = ["KE", "OZ", "7C", "LJ"][n % 4]
+        while loop.time() < deadline:
+            # latency includes waiting for the loop to dispatch the request
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            if executor is None:
+                catalog.search(airline)
+            else:
+                await loop.run_in_executor(executor, catalog.search, airline)
+            catalog_ms.append((time.perf_counter() - start) * 1000)
+
+    async def health_probe() -> None:
+        interval = 0.02
+        while loop.time() < deadline:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            health_ms.append((time.perf_counter() - start - interval) * 1000)
+
+    try:
+        await asyncio.gather(health_probe(), *(client(n) for n in range(clients)))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+    return {"catalog": catalog_ms, "health": health_ms}
+
+
+def report(label: str, results: Dict[str, List[float]], seconds: float) -> None:
+    catalog, health = results["catalog"], results["health"]
+    print(f"{label}")
+    print(f"  catalog  {len(catalog) / seconds:>7.0f} req/s  "
+          f"p50 {statistics.median(catalog):>8.1f}ms  p99 {percentile(catalog, 0.99):>8.1f}ms")
+    print(f"  health   {len(health):>7d} probes "
+          f"p50 {statistics.median(health):>8.1f}ms  p99 {percentile(health, 0.99):>8.1f}ms  (scheduling delay)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inline vs offloaded blocking service calls")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--threads", type=int, default=40, help="offload pool size (BLOCKING_IO_THREADS)")
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--io-latency-ms", type=float, default=5.0, help="simulated storage latency per read")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mentors.json")
+        make_catalog(path, args.records)
+        catalog = FileCatalog(path, args.io_latency_ms / 1000)
+
+        print(f"{args.clients} clients, {args.seconds:.0f}s, {args.records} records, "
+              f"{args.io_latency_ms:.0f}ms storage latency\n")
+        report("inline (BLOCKING_IO_THREADS=0)",
+               asyncio.run(run(catalog, args.clients, args.seconds, 0)), args.seconds)
+        report(f"offloaded ({args.threads} threads)",
+               asyncio.run(run(catalog, args.clients, args.seconds, args.threads)), args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,9 @@ Enterprise-grade performance and load testing.
 Usage:
     locust -f tests/load/locustfile.py --host=http://localhost:8000
     locust -f tests/load/locustfile.py --host=http://localhost:8000 --headless -u 100 -r 10 -t 5m
+
+    # Catalog reads only (blocking I/O benchmark, see README)
+    locust -f tests/load/locustfile.py --host=http://localhost:8000 --headless -u 200 -r 50 -t 3m --tags catalog
 """
 
 import json
@@ -14,7 +17,7 @@ import string
 import time
 from typing import Optional
 
-from locust import HttpUser, TaskSet, between, task, events
+from locust import HttpUser, TaskSet, between, task, tag, events
 from locust.runners import MasterRunner, WorkerRunner
 
 
@@ -216,6 +219,7 @@ class APITasks(TaskSet):
     # =========================================================================
 
     @task(5)
+    @tag("catalog")
     def get_jobs(self):
         """Get job listings."""
         with self.client.get(
@@ -229,6 +233,7 @@ class APITasks(TaskSet):
                 response.failure(f"Get jobs failed: {response.status_code}")
 
     @task(2)
+    @tag("catalog")
     def search_jobs(self):
         """Search job listings."""
         airlines = ["대한항공", "아시아나", "제주항공", "진에어", "티웨이"]
@@ -248,6 +253,7 @@ class APITasks(TaskSet):
     # =========================================================================
 
     @task(3)
+    @tag("catalog")
     def get_mentors(self):
         """Get mentor listings."""
         with self.client.get(
@@ -265,6 +271,7 @@ class APITasks(TaskSet):
     # =========================================================================
 
     @task(1)
+    @tag("catalog")
     def health_check(self):
         """Health check endpoint."""
         with self.client.get("/health", catch_response=True) as response:
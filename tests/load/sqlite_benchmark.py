@@ -0,0 +1,167 @@
+"""
+SQLite Concurrency Benchmark.
+
+Compares the previous SQLite setup (one StaticPool connection shared by
+every thread, rollback journal) with the pooled WAL setup from
+src.database.session under concurrent readers and writers.
+
+Usage:
+    python tests/load/sqlite_benchmark.py
+    python tests/load/sqlite_benchmark.py --writers 8 --readers 16 --seconds 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import get_settings
+from src.database.session import create_sqlite_engine
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    score REAL NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+
+def legacy_engines(url: str) -> Dict[str, Engine]:
+    """Previous configuration: one shared connection, default journal."""
+    engine = create_engine(url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=DELETE")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    return {"write": engine, "read": engine}
+
+
+def pooled_engines(url: str) -> Dict[str, Engine]:
+    """Current configuration: WAL, pooled writers, read-only reporting pool."""
+    db = get_settings().database
+    return {
+        "write": create_sqlite_engine(url, db),
+        "read": create_sqlite_engine(url, db, read_only=True),
+    }
+
+
+def seed(engine: Engine, rows: int) -> None:
+    with engine.begin() as conn:
+        conn.execute(text(SCHEMA))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_events_user ON events (user_id)"))
+        conn.execute(
+            text("INSERT INTO events (user_id, score, created_at) VALUES (:u, :s, :t)"),
+            [{"u": f"u{i % 100}", "s": i % 97, "t": time.time()} for i in range(rows)]
+        )
+
+
+def write_once(engine: Engine, worker: int, n: int) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO events (user_id, score, created_at) VALUES (:u, :s, :t)"),
+            {"u": f"u{(worker * 31 + n) % 100}", "s": n % 97, "t": time.time()}
+        )
+
+
+def read_once(engine: Engine, worker: int, n: int) -> None:
+    # Reporting-style aggregate plus a point lookup
+    with engine.connect() as conn:
+        conn.execute(text("SELECT user_id, COUNT(*), AVG(score) FROM events GROUP BY user_id")).all()
+        conn.execute(
+            text("SELECT * FROM events WHERE user_id = :u ORDER BY id DESC LIMIT 10"),
+            {"u": f"u{n % 100}"}
+        ).all()
+
+
+def run_workers(
+    engine: Engine,
+    operation: Callable[[Engine, int, int], None],
+    count: int,
+    deadline: float,
+    results: Dict[str, list]
+) -> List[threading.Thread]:
+    def loop(worker: int) -> None:
+        n = 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                operation(engine, worker, n)
+                results["latencies"].append(time.perf_counter() - start)
+            except Exception as e:
+                results["errors"].append(type(e).__name__)
+            n += 1
+
+    threads = [threading.Thread(target=loop, args=(i,), daemon=True) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def summarize(name: str, results: Dict[str, list], seconds: float) -> str:
+    latencies = sorted(results["latencies"])
+    if not latencies:
+        return f"  {name:<7} no successful operations, {len(results['errors'])} errors"
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return (
+        f"  {name:<7} {len(latencies) / seconds:>9.1f} ops/s"
+        f"  p50 {quantiles[49] * 1000:>7.2f}ms"
+        f"  p95 {quantiles[94] * 1000:>7.2f}ms"
+        f"  p99 {quantiles[98] * 1000:>7.2f}ms"
+        f"  errors {len(results['errors'])}"
+    )
+
+
+def benchmark(profile: str, writers: int, readers: int, seconds: float, rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        engines = legacy_engines(url) if profile == "legacy" else pooled_engines(url)
+        seed(engines["write"], rows)
+
+        write_results: Dict[str, list] = {"latencies": [], "errors": []}
+        read_results: Dict[str, list] = {"latencies": [], "errors": []}
+        deadline = time.perf_counter() + seconds
+        threads = run_workers(engines["write"], write_once, writers, deadline, write_results)
+        threads += run_workers(engines["read"], read_once, readers, deadline, read_results)
+        for thread in threads:
+            thread.join()
+
+        print(f"{profile} ({writers} writers, {readers} readers, {seconds:.0f}s)")
+        print(summarize("writes", write_results, seconds))
+        print(summarize("reads", read_results, seconds))
+        for engine in set(engines.values()):
+            engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite concurrent read/write benchmark")
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--rows", type=int, default=20000, help="Rows seeded before the run")
+    parser.add_argument("--profile", choices=["legacy", "pooled", "both"], default="both")
+    args = parser.parse_args()
+
+    profiles = ["legacy", "pooled"] if args.profile == "both" else [args.profile]
+    for profile in profiles:
+        benchmark(profile, args.writers, args.readers, args.seconds, args.rows)
+
+
+if __name__ == "__main__":
+    main()
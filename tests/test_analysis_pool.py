@@ -0,0 +1,81 @@
+# tests/test_analysis_pool.py
+# CPU 집약 분석 프로세스 풀 테스트
+
+import os
+import sys
+import time
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analysis_pool import AnalysisPool, PoolSaturated
+
+
+@pytest.fixture
+def pool():
+    pool = AnalysisPool(max_workers=1, max_pending=1, enabled=True, preload=())
+    yield pool
+    pool.shutdown()
+
+
+class TestAnalysisPool:
+    """프로세스 풀 실행/백프레셔/폴백 테스트"""
+
+    def test_runs_in_worker_process(self, pool):
+        """작업이 별도 워커 프로세스에서 실행되는지 테스트"""
+        assert pool.run(os.getpid) != os.getpid()
+
+        stats = pool.get_stats()
+        assert stats["started"] is True
+        assert stats["completed"] == 1
+        assert stats["pending"] == 0
+
+    def test_task_error_propagates(self, pool):
+        """작업 예외는 폴백 없이 그대로 전달되는지 테스트"""
+        with pytest.raises(ValueError):
+            pool.run(int, "not a number")
+
+        assert pool.get_stats()["fallbacks"] == 0
+
+    def test_backpressure_and_inline_fallback(self, pool):
+        """포화 시 submit은 거절하고 run은 호출 스레드에서 실행하는지 테스트"""
+        busy = pool.submit(time.sleep, 0.5)
+
+        with pytest.raises(PoolSaturated):
+            pool.submit(os.getpid)
+        assert pool.run(os.getpid) == os.getpid()
+
+        busy.result(timeout=30)
+        stats = pool.get_stats()
+        assert stats["rejected"] == 2
+        assert stats["fallbacks"] == 1
+
+    def test_restarts_after_worker_crash(self, pool):
+        """워커가 죽으면 다음 작업에서 풀을 다시 만드는지 테스트"""
+        with pytest.raises(BrokenProcessPool):
+            pool.submit(os._exit, 1).result(timeout=30)
+
+        assert pool.run(os.getpid) != os.getpid()
+        assert pool.get_stats()["restarts"] == 1
+
+    def test_disabled_pool_runs_inline(self):
+        """비활성화된 풀은 호출 스레드에서 실행하는지 테스트"""
+        pool = AnalysisPool(enabled=False)
+
+        assert pool.run(os.getpid) == os.getpid()
+        with pytest.raises(RuntimeError):
+            pool.submit(os.getpid)
+        assert pool.get_stats()["started"] is False
+
+    def test_start_prewarms_workers(self):
+        """start()가 워커를 미리 띄우는지 테스트"""
+        pool = AnalysisPool(max_workers=2, enabled=True, preload=())
+        try:
+            assert pool.start() is True
+            assert pool.start() is True
+            assert pool.get_stats()["submitted"] == 2
+        finally:
+            pool.shutdown()
@@ -0,0 +1,169 @@
+# tests/test_chunked_stt.py
+# 청크 단위 STT (무음 분할 + 병렬 인식 + 부분 결과) 테스트
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("requests")
+
+import voice_utils
+from voice_utils import StubSTTBackend, _plan_stt_chunks
+
+
+def make_speech_wav(seconds: float, sr: int = 16000, gap_every: float = 4.0) -> bytes:
+    """gap_every초마다 0.6초 무음이 들어간 합성 음성 WAV"""
+    np = pytest.importorskip("numpy")
+    sf = pytest.importorskip("soundfile")
+    pytest.importorskip("librosa")
+
+    t = np.arange(int(seconds * sr)) / sr
+    y = 0.3 * np.sin(2 * np.pi * 200 * t)
+    y[(t % gap_every) > gap_every - 0.6] = 0
+    buf = io.BytesIO()
+    sf.write(buf, y.astype(np.float32), sr, format="WAV")
+    return buf.getvalue()
+
+
+class TestPlanChunks:
+    """청크 경계 결정 테스트"""
+
+    def test_cuts_in_silence_after_target(self):
+        """목표 길이를 넘긴 뒤 첫 무음 가운데에서 자르는지 테스트"""
+        # 음성 10단위, 무음 2단위 반복
+        intervals = [(i * 12, i * 12 + 10) for i in range(10)]
+
+        chunks = _plan_stt_chunks(intervals, total=120, target=30, max_len=60)
+
+        assert chunks == [(0, 35), (35, 71), (71, 107), (107, 120)]
+
+    def test_long_speech_without_silence_is_split_evenly(self):
+        """무음 없이 최대 길이를 넘는 구간은 균등 분할되는지 테스트"""
+        chunks = _plan_stt_chunks([(0, 100)], total=100, target=20, max_len=30)
+
+        assert chunks == [(0, 25), (25, 50), (50, 75), (75, 100)]
+
+    def test_short_tail_is_merged(self):
+        """짧은 꼬리는 앞 청크에 붙는지 테스트"""
+        chunks = _plan_stt_chunks([(0, 30), (32, 35)], total=35, target=30, max_len=60)
+
+        assert chunks == [(0, 35)]
+
+
+class TestChunkedTranscription:
+    """transcribe_audio_chunked 테스트 (StubSTTBackend, 네트워크 없음)"""
+
+    def test_stitches_words_and_emits_partials(self):
+        """청크 결과를 원래 시각으로 합치고 부분 결과를 순서대로 전달하는지 테스트"""
+        audio = make_speech_wav(70.0)
+        backend = StubSTTBackend(words_per_second=1.0, latency=0.05)
+        partials = []
+
+        result = voice_utils.transcribe_audio_chunked(
+            audio, language="en", backend=backend,
+            on_partial=lambda text, done, total: partials.append((text, done, total))
+        )
+
+        total_chunks = len(backend.calls)
+        assert total_chunks >= 3
+        assert all(call["duration"] <= voice_utils.STT_CHUNK_MAX_SECONDS for call in backend.calls)
+        assert result["duration"] == pytest.approx(70.0, abs=0.01)
+        assert result["language"] == "en"
+
+        starts = [w["start"] for w in result["words"]]
+        assert starts == sorted(starts)
+        assert result["words"][-1]["end"] <= result["duration"]
+        assert len(result["words"]) == sum(int(call["duration"]) for call in backend.calls)
+        assert result["text"] == " ".join(["word"] * len(result["words"]))
+
+        assert [done for _, done, _ in partials] == sorted(done for _, done, _ in partials)
+        assert partials[-1] == (result["text"], total_chunks, total_chunks)
+
+    def test_short_audio_uses_single_request(self):
+        """짧은 녹음은 청크 없이 한 번에 인식하는지 테스트"""
+        backend = StubSTTBackend()
+
+        result = voice_utils.transcribe_audio_chunked(make_speech_wav(5.0), backend=backend)
+
+        assert len(backend.calls) == 1
+        assert len(result["words"]) == 10
+
+    def test_stub_backend_setting(self, monkeypatch):
+        """STT_BACKEND=stub 설정 시 transcribe_audio가 가짜 인식기를 쓰는지 테스트"""
+        monkeypatch.setattr(voice_utils, "STT_BACKEND", "stub")
+        voice_utils.set_stt_backend(None)
+        try:
+            result = voice_utils.transcribe_audio(make_speech_wav(3.0))
+        finally:
+            voice_utils.set_stt_backend(None)
+
+        assert isinstance(voice_utils.get_stt_backend(), StubSTTBackend)
+        assert result["duration"] == pytest.approx(3.0)
+        assert len(result["words"]) == 6
+
+
+class FlakySTTBackend(StubSTTBackend):
+    """지정한 청크 요청을 fail_times번 실패(None)시키는 가짜 STT"""
+
+    def __init__(self, fail_chunk: str, fail_times: int, fail_whole: bool = False):
+        super().__init__()
+        self.fail_chunk = fail_chunk
+        self.fail_times = fail_times
+        self.fail_whole = fail_whole
+        self.requests = []
+
+    def transcribe(self, audio_bytes, language="ko", filename="audio.webm"):
+        with self._lock:
+            self.requests.append(filename)
+            if filename == self.fail_chunk and self.fail_times > 0:
+                self.fail_times -= 1
+                return None
+        if filename == "audio.webm" and self.fail_whole:
+            return None
+        return super().transcribe(audio_bytes, language, filename)
+
+
+class TestChunkFailures:
+    """청크 인식 실패 시 재시도/전체 인식 전환 테스트 (부분 전사 반환 금지)"""
+
+    def test_failed_chunk_is_retried(self):
+        """한 번 실패한 청크는 재시도해 빠짐없이 합치는지 테스트"""
+        audio = make_speech_wav(70.0)
+        backend = FlakySTTBackend("chunk1.wav", fail_times=1)
+
+        result = voice_utils.transcribe_audio_chunked(audio, language="en", backend=backend)
+        expected = voice_utils.transcribe_audio_chunked(audio, language="en", backend=StubSTTBackend())
+
+        assert backend.requests.count("chunk1.wav") == 2
+        assert "audio.webm" not in backend.requests
+        assert result == expected
+
+    def test_persistent_failure_falls_back_to_whole_file(self):
+        """재시도 후에도 실패하면 전체 녹음을 한 번에 인식하는지 테스트"""
+        backend = FlakySTTBackend("chunk1.wav", fail_times=99)
+        partials = []
+
+        result = voice_utils.transcribe_audio_chunked(
+            make_speech_wav(70.0), language="en", backend=backend,
+            on_partial=lambda text, done, total: partials.append((text, done, total))
+        )
+
+        assert backend.requests.count("chunk1.wav") == 1 + voice_utils.STT_CHUNK_RETRIES
+        assert backend.requests[-1] == "audio.webm"
+        assert result["duration"] == pytest.approx(70.0, abs=0.01)
+        assert len(result["words"]) == 140
+        assert partials[-1] == (result["text"], 1, 1)
+        assert all(done == 1 for _, done, _ in partials[:-1])
+
+    def test_returns_none_when_fallback_fails(self):
+        """전체 인식까지 실패하면 일부 전사 대신 None을 반환하는지 테스트"""
+        backend = FlakySTTBackend("chunk0.wav", fail_times=99, fail_whole=True)
+
+        result = voice_utils.transcribe_audio_chunked(make_speech_wav(70.0), backend=backend)
+
+        assert result is None
+        assert backend.requests[-1] == "audio.webm"
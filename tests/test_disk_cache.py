@@ -0,0 +1,83 @@
+# tests/test_disk_cache.py
+# Disk Cache 테스트
+
+import pytest
+import time
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from disk_cache import DiskCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """임시 캐시 파일 경로"""
+    return tmp_path / "cache.sqlite3"
+
+
+class TestDiskCache:
+    """DiskCache 클래스 테스트"""
+
+    def test_set_and_get(self, cache_path):
+        """저장 및 조회 테스트"""
+        cache = DiskCache(cache_path)
+        cache.set("key", {"questions": ["Q1", "Q2"], "score": 85})
+
+        assert cache.get("key") == {"questions": ["Q1", "Q2"], "score": 85}
+        assert cache.get("missing") is None
+
+    def test_bytes_roundtrip(self, cache_path):
+        """바이너리 값 저장 테스트"""
+        cache = DiskCache(cache_path)
+        audio = bytes(range(256)) * 10
+        cache.set("audio", audio)
+
+        assert cache.get("audio") == audio
+
+    def test_shared_between_instances(self, cache_path):
+        """다른 인스턴스(프로세스)와 공유되는지 테스트"""
+        DiskCache(cache_path, namespace="ns").set("key", "value")
+
+        assert DiskCache(cache_path, namespace="ns").get("key") == "value"
+        assert DiskCache(cache_path, namespace="other").get("key") is None
+
+    def test_ttl_expiry(self, cache_path):
+        """TTL 만료 테스트"""
+        cache = DiskCache(cache_path, ttl_seconds=0.1)
+        cache.set("key", "value")
+        time.sleep(0.15)
+
+        assert cache.get("key") is None
+
+    def test_max_entries_evicts_least_recently_used(self, cache_path):
+        """항목 수 초과 시 LRU 제거 테스트"""
+        cache = DiskCache(cache_path, max_entries=2)
+        cache.set("a", 1)
+        time.sleep(0.01)
+        cache.set("b", 2)
+        time.sleep(0.01)
+        cache.get("a")  # a를 최근 사용으로
+        time.sleep(0.01)
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_max_bytes_enforced(self, cache_path):
+        """용량 제한 테스트"""
+        cache = DiskCache(cache_path, max_bytes=2500)
+        for i in range(5):
+            cache.set(f"blob{i}", b"x" * 1000)
+            time.sleep(0.01)
+
+        stats = cache.stats()
+        assert stats["size_bytes"] <= 2500
+        assert cache.get("blob4") is not None
+
+    def test_unserializable_value_rejected(self, cache_path):
+        """직렬화 불가 값 저장 실패 테스트"""
+        cache = DiskCache(cache_path)
+        assert cache.set("key", object()) is False
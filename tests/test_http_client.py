@@ -0,0 +1,155 @@
+# tests/test_http_client.py
+# 공통 HTTP 전송 계층 테스트
+
+import pytest
+import threading
+import time
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import http_client
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    """통계 초기화"""
+    http_client.reset_latency_stats()
+    yield
+    http_client.reset_latency_stats()
+
+
+class TestSharedSession:
+    """공유 세션 테스트"""
+
+    def test_session_is_reused(self):
+        """같은 세션 인스턴스를 재사용하는지 테스트"""
+        assert http_client.get_session() is http_client.get_session()
+
+    def test_post_records_latency_by_endpoint(self, monkeypatch):
+        """엔드포인트별 지연 시간 기록 테스트"""
+        session = MagicMock()
+        session.request.return_value = "response"
+        monkeypatch.setattr(http_client, "get_session", lambda: session)
+
+        result = http_client.post("google_tts", "https://example.com/tts?key=secret", endpoint="tts", json={})
+
+        assert result == "response"
+        stats = http_client.get_latency_stats()
+        assert "google_tts:tts" in stats
+        assert stats["google_tts:tts"]["count"] == 1
+        # API 키가 들어간 URL은 통계 키로 쓰이지 않음
+        assert not any("secret" in key for key in stats)
+
+    def test_errors_counted(self, monkeypatch):
+        """예외 발생 시 오류로 집계되는지 테스트"""
+        session = MagicMock()
+        session.request.side_effect = RuntimeError("connection reset")
+        monkeypatch.setattr(http_client, "get_session", lambda: session)
+
+        with pytest.raises(RuntimeError):
+            http_client.post("openai", "https://example.com/v1/chat", endpoint="chat")
+
+        assert http_client.get_latency_stats()["openai:chat"]["errors"] == 1
+
+
+class TestProviderConcurrency:
+    """제공자별 동시성 제한 테스트"""
+
+    def test_limit_enforced(self, monkeypatch):
+        """동시 요청 수가 상한을 넘지 않는지 테스트"""
+        monkeypatch.setitem(http_client.PROVIDER_CONCURRENCY, "limited", 2)
+        monkeypatch.setattr(http_client, "_semaphores", {})
+
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def fake_request(*args, **kwargs):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(0.05)
+            with lock:
+                state["current"] -= 1
+
+        session = MagicMock()
+        session.request.side_effect = fake_request
+        monkeypatch.setattr(http_client, "get_session", lambda: session)
+
+        threads = [
+            threading.Thread(target=http_client.post, args=("limited", "https://example.com"))
+            for _ in range(6)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert state["peak"] == 2
+
+    def test_stream_holds_slot_until_closed(self, monkeypatch):
+        """스트리밍 요청은 본문을 다 읽고 블록을 나갈 때까지 슬롯을 잡는지 테스트"""
+        monkeypatch.setitem(http_client.PROVIDER_CONCURRENCY, "limited", 1)
+        monkeypatch.setattr(http_client, "_semaphores", {})
+
+        response = MagicMock(status_code=200, headers={})
+        session = MagicMock()
+        session.request.return_value = response
+        monkeypatch.setattr(http_client, "get_session", lambda: session)
+        semaphore = http_client._get_semaphore("limited")
+
+        with http_client.stream("POST", "limited", "https://example.com/v1/chat", endpoint="chat:stream") as r:
+            assert r is response
+            assert not semaphore.acquire(blocking=False)
+            time.sleep(0.05)
+
+        assert semaphore.acquire(blocking=False)
+        semaphore.release()
+        response.close.assert_called_once()
+        assert session.request.call_args.kwargs["stream"] is True
+        stats = http_client.get_latency_stats()["limited:chat:stream"]
+        assert stats["count"] == 1
+        assert stats["sum"] >= 0.05
+
+    def test_stream_error_while_reading_counted(self, monkeypatch):
+        """스트림을 읽다가 난 예외가 오류로 집계되고 응답이 닫히는지 테스트"""
+        response = MagicMock(status_code=200, headers={})
+        session = MagicMock()
+        session.request.return_value = response
+        monkeypatch.setattr(http_client, "get_session", lambda: session)
+
+        with pytest.raises(ConnectionError):
+            with http_client.stream("POST", "openai", "https://example.com/v1/chat", endpoint="chat:stream"):
+                raise ConnectionError("connection reset")
+
+        response.close.assert_called_once()
+        assert http_client.get_latency_stats()["openai:chat:stream"]["errors"] == 1
+
+
+class TestHttpClientSpans:
+    """http_client 스팬 연동 테스트"""
+
+    def test_request_recorded_as_child_span(self, monkeypatch):
+        """HTTP 호출이 현재 트레이스의 하위 스팬으로 기록되는지 테스트"""
+        import tracing
+        from tracing import Tracer
+
+        local = Tracer(log_file=None)
+        monkeypatch.setattr(tracing, "tracer", local)
+        monkeypatch.setattr(http_client, "trace_span", local.span)
+
+        response = MagicMock(status_code=200, content=b"x" * 128)
+        session = MagicMock()
+        session.request.return_value = response
+        monkeypatch.setattr(http_client, "get_session", lambda: session)
+
+        with local.trace("turn"):
+            http_client.post("openai", "https://example.com/v1/chat", endpoint="chat/completions", json={})
+
+        span = local.get_recent_traces()[0]["spans"][1]
+        assert span["name"] == "http openai:chat/completions"
+        assert span["attributes"]["status"] == 200
+        assert span["attributes"]["response_bytes"] == 128
+        assert "queue_ms" in span["attributes"]
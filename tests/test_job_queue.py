@@ -0,0 +1,256 @@
+# tests/test_job_queue.py
+# Job Queue 테스트
+
+import pytest
+import time
+import threading
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import job_queue as jq
+from job_queue import JobQueue, JobPriority, job_registry
+
+
+def wait_until(predicate, timeout=5.0):
+    """조건 충족까지 대기"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def queue_factory(tmp_path, monkeypatch):
+    """임시 저장소를 쓰는 JobQueue 생성"""
+    monkeypatch.setattr(jq, "JOBS_FILE", tmp_path / "jobs.json")
+    monkeypatch.setattr(jq, "JOBS_JOURNAL_FILE", tmp_path / "jobs.journal")
+    monkeypatch.setattr(jq, "JOBS_ARCHIVE_FILE", tmp_path / "jobs_archive.jsonl")
+    queues = []
+
+    def factory(**kwargs):
+        q = JobQueue(**kwargs)
+        queues.append(q)
+        return q
+
+    yield factory
+
+    for q in queues:
+        q.stop()
+
+
+class TestConcurrentExecution:
+    """동시 실행 테스트"""
+
+    def test_jobs_run_in_parallel(self, queue_factory):
+        """여러 작업이 동시에 실행되는지 테스트"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        @job_registry.register("test_parallel")
+        def parallel_job():
+            barrier.wait()
+            return "ok"
+
+        q = queue_factory(max_workers=3)
+        job_ids = [q.enqueue("test_parallel") for _ in range(3)]
+        q.start()
+
+        assert wait_until(lambda: all(q.get_status(j) == "completed" for j in job_ids))
+
+    def test_slow_job_does_not_block_others(self, queue_factory):
+        """느린 작업이 다른 작업을 막지 않는지 테스트"""
+        release = threading.Event()
+
+        @job_registry.register("test_slow")
+        def slow_job():
+            release.wait(timeout=5)
+            return "slow"
+
+        @job_registry.register("test_fast")
+        def fast_job():
+            return "fast"
+
+        q = queue_factory(max_workers=2)
+        slow_id = q.enqueue("test_slow", priority=JobPriority.HIGH)
+        fast_id = q.enqueue("test_fast")
+        q.start()
+
+        assert wait_until(lambda: q.get_status(fast_id) == "completed")
+        assert q.get_status(slow_id) == "running"
+        release.set()
+        assert wait_until(lambda: q.get_status(slow_id) == "completed")
+
+    def test_per_function_concurrency_limit(self, queue_factory):
+        """함수별 동시 실행 상한 테스트"""
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        @job_registry.register("test_capped", max_concurrency=1)
+        def capped_job():
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(0.05)
+            with lock:
+                state["current"] -= 1
+
+        q = queue_factory(max_workers=4)
+        job_ids = [q.enqueue("test_capped") for _ in range(4)]
+        q.start()
+
+        assert wait_until(lambda: all(q.get_status(j) == "completed" for j in job_ids))
+        assert state["peak"] == 1
+
+
+class TestScheduling:
+    """예약/재시도 테스트"""
+
+    def test_scheduled_job_waits(self, queue_factory):
+        """예약 작업이 예약 시각 이후 실행되는지 테스트"""
+        @job_registry.register("test_scheduled")
+        def scheduled_job():
+            return time.time()
+
+        q = queue_factory(max_workers=1)
+        run_at = datetime.now() + timedelta(seconds=0.3)
+        job_id = q.enqueue("test_scheduled", scheduled_at=run_at)
+        q.start()
+
+        assert q.get_stats()["scheduled"] == 1
+        assert wait_until(lambda: q.get_status(job_id) == "completed")
+        assert q.get_result(job_id) >= run_at.timestamp()
+
+    def test_retry_with_backoff(self, queue_factory, monkeypatch):
+        """실패 작업이 백오프 후 재시도되는지 테스트"""
+        monkeypatch.setattr(jq, "RETRY_BACKOFF_BASE_SECONDS", 0.05)
+        attempts = []
+
+        @job_registry.register("test_flaky")
+        def flaky_job():
+            attempts.append(time.time())
+            if len(attempts) < 2:
+                raise ValueError("일시 오류")
+            return "recovered"
+
+        q = queue_factory(max_workers=1)
+        job_id = q.enqueue("test_flaky")
+        q.start()
+
+        assert wait_until(lambda: q.get_status(job_id) == "completed")
+        assert q.get_job(job_id).retries == 1
+        assert attempts[1] - attempts[0] >= 0.05
+
+    def test_unknown_function_fails(self, queue_factory):
+        """미등록 함수 작업 실패 테스트"""
+        q = queue_factory(max_workers=1)
+        job_id = q.enqueue("no_such_function")
+        q.start()
+
+        assert wait_until(lambda: q.get_status(job_id) == "failed")
+
+    def test_cancelled_job_not_run(self, queue_factory):
+        """취소된 작업은 실행되지 않는지 테스트"""
+        calls = []
+
+        @job_registry.register("test_cancel")
+        def cancel_job():
+            calls.append(1)
+
+        q = queue_factory(max_workers=1)
+        job_id = q.enqueue("test_cancel")
+        assert q.cancel(job_id) is True
+        q.start()
+
+        time.sleep(0.2)
+        assert calls == []
+        assert q.get_status(job_id) == "cancelled"
+
+
+class TestJournalStorage:
+    """저널 저장 방식 테스트"""
+
+    def test_enqueue_appends_journal_only(self, queue_factory):
+        """작업 추가 시 스냅샷을 다시 쓰지 않는지 테스트"""
+        q = queue_factory(storage_mode="journal")
+        for i in range(5):
+            q.enqueue("send_email", kwargs={"to": f"user{i}@test.com", "subject": "s", "body": "b"})
+
+        assert not jq.JOBS_FILE.exists()
+        lines = jq.JOBS_JOURNAL_FILE.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 5
+
+    def test_restart_replays_journal(self, queue_factory):
+        """재시작 시 저널 재생으로 작업이 복원되는지 테스트"""
+        q1 = queue_factory(storage_mode="journal")
+        pending_id = q1.enqueue("cleanup_data", kwargs={"days": 7})
+        cancelled_id = q1.enqueue("cleanup_data", kwargs={"days": 1})
+        q1.cancel(cancelled_id)
+        q1.stop()
+
+        q2 = queue_factory(storage_mode="journal")
+        assert q2.get_status(pending_id) == "pending"
+        assert q2.get_status(cancelled_id) == "cancelled"
+        assert q2.get_stats()["queue_size"] == 1
+        # 재생 후 스냅샷으로 압축됨
+        assert jq.JOBS_FILE.exists()
+        assert jq.JOBS_JOURNAL_FILE.read_text(encoding="utf-8") == ""
+
+    def test_truncated_journal_line_ignored(self, queue_factory):
+        """기록 도중 잘린 저널 줄을 무시하는지 테스트"""
+        q1 = queue_factory(storage_mode="journal")
+        job_id = q1.enqueue("cleanup_data")
+        q1.stop()
+        with open(jq.JOBS_JOURNAL_FILE, "a", encoding="utf-8") as f:
+            f.write('{"op": "set", "id"')
+
+        q2 = queue_factory(storage_mode="journal")
+        assert q2.get_status(job_id) == "pending"
+
+    def test_interrupted_running_job_is_requeued(self, queue_factory):
+        """실행 중 종료된 작업이 재시작 시 재시도 횟수를 소모하고 다시 대기하는지 테스트"""
+        q1 = queue_factory(storage_mode="journal")
+        job_id = q1.enqueue("cleanup_data")
+        q1.stop()
+        with open(jq.JOBS_JOURNAL_FILE, "a", encoding="utf-8") as f:
+            f.write('{"op": "set", "id": "%s", "fields": {"status": "running"}}\n' % job_id)
+
+        q2 = queue_factory(storage_mode="journal")
+        job = q2.get_job(job_id)
+        assert job.status == "pending"
+        assert job.retries == 1
+        assert q2.get_stats()["queue_size"] == 1
+
+    def test_interrupted_job_without_retries_fails(self, queue_factory):
+        """재시도 횟수를 다 쓴 중단 작업은 실패 처리되는지 테스트"""
+        q1 = queue_factory(storage_mode="journal")
+        job_id = q1.enqueue("cleanup_data")
+        q1.stop()
+        with open(jq.JOBS_JOURNAL_FILE, "a", encoding="utf-8") as f:
+            f.write('{"op": "set", "id": "%s", "fields": {"status": "running", "retries": %d}}\n'
+                    % (job_id, jq.MAX_RETRIES - 1))
+
+        q2 = queue_factory(storage_mode="journal")
+        assert q2.get_status(job_id) == "failed"
+        assert q2.get_stats()["queue_size"] == 0
+
+        q3 = queue_factory(storage_mode="journal")
+        assert q3.get_status(job_id) == "failed"
+
+    def test_compaction_archives_finished_jobs(self, queue_factory, monkeypatch):
+        """압축 시 오래된 종료 작업이 아카이브로 이동하는지 테스트"""
+        monkeypatch.setattr(jq, "ARCHIVE_KEEP_RECENT", 2)
+        q = queue_factory(storage_mode="journal")
+        job_ids = [q.enqueue("cleanup_data") for _ in range(5)]
+        for job_id in job_ids[:4]:
+            q.cancel(job_id)
+
+        q.compact()
+
+        archived = jq.JOBS_ARCHIVE_FILE.read_text(encoding="utf-8").splitlines()
+        assert len(archived) == 2
+        assert q.get_stats()["total_jobs"] == 3
+        assert q.get_status(job_ids[4]) == "pending"
@@ -0,0 +1,143 @@
+# tests/test_llm_utils.py
+# 꼬리질문 스트리밍 (SSE 파싱 + FollowupStream 오류 처리) 테스트
+
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("requests")
+pytest.importorskip("streamlit")
+
+import llm_utils
+from llm_utils import FollowupStream, _iter_sse_deltas
+
+
+def openai_line(content):
+    return "data: " + json.dumps({"choices": [{"delta": {"content": content}}]}, ensure_ascii=False)
+
+
+class FakeStreamResponse:
+    """iter_lines로 SSE 줄을 내보내는 가짜 스트리밍 응답"""
+
+    def __init__(self, lines, error=None, status_error=None):
+        self.lines = lines
+        self.error = error
+        self.status_error = status_error
+        self.encoding = None
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_error:
+            raise self.status_error
+
+    def iter_lines(self, decode_unicode=False):
+        for line in self.lines:
+            yield line
+        if self.error:
+            raise self.error
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_post(monkeypatch):
+    """http_client.stream을 가짜 응답으로 교체 (블록을 나가면 응답을 닫음)"""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+    def install(response):
+        @contextmanager
+        def stream(*args, **kwargs):
+            try:
+                yield response
+            finally:
+                response.close()
+
+        monkeypatch.setattr(llm_utils.http_client, "stream", stream)
+        return response
+
+    return install
+
+
+def make_stream():
+    return FollowupStream({"model": "test"}, timeout=5, sanitizer=lambda text: text.strip() or None, label="Test")
+
+
+class TestIterSSEDeltas:
+    """SSE 파싱 테스트"""
+
+    def test_openai_chunks(self):
+        """OpenAI 형식 조각을 순서대로 내보내고 [DONE]에서 멈추는지 테스트"""
+        response = FakeStreamResponse([
+            ": keep-alive",
+            openai_line("지원"),
+            "",
+            "data: {not json",
+            openai_line("동기는"),
+            "data: " + json.dumps({"choices": [{"delta": {}}]}),
+            "data: [DONE]",
+            openai_line("무시"),
+        ])
+
+        assert list(_iter_sse_deltas(response)) == ["지원", "동기는"]
+        assert response.encoding == "utf-8"
+
+
+class TestFollowupStream:
+    """FollowupStream 결과/오류 처리 테스트"""
+
+    def test_complete_stream(self, fake_post):
+        """끝까지 받으면 정리된 최종 질문이 result에 담기는지 테스트"""
+        response = fake_post(FakeStreamResponse([openai_line(" 그 경험에서"), openai_line(" 무엇을 배웠나요? "), "data: [DONE]"]))
+        stream = make_stream()
+
+        chunks = list(stream)
+
+        assert chunks == [" 그 경험에서", " 무엇을 배웠나요? "]
+        assert stream.result == "그 경험에서 무엇을 배웠나요?"
+        assert stream.error is None
+        assert stream.done and response.closed
+
+    def test_failure_mid_stream_discards_partial_text(self, fake_post):
+        """일부 조각 후 연결이 끊기면 잘린 질문을 결과로 쓰지 않는지 테스트"""
+        import requests
+
+        response = fake_post(FakeStreamResponse(
+            [openai_line("그 경험에서"), openai_line(" 무엇을")],
+            error=requests.exceptions.ConnectionError("connection reset")
+        ))
+        stream = make_stream()
+
+        chunks = list(stream)
+
+        assert chunks == ["그 경험에서", " 무엇을"]
+        assert stream.text == "그 경험에서 무엇을"
+        assert stream.result is None
+        assert "ConnectionError" in stream.error
+        assert response.closed
+
+    def test_http_error(self, fake_post):
+        """5xx 응답이면 조각 없이 result가 None인지 테스트"""
+        import requests
+
+        fake_post(FakeStreamResponse([], status_error=requests.exceptions.HTTPError("503 Server Error")))
+        stream = make_stream()
+
+        assert list(stream) == []
+        assert stream.result is None
+        assert stream.error
+
+    def test_missing_api_key(self, monkeypatch):
+        """API 키가 없으면 호출 없이 끝나는지 테스트"""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.delenv("OPENAI_APIKEY", raising=False)
+        stream = make_stream()
+
+        assert list(stream) == []
+        assert stream.result is None
+        assert stream.done
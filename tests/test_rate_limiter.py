@@ -8,7 +8,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from rate_limiter import RateLimiter, RateLimitExceeded, rate_limit
+from rate_limiter import RateLimiter, RateLimitExceeded, rate_limit, MemoryRateLimitBackend
 
 
 class TestRateLimiter:
@@ -107,3 +107,70 @@ class TestRateLimitDecorator:
         # 101번째 차단됨
         with pytest.raises(RateLimitExceeded):
             test_func(sample_user_id)
+
+
+class TestSlidingWindowCounter:
+    """슬라이딩 윈도우 카운터 / 유휴 항목 정리 테스트"""
+
+    def test_previous_window_decays(self, monkeypatch):
+        """직전 윈도우 요청이 경과 비율만큼 줄어드는지 테스트"""
+        import rate_limiter as rl
+        now = [6000.0]  # 60초 윈도우 경계
+        monkeypatch.setattr(rl.time, "time", lambda: now[0])
+        limiter = RateLimiter()
+
+        for _ in range(100):
+            limiter.record_request("u", "general")
+        assert limiter.check_rate_limit("u", "general")[0] is False
+
+        limiter.reset_user("u")
+        for _ in range(100):
+            limiter.record_request("u", "general")
+
+        # 다음 윈도우 절반 경과 → 직전 100건 중 절반만 반영
+        now[0] = 6090.0
+        allowed, info = limiter.check_rate_limit("u", "general")
+        assert allowed is True
+        assert info["current"] == 50
+
+    def test_check_does_not_track_unknown_users(self):
+        """조회만 한 사용자는 저장하지 않음 테스트"""
+        limiter = RateLimiter()
+        for i in range(100):
+            limiter.check_rate_limit(f"user_{i}", "general")
+        assert limiter.tracked_users() == 0
+
+    def test_idle_users_evicted(self, monkeypatch):
+        """유휴 사용자 항목 제거 테스트"""
+        import rate_limiter as rl
+        now = [1000.0]
+        monkeypatch.setattr(rl.time, "time", lambda: now[0])
+        limiter = RateLimiter(MemoryRateLimitBackend(stripes=1, idle_seconds=100))
+
+        for i in range(50):
+            limiter.record_request(f"user_{i}", "general")
+        assert limiter.tracked_users() == 50
+
+        now[0] += 200
+        limiter.record_request("active", "general")
+        assert limiter.tracked_users() == 1
+
+    def test_concurrent_records(self, monkeypatch):
+        """여러 스레드 동시 기록 테스트"""
+        import threading
+        import rate_limiter as rl
+        monkeypatch.setattr(rl.time, "time", lambda: 1000.0)
+        limiter = RateLimiter()
+
+        def worker(n):
+            for _ in range(50):
+                limiter.record_request(f"user_{n % 4}", "openai")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        total = sum(limiter.get_user_stats(f"user_{n}")["openai"]["current"] for n in range(4))
+        assert total == 400
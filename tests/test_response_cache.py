@@ -8,9 +8,21 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import response_cache as rc
+from disk_cache import DiskCache
 from response_cache import ResponseCache, cached, get_cached_or_call
 
 
+@pytest.fixture(autouse=True)
+def isolated_global_cache(tmp_path):
+    """전역 캐시의 디스크 저장소를 임시 경로로 교체"""
+    original = rc.response_cache._disk
+    rc.response_cache._disk = DiskCache(tmp_path / "global.sqlite3", namespace="response_cache")
+    yield
+    rc.response_cache._disk = original
+    rc.response_cache.invalidate()
+
+
 class TestResponseCache:
     """ResponseCache 클래스 테스트"""
 
@@ -175,3 +187,220 @@ class TestGetCachedOrCall:
 
         assert called is False  # 함수 호출 안됨
         assert result == "cached_response"
+
+
+class TestDiskBackend:
+    """SQLite 디스크 백엔드 테스트"""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return tmp_path / "response_cache.sqlite3"
+
+    def test_persists_across_instances(self, db_path):
+        """다른 인스턴스(프로세스)에서도 조회 테스트"""
+        ResponseCache(disk_path=db_path).set("api", {"q": 1}, {"text": "저장됨"})
+
+        other = ResponseCache(disk_path=db_path)
+        assert other.get("api", {"q": 1}) == {"text": "저장됨"}
+
+    def test_bytes_payload(self, db_path):
+        """bytes 응답 BLOB 저장 테스트"""
+        audio = b"\x00\x01RIFF" * 100
+        ResponseCache(disk_path=db_path).set("tts", {"text": "안녕하세요"}, audio)
+
+        assert ResponseCache(disk_path=db_path).get("tts", {"text": "안녕하세요"}) == audio
+
+    def test_disk_ttl_expiry(self, db_path):
+        """디스크 항목 TTL 만료 테스트"""
+        ResponseCache(disk_path=db_path).set("api", {"q": 1}, "r", ttl=1)
+        time.sleep(1.2)
+
+        assert ResponseCache(disk_path=db_path).get("api", {"q": 1}) is None
+
+    def test_invalidate_by_type_on_disk(self, db_path):
+        """디스크 항목 타입별 무효화 테스트"""
+        cache = ResponseCache(disk_path=db_path)
+        cache.set("api1", {"a": 1}, "response1")
+        cache.set("api2", {"b": 2}, "response2")
+
+        assert cache.invalidate(api_type="api1") == 1
+
+        other = ResponseCache(disk_path=db_path)
+        assert other.get("api1", {"a": 1}) is None
+        assert other.get("api2", {"b": 2}) == "response2"
+
+    def test_unserializable_stays_in_memory(self, db_path):
+        """직렬화 불가 응답은 메모리에만 저장 테스트"""
+        cache = ResponseCache(disk_path=db_path)
+        value = object()
+        cache.set("api", {"q": 1}, value)
+
+        assert cache.get("api", {"q": 1}) is value
+        assert ResponseCache(disk_path=db_path).get("api", {"q": 1}) is None
+
+
+class TestMemoryLimits:
+    """메모리 LRU 제한 테스트"""
+
+    def test_lru_keeps_recently_used(self):
+        """최근 조회 항목 유지 테스트"""
+        cache = ResponseCache(max_entries=2)
+        cache.set("api", {"i": 1}, "r1")
+        cache.set("api", {"i": 2}, "r2")
+        cache.get("api", {"i": 1})
+        cache.set("api", {"i": 3}, "r3")
+
+        assert cache.get("api", {"i": 1}) == "r1"
+        assert cache.get("api", {"i": 2}) is None
+
+    def test_size_limit(self):
+        """MAX_CACHE_SIZE_MB 용량 제한 테스트"""
+        cache = ResponseCache(max_size_mb=0.01)  # 약 10KB
+        for i in range(10):
+            cache.set("tts", {"i": i}, b"x" * 3000)
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 3
+        assert cache.get("tts", {"i": 9}) is not None
+        assert cache.get("tts", {"i": 0}) is None
+
+
+class TestSingleFlight:
+    """동일 키 동시 요청 병합 테스트"""
+
+    def _run_concurrently(self, target, count):
+        import threading
+        results, errors = [], []
+
+        def run():
+            try:
+                results.append(target())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run) for _ in range(count)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+        return results, errors
+
+    def test_concurrent_callers_share_one_call(self):
+        """동시 호출 시 한 번만 실행 테스트"""
+        import threading
+        cache = ResponseCache()
+        calls = []
+        release = threading.Event()
+
+        def slow_call():
+            calls.append(1)
+            release.wait(5)
+            return "shared"
+
+        threading.Timer(0.3, release.set).start()
+        results, errors = self._run_concurrently(
+            lambda: cache.get_or_call("question_generation", {"airline": "KE"}, slow_call), 8
+        )
+
+        assert errors == []
+        assert results == ["shared"] * 8
+        assert len(calls) == 1
+        assert cache.get_stats()["coalesced_calls"] == 7
+
+    def test_error_propagates_to_waiters(self):
+        """진행 중 호출의 예외가 대기자에게 전파 테스트"""
+        import threading
+        cache = ResponseCache()
+        calls = []
+        release = threading.Event()
+
+        def failing_call():
+            calls.append(1)
+            release.wait(5)
+            raise RuntimeError("upstream down")
+
+        threading.Timer(0.3, release.set).start()
+        results, errors = self._run_concurrently(
+            lambda: cache.get_or_call("api", {"q": 1}, failing_call), 5
+        )
+
+        assert results == []
+        assert len(errors) == 5
+        assert all(isinstance(e, RuntimeError) for e in errors)
+        assert len(calls) == 1
+        # 실패는 캐시되지 않음
+        assert cache.get_or_call("api", {"q": 1}, lambda: "ok") == "ok"
+
+    def test_leader_interrupt_not_shared_with_waiters(self):
+        """첫 호출자의 BaseException(스크립트 중단 등)은 대기자에게 전파되지 않고 대기자가 다시 호출 테스트"""
+        import threading
+
+        class ScriptStopped(BaseException):
+            pass
+
+        cache = ResponseCache()
+        calls = []
+        release = threading.Event()
+        leader_errors = []
+
+        def call():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(5)
+                raise ScriptStopped()
+            return "retried"
+
+        def run_leader():
+            try:
+                cache.get_or_call("api", {"q": 1}, call)
+            except BaseException as e:
+                leader_errors.append(e)
+
+        leader = threading.Thread(target=run_leader)
+        leader.start()
+        time.sleep(0.1)
+        threading.Timer(0.2, release.set).start()
+        results, errors = self._run_concurrently(lambda: cache.get_or_call("api", {"q": 1}, call), 4)
+        leader.join(timeout=5)
+
+        assert len(leader_errors) == 1 and isinstance(leader_errors[0], ScriptStopped)
+        assert errors == []
+        assert results == ["retried"] * 4
+        assert len(calls) == 2
+
+    def test_waiter_timeout_calls_directly(self):
+        """대기 시간 초과 시 직접 호출 테스트"""
+        import threading
+        cache = ResponseCache()
+        release = threading.Event()
+        leader = threading.Thread(
+            target=lambda: cache.get_or_call("api", {"q": 1}, lambda: release.wait(5) and "slow")
+        )
+        leader.start()
+        time.sleep(0.1)
+
+        result = cache.get_or_call("api", {"q": 1}, lambda: "fast", wait_timeout=0.1)
+        release.set()
+        leader.join(timeout=5)
+
+        assert result == "fast"
+        assert cache.get_stats()["coalesce_timeouts"] == 1
+
+    def test_decorator_coalesces(self):
+        """데코레이터 동시 호출 병합 테스트"""
+        import threading
+        calls = []
+        release = threading.Event()
+
+        @cached("test_single_flight", ttl=60)
+        def generate(airline):
+            calls.append(airline)
+            release.wait(5)
+            return f"questions_{airline}"
+
+        threading.Timer(0.3, release.set).start()
+        results, errors = self._run_concurrently(lambda: generate(airline="OZ"), 6)
+
+        assert errors == []
+        assert results == ["questions_OZ"] * 6
+        assert calls == ["OZ"]
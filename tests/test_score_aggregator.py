@@ -0,0 +1,145 @@
+# tests/test_score_aggregator.py
+# Score Aggregator 테스트
+
+import pytest
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import score_aggregator as sa
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """임시 저장소를 쓰는 ScoreStore"""
+    monkeypatch.setattr(sa, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(sa, "SCORE_AGGREGATE_FILE", tmp_path / "score_aggregate.json")
+    monkeypatch.setattr(sa, "SCORE_LOG_FILE", tmp_path / "score_aggregate.jsonl")
+    fresh = sa.ScoreStore()
+    monkeypatch.setattr(sa, "_store", fresh)
+    return fresh
+
+
+def add(user, airline, total, **extra):
+    scores = {"종합점수": total}
+    scores.update(extra)
+    assert sa.add_score(user, airline, "모의면접", scores) is True
+
+
+class TestScoreStore:
+    """ScoreStore 저장/인덱스 테스트"""
+
+    def test_add_appends_without_rewriting_snapshot(self, store):
+        """점수 추가가 스냅샷을 다시 쓰지 않는지 테스트"""
+        sa.initialize()
+        before = sa.SCORE_AGGREGATE_FILE.read_text(encoding="utf-8")
+
+        add("u1", "대한항공", 80)
+        add("u2", "대한항공", 70)
+
+        assert sa.SCORE_AGGREGATE_FILE.read_text(encoding="utf-8") == before
+        assert len(sa.SCORE_LOG_FILE.read_text(encoding="utf-8").splitlines()) == 2
+        assert sa.get_score_count() == 2
+
+    def test_picks_up_appends_from_other_process(self, store):
+        """다른 프로세스가 추가한 기록을 반영하는지 테스트"""
+        add("u1", "대한항공", 80)
+        assert sa.get_score_count() == 1
+
+        other = sa.ScoreStore()
+        other.append({"user_id": "x", "airline": "진에어", "scores": {"종합점수": 60.0},
+                      "timestamp": datetime.now().isoformat()})
+
+        assert sa.get_score_count() == 2
+        assert len(sa.get_all_scores(airline="진에어")) == 1
+
+    def test_partial_log_line_ignored_until_complete(self, store):
+        """기록 중인 마지막 줄은 완성될 때까지 무시하는지 테스트"""
+        add("u1", "대한항공", 80)
+        with open(sa.SCORE_LOG_FILE, "a", encoding="utf-8") as f:
+            f.write('{"user_id": "u2"')
+
+        assert sa.get_score_count() == 1
+
+    def test_compact_folds_log_into_snapshot(self, store):
+        """압축 후 로그가 비고 기록이 유지되는지 테스트"""
+        for i in range(3):
+            add(f"u{i}", "제주항공", 60 + i)
+
+        assert store.compact() is True
+        assert sa.SCORE_LOG_FILE.read_text(encoding="utf-8") == ""
+        data = json.loads(sa.SCORE_AGGREGATE_FILE.read_text(encoding="utf-8"))
+        assert len(data["records"]) == 3
+        assert sa.get_score_count() == 3
+
+    def test_clear_old_records(self, store):
+        """오래된 기록 삭제 테스트"""
+        add("u1", "대한항공", 80)
+        store.append({"user_id": "old", "airline": "대한항공", "scores": {"종합점수": 50.0},
+                      "timestamp": (datetime.now() - timedelta(days=400)).isoformat()})
+
+        assert sa.clear_old_records(days=365) == 1
+        assert sa.get_score_count() == 1
+
+
+class TestStatistics:
+    """통계/순위 테스트"""
+
+    def test_percentile_matches_linear_count(self, store):
+        """bisect 백분위가 선형 계산과 같은지 테스트"""
+        values = [55, 60, 60, 72, 80, 91, 45]
+        for i, value in enumerate(values):
+            add(f"u{i}", "대한항공", value)
+
+        for score in (40, 60, 61, 91, 100):
+            expected = round(sum(1 for v in values if v < score) / len(values) * 100, 1)
+            assert sa.calculate_percentile(score, "종합점수") == expected
+
+    def test_percentile_per_airline(self, store):
+        """항공사별 백분위 테스트"""
+        for i in range(5):
+            add(f"k{i}", "대한항공", 80 + i)
+            add(f"j{i}", "진에어", 50 + i)
+
+        assert sa.calculate_percentile(60, "종합점수", airline="진에어") == 100.0
+        assert sa.calculate_percentile(60, "종합점수", airline="대한항공") == 0.0
+
+    def test_percentile_insufficient_data(self, store):
+        """데이터 부족 시 -1 반환 테스트"""
+        add("u1", "대한항공", 80)
+        assert sa.calculate_percentile(70, "종합점수") == -1.0
+
+    def test_statistics(self, store):
+        """통계 요약 테스트"""
+        for i, value in enumerate([60, 70, 80]):
+            add(f"u{i}", "대한항공", value)
+
+        stats = sa.get_statistics(category="종합점수")
+        assert stats["mean"] == 70.0
+        assert stats["min"] == 60.0
+        assert stats["max"] == 80.0
+        assert stats["count"] == 3
+
+    def test_weekly_ranking_best_per_user(self, store):
+        """주간 순위가 사용자별 최고점 기준인지 테스트"""
+        add("u1", "대한항공", 70)
+        add("u1", "대한항공", 90)
+        add("u2", "대한항공", 85)
+        store.append({"user_id": "old", "airline": "대한항공", "scores": {"종합점수": 99.0},
+                      "timestamp": (datetime.now() - timedelta(days=14)).isoformat()})
+
+        ranking = sa.get_weekly_ranking()
+        assert [r["score"] for r in ranking] == [90, 85]
+
+    def test_user_rank(self, store):
+        """사용자 순위 조회 테스트"""
+        add("u1", "대한항공", 70)
+        add("u2", "대한항공", 90)
+
+        rank = sa.get_user_rank("u1")
+        assert rank["weekly_rank"] == 2
+        assert rank["monthly_total_users"] == 2
+        assert len(sa.get_user_scores("u1")) == 1
@@ -0,0 +1,228 @@
+# tests/test_sharp_question_pipeline.py
+# 자소서 기반 질문 파이프라인 (문항 병렬 처리 + 결과 캐시) 테스트
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("requests")
+
+import sharp_question_pipeline as sqp
+from sharp_question_pipeline import InterviewQuestionPipeline
+
+
+QA_PAIRS = [
+    {"prompt": f"문항 {i}", "answer": f"답변 {i}"}
+    for i in range(1, 4)
+]
+
+
+def item_result(q_num, question_text):
+    """정상 처리된 문항 결과"""
+    return {
+        "q_num": q_num,
+        "question_text": question_text,
+        "validated_questions": [{"id": f"Q{q_num}", "question": f"{question_text} 꼬리질문"}],
+        "rejected_questions": [],
+    }
+
+
+@pytest.fixture
+def pipeline_factory(tmp_path, monkeypatch):
+    """임시 디스크 캐시를 쓰는 파이프라인 + 문항 처리 스텁"""
+    monkeypatch.setattr(sqp, "PIPELINE_CACHE_FILE", tmp_path / "sharp.sqlite3")
+
+    def factory(handler, **kwargs):
+        pipeline = InterviewQuestionPipeline(**kwargs)
+        calls = []
+
+        def process_single_item(q_num, question_text, answer_text):
+            calls.append(q_num)
+            return handler(q_num, question_text)
+
+        monkeypatch.setattr(pipeline, "process_single_item", process_single_item)
+        pipeline.calls = calls
+        return pipeline
+
+    return factory
+
+
+class TestResultCache:
+    """전체/문항 결과 캐시 테스트"""
+
+    def test_complete_result_is_cached(self, pipeline_factory):
+        """모든 문항이 성공하면 두 번째 호출은 캐시에서 반환하는지 테스트"""
+        pipeline = pipeline_factory(item_result)
+
+        first = pipeline.process(QA_PAIRS)
+        second = pipeline.process(QA_PAIRS)
+
+        assert second is first or second == first
+        assert sorted(pipeline.calls) == [1, 2, 3]
+
+    def test_failed_item_is_not_cached(self, pipeline_factory):
+        """실패 문항이 있는 결과는 저장하지 않고, 다음 호출에서 실패 문항만 다시 처리하는지 테스트"""
+        outage = {"active": True}
+
+        def handler(q_num, question_text):
+            if q_num == 2 and outage["active"]:
+                raise RuntimeError("CLOVA 503")
+            return item_result(q_num, question_text)
+
+        pipeline = pipeline_factory(handler)
+        first = pipeline.process(QA_PAIRS)
+        assert first["summary"]["failed_items"] == [2]
+
+        outage["active"] = False
+        second = pipeline.process(QA_PAIRS)
+
+        assert second["summary"]["failed_items"] == []
+        assert sorted(pipeline.calls) == [1, 2, 2, 3]
+
+    def test_failed_result_not_persisted_to_disk(self, pipeline_factory):
+        """실패가 섞인 결과가 디스크 캐시에 남지 않는지 테스트 (재시작 후 재처리)"""
+        def handler(q_num, question_text):
+            if q_num == 3:
+                return {"q_num": q_num, "questions": [], "error": "질문 생성 실패"}
+            return item_result(q_num, question_text)
+
+        pipeline_factory(handler).process(QA_PAIRS)
+        restarted = pipeline_factory(item_result)
+        result = restarted.process(QA_PAIRS)
+
+        assert restarted.calls == [3]
+        assert result["summary"]["failed_items"] == []
+
+    def test_memory_cache_is_thread_safe(self, pipeline_factory, monkeypatch):
+        """여러 스레드가 동시에 조회/저장/제거해도 예외가 없는지 테스트"""
+        monkeypatch.setattr(sqp, "PIPELINE_MEMORY_CACHE_SIZE", 4)
+        pipeline = pipeline_factory(item_result, use_disk_cache=False)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(2000):
+                    key = f"k{(offset + i) % 8}"
+                    pipeline._memory_cache_set(key, i)
+                    pipeline._cache_get(key)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert len(pipeline._cache) <= 4
+
+
+class TestProcessItems:
+    """문항 병렬 처리 테스트"""
+
+    def test_results_keep_input_order(self, pipeline_factory):
+        """늦게 끝난 문항이 있어도 결과가 입력 순서인지 테스트"""
+        delays = {1: 0.3, 2: 0.0, 3: 0.1}
+
+        def handler(q_num, question_text):
+            time.sleep(delays[q_num])
+            return item_result(q_num, question_text)
+
+        pipeline = pipeline_factory(handler, max_parallel_items=3, use_disk_cache=False)
+        result = pipeline.process(QA_PAIRS)
+
+        assert [item["q_num"] for item in result["items"]] == [1, 2, 3]
+        assert [q["id"] for q in result["all_deep_questions"]] == ["Q1", "Q2", "Q3"]
+
+    def test_items_run_concurrently(self, pipeline_factory):
+        """문항이 동시에 처리되는지 테스트"""
+        def handler(q_num, question_text):
+            time.sleep(0.3)
+            return item_result(q_num, question_text)
+
+        pipeline = pipeline_factory(handler, max_parallel_items=3, use_disk_cache=False)
+        start = time.time()
+        pipeline.process(QA_PAIRS)
+
+        assert time.time() - start < 0.8
+
+    def test_exception_is_isolated(self, pipeline_factory):
+        """예외가 난 문항만 오류 결과가 되고 나머지는 정상인지 테스트"""
+        def handler(q_num, question_text):
+            if q_num == 1:
+                raise ValueError("파싱 오류")
+            return item_result(q_num, question_text)
+
+        pipeline = pipeline_factory(handler, max_parallel_items=3, use_disk_cache=False)
+        result = pipeline.process(QA_PAIRS)
+
+        assert result["items"][0]["error"] == "파싱 오류"
+        assert result["summary"]["failed_items"] == [1]
+        assert result["summary"]["timed_out_items"] == []
+        assert result["summary"]["total_validated"] == 2
+
+    def test_slow_item_times_out_with_partial_results(self, pipeline_factory):
+        """제한 시간을 넘긴 문항은 시간 초과로 대체하고 나머지 결과는 반환하는지 테스트"""
+        release = threading.Event()
+
+        def handler(q_num, question_text):
+            if q_num == 2:
+                release.wait(5)
+            return item_result(q_num, question_text)
+
+        pipeline = pipeline_factory(handler, max_parallel_items=3, item_deadline=0.2, use_disk_cache=False)
+        try:
+            start = time.time()
+            result = pipeline.process(QA_PAIRS)
+            elapsed = time.time() - start
+        finally:
+            release.set()
+
+        assert elapsed < 2.0
+        assert result["items"][1]["error"] == "시간 초과"
+        assert result["summary"]["timed_out_items"] == [2]
+        assert result["summary"]["failed_items"] == []
+        assert [q["id"] for q in result["all_deep_questions"]] == ["Q1", "Q3"]
+
+    def test_partial_results_are_not_cached(self, pipeline_factory):
+        """시간 초과/실패가 섞인 결과는 전체 캐시에 남지 않고, 성공 문항만 문항 캐시에 남는지 테스트"""
+        release = threading.Event()
+
+        def handler(q_num, question_text):
+            if q_num == 1:
+                raise RuntimeError("CLOVA 503")
+            if q_num == 2 and not release.is_set():
+                release.wait(5)
+            return item_result(q_num, question_text)
+
+        pipeline = pipeline_factory(handler, max_parallel_items=3, item_deadline=0.2)
+        try:
+            pipeline.process(QA_PAIRS)
+        finally:
+            release.set()
+
+        assert pipeline._cache_get(pipeline._get_cache_key(QA_PAIRS)) is None
+        cached_items = [
+            pipeline._cache_get(pipeline._get_item_cache_key(p["prompt"], p["answer"])) is not None
+            for p in QA_PAIRS
+        ]
+        assert cached_items == [False, False, True]
+
+    def test_sequential_mode(self, pipeline_factory):
+        """max_parallel_items=1이면 순서대로 처리하고 예외를 격리하는지 테스트"""
+        def handler(q_num, question_text):
+            if q_num == 2:
+                raise RuntimeError("오류")
+            return item_result(q_num, question_text)
+
+        pipeline = pipeline_factory(handler, max_parallel_items=1, use_disk_cache=False)
+        result = pipeline.process(QA_PAIRS)
+
+        assert pipeline.calls == [1, 2, 3]
+        assert result["summary"]["failed_items"] == [2]
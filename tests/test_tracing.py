@@ -0,0 +1,113 @@
+# tests/test_tracing.py
+# 경량 트레이싱 테스트
+
+import pytest
+import threading
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tracing import Tracer, NOOP_SPAN
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    return Tracer(buffer_size=10, log_file=tmp_path / "traces.jsonl")
+
+
+class TestSpans:
+    """스팬 중첩/기록 테스트"""
+
+    def test_nested_spans_share_trace(self, tracer):
+        """하위 스팬이 같은 trace_id와 부모 관계로 기록되는지 테스트"""
+        with tracer.trace("mock_interview.turn", question_idx=2) as root:
+            with tracer.span("stt") as stt:
+                stt.set(audio_bytes=4096)
+                with tracer.span("http openai:audio/transcriptions"):
+                    pass
+            with tracer.span("tts") as tts:
+                tts.set_cache(True)
+
+        data = tracer.get_recent_traces()[0]
+        spans = {s["name"]: s for s in data["spans"]}
+
+        assert data["trace_id"] == root.trace_id
+        assert data["attributes"] == {"question_idx": 2}
+        assert spans["stt"]["parent_id"] == root.span_id
+        assert spans["http openai:audio/transcriptions"]["parent_id"] == stt.span_id
+        assert spans["stt"]["attributes"]["audio_bytes"] == 4096
+        assert spans["tts"]["attributes"]["cache"] == "hit"
+        assert data["duration_ms"] >= spans["stt"]["duration_ms"]
+
+    def test_span_outside_trace_is_noop(self, tracer):
+        """트레이스 밖 스팬은 기록하지 않는지 테스트"""
+        with tracer.span("stt") as span:
+            assert span is NOOP_SPAN
+            span.set(audio_bytes=1)
+
+        @tracer.traced("tts")
+        def synthesize():
+            return b"audio"
+
+        assert synthesize() == b"audio"
+        assert tracer.get_recent_traces() == []
+
+    def test_error_recorded_and_raised(self, tracer):
+        """예외가 스팬 오류로 기록되고 전파되는지 테스트"""
+        with pytest.raises(ValueError):
+            with tracer.trace("turn"):
+                with tracer.span("content_scoring"):
+                    raise ValueError("bad json")
+
+        data = tracer.get_recent_traces()[0]
+        assert data["status"] == "error"
+        assert data["spans"][1]["error"] == "ValueError: bad json"
+
+    def test_threads_do_not_share_context(self, tracer):
+        """다른 스레드의 스팬이 현재 트레이스에 섞이지 않는지 테스트"""
+        def worker():
+            with tracer.span("other_thread") as span:
+                assert span is NOOP_SPAN
+
+        with tracer.trace("turn"):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        assert [s["name"] for s in tracer.get_recent_traces()[0]["spans"]] == ["turn"]
+
+
+class TestStorage:
+    """링버퍼/JSONL 저장 테스트"""
+
+    def test_ring_buffer_and_jsonl(self, tracer):
+        """링버퍼 크기 제한과 파일 기록 테스트"""
+        for i in range(15):
+            with tracer.trace("turn", question_idx=i):
+                pass
+
+        recent = tracer.get_recent_traces(limit=100)
+        assert len(recent) == 10
+        assert recent[0]["attributes"]["question_idx"] == 14
+
+        from_file = tracer.load_traces(limit=100)
+        assert len(from_file) == 15
+        assert tracer.get_trace(from_file[-1]["trace_id"])["attributes"]["question_idx"] == 0
+
+    def test_stage_stats(self, tracer):
+        """단계별 통계와 비중 계산 테스트"""
+        for _ in range(3):
+            with tracer.trace("turn"):
+                with tracer.span("stt"):
+                    pass
+                with tracer.span("tts") as span:
+                    span.set_cache(False)
+
+        stats = tracer.get_stage_stats()
+
+        assert stats["stt"]["count"] == 3
+        assert stats["tts"]["cache_misses"] == 3
+        assert stats["turn"]["share"] == 1.0
+        assert 0 <= stats["stt"]["share"] <= 1.0
+
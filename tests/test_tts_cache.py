@@ -0,0 +1,168 @@
+# tests/test_tts_cache.py
+# TTS 오디오 캐시 (내용 주소 키 + 용량 제한 + 사전 생성) 테스트
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import tts_cache
+from tts_cache import TTSCache, cached_tts, tts_cache_key, collect_prewarm_jobs, prewarm_tts_cache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """임시 파일을 쓰는 전역 캐시"""
+    cache = TTSCache(tmp_path / "tts.sqlite3", enabled=True)
+    monkeypatch.setattr(tts_cache, "tts_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def synth():
+    """호출을 기록하는 가짜 합성 함수"""
+    calls = []
+
+    @cached_tts("fake", voice="voice", speed="speed")
+    def synthesize(text, voice="nova", speed=1.0, model="tts-1-hd"):
+        calls.append((text, voice, speed, model))
+        return f"{model}|{voice}|{speed}|{text}".encode("utf-8")
+
+    synthesize.calls = calls
+    return synthesize
+
+
+class TestCacheKey:
+    """캐시 키 테스트"""
+
+    def test_same_inputs_same_key(self):
+        """같은 입력은 같은 키"""
+        assert tts_cache_key("openai", "alloy", 0.85, None, "안녕하세요") == \
+            tts_cache_key("openai", "alloy", 0.85, None, "안녕하세요")
+
+    def test_every_field_changes_key(self):
+        """제공자/음성/속도/감정/텍스트/옵션이 모두 키에 반영되는지 테스트"""
+        base = ("clova", "nara", 0, 0, "안녕하세요")
+        variants = [
+            ("google", "nara", 0, 0, "안녕하세요"),
+            ("clova", "nminsang", 0, 0, "안녕하세요"),
+            ("clova", "nara", 1, 0, "안녕하세요"),
+            ("clova", "nara", 0, 3, "안녕하세요"),
+            ("clova", "nara", 0, 0, "안녕하세요."),
+        ]
+        keys = {tts_cache_key(*base)} | {tts_cache_key(*v) for v in variants}
+        keys.add(tts_cache_key(*base, pitch=2))
+
+        assert len(keys) == 7
+
+    def test_provider_prefix(self):
+        """키에 제공자 접두어가 붙는지 테스트"""
+        assert tts_cache_key("edge", "ko-KR-SunHiNeural", "+0%", None, "text").startswith("edge:")
+
+
+class TestCachedTTS:
+    """cached_tts 데코레이터 테스트"""
+
+    def test_second_call_is_served_from_cache(self, cache, synth):
+        """같은 인자의 두 번째 호출은 합성 없이 캐시에서 반환하는지 테스트"""
+        first = synth("Welcome aboard.", voice="alloy", speed=0.85)
+        second = synth("Welcome aboard.", "alloy", 0.85)
+
+        assert first == second
+        assert len(synth.calls) == 1
+        assert cache.get_stats()["hits"] == 1
+
+    def test_different_options_are_separate_entries(self, cache, synth):
+        """모델 등 기타 옵션이 다르면 따로 합성하는지 테스트"""
+        synth("Welcome aboard.", voice="alloy")
+        synth("Welcome aboard.", voice="alloy", model="tts-1")
+
+        assert len(synth.calls) == 2
+
+    def test_failures_are_not_cached(self, cache):
+        """실패(None)는 저장하지 않는지 테스트"""
+        results = iter([None, b"audio"])
+
+        @cached_tts("fake", voice="voice")
+        def flaky(text, voice="nova"):
+            return next(results)
+
+        assert flaky("hello") is None
+        assert flaky("hello") == b"audio"
+        assert flaky("hello") == b"audio"
+
+    def test_disabled_cache_passes_through(self, tmp_path, monkeypatch, synth):
+        """비활성화 시 매번 합성하는지 테스트"""
+        monkeypatch.setattr(tts_cache, "tts_cache", TTSCache(tmp_path / "tts.sqlite3", enabled=False))
+
+        synth("hello")
+        synth("hello")
+
+        assert len(synth.calls) == 2
+        assert not (tmp_path / "tts.sqlite3").exists()
+
+    def test_size_limit_evicts_least_recently_used(self, tmp_path):
+        """용량을 넘으면 가장 오래 안 쓴 오디오부터 제거하는지 테스트"""
+        cache = TTSCache(tmp_path / "tts.sqlite3", max_mb=2500 / (1024 * 1024), enabled=True)
+        cache.set("fake:a", b"a" * 1000)
+        cache.set("fake:b", b"b" * 1000)
+        cache.get("fake:a")
+        cache.set("fake:c", b"c" * 1000)
+
+        assert cache.get("fake:a") is not None
+        assert cache.get("fake:b") is None
+        assert cache.get("fake:c") is not None
+
+    def test_clear_by_provider(self, cache):
+        """제공자별 삭제 테스트"""
+        cache.set(tts_cache_key("openai", "alloy", 1.0, None, "a"), b"1")
+        cache.set(tts_cache_key("clova", "nara", 0, 0, "a"), b"2")
+
+        assert cache.clear("openai") == 1
+        assert cache.get(tts_cache_key("clova", "nara", 0, 0, "a")) == b"2"
+
+
+class TestPrewarm:
+    """고정 스크립트 사전 생성 테스트"""
+
+    def test_collects_static_scripts(self):
+        """면접 질문/영어 질문·모범답변/기내방송 스크립트를 중복 없이 수집하는지 테스트"""
+        jobs = collect_prewarm_jobs()
+        sources = {job.source for job in jobs}
+
+        assert sources == {"interview", "english", "announcement"}
+        assert len({job[1:] for job in jobs}) == len(jobs)
+        assert all(job.text.strip() for job in jobs)
+        assert all(job.model == "tts-1" for job in jobs if job.source == "announcement")
+
+    def test_prewarm_renders_once(self, cache, synth):
+        """첫 실행은 모두 생성하고 다시 실행하면 모두 캐시 적중인지 테스트"""
+        total = len(collect_prewarm_jobs(["announcement"]))
+
+        dry = prewarm_tts_cache(["announcement"], dry_run=True, synthesize=synth)
+        first = prewarm_tts_cache(["announcement"], workers=2, synthesize=synth)
+        second = prewarm_tts_cache(["announcement"], synthesize=synth)
+
+        assert dry == {"total": total, "cached": 0, "rendered": 0, "failed": 0, "by_source": {"announcement": total}}
+        assert first["rendered"] == total
+        assert second["cached"] == total
+        assert len(synth.calls) == total
+
+
+class TestVoiceUtilsIntegration:
+    """voice_utils TTS 함수 캐시 연동 테스트"""
+
+    def test_generate_tts_audio_uses_cache(self, cache, monkeypatch):
+        """캐시된 오디오는 API 키 없이도 반환되는지 테스트"""
+        pytest.importorskip("requests")
+        import voice_utils
+
+        key = voice_utils.generate_openai_tts.cache_key("Tell me about yourself.", voice="alloy", speed=0.85)
+        cache.set(key, b"cached-mp3")
+        monkeypatch.setattr(voice_utils, "get_openai_api_key", lambda: "")
+
+        audio = voice_utils.generate_tts_audio("Tell me about yourself.", voice="alloy", speed=0.85)
+
+        assert audio == b"cached-mp3"
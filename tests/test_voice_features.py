@@ -0,0 +1,185 @@
+# tests/test_voice_features.py
+# 공용 음성 특성 추출 (디코딩 1회 + 해시 캐시) 테스트
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("librosa")
+sf = pytest.importorskip("soundfile")
+pytest.importorskip("requests")
+
+import voice_utils
+
+
+def make_wav(seconds: float = 3.0, sr: int = 16000) -> bytes:
+    """피치가 천천히 변하는 합성 음성 WAV"""
+    t = np.arange(int(seconds * sr)) / sr
+    f0 = 180 + 20 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / sr
+    y = 0.3 * (np.sin(phase) + 0.4 * np.sin(2 * phase))
+    buf = io.BytesIO()
+    sf.write(buf, y.astype(np.float32), sr, format="WAV")
+    return buf.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    voice_utils.clear_audio_feature_cache()
+    yield
+    voice_utils.clear_audio_feature_cache()
+
+
+@pytest.fixture
+def decode_counter(monkeypatch):
+    """decode_audio 호출 횟수 기록"""
+    calls = []
+    original = voice_utils.decode_audio
+
+    def counting(audio_bytes):
+        calls.append(len(audio_bytes))
+        return original(audio_bytes)
+
+    monkeypatch.setattr(voice_utils, "decode_audio", counting)
+    return calls
+
+
+class TestAudioFeatures:
+    """extract_audio_features 테스트"""
+
+    def test_features_from_memory(self):
+        """WAV를 메모리에서 디코딩해 특성을 계산하는지 테스트"""
+        features = voice_utils.extract_audio_features(make_wav(3.0))
+
+        assert features is not None
+        assert features.duration == pytest.approx(3.0, abs=0.01)
+        assert len(features.pitch_values) > 10
+        assert 150 < float(np.median(features.pitch_values)) < 220
+        assert len(features.rms) > 0
+        assert features.segment_energy is not None
+
+    def test_empty_audio(self):
+        """빈 오디오는 None"""
+        assert voice_utils.extract_audio_features(b"") is None
+
+    def test_all_analyzers_decode_once(self, decode_counter):
+        """턴 분석과 결과 화면 종합 분석이 디코딩을 한 번만 하는지 테스트"""
+        audio = make_wav(4.0)
+
+        voice_utils.analyze_voice_advanced(audio, transcribed_text="안녕하세요 저는 지원자입니다")
+        voice_utils.analyze_interview_emotion(audio, "안녕하세요")
+        voice_utils.analyze_voice_complete(audio, transcription={"text": "안녕하세요", "duration": 4.0, "words": []})
+
+        assert len(decode_counter) == 1
+
+    def test_cache_is_bounded(self, monkeypatch, decode_counter):
+        """캐시 크기 제한 테스트"""
+        monkeypatch.setattr(voice_utils, "AUDIO_FEATURE_CACHE_SIZE", 2)
+        clips = [make_wav(1.0 + i * 0.1) for i in range(3)]
+
+        for audio in clips:
+            voice_utils.extract_audio_features(audio)
+        voice_utils.extract_audio_features(clips[0])
+
+        assert len(decode_counter) == 4
+
+    def test_timeout_is_not_cached(self, monkeypatch):
+        """분석 풀 시간 초과 결과는 캐시하지 않고 다음 호출에서 다시 계산하는지 테스트"""
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        original = voice_utils.run_analysis
+        calls = []
+
+        def flaky(fn, *args, **kwargs):
+            calls.append(fn.__name__)
+            if len(calls) == 1:
+                raise FutureTimeoutError()
+            return original(fn, *args, **kwargs)
+
+        monkeypatch.setattr(voice_utils, "run_analysis", flaky)
+        audio = make_wav(1.0)
+
+        assert voice_utils.extract_audio_features(audio) is None
+        assert voice_utils.extract_audio_features(audio) is not None
+        assert voice_utils.extract_audio_features(audio) is not None
+        assert len(calls) == 2
+
+    def test_decode_error_is_not_cached(self, monkeypatch):
+        """디코딩 예외도 캐시하지 않는지 테스트"""
+        original = voice_utils.decode_audio
+        failures = iter([OSError("임시 파일 쓰기 실패")])
+
+        def flaky(audio_bytes):
+            error = next(failures, None)
+            if error:
+                raise error
+            return original(audio_bytes)
+
+        monkeypatch.setattr(voice_utils, "decode_audio", flaky)
+        audio = make_wav(1.0)
+
+        assert voice_utils.extract_audio_features(audio) is None
+        assert voice_utils.extract_audio_features(audio) is not None
+
+
+class TestAnalyzers:
+    """공용 특성을 쓰는 분석기 테스트"""
+
+    def test_emotion_features_use_shared_extraction(self):
+        """감정 분석용 특성이 공용 특성과 일치하는지 테스트"""
+        audio = make_wav(3.0)
+        features = voice_utils.extract_voice_features_for_emotion(audio)
+        shared = voice_utils.extract_audio_features(audio)
+
+        assert features["pitch_mean"] == pytest.approx(float(np.mean(shared.pitch_values)))
+        assert features["energy_mean"] == pytest.approx(float(np.mean(shared.rms)))
+        assert 0.0 <= features["pause_ratio"] <= 1.0
+
+    def test_voice_complete_runs_physical_analysis(self):
+        """analyze_voice_complete가 물리적 음성 분석 결과를 포함하는지 테스트"""
+        result = voice_utils.analyze_voice_complete(
+            make_wav(3.0),
+            transcription={"text": "안녕하세요 저는 지원자입니다", "duration": 3.0, "words": []}
+        )
+
+        assert "jitter_percent" in result["voice_analysis"]["tremor"]
+        assert 0 <= result["total_score"] <= 100
+
+
+class TestPitchContour:
+    """벡터화된 피치 윤곽 추출 테스트"""
+
+    @staticmethod
+    def legacy_contour(pitches, magnitudes):
+        """기존 프레임별 루프 구현"""
+        pitch_values = []
+        for t in range(pitches.shape[1]):
+            index = magnitudes[:, t].argmax()
+            pitch = pitches[index, t]
+            if pitch > 0:
+                pitch_values.append(pitch)
+        return np.array(pitch_values, dtype=pitches.dtype)
+
+    def test_matches_frame_loop(self):
+        """무성 프레임/동률 bin을 포함해 기존 루프와 결과가 같은지 테스트"""
+        rng = np.random.default_rng(3)
+        pitches = rng.uniform(80, 400, (64, 500)).astype(np.float32)
+        pitches[rng.random(pitches.shape) < 0.3] = 0
+        magnitudes = rng.integers(0, 4, pitches.shape).astype(np.float32)
+        magnitudes[:, :50] = 0  # 무음 프레임
+
+        expected = self.legacy_contour(pitches, magnitudes)
+        result = voice_utils._pitch_contour(pitches, magnitudes)
+
+        assert result.dtype == expected.dtype
+        np.testing.assert_array_equal(result, expected)
+
+    def test_empty_frames(self):
+        """프레임이 없으면 빈 배열"""
+        empty = np.zeros((1025, 0), dtype=np.float32)
+        assert len(voice_utils._pitch_contour(empty, empty)) == 0
@@ -0,0 +1,107 @@
+"""
+Unit Tests for Async Dispatch.
+
+Tests for the async service facade used by async API endpoints.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.infrastructure import async_dispatch
+from src.infrastructure.async_dispatch import AsyncServiceFacade, async_facade, run_blocking
+
+
+class FakeService:
+    """Synchronous service with a blocking method."""
+
+    NAMES = {"KE": "대한항공"}
+
+    def __init__(self):
+        self.threads = []
+
+    def slow_lookup(self, value, delay=0.2):
+        self.threads.append(threading.get_ident())
+        time.sleep(delay)
+        return value * 2
+
+    def fail(self):
+        raise KeyError("missing")
+
+
+@pytest.fixture
+def threads(monkeypatch):
+    """Set the blocking thread count for a test."""
+    def set_threads(count):
+        settings = async_dispatch.get_settings()
+        monkeypatch.setattr(settings, "blocking_io_threads", count)
+        monkeypatch.setattr(async_dispatch, "_limiters", {})
+    return set_threads
+
+
+class TestAsyncServiceFacade:
+    """Tests for AsyncServiceFacade."""
+
+    @pytest.mark.unit
+    def test_calls_run_off_the_event_loop(self, threads):
+        threads(4)
+        service = FakeService()
+        facade = AsyncServiceFacade(service)
+        ticks = []
+
+        async def ticker():
+            for _ in range(10):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.02)
+
+        async def main():
+            results = await asyncio.gather(
+                facade.slow_lookup(1), facade.slow_lookup(2), ticker()
+            )
+            return results[:2]
+
+        start = time.perf_counter()
+        assert asyncio.run(main()) == [2, 4]
+
+        assert time.perf_counter() - start < 0.35  # both calls overlapped
+        assert threading.get_ident() not in service.threads
+        gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+        assert max(gaps) < 0.15  # the loop kept running
+
+    @pytest.mark.unit
+    def test_inline_when_disabled(self, threads):
+        threads(0)
+        service = FakeService()
+
+        result = asyncio.run(AsyncServiceFacade(service).slow_lookup(3, delay=0))
+
+        assert result == 6
+        assert service.threads == [threading.get_ident()]
+
+    @pytest.mark.unit
+    def test_attributes_and_errors(self, threads):
+        threads(2)
+        facade = AsyncServiceFacade(FakeService())
+
+        assert facade.NAMES["KE"] == "대한항공"
+        with pytest.raises(KeyError):
+            asyncio.run(facade.fail())
+        assert async_dispatch.get_dispatch_stats()["errors"] >= 1
+
+    @pytest.mark.unit
+    def test_facade_reused_per_service(self):
+        service = FakeService()
+        assert async_facade(service) is async_facade(service)
+        assert async_facade(service).sync is service
+
+    @pytest.mark.unit
+    def test_run_blocking_passes_arguments(self, threads):
+        threads(2)
+        assert asyncio.run(run_blocking(divmod, 7, 2)) == (3, 1)
@@ -0,0 +1,202 @@
+"""
+Unit Tests for the Redis Backplane.
+
+Runs RedisBackplane against an in-process fake of the RedisCache pub/sub
+API (publish / subscribe / listen), so no Redis server is needed.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.realtime import backplane
+from src.realtime.backplane import RedisBackplane
+
+
+class FakePubSub:
+    """Subscription on a FakeRedisCache channel."""
+
+    def __init__(self, broker, channel):
+        self.broker = broker
+        self.channel = channel
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.fail_next_listen = False
+        self.closed = False
+
+    async def listen(self):
+        if self.fail_next_listen:
+            self.fail_next_listen = False
+            raise ConnectionError("connection reset")
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        self.closed = True
+        self.broker.subscribers.remove(self)
+
+
+class FakeRedisCache:
+    """In-process stand-in for RedisCache.publish/subscribe."""
+
+    def __init__(self):
+        self.subscribers = []
+
+    async def publish(self, channel, message):
+        receivers = [s for s in self.subscribers if s.channel == channel]
+        for subscriber in receivers:
+            subscriber.queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(receivers)
+
+    async def subscribe(self, *channels):
+        pubsub = FakePubSub(self, channels[0])
+        self.subscribers.append(pubsub)
+        return pubsub
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def start_nodes(cache, count):
+    nodes, inboxes = [], []
+    for _ in range(count):
+        inbox = []
+
+        async def handler(message, inbox=inbox):
+            inbox.append(message)
+
+        node = RedisBackplane(cache)
+        await node.start(handler)
+        nodes.append(node)
+        inboxes.append(inbox)
+    return nodes, inboxes
+
+
+class TestRedisBackplane:
+    """Tests for RedisBackplane fan-out over a fake pub/sub."""
+
+    @pytest.mark.unit
+    def test_publish_reaches_other_nodes_only(self):
+        async def scenario():
+            cache = FakeRedisCache()
+            nodes, inboxes = await start_nodes(cache, 3)
+            await nodes[0].publish({"kind": "room", "room": "r1", "event": {"type": "chat"}})
+            await settle()
+            for node in nodes:
+                await node.stop()
+            return nodes, inboxes
+
+        nodes, inboxes = asyncio.run(scenario())
+
+        assert inboxes[0] == []
+        for inbox in inboxes[1:]:
+            assert len(inbox) == 1
+            assert inbox[0]["room"] == "r1"
+            assert inbox[0]["origin"] == nodes[0].node_id
+
+    @pytest.mark.unit
+    def test_invalid_payload_is_skipped(self):
+        async def scenario():
+            cache = FakeRedisCache()
+            nodes, inboxes = await start_nodes(cache, 1)
+            await cache.publish("ws:fanout", "{not json")
+            await cache.publish("ws:fanout", json.dumps({"kind": "broadcast", "origin": "other"}))
+            await settle()
+            await nodes[0].stop()
+            return inboxes[0]
+
+        inbox = asyncio.run(scenario())
+
+        assert inbox == [{"kind": "broadcast", "origin": "other"}]
+
+    @pytest.mark.unit
+    def test_read_error_resumes_listening(self, monkeypatch):
+        monkeypatch.setattr(backplane, "RECONNECT_DELAY_SECONDS", 0.01)
+
+        async def scenario():
+            cache = FakeRedisCache()
+            node = RedisBackplane(cache)
+            inbox = []
+
+            async def handler(message):
+                inbox.append(message)
+
+            original_subscribe = cache.subscribe
+
+            async def subscribe(*channels):
+                pubsub = await original_subscribe(*channels)
+                pubsub.fail_next_listen = True
+                return pubsub
+
+            cache.subscribe = subscribe
+            await node.start(handler)
+            await asyncio.sleep(0.05)
+            await cache.publish("ws:fanout", json.dumps({"kind": "user", "origin": "other"}))
+            await settle()
+            await node.stop()
+            return inbox
+
+        inbox = asyncio.run(scenario())
+
+        assert inbox == [{"kind": "user", "origin": "other"}]
+
+    @pytest.mark.unit
+    def test_stop_closes_subscription(self):
+        async def scenario():
+            cache = FakeRedisCache()
+            nodes, _ = await start_nodes(cache, 1)
+            pubsub = nodes[0]._pubsub
+            await nodes[0].stop()
+            return cache, pubsub
+
+        cache, pubsub = asyncio.run(scenario())
+
+        assert pubsub.closed
+        assert cache.subscribers == []
+
+
+class TestRedisCacheSubscribe:
+    """Tests for the dedicated pub/sub connection pool."""
+
+    @pytest.mark.unit
+    def test_subscribe_uses_connections_without_socket_timeout(self, monkeypatch):
+        pytest.importorskip("redis")
+        from src.cache import redis_cache
+        from src.cache.redis_cache import CacheConfig, RedisCache
+
+        class FakePubSubClient:
+            async def subscribe(self, *channels):
+                self.channels = channels
+
+        class FakeRedis:
+            def __init__(self, connection_pool):
+                self.connection_pool = connection_pool
+
+            def pubsub(self, **kwargs):
+                return FakePubSubClient()
+
+        monkeypatch.setattr(redis_cache, "Redis", FakeRedis)
+
+        async def scenario():
+            cache = RedisCache(CacheConfig(url="redis://localhost:6379/0"))
+            cache._pool = cache._create_pool()
+            cache._client = FakeRedis(cache._pool)
+            cache._connected = True
+            pubsub = await cache.subscribe("ws:fanout")
+            await cache.subscribe("other")
+            return cache, pubsub
+
+        cache, pubsub = asyncio.run(scenario())
+
+        assert pubsub.channels == ("flyready:ws:fanout",)
+        assert cache._pool.connection_kwargs["socket_timeout"] == 5.0
+        assert cache._pubsub_pool.connection_kwargs["socket_timeout"] is None
+        assert cache._pubsub_pool.connection_kwargs["health_check_interval"] == 30
+        assert cache._pubsub_client is not cache._client
@@ -0,0 +1,105 @@
+"""
+Unit Tests for Database Session Management.
+
+Tests for the pooled SQLite engines (WAL, PRAGMAs, read-only reporting pool).
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from src.config.settings import DatabaseSettings
+from src.database.session import create_sqlite_engine, sqlite_path
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'app.db'}"
+
+
+def pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+class TestSQLiteEngine:
+    """Tests for create_sqlite_engine."""
+
+    @pytest.mark.unit
+    def test_sqlite_path(self):
+        assert sqlite_path("sqlite:////data/app.db") == "/data/app.db"
+        assert sqlite_path("sqlite:///file:/data/app.db?mode=ro&uri=true") == "/data/app.db"
+        assert sqlite_path("sqlite://") is None
+        assert sqlite_path("sqlite:///:memory:") is None
+        assert sqlite_path("postgresql://u:p@localhost/app") is None
+
+    @pytest.mark.unit
+    def test_pragmas_applied(self, db_url):
+        db = DatabaseSettings(sqlite_busy_timeout_ms=1234, sqlite_mmap_size=1 << 20)
+        engine = create_sqlite_engine(db_url, db)
+
+        assert pragma(engine, "journal_mode") == "wal"
+        assert pragma(engine, "synchronous") == 1  # NORMAL
+        assert pragma(engine, "busy_timeout") == 1234
+        assert pragma(engine, "mmap_size") == 1 << 20
+        assert pragma(engine, "foreign_keys") == 1
+
+    @pytest.mark.unit
+    def test_threads_get_their_own_connections(self, db_url):
+        engine = create_sqlite_engine(db_url, DatabaseSettings(sqlite_pool_size=4))
+        assert isinstance(engine.pool, QueuePool)
+
+        barrier = threading.Barrier(3)
+        connections = []
+
+        def worker():
+            with engine.connect() as conn:
+                connections.append(id(conn.connection.driver_connection))
+                barrier.wait(timeout=5)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(connections)) == 3
+
+    @pytest.mark.unit
+    def test_read_only_engine(self, db_url):
+        db = DatabaseSettings()
+        engine = create_sqlite_engine(db_url, db)
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+            conn.execute(text("INSERT INTO items (name) VALUES ('a')"))
+
+        reader = create_sqlite_engine(db_url, db, read_only=True)
+
+        with reader.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 1
+            with pytest.raises(sqlalchemy.exc.OperationalError):
+                conn.execute(text("INSERT INTO items (name) VALUES ('b')"))
+
+        # Reads see commits made after the reader pool was opened
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO items (name) VALUES ('c')"))
+        with reader.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 2
+
+    @pytest.mark.unit
+    def test_memory_database_keeps_static_pool(self):
+        engine = create_sqlite_engine("sqlite://", DatabaseSettings())
+
+        assert isinstance(engine.pool, StaticPool)
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        assert pragma(engine, "foreign_keys") == 1
@@ -0,0 +1,267 @@
+"""
+Unit Tests for Metrics Collector.
+
+Tests for quantile sketches, sliding windows, label cardinality limits,
+timers, the disabled mode and Prometheus export.
+"""
+
+import os
+import random
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.analytics.metrics import (
+    OVERFLOW_LABEL,
+    Counter,
+    Histogram,
+    MetricsCollector,
+    QuantileSketch,
+    metrics_collector,
+    set_enabled,
+    start_metrics_server,
+    stop_metrics_server,
+)
+
+
+class FakeClock:
+    """Manually advanced clock for window tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestQuantileSketch:
+    """Tests for QuantileSketch."""
+
+    @pytest.mark.unit
+    def test_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(0, 1) for _ in range(20000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        values.sort()
+        for q in (0.5, 0.95, 0.99):
+            expected = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.02)
+
+    @pytest.mark.unit
+    def test_merge_and_edge_values(self):
+        left, right = QuantileSketch(), QuantileSketch()
+        for value in (-2.0, 0.0, 1.0):
+            left.add(value)
+        right.add(100.0, count=3)
+
+        left.merge(right)
+
+        assert left.count == 6
+        assert left.quantile(0.0) == -2.0
+        assert left.quantile(1.0) == 100.0
+        assert QuantileSketch().quantile(0.5) is None
+
+    @pytest.mark.unit
+    def test_bins_are_bounded(self):
+        sketch = QuantileSketch(max_bins=50)
+        for i in range(1, 10000):
+            sketch.add(i * 0.37)
+
+        assert len(sketch._positive) <= 50
+        assert sketch.quantile(0.99) == pytest.approx(0.99 * 9999 * 0.37, rel=0.02)
+
+
+class TestHistogram:
+    """Tests for Histogram buckets, quantiles and windows."""
+
+    @pytest.mark.unit
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram("latency", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        summary = histogram.get_summary()
+
+        assert summary["buckets"] == {0.1: 2, 1.0: 3, float("inf"): 4}
+        assert summary["count"] == 4
+        assert summary["p50"] == pytest.approx(0.1, rel=0.02)
+
+    @pytest.mark.unit
+    def test_sliding_windows(self):
+        clock = FakeClock()
+        histogram = Histogram("latency", "Latency", labels=["provider"], clock=clock)
+        for _ in range(100):
+            histogram.observe(0.2, provider="openai")
+
+        clock.now += 120  # the slow burst is the only thing in the last minute
+        for _ in range(10):
+            histogram.observe(4.0, provider="openai")
+
+        assert histogram.quantile(0.5, window=60, provider="openai") == pytest.approx(4.0, rel=0.02)
+        assert histogram.quantile(0.5, window=300, provider="openai") == pytest.approx(0.2, rel=0.02)
+        windows = histogram.get_summary(provider="openai")["windows"]
+        assert (windows["1m"]["count"], windows["5m"]["count"], windows["1h"]["count"]) == (10, 110, 110)
+
+        clock.now += 7200
+        assert histogram.get_summary(provider="openai")["windows"]["1h"]["count"] == 0
+        assert histogram.get_summary(provider="openai")["count"] == 110
+
+    @pytest.mark.unit
+    def test_concurrent_observe(self):
+        histogram = Histogram("latency", "Latency", windows=(60.0,))
+
+        def worker():
+            for _ in range(2000):
+                histogram.observe(0.01)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = histogram.get_summary()
+        assert summary["count"] == 16000
+        assert summary["buckets"][float("inf")] == 16000
+        assert summary["windows"]["1m"]["count"] == 16000
+
+
+class TestCardinality:
+    """Tests for label cardinality limits."""
+
+    @pytest.mark.unit
+    def test_new_series_fold_into_overflow(self):
+        counter = Counter("requests", "Requests", labels=["endpoint"], max_series=2)
+        for endpoint in ("/a", "/b", "/c", "/d", "/a"):
+            counter.inc(endpoint=endpoint)
+
+        assert counter.get(endpoint="/a") == 2
+        assert counter.get(endpoint=OVERFLOW_LABEL) == 2
+        assert counter.get(endpoint="/c") == 0
+        assert counter.overflowed == 2
+
+
+class TestPrometheusExport:
+    """Tests for MetricsCollector.to_prometheus."""
+
+    @pytest.mark.unit
+    def test_histogram_export(self):
+        collector = MetricsCollector()
+        collector.histogram("ai_request_duration_seconds").observe(1.5, provider="openai")
+
+        output = collector.to_prometheus()
+
+        assert 'ai_request_duration_seconds_bucket{provider="openai",le="+Inf"} 1' in output
+        assert "# TYPE ai_request_duration_seconds_window_quantile gauge" in output
+        assert 'ai_request_duration_seconds_window_quantile{provider="openai",window="5m",quantile="0.99"}' in output
+
+    @pytest.mark.unit
+    def test_collect_all_includes_quantiles(self):
+        collector = MetricsCollector()
+        collector.create_histogram("tts_seconds", "TTS latency", labels=["voice"], max_series=1)
+        collector.histogram("tts_seconds").observe(0.4, voice="a")
+        collector.histogram("tts_seconds").observe(0.4, voice="b")
+
+        data = collector.collect_all()
+
+        series = data["histograms"]["tts_seconds"]
+        assert [s["labels"]["voice"] for s in series] == ["a", OVERFLOW_LABEL]
+        assert series[0]["quantiles"][0.95] == pytest.approx(0.4, rel=0.02)
+        assert data["overflowed_series"] == {"tts_seconds": 1}
+
+    @pytest.mark.unit
+    def test_collectors_refresh_gauges_before_export(self):
+        collector = MetricsCollector()
+        gauge = collector.get_or_create_gauge("sys_x", "Refreshed at scrape time")
+        collector.register_collector("system", lambda: gauge.inc() or [])
+
+        assert "sys_x 1" in collector.to_prometheus()
+        assert [v.value for v in collector.collect_all()["gauges"]["sys_x"]] == [2]
+
+
+class TestTimer:
+    """Tests for MetricsCollector.timer and the disabled mode."""
+
+    @pytest.fixture(autouse=True)
+    def enabled(self):
+        set_enabled(True)
+        yield
+        set_enabled(True)
+
+    @pytest.mark.unit
+    def test_context_manager_and_decorator(self):
+        collector = MetricsCollector()
+
+        with collector.timer("job_seconds", "Job duration", job="report") as timer:
+            pass
+
+        @collector.timer("job_seconds", job="export")
+        def export():
+            return "done"
+
+        assert export() == "done"
+        assert timer.elapsed >= 0
+        histogram = collector.histogram("job_seconds")
+        assert histogram.labels == ["job"]
+        assert histogram.get_summary(job="report")["count"] == 1
+        assert histogram.get_summary(job="export")["count"] == 1
+
+    @pytest.mark.unit
+    def test_get_or_create_rejects_type_conflict(self):
+        collector = MetricsCollector()
+
+        assert collector.get_or_create_counter("jobs_total") is collector.get_or_create_counter("jobs_total")
+        with pytest.raises(ValueError):
+            collector.get_or_create_gauge("jobs_total")
+
+    @pytest.mark.unit
+    def test_disabled_mode_records_nothing(self):
+        collector = MetricsCollector()
+
+        @collector.timer("job_seconds", job="export")
+        def export():
+            return "done"
+
+        set_enabled(False)
+        collector.counter("http_requests_total").inc(method="GET", endpoint="/", status="200")
+        collector.gauge("active_users").set(5)
+        with collector.timer("other_seconds"):
+            pass
+        assert export() == "done"
+
+        assert collector.total("http_requests_total") == 0
+        assert collector.total("active_users") == 0
+        assert collector.histogram("other_seconds") is None
+        assert collector.histogram("job_seconds").get_summary(job="export")["count"] == 0
+
+
+class TestMetricsServer:
+    """Tests for the standalone /metrics exporter."""
+
+    @pytest.mark.unit
+    def test_serves_metrics(self):
+        port = start_metrics_server(port=19464, host="127.0.0.1")
+        if port is None:
+            pytest.skip("metrics port unavailable")
+        try:
+            assert start_metrics_server(port=19465, host="127.0.0.1") == port
+            metrics_collector.get_or_create_counter("exporter_test_total").inc()
+
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+                body = response.read().decode("utf-8")
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert "exporter_test_total 1" in body
+
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/other", timeout=5)
+        finally:
+            stop_metrics_server()
@@ -0,0 +1,130 @@
+"""
+Unit Tests for Query Profiler.
+
+Tests for statement fingerprints, per-request N+1 detection and
+Prometheus export through MetricsCollector.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+from sqlalchemy import text
+
+from src.analytics.metrics import MetricsCollector
+from src.database.query_optimizer import QueryProfiler, fingerprint_query
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE mentors (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO mentors (name) VALUES ('a'), ('b'), ('c')"))
+    return engine
+
+
+class TestFingerprint:
+    """Tests for fingerprint_query."""
+
+    @pytest.mark.unit
+    def test_literals_and_parameters_are_stripped(self):
+        assert fingerprint_query("SELECT * FROM users WHERE id = 42 AND name = 'O''Brien'") == \
+            "SELECT * FROM users WHERE id = ? AND name = ?"
+        assert fingerprint_query("SELECT * FROM t WHERE a = :a_1 AND b = %(b)s AND c = $1") == \
+            "SELECT * FROM t WHERE a = ? AND b = ? AND c = ?"
+
+    @pytest.mark.unit
+    def test_lists_collapse(self):
+        short = fingerprint_query("SELECT * FROM t WHERE id IN (1, 2)")
+        long = fingerprint_query("SELECT * FROM t\n WHERE id IN (?, ?, ?, ?)")
+        assert short == long
+        assert fingerprint_query("INSERT INTO t (a, b) VALUES (?, ?), (?, ?)") == \
+            "INSERT INTO t (a, b) VALUES (?+)"
+
+
+class TestQueryProfiler:
+    """Tests for QueryProfiler aggregation."""
+
+    @pytest.mark.unit
+    def test_aggregates_by_fingerprint(self):
+        profiler = QueryProfiler()
+        for i in range(1, 101):
+            profiler.record(f"SELECT * FROM jobs WHERE id = {i}", float(i), rows=1)
+        profiler.record("DELETE FROM jobs", 5.0, rows=100)
+
+        stats = profiler.get_fingerprint_stats(order_by="count")
+
+        assert len(stats) == 2
+        select = stats[0]
+        assert select["fingerprint"] == "SELECT * FROM jobs WHERE id = ?"
+        assert (select["count"], select["rows"], select["total_ms"]) == (100, 100, 5050.0)
+        assert (select["p50_ms"], select["p95_ms"], select["p99_ms"]) == (50.0, 95.0, 99.0)
+        assert profiler.get_summary()["total_queries"] == 101
+
+    @pytest.mark.unit
+    def test_fingerprint_cap(self):
+        profiler = QueryProfiler(max_fingerprints=2)
+        for table in ("a", "b", "c", "d"):
+            profiler.record(f"SELECT * FROM {table}", 1.0)
+
+        names = {s["fingerprint"] for s in profiler.get_fingerprint_stats()}
+        assert names == {"SELECT * FROM a", "SELECT * FROM b", QueryProfiler.OTHER_FINGERPRINT}
+
+    @pytest.mark.unit
+    def test_n_plus_one_detected_per_request(self, engine):
+        profiler = QueryProfiler(n_plus_one_threshold=3)
+        profiler.enable(engine)
+
+        with profiler.request_scope() as scope:
+            with engine.connect() as conn:
+                for mentor_id in (1, 2, 3):
+                    conn.execute(text("SELECT * FROM mentors WHERE id = :id"), {"id": mentor_id})
+            scope.name = "GET /mentors"
+
+        # Same statements spread over separate requests are not flagged
+        for mentor_id in (1, 2, 3):
+            with profiler.request_scope("GET /mentors/{mentor_id}"):
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT * FROM mentors WHERE id = :id"), {"id": mentor_id})
+
+        findings = profiler.get_n_plus_one()
+        assert len(findings) == 1
+        assert findings[0]["endpoint"] == "GET /mentors"
+        assert findings[0]["count"] == 3
+        assert findings[0]["fingerprint"] == "SELECT * FROM mentors WHERE id = ?"
+
+    @pytest.mark.unit
+    def test_disable_stops_recording(self, engine):
+        profiler = QueryProfiler()
+        profiler.enable(engine)
+        profiler.enable(engine)  # idempotent
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        profiler.disable()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 2"))
+
+        assert profiler.get_summary()["total_queries"] == 1
+
+    @pytest.mark.unit
+    def test_prometheus_export(self):
+        profiler = QueryProfiler(n_plus_one_threshold=2)
+        with profiler.request_scope("GET /jobs"):
+            profiler.record('SELECT "title" FROM jobs WHERE id = 1', 2.0, rows=1)
+            profiler.record('SELECT "title" FROM jobs WHERE id = 2', 4.0, rows=1)
+
+        collector = MetricsCollector()
+        collector.register_collector("query_profiler", profiler.collect_metrics)
+        output = collector.to_prometheus()
+
+        assert "# TYPE db_query_fingerprint_duration_ms summary" in output
+        assert 'fingerprint="SELECT \\"title\\" FROM jobs WHERE id = ?"' in output
+        assert 'quantile="0.99"' in output
+        assert "db_query_fingerprint_duration_ms_count{" in output
+        assert 'db_n_plus_one_total{endpoint="GET /jobs"' in output
@@ -0,0 +1,176 @@
+"""
+Unit Tests for Real-time WebSocket Fan-out.
+
+Tests for ConnectionManager queues and the pub/sub backplane.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from starlette.websockets import WebSocketState
+
+from src.realtime.backplane import InMemoryBackplane, InMemoryHub
+from src.realtime.events import Event, EventType
+from src.realtime.websocket import ConnectionManager
+
+
+class FakeWebSocket:
+    """WebSocket double recording sent frames."""
+
+    def __init__(self, delay: float = 0.0, block: bool = False):
+        self.client_state = WebSocketState.CONNECTED
+        self.sent = []
+        self.closed_with = None
+        self.delay = delay
+        self.block = block
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.block:
+            await asyncio.Event().wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000, reason=None):
+        self.closed_with = code
+        self.client_state = WebSocketState.DISCONNECTED
+
+    def events(self, event_type):
+        return [m for m in self.sent if m["type"] == event_type.value]
+
+
+def chat(text="hi"):
+    return Event(type=EventType.CHAT_MESSAGE, data={"content": text})
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0.01)
+
+
+class TestConnectionManager:
+    """Tests for queued fan-out."""
+
+    @pytest.mark.unit
+    def test_room_fanout(self):
+        async def scenario():
+            manager = ConnectionManager()
+            sockets = [FakeWebSocket() for _ in range(3)]
+            for i, ws in enumerate(sockets):
+                connection = await manager.connect(ws, f"u{i}")
+                await manager.join_room(connection, "room")
+
+            sent = await manager.send_to_room("room", chat(), exclude={"u0"})
+            await settle()
+            return sent, sockets
+
+        sent, sockets = asyncio.run(scenario())
+
+        assert sent == 2
+        assert [len(ws.events(EventType.CHAT_MESSAGE)) for ws in sockets] == [0, 1, 1]
+
+    @pytest.mark.unit
+    def test_slow_client_does_not_stall_room(self):
+        async def scenario():
+            manager = ConnectionManager(send_timeout=5.0)
+            slow, fast = FakeWebSocket(delay=1.0), FakeWebSocket()
+            for user_id, ws in (("slow", slow), ("fast", fast)):
+                await manager.join_room(await manager.connect(ws, user_id), "room")
+
+            await manager.send_to_room("room", chat())
+            await settle()
+            return fast
+
+        fast = asyncio.run(asyncio.wait_for(scenario(), timeout=0.5))
+
+        assert len(fast.events(EventType.CHAT_MESSAGE)) == 1
+
+    @pytest.mark.unit
+    def test_full_queue_drops_consumer(self):
+        async def scenario():
+            manager = ConnectionManager(queue_size=3)
+            stuck = FakeWebSocket(block=True)
+            await manager.connect(stuck, "stuck")
+
+            for i in range(10):
+                await manager.send_to_user("stuck", chat(str(i)))
+            await settle()
+            return manager, stuck
+
+        manager, stuck = asyncio.run(scenario())
+
+        assert stuck.closed_with == 1013
+        assert not manager.is_user_online("stuck")
+        assert manager.get_stats()["slow_consumers_dropped"] == 1
+
+    @pytest.mark.unit
+    def test_send_timeout_drops_consumer(self):
+        async def scenario():
+            manager = ConnectionManager(send_timeout=0.05)
+            stuck = FakeWebSocket(block=True)
+            await manager.connect(stuck, "stuck")  # "connected" event blocks
+            await asyncio.sleep(0.2)
+            return manager, stuck
+
+        manager, stuck = asyncio.run(scenario())
+
+        assert stuck.closed_with == 1013
+        assert manager.total_connections == 0
+
+
+class TestBackplane:
+    """Tests for cross-process fan-out through a shared in-memory hub."""
+
+    @pytest.mark.unit
+    def test_fanout_reaches_other_workers(self):
+        async def scenario():
+            hub = InMemoryHub()
+            workers = [ConnectionManager(backplane=InMemoryBackplane(hub)) for _ in range(2)]
+            for worker in workers:
+                await worker.start()
+
+            a, b = FakeWebSocket(), FakeWebSocket()
+            await workers[0].join_room(await workers[0].connect(a, "alice"), "room")
+            await workers[1].join_room(await workers[1].connect(b, "bob"), "room")
+
+            await workers[0].send_to_room("room", chat("room"))
+            await workers[1].send_to_user("alice", chat("direct"))
+            await workers[0].broadcast(chat("all"), exclude={"alice"})
+            await workers[1].broadcast(Event(type=EventType.HEARTBEAT), local_only=True)
+            await settle()
+            return a, b
+
+        a, b = asyncio.run(scenario())
+
+        assert [m["data"]["content"] for m in a.events(EventType.CHAT_MESSAGE)] == ["room", "direct"]
+        assert [m["data"]["content"] for m in b.events(EventType.CHAT_MESSAGE)] == ["room", "all"]
+        assert len(a.events(EventType.HEARTBEAT)) == 0
+        assert len(b.events(EventType.HEARTBEAT)) == 1
+
+    @pytest.mark.unit
+    def test_messages_not_echoed_to_publisher(self):
+        async def scenario():
+            hub = InMemoryHub()
+            worker = ConnectionManager(backplane=InMemoryBackplane(hub))
+            await worker.start()
+            ws = FakeWebSocket()
+            await worker.connect(ws, "alice")
+
+            await worker.send_to_user("alice", chat())
+            await settle()
+            return worker, ws
+
+        worker, ws = asyncio.run(scenario())
+
+        assert len(ws.events(EventType.CHAT_MESSAGE)) == 1
+        assert worker.get_stats()["remote_messages"] == 0
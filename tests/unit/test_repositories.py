@@ -0,0 +1,265 @@
+"""
+Unit Tests for Repository Layer.
+
+Tests for JSONRepository file and indexed modes and SQL document storage,
+including query() push-down.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Optional
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.models.base import Entity
+from src.core.exceptions import AlreadyExistsError, NotFoundError
+from src.repositories.base import JSONRepository
+
+
+class Item(Entity):
+    """Minimal entity for repository tests."""
+
+    owner_id: str
+    status: str = "active"
+    tags: list = []
+    title: str = ""
+    score: Optional[float] = None
+
+
+class ItemRepository(JSONRepository[Item]):
+    """Repository with text search over title and tags."""
+
+    search_fields = ("title", "tags")
+
+
+def make_repo(tmp_path, **options):
+    return ItemRepository(
+        data_dir=str(tmp_path),
+        filename="items.json",
+        entity_class=Item,
+        indexes=("owner_id", "status", "tags", "score"),
+        **options
+    )
+
+
+def make_sql_repo(tmp_path):
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    from src.repositories.sql_repository import SQLDocumentRepository
+
+    class SQLItemRepository(ItemRepository, SQLDocumentRepository):
+        sql_column_types = {"score": sqlalchemy.Float()}
+        sql_list_fields = ("tags",)
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    return SQLItemRepository(
+        data_dir=str(tmp_path),
+        filename="items.json",
+        entity_class=Item,
+        indexes=("owner_id", "status", "tags", "score"),
+        engine=engine
+    )
+
+
+@pytest.fixture(params=["file", "indexed", "sql"])
+def repo(request, tmp_path):
+    """Repository in every storage mode."""
+    if request.param == "sql":
+        return make_sql_repo(tmp_path)
+    return make_repo(tmp_path, indexed=request.param == "indexed")
+
+
+# =============================================================================
+# Shared Behaviour
+# =============================================================================
+
+class TestJSONRepositoryModes:
+    """All storage modes must behave identically."""
+
+    @pytest.mark.unit
+    def test_crud(self, repo):
+        item = repo.create(Item(owner_id="u1"))
+
+        assert repo.exists(item.id)
+        assert repo.get_by_id(item.id).owner_id == "u1"
+
+        item.status = "closed"
+        repo.update(item)
+        assert repo.get_by_id(item.id).status == "closed"
+
+        assert repo.delete(item.id) is True
+        assert repo.get_by_id(item.id) is None
+        assert repo.delete(item.id) is False
+
+    @pytest.mark.unit
+    def test_duplicate_and_missing(self, repo):
+        item = repo.create(Item(owner_id="u1"))
+
+        with pytest.raises(AlreadyExistsError):
+            repo.create(item)
+        with pytest.raises(NotFoundError):
+            repo.update(Item(owner_id="u2"))
+
+    @pytest.mark.unit
+    def test_find_criteria(self, repo):
+        a = repo.create(Item(owner_id="u1", status="active"))
+        b = repo.create(Item(owner_id="u1", status="closed"))
+        c = repo.create(Item(owner_id="u2", status="active"))
+
+        assert [i.id for i in repo.find(owner_id="u1")] == [a.id, b.id]
+        assert [i.id for i in repo.find(owner_id="u1", status="active")] == [a.id]
+        assert [i.id for i in repo.find(owner_id=["u1", "u2"], status="active")] == [a.id, c.id]
+        assert [i.id for i in repo.find(status=lambda s: s != "active")] == [b.id]
+        assert repo.find(owner_id="nobody") == []
+        assert repo.count(status="active") == 2
+        assert repo.count() == 3
+
+    @pytest.mark.unit
+    def test_find_unhashable_values(self, repo):
+        item = repo.create(Item(owner_id="u1", tags=["a", "b"]))
+        repo.create(Item(owner_id="u2", tags=["c"]))
+
+        assert [i.id for i in repo.find(tags=["a", "b"])] == []  # list criteria = membership
+        assert [i.id for i in repo.find(tags=lambda t: "a" in t)] == [item.id]
+
+    @pytest.mark.unit
+    def test_save_creates_then_updates(self, repo):
+        item = Item(owner_id="u1")
+        repo.save(item)
+        item.status = "closed"
+        repo.save(item)
+
+        assert repo.count() == 1
+        assert repo.get_by_id(item.id).status == "closed"
+
+    @pytest.mark.unit
+    def test_query_filters_sorts_and_pages(self, repo):
+        a = repo.create(Item(owner_id="u1", tags=["ke"], title="Cabin crew", score=4.5))
+        b = repo.create(Item(owner_id="u1", tags=["oz", "ke"], title="Ground staff", score=4.9))
+        c = repo.create(Item(owner_id="u2", tags=["ke"], title="Pilot", score=None))
+        d = repo.create(Item(owner_id="u1", status="closed", title="Cabin manager", score=3.0))
+
+        items, total = repo.query(status="active", tags__contains="ke", order_by=[("score", True)])
+        assert total == 3
+        assert [i.id for i in items] == [b.id, a.id, c.id]  # None sorts last
+
+        items, total = repo.query(score__gte=4.0, order_by=[("score", False)], limit=1)
+        assert (total, [i.id for i in items]) == (2, [a.id])
+
+        items, total = repo.query(text="CABIN", offset=1, limit=5)
+        assert (total, [i.id for i in items]) == (2, [d.id])
+
+        items, total = repo.query(text="oz", score__lt=5)
+        assert (total, [i.id for i in items]) == (1, [b.id])
+
+    @pytest.mark.unit
+    def test_query_page(self, repo):
+        for i in range(5):
+            repo.create(Item(owner_id="u1", score=float(i)))
+
+        page = repo.query_page(page=2, page_size=2, order_by=[("score", True)], owner_id="u1")
+
+        assert page["total"] == 5
+        assert page["total_pages"] == 3
+        assert [i.score for i in page["items"]] == [2.0, 1.0]
+
+
+# =============================================================================
+# Indexed Mode
+# =============================================================================
+
+class TestIndexedMode:
+    """Tests specific to the resident indexed mode."""
+
+    @pytest.mark.unit
+    def test_returned_entities_are_copies(self, tmp_path):
+        repo = make_repo(tmp_path, indexed=True)
+        item = repo.create(Item(owner_id="u1"))
+
+        loaded = repo.get_by_id(item.id)
+        loaded.status = "changed"
+
+        assert repo.get_by_id(item.id).status == "active"
+
+    @pytest.mark.unit
+    def test_reloads_on_external_change(self, tmp_path):
+        repo = make_repo(tmp_path, indexed=True)
+        other = make_repo(tmp_path, indexed=True)
+        repo.create(Item(owner_id="u1"))
+        assert other.count() == 1
+
+        # Simulate another process writing the file
+        time.sleep(0.01)
+        created = other.create(Item(owner_id="u2"))
+
+        assert repo.get_by_id(created.id).owner_id == "u2"
+        assert [i.owner_id for i in repo.find(owner_id="u2")] == ["u2"]
+
+    @pytest.mark.unit
+    def test_file_remains_compatible(self, tmp_path):
+        repo = make_repo(tmp_path, indexed=True)
+        item = repo.create(Item(owner_id="u1"))
+
+        with open(tmp_path / "items.json", encoding="utf-8") as f:
+            rows = json.load(f)
+        assert [row["id"] for row in rows] == [item.id]
+
+        assert make_repo(tmp_path).get_by_id(item.id).owner_id == "u1"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    @pytest.mark.unit
+    def test_batched_writes(self, tmp_path):
+        repo = make_repo(tmp_path, indexed=True, write_delay=60)
+        for i in range(5):
+            repo.create(Item(owner_id=f"u{i}"))
+
+        assert make_repo(tmp_path).count() == 0  # not flushed yet
+        assert repo.count() == 5
+
+        repo.flush()
+        assert make_repo(tmp_path).count() == 5
+
+
+# =============================================================================
+# SQL Storage
+# =============================================================================
+
+class TestSQLRepository:
+    """Tests specific to SQL document storage."""
+
+    @pytest.mark.unit
+    def test_bulk_import(self, tmp_path):
+        repo = make_sql_repo(tmp_path)
+        rows = [Item(owner_id=f"u{i % 3}").model_dump(mode="json") for i in range(10)]
+        rows.append({"id": "broken"})  # fails validation
+
+        assert repo.bulk_import(rows, batch_size=4) == 10
+        assert repo.bulk_import(rows) == 0  # already imported
+        assert [i.id for i in repo.get_all()] == [r["id"] for r in rows[:10]]
+        assert repo.count(owner_id="u0") == 4
+
+    @pytest.mark.unit
+    def test_sessions_on_date_uses_indexed_columns(self, tmp_path):
+        pytest.importorskip("sqlalchemy")
+        import sqlalchemy
+        from datetime import date, time as dtime
+        from decimal import Decimal
+        from src.core.models.mentor import MentoringSession, SessionType
+        from src.repositories.sql_repository import SQLSessionRepository
+
+        engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'sessions.db'}")
+        repo = SQLSessionRepository(str(tmp_path), engine=engine)
+        session_type = SessionType.VIDEO_CALL
+        for day in (1, 2, 2):
+            repo.create(MentoringSession(
+                mentor_id="m1", mentee_id="u1", session_type=session_type,
+                scheduled_date=date(2025, 1, day), scheduled_time=dtime(10, 0),
+                price=Decimal("30000")
+            ))
+
+        assert len(repo.get_sessions_on_date("m1", date(2025, 1, 2))) == 2
+        assert repo.get_sessions_on_date("m2", date(2025, 1, 2)) == []
@@ -0,0 +1,386 @@
+# tracing.py
+# 경량 트레이싱 - 모의면접 한 턴(STT → 채점 → 음성 분석 → 꼬리질문 → TTS)의 단계별 지연 추적
+# 외부 트레이싱 서비스 없이 프로세스 내 링버퍼 + JSONL 파일에 기록
+
+import os
+import json
+import time
+import uuid
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+try:
+    from logging_config import get_logger
+    logger = get_logger(__name__)
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 설정
+# ============================================================
+
+# TRACING_ENABLED=false 이면 trace()/span()이 아무것도 기록하지 않음
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").strip().lower() not in ("0", "false", "no", "off")
+
+# 메모리에 보관할 최근 트레이스 수
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "200"))
+
+# 트레이스당 최대 스팬 수 (초과분은 dropped_spans로 집계)
+TRACE_MAX_SPANS = 256
+
+# JSONL 파일 (크기 초과 시 .1로 교체)
+TRACE_DIR = Path(__file__).parent / "logs" / "traces"
+TRACE_LOG_FILE = TRACE_DIR / "traces.jsonl"
+TRACE_LOG_MAX_BYTES = 5 * 1024 * 1024
+
+
+# ============================================================
+# 스팬 / 트레이스
+# ============================================================
+
+@dataclass
+class Span:
+    """트레이스 안의 한 단계"""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start: float = field(default_factory=time.time)
+    duration_ms: float = 0.0
+    status: str = "ok"
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    _t0: float = field(default_factory=time.perf_counter, repr=False)
+
+    def set(self, **attributes) -> "Span":
+        """속성 추가 (payload 크기, 제공자 등)"""
+        self.attributes.update(attributes)
+        return self
+
+    def set_cache(self, hit: bool) -> "Span":
+        """캐시 히트/미스 기록"""
+        self.attributes["cache"] = "hit" if hit else "miss"
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": round(self.start, 6),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """트레이스 밖이거나 비활성화 상태에서 쓰는 빈 스팬"""
+
+    __slots__ = ()
+
+    name = ""
+    trace_id = None
+    span_id = None
+
+    def set(self, **attributes) -> "_NoopSpan":
+        return self
+
+    def set_cache(self, hit: bool) -> "_NoopSpan":
+        return self
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+@dataclass
+class Trace:
+    """루트 스팬과 그 하위 스팬 묶음 (모의면접 한 턴)"""
+    trace_id: str
+    spans: List[Span] = field(default_factory=list)
+    dropped_spans: int = 0
+
+    @property
+    def root(self) -> Span:
+        return self.spans[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        root = self.root
+        return {
+            "trace_id": self.trace_id,
+            "name": root.name,
+            "start": round(root.start, 6),
+            "duration_ms": round(root.duration_ms, 3),
+            "status": "error" if any(s.status == "error" for s in self.spans) else "ok",
+            "attributes": root.attributes,
+            "dropped_spans": self.dropped_spans,
+            "spans": [s.to_dict() for s in self.spans],
+        }
+
+
+_current_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("trace", default=None)
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("span", default=None)
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+# ============================================================
+# 트레이서
+# ============================================================
+
+class Tracer:
+    """
+    중첩 스팬 기록기
+
+    사용법:
+        with tracer.trace("mock_interview.turn", question_idx=3) as turn:
+            with tracer.span("stt") as s:
+                s.set(audio_bytes=len(audio))
+                ...
+
+    trace() 밖에서 열린 span()은 기록하지 않으므로(NOOP_SPAN) 라이브러리
+    함수에 붙여도 단독 호출 시 비용이 거의 없습니다.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = TRACE_BUFFER_SIZE,
+        log_file: Optional[Path] = TRACE_LOG_FILE,
+        max_log_bytes: int = TRACE_LOG_MAX_BYTES,
+        enabled: bool = TRACING_ENABLED
+    ):
+        self.enabled = enabled
+        self.log_file = log_file
+        self.max_log_bytes = max_log_bytes
+        self._traces: Deque[Trace] = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # 기록
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def trace(self, name: str, **attributes) -> Iterator[Span]:
+        """새 트레이스(루트 스팬) 시작. 이미 트레이스 안이면 하위 스팬이 됩니다."""
+        if not self.enabled:
+            yield NOOP_SPAN
+            return
+        if _current_trace.get() is not None:
+            with self.span(name, **attributes) as child:
+                yield child
+            return
+
+        trace_id = _new_id()
+        root = Span(name=name, trace_id=trace_id, span_id=_new_id(), attributes=attributes)
+        trace = Trace(trace_id=trace_id, spans=[root])
+        trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(root)
+        try:
+            yield root
+        except Exception as e:
+            root.status, root.error = "error", f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            root.duration_ms = (time.perf_counter() - root._t0) * 1000
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+            self._finish(trace)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """현재 트레이스의 하위 스팬 (트레이스 밖이면 NOOP_SPAN)"""
+        trace = _current_trace.get()
+        if trace is None or not self.enabled:
+            yield NOOP_SPAN
+            return
+        if len(trace.spans) >= TRACE_MAX_SPANS:
+            trace.dropped_spans += 1
+            yield NOOP_SPAN
+            return
+
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=trace.trace_id,
+            span_id=_new_id(),
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes
+        )
+        trace.spans.append(span)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.status, span.error = "error", f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - span._t0) * 1000
+            _current_span.reset(token)
+
+    def traced(self, name: Optional[str] = None) -> Callable:
+        """함수 전체를 스팬으로 기록하는 데코레이터"""
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if _current_trace.get() is None:
+                    return func(*args, **kwargs)
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def current_span(self):
+        """현재 스팬 (없으면 NOOP_SPAN)"""
+        return _current_span.get() or NOOP_SPAN
+
+    def _finish(self, trace: Trace) -> None:
+        """링버퍼/JSONL/메트릭 반영"""
+        with self._lock:
+            self._traces.append(trace)
+
+        data = trace.to_dict()
+        self._write(data)
+
+        try:
+            from src.analytics.metrics import metrics_collector
+            histogram = metrics_collector.get_or_create_histogram(
+                "trace_span_duration_seconds", "Duration of traced stages", ["span"]
+            )
+            for span in trace.spans:
+                histogram.observe(span.duration_ms / 1000, span=span.name)
+        except Exception as e:
+            logger.debug(f"트레이스 메트릭 기록 실패: {e}")
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        if self.log_file is None:
+            return
+        line = json.dumps(data, ensure_ascii=False, default=str) + "\n"
+        try:
+            with self._lock:
+                self.log_file.parent.mkdir(parents=True, exist_ok=True)
+                if self.log_file.exists() and self.log_file.stat().st_size > self.max_log_bytes:
+                    self.log_file.replace(self.log_file.with_name(self.log_file.name + ".1"))
+                with open(self.log_file, "a", encoding="utf-8") as f:
+                    f.write(line)
+        except OSError as e:
+            logger.debug(f"트레이스 파일 기록 실패: {e}")
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+
+    def get_recent_traces(self, limit: int = 50, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """최근 트레이스 (최신순)"""
+        with self._lock:
+            traces = list(self._traces)
+        result = [t.to_dict() for t in reversed(traces) if name is None or t.root.name == name]
+        return result[:limit]
+
+    def get_trace(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        """trace_id로 조회 (메모리 → 파일 순)"""
+        with self._lock:
+            for trace in self._traces:
+                if trace.trace_id == trace_id:
+                    return trace.to_dict()
+        for data in self.load_traces(limit=TRACE_BUFFER_SIZE * 5):
+            if data.get("trace_id") == trace_id:
+                return data
+        return None
+
+    def load_traces(self, limit: int = 200) -> List[Dict[str, Any]]:
+        """JSONL 파일에서 최근 트레이스 로드 (재시작 후 조회용, 최신순)"""
+        if self.log_file is None or not self.log_file.exists():
+            return []
+        try:
+            with open(self.log_file, "r", encoding="utf-8") as f:
+                lines = deque(f, maxlen=limit)
+        except OSError:
+            return []
+
+        result = []
+        for line in reversed(lines):
+            try:
+                result.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return result
+
+    def get_stage_stats(self, traces: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        스팬 이름별 지연 통계
+
+        Returns:
+            {span_name: {count, avg_ms, p50_ms, p95_ms, max_ms, share, errors, cache_hits, cache_misses}}
+            share: 루트 스팬 총합 대비 해당 단계 시간 비율
+        """
+        if traces is None:
+            traces = self.get_recent_traces(limit=TRACE_BUFFER_SIZE)
+
+        durations: Dict[str, List[float]] = {}
+        counters: Dict[str, Dict[str, int]] = {}
+        root_total = 0.0
+        for data in traces:
+            root_total += data.get("duration_ms", 0.0)
+            for span in data.get("spans", []):
+                name = span["name"]
+                durations.setdefault(name, []).append(span["duration_ms"])
+                c = counters.setdefault(name, {"errors": 0, "cache_hits": 0, "cache_misses": 0})
+                if span.get("status") == "error":
+                    c["errors"] += 1
+                cache = span.get("attributes", {}).get("cache")
+                if cache == "hit":
+                    c["cache_hits"] += 1
+                elif cache == "miss":
+                    c["cache_misses"] += 1
+
+        stats = {}
+        for name, values in durations.items():
+            values.sort()
+            total = sum(values)
+            stats[name] = {
+                "count": len(values),
+                "avg_ms": round(total / len(values), 2),
+                "p50_ms": round(_percentile(values, 0.5), 2),
+                "p95_ms": round(_percentile(values, 0.95), 2),
+                "max_ms": round(values[-1], 2),
+                "share": round(total / root_total, 4) if root_total else 0.0,
+                **counters[name],
+            }
+        return dict(sorted(stats.items(), key=lambda item: item[1]["avg_ms"] * item[1]["count"], reverse=True))
+
+    def clear(self) -> None:
+        """메모리 버퍼 초기화 (파일은 유지)"""
+        with self._lock:
+            self._traces.clear()
+
+
+# ============================================================
+# 전역 인스턴스 / 간편 함수
+# ============================================================
+
+tracer = Tracer()
+
+trace = tracer.trace
+span = tracer.span
+traced = tracer.traced
+current_span = tracer.current_span
+get_recent_traces = tracer.get_recent_traces
+get_stage_stats = tracer.get_stage_stats
@@ -0,0 +1,380 @@
+# tts_cache.py
+# TTS 오디오 캐시 - (제공자, 음성, 속도, 감정, 텍스트) 내용 주소 디스크 캐시 + 고정 스크립트 사전 생성
+
+import os
+import json
+import sqlite3
+import hashlib
+import inspect
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+try:
+    from logging_config import get_logger
+    logger = get_logger(__name__)
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+from disk_cache import CACHE_DIR, DiskCache
+from tracing import span as trace_span
+
+
+# ============================================================
+# 설정
+# ============================================================
+
+TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").strip().lower() in ("1", "true", "yes", "on")
+TTS_CACHE_DB = CACHE_DIR / "tts_audio.sqlite3"
+# 최대 저장 용량 - 넘으면 가장 오래 재생되지 않은 오디오부터 제거
+TTS_CACHE_MAX_MB = float(os.getenv("TTS_CACHE_MAX_MB", "500"))
+# 키 형식이나 오디오 포맷이 바뀌면 올려서 이전 항목을 무효화
+TTS_CACHE_VERSION = 1
+# 사전 생성 동시 요청 수 (TTS API 분당 한도 고려)
+TTS_PREWARM_WORKERS = int(os.getenv("TTS_PREWARM_WORKERS", "4"))
+
+
+def tts_cache_key(
+    provider: str,
+    voice: Any,
+    speed: Any,
+    emotion: Any,
+    text: str,
+    **options
+) -> str:
+    """
+    TTS 캐시 키 생성
+
+    합성 결과를 바꾸는 값(제공자/음성/속도/감정/텍스트/기타 옵션)을 모두 해시하므로
+    같은 키는 같은 오디오를 뜻합니다. 제공자 접두어로 제공자별 삭제를 지원합니다.
+    """
+    payload = {
+        "v": TTS_CACHE_VERSION,
+        "provider": provider,
+        "voice": voice,
+        "speed": speed,
+        "emotion": emotion,
+        "text": text,
+        "options": options,
+    }
+    digest = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    return f"{provider}:{digest}"
+
+
+# ============================================================
+# 캐시
+# ============================================================
+
+class TTSCache:
+    """
+    TTS 오디오 디스크 캐시 (SQLite, 프로세스 간 공유)
+
+    - 오디오는 만료 없이 보관하고 용량(max_mb)을 넘으면 LRU로 제거
+    - 캐시 파일을 열 수 없으면 캐시 없이 동작
+    """
+
+    def __init__(self, path=TTS_CACHE_DB, max_mb: float = TTS_CACHE_MAX_MB, enabled: bool = None):
+        self.path = path
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.enabled = TTS_CACHE_ENABLED if enabled is None else enabled
+        self._disk: Optional[DiskCache] = None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    def _get_disk(self) -> Optional[DiskCache]:
+        """디스크 캐시 (첫 사용 시 생성)"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            if self._disk is None:
+                try:
+                    self._disk = DiskCache(self.path, namespace="tts_audio", max_bytes=self.max_bytes)
+                except (sqlite3.Error, OSError) as e:
+                    logger.error(f"TTS 캐시 초기화 실패, 캐시 없이 동작: {e}")
+                    self.enabled = False
+            return self._disk
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시된 오디오 조회"""
+        disk = self._get_disk()
+        if disk is None:
+            return None
+        try:
+            audio = disk.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"TTS 캐시 조회 실패: {e}")
+            audio = None
+        with self._lock:
+            self._stats["hits" if audio is not None else "misses"] += 1
+        return audio
+
+    def set(self, key: str, audio: bytes) -> bool:
+        """오디오 저장"""
+        disk = self._get_disk()
+        if disk is None or not audio:
+            return False
+        try:
+            stored = disk.set(key, audio)
+        except sqlite3.Error as e:
+            logger.warning(f"TTS 캐시 저장 실패: {e}")
+            return False
+        if stored:
+            with self._lock:
+                self._stats["stores"] += 1
+        return stored
+
+    def clear(self, provider: str = None) -> int:
+        """캐시 삭제 (provider 지정 시 해당 제공자만)"""
+        disk = self._get_disk()
+        if disk is None:
+            return 0
+        if provider:
+            return disk.delete_prefix(f"{provider}:")
+        return disk.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        disk = self._get_disk()
+        with self._lock:
+            stats = {"enabled": self.enabled, **self._stats}
+        if disk is not None:
+            stats["disk"] = disk.stats()
+        return stats
+
+
+# 전역 캐시 인스턴스 (TTS_CACHE_ENABLED=false 이면 캐시 없이 동작)
+tts_cache = TTSCache()
+
+
+# ============================================================
+# 데코레이터
+# ============================================================
+
+def cached_tts(provider: str, voice: str, speed: str = None, emotion: str = None):
+    """
+    TTS 함수 캐싱 데코레이터
+
+    voice/speed/emotion은 감싼 함수의 인자 이름이며, 나머지 인자(text 제외)는
+    기타 옵션으로 키에 들어갑니다. 실패(None/빈 오디오)는 저장하지 않습니다.
+    감싼 함수에는 같은 인자로 캐시 키를 계산하는 cache_key()가 붙습니다.
+
+    Usage:
+        @cached_tts("clova", voice="speaker", speed="speed", emotion="emotion")
+        def generate_clova_tts(text, speaker="nara", speed=0, emotion=0, volume=0, pitch=0):
+            ...
+    """
+    def decorator(func: Callable):
+        signature = inspect.signature(func)
+
+        def cache_key(*args, **kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            text = params.pop("text")
+            return tts_cache_key(
+                provider,
+                params.pop(voice),
+                params.pop(speed) if speed else None,
+                params.pop(emotion) if emotion else None,
+                text,
+                **params
+            )
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            text = signature.bind(*args, **kwargs).arguments.get("text")
+            if not tts_cache.enabled or not text or not text.strip():
+                return func(*args, **kwargs)
+
+            key = cache_key(*args, **kwargs)
+            with trace_span("tts_cache", provider=provider) as span:
+                audio = tts_cache.get(key)
+                span.set_cache(audio is not None)
+                if audio is not None:
+                    return audio
+
+            audio = func(*args, **kwargs)
+            if audio:
+                tts_cache.set(key, audio)
+            return audio
+
+        wrapper.cache_key = cache_key
+        return wrapper
+    return decorator
+
+
+# ============================================================
+# 고정 스크립트 사전 생성
+# ============================================================
+
+# 면접 질문/모범 답변 음성 설정 - 페이지 호출(2_영어면접, 4_모의면접)과 같아야 캐시 적중
+INTERVIEW_TTS_VOICE = "alloy"
+INTERVIEW_TTS_SPEED = 0.85
+
+PREWARM_SOURCES = ("interview", "english", "announcement")
+
+
+class PrewarmJob(NamedTuple):
+    """사전 생성할 오디오 한 건 (generate_openai_tts 인자)"""
+    source: str
+    text: str
+    voice: str
+    speed: float = 1.0
+    model: str = "tts-1-hd"
+
+
+def _interview_jobs() -> List[PrewarmJob]:
+    """항공사별/공통 면접 질문"""
+    from airline_questions import AIRLINE_SPECIFIC_QUESTIONS, COMMON_QUESTIONS
+
+    questions = []
+    for airline_qs in AIRLINE_SPECIFIC_QUESTIONS.values():
+        for category in ["common", "values", "situational", "personality"]:
+            questions.extend(airline_qs.get(category, []))
+    for category_qs in COMMON_QUESTIONS.values():
+        questions.extend(category_qs)
+    return [PrewarmJob("interview", q, INTERVIEW_TTS_VOICE, INTERVIEW_TTS_SPEED) for q in questions]
+
+
+def _english_jobs() -> List[PrewarmJob]:
+    """영어면접 질문과 모범 답변"""
+    from english_interview_data import ENGLISH_QUESTIONS, ADVANCED_QUESTIONS
+
+    texts = []
+    for cat_data in ENGLISH_QUESTIONS.values():
+        for q in cat_data["questions"]:
+            texts.append(q["question"])
+            texts.append(q.get("sample_answer", ""))
+    texts.extend(q["question"] for q in ADVANCED_QUESTIONS)
+    return [PrewarmJob("english", t, INTERVIEW_TTS_VOICE, INTERVIEW_TTS_SPEED) for t in texts]
+
+
+def _announcement_jobs() -> List[PrewarmJob]:
+    """기내방송 스크립트 (한국어/영어 x 모범 음성 목소리)"""
+    from announcement_scripts import ANNOUNCEMENTS, ANNOUNCEMENT_TTS_VOICES, ANNOUNCEMENT_TTS_MODEL
+
+    return [
+        PrewarmJob("announcement", ann[lang], voice, model=ANNOUNCEMENT_TTS_MODEL)
+        for ann in ANNOUNCEMENTS.values()
+        for lang in ("korean", "english")
+        for voice in ANNOUNCEMENT_TTS_VOICES.values()
+    ]
+
+
+_JOB_BUILDERS = {
+    "interview": _interview_jobs,
+    "english": _english_jobs,
+    "announcement": _announcement_jobs,
+}
+
+
+def collect_prewarm_jobs(sources: Iterable[str] = PREWARM_SOURCES) -> List[PrewarmJob]:
+    """사전 생성 대상 수집 (빈 텍스트/중복 제외)"""
+    jobs, seen = [], set()
+    for source in sources:
+        for job in _JOB_BUILDERS[source]():
+            identity = job[1:]
+            if job.text and job.text.strip() and identity not in seen:
+                seen.add(identity)
+                jobs.append(job)
+    return jobs
+
+
+def prewarm_tts_cache(
+    sources: Iterable[str] = PREWARM_SOURCES,
+    workers: int = TTS_PREWARM_WORKERS,
+    dry_run: bool = False,
+    synthesize: Callable[..., Optional[bytes]] = None
+) -> Dict[str, Any]:
+    """
+    고정 스크립트 오디오를 미리 생성해 캐시에 저장
+
+    Args:
+        sources: 대상 (interview, english, announcement)
+        workers: 동시 요청 수
+        dry_run: True면 생성하지 않고 캐시 여부만 집계
+        synthesize: 합성 함수 (기본 voice_utils.generate_openai_tts, cache_key 속성 필요)
+
+    Returns:
+        {"total", "cached", "rendered", "failed", "by_source"}
+    """
+    if synthesize is None:
+        from voice_utils import generate_openai_tts
+        synthesize = generate_openai_tts
+
+    if tts_cache._get_disk() is None:
+        raise RuntimeError("TTS 캐시가 비활성화되어 있어 사전 생성할 수 없습니다 (TTS_CACHE_ENABLED)")
+
+    jobs = collect_prewarm_jobs(sources)
+    pending = [
+        job for job in jobs
+        if tts_cache.get(synthesize.cache_key(job.text, voice=job.voice, speed=job.speed, model=job.model)) is None
+    ]
+    result = {
+        "total": len(jobs),
+        "cached": len(jobs) - len(pending),
+        "rendered": 0,
+        "failed": 0,
+        "by_source": {},
+    }
+    for job in pending:
+        result["by_source"][job.source] = result["by_source"].get(job.source, 0) + 1
+
+    if dry_run or not pending:
+        return result
+
+    def render(job: PrewarmJob) -> bool:
+        try:
+            return bool(synthesize(job.text, voice=job.voice, speed=job.speed, model=job.model))
+        except Exception as e:
+            logger.warning(f"TTS 사전 생성 실패 ({job.source}): {e}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for ok in executor.map(render, pending):
+            result["rendered" if ok else "failed"] += 1
+
+    logger.info(
+        f"TTS 사전 생성 완료 (total: {result['total']}, cached: {result['cached']}, "
+        f"rendered: {result['rendered']}, failed: {result['failed']})"
+    )
+    return result
+
+
+def get_tts_cache_stats() -> Dict[str, Any]:
+    """전역 TTS 캐시 통계"""
+    return tts_cache.get_stats()
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TTS 오디오 캐시 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prewarm_parser = subparsers.add_parser("prewarm", help="고정 스크립트 오디오 사전 생성")
+    prewarm_parser.add_argument("--only", nargs="+", choices=PREWARM_SOURCES, default=list(PREWARM_SOURCES))
+    prewarm_parser.add_argument("--workers", type=int, default=TTS_PREWARM_WORKERS)
+    prewarm_parser.add_argument("--dry-run", action="store_true", help="생성하지 않고 미생성 건수만 출력")
+
+    subparsers.add_parser("stats", help="캐시 통계 출력")
+
+    clear_parser = subparsers.add_parser("clear", help="캐시 삭제")
+    clear_parser.add_argument("--provider", help="해당 제공자(openai, clova, google, edge)만 삭제")
+
+    args = parser.parse_args()
+
+    if args.command == "prewarm":
+        summary = prewarm_tts_cache(args.only, workers=args.workers, dry_run=args.dry_run)
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    elif args.command == "stats":
+        print(json.dumps(get_tts_cache_stats(), ensure_ascii=False, indent=2, default=str))
+    else:
+        print(f"삭제된 항목: {tts_cache.clear(args.provider)}")
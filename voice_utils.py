@@ -7,11 +7,23 @@ from logging_config import get_logger
 import os
 import re
 import json
+import hashlib
+import time
 import tempfile
+import threading
+import contextvars
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, Tuple
 from io import BytesIO
 
+import http_client
+from analysis_pool import run_analysis
+from tracing import traced, current_span, span as trace_span
+from tts_cache import cached_tts
+
 logger = get_logger(__name__)
 
 # OpenAI API 설정
@@ -134,6 +146,7 @@ def get_clova_speaker_for_persona(persona: str, escalation_level: int = 0) -> Tu
     return (speaker, speed, emotion_code)
 
 
+@cached_tts("clova", voice="speaker", speed="speed", emotion="emotion")
 def generate_clova_tts(
     text: str,
     speaker: str = "nara",
@@ -189,8 +202,10 @@ def generate_clova_tts(
         data["emotion-strength"] = "2"  # 감정 강도 (1: 약함, 2: 보통, 3: 강함)
 
     try:
-        r = requests.post(
+        r = http_client.post(
+            "clova_tts",
             CLOVA_VOICE_URL,
+            endpoint="tts",
             headers=headers,
             data=data,
             timeout=30
@@ -311,6 +326,144 @@ def get_openai_api_key() -> str:
     )
 
 
+# =====================
+# STT 백엔드
+# =====================
+
+# STT 백엔드: "whisper" (OpenAI API) / "stub" (네트워크 없이 쓰는 가짜 인식기, 테스트/로컬 개발용)
+STT_BACKEND = os.getenv("STT_BACKEND", "whisper")
+
+
+class WhisperSTTBackend:
+    """OpenAI Whisper API (verbose_json + 단어 타임스탬프)"""
+
+    name = "whisper"
+
+    def __init__(self, timeout: float = 90):
+        self.timeout = timeout
+
+    def transcribe(
+        self,
+        audio_bytes: bytes,
+        language: str = "ko",
+        filename: str = "audio.webm"
+    ) -> Optional[Dict[str, Any]]:
+        api_key = get_openai_api_key()
+        if not api_key:
+            print("[Whisper] API 키 없음")
+            return None
+
+        mime_type = "audio/wav" if filename.endswith(".wav") else "audio/webm"
+        try:
+            r = http_client.post(
+                "openai",
+                f"{OPENAI_API_URL}/audio/transcriptions",
+                endpoint="audio/transcriptions",
+                headers={"Authorization": f"Bearer {api_key}"},
+                files={"file": (filename, audio_bytes, mime_type)},
+                data={
+                    "model": "whisper-1",
+                    "language": language,
+                    "response_format": "verbose_json",
+                    "timestamp_granularities": ["word"],
+                },
+                timeout=self.timeout
+            )
+            r.raise_for_status()
+            result = r.json()
+        except requests.exceptions.Timeout:
+            print(f"[Whisper] API 타임아웃 ({self.timeout:.0f}초 초과)")
+            return None
+        except requests.exceptions.HTTPError as e:
+            print(f"[Whisper] HTTP 오류: {e.response.status_code if e.response else 'unknown'}")
+            return None
+        except Exception as e:
+            print(f"[Whisper] API 오류: {e}")
+            return None
+
+        return {
+            "text": result.get("text", "").strip(),
+            "duration": result.get("duration", 0),
+            "words": result.get("words", []),
+            "language": result.get("language", language),
+        }
+
+
+class StubSTTBackend:
+    """
+    네트워크 없이 동작하는 가짜 STT
+
+    오디오 길이만 보고 초당 words_per_second개의 단어("word")를 균등한 타임스탬프로
+    돌려줍니다. latency로 API 지연을 흉내 낼 수 있고, 호출 기록은 calls에 남습니다.
+    """
+
+    name = "stub"
+
+    def __init__(self, words_per_second: float = 2.0, latency: float = 0.0):
+        self.words_per_second = words_per_second
+        self.latency = latency
+        self.calls: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _duration(audio_bytes: bytes) -> float:
+        import wave
+        try:
+            with wave.open(BytesIO(audio_bytes)) as w:
+                return w.getnframes() / float(w.getframerate())
+        except Exception:
+            pass
+        try:
+            y, sr = decode_audio(audio_bytes)
+            return len(y) / sr
+        except Exception:
+            return 0.0
+
+    def transcribe(
+        self,
+        audio_bytes: bytes,
+        language: str = "ko",
+        filename: str = "audio.webm"
+    ) -> Optional[Dict[str, Any]]:
+        if self.latency:
+            time.sleep(self.latency)
+        duration = round(self._duration(audio_bytes), 3)
+        with self._lock:
+            self.calls.append({"bytes": len(audio_bytes), "language": language, "duration": duration})
+
+        step = 1.0 / self.words_per_second
+        words = [
+            {"word": "word", "start": round(i * step, 3), "end": round(i * step + step * 0.8, 3)}
+            for i in range(int(duration * self.words_per_second))
+        ]
+        if not words:
+            return {"text": "", "duration": duration, "words": [], "language": language}
+        return {
+            "text": " ".join(w["word"] for w in words),
+            "duration": duration,
+            "words": words,
+            "language": language,
+        }
+
+
+_stt_backend = None
+
+
+def get_stt_backend():
+    """STT_BACKEND 설정에 따른 STT 백엔드 (프로세스당 1개)"""
+    global _stt_backend
+    if _stt_backend is None:
+        _stt_backend = StubSTTBackend() if STT_BACKEND == "stub" else WhisperSTTBackend()
+    return _stt_backend
+
+
+def set_stt_backend(backend) -> None:
+    """STT 백엔드 교체 (None이면 STT_BACKEND 설정으로 복귀)"""
+    global _stt_backend
+    _stt_backend = backend
+
+
+@traced("stt")
 def transcribe_audio(audio_bytes: bytes, language: str = "ko") -> Optional[Dict[str, Any]]:
     """
     OpenAI Whisper API로 음성을 텍스트로 변환
@@ -326,78 +479,261 @@ def transcribe_audio(audio_bytes: bytes, language: str = "ko") -> Optional[Dict[
             "words": [{"word": "안녕", "start": 0.0, "end": 0.5}, ...]
         }
     """
-    api_key = get_openai_api_key()
-    if not api_key:
-        print("[Whisper] API 키 없음")
-        return None
+    current_span().set(audio_bytes=len(audio_bytes) if audio_bytes else 0, language=language)
 
     # 최소 오디오 크기 체크 (1KB 미만은 유효하지 않음)
     if not audio_bytes or len(audio_bytes) < 1000:
         print(f"[Whisper] 오디오 데이터 부족: {len(audio_bytes) if audio_bytes else 0} bytes")
         return None
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
+    result = get_stt_backend().transcribe(audio_bytes, language)
+    if result is None:
+        return None
+
+    # 인식된 텍스트가 너무 짧으면 실패로 간주하지 않음 (빈 문자열만 제외)
+    if not result["text"]:
+        print("[Whisper] 인식된 텍스트 없음 (무음 또는 너무 짧은 녹음)")
+        return None
+
+    current_span().set(text_chars=len(result["text"]), audio_seconds=result["duration"])
+    return result
+
+
+# =====================
+# 청크 단위 STT (긴 녹음: 무음 구간 분할 + 병렬 인식 + 부분 결과)
+# =====================
+
+# 이보다 짧은 녹음은 한 번에 인식 (초)
+STT_CHUNK_MIN_SECONDS = float(os.getenv("STT_CHUNK_MIN_SECONDS", "30"))
+# 청크 목표/최대 길이 (초) - 목표 길이를 넘긴 뒤 첫 무음 구간에서 자름
+STT_CHUNK_TARGET_SECONDS = float(os.getenv("STT_CHUNK_TARGET_SECONDS", "15"))
+STT_CHUNK_MAX_SECONDS = float(os.getenv("STT_CHUNK_MAX_SECONDS", "30"))
+# 동시 인식 요청 수
+STT_CHUNK_WORKERS = int(os.getenv("STT_CHUNK_WORKERS", "4"))
+# 실패한 청크 재시도 횟수 (그래도 실패하면 전체 녹음을 한 번에 인식)
+STT_CHUNK_RETRIES = 1
+# 무음 판정 기준 (최대 음량 대비 dB)
+STT_SILENCE_TOP_DB = 35
+# 청크 업로드 샘플레이트 (Whisper 내부 처리 기준)
+STT_CHUNK_SAMPLE_RATE = 16000
+
+
+def _plan_stt_chunks(
+    intervals: List[Tuple[int, int]],
+    total: int,
+    target: int,
+    max_len: int
+) -> List[Tuple[int, int]]:
+    """
+    음성 구간 목록으로 청크 경계 결정 (샘플 단위)
+
+    무음 구간의 가운데에서만 자르고, 무음 없이 max_len을 넘는 구간은 균등 분할합니다.
+    target의 1/3보다 짧은 꼬리는 앞 청크에 붙입니다 (짧은 조각은 인식 품질이 낮음).
+    청크는 끊김 없이 전체 [0, total)을 덮습니다.
+    """
+    # 자를 수 있는 위치 = 인접한 음성 구간 사이 무음의 가운데
+    candidates = [
+        (prev_end + next_start) // 2
+        for (_, prev_end), (next_start, _) in zip(intervals, intervals[1:])
+        if next_start > prev_end
+    ]
+
+    bounds = [0]
+    last_candidate = None
+    for cut in candidates:
+        if cut - bounds[-1] > max_len and last_candidate is not None and last_candidate > bounds[-1]:
+            bounds.append(last_candidate)
+        if cut - bounds[-1] >= target and total - cut >= target // 3:
+            bounds.append(cut)
+        last_candidate = cut
+    if total - bounds[-1] > max_len and last_candidate is not None and last_candidate > bounds[-1]:
+        bounds.append(last_candidate)
+    bounds.append(total)
+
+    chunks = []
+    for start, end in zip(bounds, bounds[1:]):
+        pieces = max(1, -(-(end - start) // max_len))
+        step = (end - start) / pieces
+        chunks.extend(
+            (start + round(i * step), start + round((i + 1) * step)) for i in range(pieces)
+        )
+    return chunks
+
+
+def _prepare_stt_chunks(audio_bytes: bytes) -> Tuple[float, List[Tuple[float, bytes]]]:
+    """
+    녹음을 디코딩해 무음 구간 기준으로 나누고 16kHz WAV 청크로 인코딩
+
+    분석 프로세스 풀에서 실행됩니다.
+
+    Returns:
+        (전체 길이(초), [(청크 시작(초), WAV 바이트), ...])
+    """
+    import librosa
+    import soundfile as sf
+
+    y, sr = decode_audio(audio_bytes)
+    if sr != STT_CHUNK_SAMPLE_RATE:
+        y = librosa.resample(y, orig_sr=sr, target_sr=STT_CHUNK_SAMPLE_RATE)
+        sr = STT_CHUNK_SAMPLE_RATE
+    duration = len(y) / sr
+    if duration < STT_CHUNK_MIN_SECONDS:
+        return duration, []
+
+    intervals = [tuple(map(int, iv)) for iv in librosa.effects.split(y, top_db=STT_SILENCE_TOP_DB)]
+    bounds = _plan_stt_chunks(
+        intervals, len(y), int(STT_CHUNK_TARGET_SECONDS * sr), int(STT_CHUNK_MAX_SECONDS * sr)
+    )
+
+    chunks = []
+    for start, end in bounds:
+        buf = BytesIO()
+        sf.write(buf, y[start:end], sr, format="WAV", subtype="PCM_16")
+        chunks.append((start / sr, buf.getvalue()))
+    return duration, chunks
+
+
+def _stitch_transcripts(
+    parts: List[Tuple[float, Optional[Dict[str, Any]]]],
+    duration: float,
+    language: str
+) -> Dict[str, Any]:
+    """청크별 인식 결과를 시작 시각만큼 밀어 하나의 transcribe_audio 형식으로 합침"""
+    texts = []
+    words = []
+    for offset, part in parts:
+        if not part:
+            continue
+        if part.get("text"):
+            texts.append(part["text"].strip())
+        for word in part.get("words", []):
+            words.append({
+                **word,
+                "start": round(offset + word.get("start", 0), 3),
+                "end": round(offset + word.get("end", 0), 3),
+            })
+    return {
+        "text": " ".join(t for t in texts if t),
+        "duration": round(duration, 3),
+        "words": words,
+        "language": language,
     }
 
-    # 임시 파일로 저장
-    with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as f:
-        f.write(audio_bytes)
-        temp_path = f.name
 
-    try:
-        with open(temp_path, "rb") as audio_file:
-            files = {
-                "file": ("audio.webm", audio_file, "audio/webm"),
-            }
-            data = {
-                "model": "whisper-1",
-                "language": language,
-                "response_format": "verbose_json",
-                "timestamp_granularities": ["word"],
-            }
+def _transcribe_stt_chunk(backend: Any, wav: bytes, language: str, index: int, total: int) -> Optional[Dict[str, Any]]:
+    """청크 하나 인식 (None/예외면 STT_CHUNK_RETRIES번까지 재시도, 끝내 실패하면 None)"""
+    for attempt in range(STT_CHUNK_RETRIES + 1):
+        try:
+            result = backend.transcribe(wav, language, f"chunk{index}.wav")
+        except Exception as e:
+            logger.warning(f"청크 {index + 1}/{total} 인식 오류: {e}")
+            result = None
+        if result is not None:
+            return result
+        logger.warning(f"청크 {index + 1}/{total} 인식 실패 (시도 {attempt + 1}/{STT_CHUNK_RETRIES + 1})")
+    return None
 
-            r = requests.post(
-                f"{OPENAI_API_URL}/audio/transcriptions",
-                headers=headers,
-                files=files,
-                data=data,
-                timeout=90  # 타임아웃 90초로 증가
-            )
-            r.raise_for_status()
-            result = r.json()
 
-            text = result.get("text", "").strip()
-            duration = result.get("duration", 0)
+@traced("stt")
+def transcribe_audio_chunked(
+    audio_bytes: bytes,
+    language: str = "ko",
+    on_partial: Optional[Any] = None,
+    backend: Optional[Any] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    긴 녹음용 청크 단위 STT
+
+    무음 구간에서 녹음을 나눠 청크를 동시에 인식하고, 단어 타임스탬프를 원래 위치로
+    되돌려 transcribe_audio와 같은 {"text", "duration", "words"} 형식으로 합칩니다.
+    STT_CHUNK_MIN_SECONDS보다 짧거나 디코딩할 수 없는 녹음은 한 번에 인식합니다.
+    재시도 후에도 실패한 청크가 있으면 일부만 합친 결과 대신 전체 녹음을 한 번에
+    다시 인식합니다 (그것도 실패하면 None).
+
+    Args:
+        audio_bytes: 오디오 바이트 데이터
+        language: 언어 코드 (ko, en)
+        on_partial: 앞에서부터 이어진 청크가 완료될 때마다 호출되는
+            on_partial(지금까지의 텍스트, 완료 청크 수, 전체 청크 수) - 호출한 스레드에서 실행
+        backend: STT 백엔드 (기본: get_stt_backend())
+    """
+    span = current_span()
+    span.set(audio_bytes=len(audio_bytes) if audio_bytes else 0, language=language)
+
+    if not audio_bytes or len(audio_bytes) < 1000:
+        print(f"[Whisper] 오디오 데이터 부족: {len(audio_bytes) if audio_bytes else 0} bytes")
+        return None
+
+    backend = backend or get_stt_backend()
 
-            # 인식된 텍스트가 너무 짧으면 실패로 간주하지 않음 (빈 문자열만 제외)
-            if not text:
+    try:
+        duration, chunks = run_analysis(_prepare_stt_chunks, audio_bytes)
+    except Exception as e:
+        logger.info(f"청크 분할 불가, 한 번에 인식: {e}")
+        chunks = []
+
+    failed_chunk = None
+    if len(chunks) > 1:
+        parts: List[Optional[Dict[str, Any]]] = [None] * len(chunks)
+        finished = [False] * len(chunks)
+        emitted = 0
+
+        with ThreadPoolExecutor(max_workers=min(STT_CHUNK_WORKERS, len(chunks))) as executor:
+            # 청크별 HTTP 스팬이 stt 스팬 아래에 붙도록 트레이스 컨텍스트를 복사해 실행
+            futures = {
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _transcribe_stt_chunk, backend, wav, language, i, len(chunks)
+                ): i
+                for i, (_, wav) in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    parts[i] = future.result()
+                except Exception as e:
+                    logger.warning(f"청크 {i + 1}/{len(chunks)} 인식 실패: {e}")
+                if parts[i] is None:
+                    # 빠진 청크가 있는 전사는 쓰지 않음 - 남은 청크는 취소하고 전체 인식으로 전환
+                    failed_chunk = i
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                finished[i] = True
+
+                # 앞에서부터 이어서 끝난 청크까지 부분 결과 전달
+                ready = emitted
+                while ready < len(chunks) and finished[ready]:
+                    ready += 1
+                if on_partial and ready > emitted:
+                    partial = _stitch_transcripts(
+                        [(chunks[j][0], parts[j]) for j in range(ready)], duration, language
+                    )
+                    try:
+                        on_partial(partial["text"], ready, len(chunks))
+                    except Exception as e:
+                        logger.debug(f"부분 결과 콜백 오류: {e}")
+                emitted = ready
+
+        if failed_chunk is None:
+            result = _stitch_transcripts([(chunks[i][0], parts[i]) for i in range(len(chunks))], duration, language)
+            span.set(chunks=len(chunks), text_chars=len(result["text"]), audio_seconds=result["duration"])
+
+            if not result["text"]:
                 print("[Whisper] 인식된 텍스트 없음 (무음 또는 너무 짧은 녹음)")
                 return None
+            return result
 
-            return {
-                "text": text,
-                "duration": duration,
-                "words": result.get("words", []),
-                "language": result.get("language", language),
-            }
+        logger.warning(f"청크 {failed_chunk + 1}/{len(chunks)} 재시도 후에도 실패, 전체 녹음을 한 번에 인식")
+        span.set(failed_chunk=failed_chunk + 1, fallback="whole")
 
-    except requests.exceptions.Timeout:
-        print("[Whisper] API 타임아웃 (90초 초과)")
+    result = backend.transcribe(audio_bytes, language)
+    if not result or not result["text"]:
         return None
-    except requests.exceptions.HTTPError as e:
-        print(f"[Whisper] HTTP 오류: {e.response.status_code if e.response else 'unknown'}")
-        return None
-    except Exception as e:
-        print(f"[Whisper] API 오류: {e}")
-        return None
-
-    finally:
-        # 임시 파일 삭제
-        try:
-            os.unlink(temp_path)
-        except Exception as e:
-            logger.debug(f"임시 파일 삭제 실패: {e}")
+    if on_partial:
+        on_partial(result["text"], 1, 1)
+    span.set(chunks=1, text_chars=len(result["text"]), audio_seconds=result["duration"])
+    return result
 
 
 def analyze_voice_quality(
@@ -661,6 +997,225 @@ VOICE_SCORING = {
 }
 
 
+# =====================
+# 공용 음성 특성 추출 (디코딩 1회 + 오디오 해시 캐시)
+# =====================
+
+# 최근 답변 오디오의 특성 캐시 (결과 화면에서 같은 답변을 다시 분석할 때 재사용)
+AUDIO_FEATURE_CACHE_SIZE = 32
+
+_feature_cache: "OrderedDict[str, Optional[AudioFeatures]]" = OrderedDict()
+_feature_cache_lock = threading.Lock()
+
+
+@dataclass
+class AudioFeatures:
+    """
+    한 답변 오디오에서 한 번만 계산하는 음향 특성
+
+    디코딩된 파형은 보관하지 않고 하위 분석기가 쓰는 값만 유지합니다.
+    """
+    sr: int
+    duration: float                 # 초
+    pitch_values: Any               # 유성 프레임의 피치(Hz), 프레임 순서 (np.ndarray)
+    rms: Any                        # 프레임별 RMS 에너지 (np.ndarray)
+    spectral_centroid: Optional[float] = None
+    pause_ratio: Optional[float] = None
+    segment_energy: Optional[Tuple[float, float, float]] = None  # 시작/중간/끝 1/3 구간 평균 진폭
+
+    def emotion_features(self) -> Dict[str, Any]:
+        """extract_voice_features_for_emotion 형식으로 변환 (계산 불가 항목은 생략)"""
+        import numpy as np
+
+        features: Dict[str, Any] = {}
+        if len(self.pitch_values) > 0:
+            pitch_array = self.pitch_values
+            features["pitch_mean"] = float(np.mean(pitch_array))
+            features["pitch_std"] = float(np.std(pitch_array))
+            features["pitch_range"] = float(np.max(pitch_array) - np.min(pitch_array))
+
+            # Jitter 계산
+            if len(pitch_array) > 1:
+                pitch_diff = np.abs(np.diff(pitch_array))
+                features["jitter"] = float(np.mean(pitch_diff) / (np.mean(pitch_array) + 1e-6))
+
+        if len(self.rms) > 0:
+            features["energy_mean"] = float(np.mean(self.rms))
+            features["energy_std"] = float(np.std(self.rms))
+
+            # Shimmer 계산 (에너지 변동성)
+            if len(self.rms) > 1:
+                rms_diff = np.abs(np.diff(self.rms))
+                features["shimmer"] = float(np.mean(rms_diff) / (np.mean(self.rms) + 1e-6))
+
+        if self.spectral_centroid is not None:
+            features["spectral_centroid"] = self.spectral_centroid
+        if self.pause_ratio is not None:
+            features["pause_ratio"] = self.pause_ratio
+        return features
+
+
+def decode_audio(audio_bytes: bytes) -> Tuple[Any, int]:
+    """
+    오디오 바이트를 원본 샘플레이트의 모노 파형으로 디코딩
+
+    WAV/OGG/FLAC 등 soundfile이 읽는 형식은 메모리에서 바로 디코딩하고,
+    webm/mp3처럼 ffmpeg(audioread)가 필요한 형식만 임시 파일을 거칩니다.
+    """
+    import librosa
+
+    try:
+        return librosa.load(BytesIO(audio_bytes), sr=None)
+    except Exception as e:
+        logger.debug(f"메모리 디코딩 실패, 임시 파일로 재시도: {e}")
+
+    with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as f:
+        f.write(audio_bytes)
+        temp_path = f.name
+    try:
+        return librosa.load(temp_path, sr=None)
+    finally:
+        try:
+            os.unlink(temp_path)
+        except Exception as e:
+            logger.debug(f"임시 파일 삭제 실패: {e}")
+
+
+def _pitch_contour(pitches, magnitudes):
+    """
+    piptrack 결과에서 프레임별 최대 크기 bin의 피치 중 유성(>0) 값만 추출
+
+    프레임마다 argmax를 돌던 루프와 같은 결과를 한 번의 argmax(axis=0)와
+    불리언 마스크로 계산합니다 (동률이면 둘 다 첫 번째 bin 선택).
+    """
+    import numpy as np
+
+    frames = np.arange(pitches.shape[1])
+    contour = pitches[magnitudes.argmax(axis=0), frames]
+    return contour[contour > 0]
+
+
+def _compute_audio_features(audio_bytes: bytes) -> Optional[AudioFeatures]:
+    import numpy as np
+    import librosa
+
+    y, sr = decode_audio(audio_bytes)
+    if len(y) == 0:
+        return None
+
+    features = AudioFeatures(
+        sr=int(sr),
+        duration=len(y) / sr,
+        pitch_values=np.array([], dtype=np.float32),
+        rms=np.array([], dtype=np.float32),
+    )
+
+    # 피치 추출
+    try:
+        pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
+        features.pitch_values = _pitch_contour(pitches, magnitudes)
+    except Exception as e:
+        logger.warning(f"피치 추출 실패: {e}")
+
+    # RMS 에너지
+    try:
+        features.rms = librosa.feature.rms(y=y)[0]
+    except Exception as e:
+        logger.warning(f"RMS 계산 실패: {e}")
+
+    # Spectral centroid
+    try:
+        spec_cent = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
+        if len(spec_cent) > 0:
+            features.spectral_centroid = float(np.mean(spec_cent))
+    except Exception as e:
+        logger.warning(f"Spectral centroid 계산 실패: {e}")
+
+    # 음성 구간 감지로 휴지 비율 추정
+    try:
+        intervals = librosa.effects.split(y, top_db=30)
+        if len(intervals) > 0:
+            voiced_frames = sum(end - start for start, end in intervals)
+            features.pause_ratio = 1.0 - (voiced_frames / len(y))
+    except Exception as e:
+        logger.warning(f"휴지 구간 감지 실패: {e}")
+
+    # 3구간 평균 진폭 (에너지 패턴 분석용)
+    segment_len = len(y) // 3
+    if segment_len > 0:
+        features.segment_energy = (
+            float(np.mean(np.abs(y[:segment_len]))),
+            float(np.mean(np.abs(y[segment_len:2 * segment_len]))),
+            float(np.mean(np.abs(y[2 * segment_len:]))),
+        )
+
+    return features
+
+
+def extract_audio_features(audio_bytes: bytes) -> Optional[AudioFeatures]:
+    """
+    답변 오디오의 공용 음향 특성 (디코딩/피치/RMS/스펙트럼 1회 계산)
+
+    오디오 내용 해시로 캐시하므로 같은 답변을 여러 분석기가 호출해도
+    디코딩은 한 번만 일어납니다. 시간 초과/예외로 실패한 결과는 캐시하지
+    않아 다음 호출에서 다시 계산합니다.
+
+    Returns:
+        AudioFeatures, librosa가 없거나 디코딩에 실패하면 None
+    """
+    if not audio_bytes:
+        return None
+
+    key = hashlib.sha256(audio_bytes).hexdigest()
+    with trace_span("audio_features", audio_bytes=len(audio_bytes)) as span:
+        with _feature_cache_lock:
+            if key in _feature_cache:
+                _feature_cache.move_to_end(key)
+                span.set_cache(True)
+                return _feature_cache[key]
+
+        span.set_cache(False)
+        try:
+            # 디코딩/피치 추적은 분석 프로세스 풀에서 실행 (캐시는 이 프로세스에 유지)
+            features = run_analysis(_compute_audio_features, audio_bytes)
+        except ImportError:
+            logger.warning("librosa가 설치되지 않아 기본 특성값을 사용합니다.")
+            return None
+        except FutureTimeoutError:
+            logger.warning("음성 특성 추출 시간 초과 (캐시하지 않음)")
+            return None
+        except Exception as e:
+            logger.warning(f"음성 특성 추출 실패: {e}")
+            return None
+
+    with _feature_cache_lock:
+        _feature_cache[key] = features
+        _feature_cache.move_to_end(key)
+        while len(_feature_cache) > AUDIO_FEATURE_CACHE_SIZE:
+            _feature_cache.popitem(last=False)
+    return features
+
+
+def clear_audio_feature_cache() -> None:
+    """음향 특성 캐시 초기화"""
+    with _feature_cache_lock:
+        _feature_cache.clear()
+
+
+def warm_analysis_worker() -> None:
+    """분석 프로세스 풀 워커 예열 - librosa import와 첫 호출 비용을 미리 지불"""
+    import numpy as np
+    import librosa
+
+    sr = 22050
+    y = (0.3 * np.sin(2 * np.pi * 200 * np.arange(sr // 2) / sr)).astype(np.float32)
+    pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
+    _pitch_contour(pitches, magnitudes)
+    librosa.feature.rms(y=y)
+    librosa.feature.spectral_centroid(y=y, sr=sr)
+    librosa.effects.split(y, top_db=30)
+
+
 # =====================
 # 고급 음성 분석 (목소리 떨림, 말끝 흐림, 톤 변화 등)
 # =====================
@@ -763,8 +1318,10 @@ JSON으로만 응답하세요:
     }
 
     try:
-        r = requests.post(
+        r = http_client.post(
+            "openai",
             f"{OPENAI_API_URL}/chat/completions",
+            endpoint="chat/completions",
             headers=headers,
             json=payload,
             timeout=20
@@ -818,10 +1375,10 @@ JSON으로만 응답하세요:
         return None
 
 
-def analyze_voice_advanced(audio_bytes: bytes, transcription: Dict[str, Any] = None) -> Dict[str, Any]:
+def analyze_voice_physical(audio_bytes: bytes, transcription: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     고급 음성 품질 분석 - 목소리 떨림, 말끝 흐림, 톤 변화 등
-    librosa 가능 시 물리적 분석, 불가 시 GPT 기반 폴백
+    librosa 가능 시 물리적 분석(extract_audio_features 공용 특성), 불가 시 GPT 기반 폴백
 
     Args:
         audio_bytes: 오디오 바이트 데이터
@@ -850,20 +1407,9 @@ def analyze_voice_advanced(audio_bytes: bytes, transcription: Dict[str, Any] = N
 
     try:
         import numpy as np
-        import io
-        import wave
-        import struct
     except ImportError:
         return result
 
-    # librosa 사용 시도 (고급 분석)
-    try:
-        import librosa
-        import librosa.display
-        HAS_LIBROSA = True
-    except ImportError:
-        HAS_LIBROSA = False
-
     # scipy 폴백
     try:
         from scipy import signal
@@ -872,27 +1418,16 @@ def analyze_voice_advanced(audio_bytes: bytes, transcription: Dict[str, Any] = N
     except ImportError:
         HAS_SCIPY = False
 
-    # 임시 파일로 저장
-    temp_path = None
     try:
-        with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as f:
-            f.write(audio_bytes)
-            temp_path = f.name
+        # 공용 음향 특성 (디코딩/피치/RMS는 답변당 1회)
+        audio_features = extract_audio_features(audio_bytes)
 
-        if HAS_LIBROSA:
-            # librosa로 고급 분석
-            y, sr = librosa.load(temp_path, sr=None)
+        if audio_features is not None:
+            pitch_values = audio_features.pitch_values
+            rms = audio_features.rms
 
             # 1. 목소리 떨림 분석 (Jitter - 피치 변동성)
             try:
-                pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
-                pitch_values = []
-                for t in range(pitches.shape[1]):
-                    index = magnitudes[:, t].argmax()
-                    pitch = pitches[index, t]
-                    if pitch > 0:
-                        pitch_values.append(pitch)
-
                 if len(pitch_values) > 10:
                     pitch_array = np.array(pitch_values)
                     # Jitter: 연속 피치 차이의 변동성
@@ -927,9 +1462,6 @@ def analyze_voice_advanced(audio_bytes: bytes, transcription: Dict[str, Any] = N
 
             # 2. 말끝 흐림 분석 (문장 끝 에너지 하강)
             try:
-                # RMS 에너지 계산
-                rms = librosa.feature.rms(y=y)[0]
-
                 if len(rms) > 20:
                     # 마지막 20% 구간의 에너지
                     last_portion = int(len(rms) * 0.2)
@@ -1090,7 +1622,7 @@ def analyze_voice_advanced(audio_bytes: bytes, transcription: Dict[str, Any] = N
                         start = i * segment_len
                         end = (i + 1) * segment_len
                         # 유효 피치 밀도
-                        valid_count = sum(1 for p in pitch_values[start:end] if p > 0)
+                        valid_count = int(np.count_nonzero(pitch_values[start:end] > 0))
                         segment_densities.append(valid_count)
 
                     # 말 속도 급변 체크
@@ -1178,14 +1710,6 @@ def analyze_voice_advanced(audio_bytes: bytes, transcription: Dict[str, Any] = N
     except Exception as e:
         print(f"Advanced voice analysis error: {e}")
 
-    finally:
-        # 임시 파일 삭제
-        if temp_path:
-            try:
-                os.unlink(temp_path)
-            except Exception as e:
-                logger.debug(f"임시 파일 삭제 실패: {e}")
-
     return result
 
 
@@ -1233,7 +1757,7 @@ def analyze_voice_complete(
         }
 
     # 2. 고급 음성 분석 (transcription 전달 → GPT 폴백용)
-    voice_analysis = analyze_voice_advanced(audio_bytes, transcription=transcription)
+    voice_analysis = analyze_voice_physical(audio_bytes, transcription=transcription)
 
     # 3. 응답 시간 분석
     response_time_analysis = {
@@ -1343,6 +1867,7 @@ def analyze_voice_complete(
     }
 
 
+@traced("tts")
 def generate_tts_audio(
     text: str,
     voice: str = "nova",  # alloy, echo, fable, onyx, nova, shimmer
@@ -1367,6 +1892,8 @@ def generate_tts_audio(
     Returns:
         MP3 오디오 바이트 데이터
     """
+    span = current_span().set(text_chars=len(text or ""))
+
     # 1. 클로바 시도
     if use_clova and is_clova_available():
         if persona:
@@ -1384,10 +1911,36 @@ def generate_tts_audio(
             emotion=emotion,
         )
         if audio:
+            span.set(provider="clova", audio_bytes=len(audio))
             return audio
         print("CLOVA TTS 실패, OpenAI로 폴백...")
 
     # 2. OpenAI TTS 폴백
+    audio = generate_openai_tts(text, voice=voice, speed=speed)
+    if audio:
+        span.set(provider="openai", audio_bytes=len(audio))
+    return audio
+
+
+@cached_tts("openai", voice="voice", speed="speed")
+def generate_openai_tts(
+    text: str,
+    voice: str = "nova",
+    speed: float = 1.0,
+    model: str = "tts-1-hd",
+) -> Optional[bytes]:
+    """
+    OpenAI TTS API로 음성 생성
+
+    Args:
+        text: 변환할 텍스트
+        voice: 음성 종류 (alloy, echo, fable, onyx, nova, shimmer)
+        speed: 속도 (0.25 ~ 4.0)
+        model: tts-1-hd (고음질) 또는 tts-1 (저지연)
+
+    Returns:
+        MP3 오디오 바이트 또는 None
+    """
     api_key = get_openai_api_key()
     if not api_key:
         return None
@@ -1398,15 +1951,17 @@ def generate_tts_audio(
     }
 
     payload = {
-        "model": "tts-1-hd",
+        "model": model,
         "input": text,
         "voice": voice,
         "speed": speed,
     }
 
     try:
-        r = requests.post(
+        r = http_client.post(
+            "openai",
             f"{OPENAI_API_URL}/audio/speech",
+            endpoint="audio/speech",
             headers=headers,
             json=payload,
             timeout=30
@@ -1546,6 +2101,7 @@ def get_audio_player_html(audio_bytes: bytes, autoplay: bool = False, volume_boo
     return f"""<audio {autoplay_attr} controls style="width: 100%;"><source src="data:audio/mp3;base64,{audio_b64}" type="audio/mp3"></audio>"""
 
 
+@traced("content_scoring")
 def evaluate_answer_content(
     question: str,
     answer_text: str,
@@ -1574,6 +2130,8 @@ def evaluate_answer_content(
             "sample_answer": "..."
         }
     """
+    current_span().set(answer_chars=len(answer_text or ""))
+
     api_key = get_openai_api_key()
     if not api_key:
         return {"error": "API 키 없음"}
@@ -1632,8 +2190,10 @@ JSON 형식으로만 응답하세요:
     }
 
     try:
-        r = requests.post(
+        r = http_client.post(
+            "openai",
             f"{OPENAI_API_URL}/chat/completions",
+            endpoint="chat/completions",
             headers=headers,
             json=payload,
             timeout=30
@@ -1734,6 +2294,7 @@ def get_google_voice_for_persona(persona: str, escalation_level: int = 0) -> Tup
     return (voice, speaking_rate, pitch)
 
 
+@cached_tts("google", voice="voice_name", speed="speaking_rate")
 def generate_google_tts(
     text: str,
     voice_name: str = "ko-KR-Neural2-A",
@@ -1787,7 +2348,7 @@ def generate_google_tts(
     }
 
     try:
-        r = requests.post(url, headers=headers, json=payload, timeout=30)
+        r = http_client.post("google_tts", url, endpoint="text:synthesize", headers=headers, json=payload, timeout=30)
 
         if r.status_code == 200:
             result = r.json()
@@ -1937,6 +2498,7 @@ def get_edge_voice_for_persona(persona: str, escalation_level: int = 0) -> Tuple
     return (voice, rate, pitch)
 
 
+@cached_tts("edge", voice="voice", speed="rate")
 def generate_edge_tts(
     text: str,
     voice: str = "ko-KR-SunHiNeural",
@@ -2103,78 +2665,12 @@ def extract_voice_features_for_emotion(audio_bytes: bytes) -> Dict[str, Any]:
         "spectral_centroid": 2000,
     }
 
-    try:
-        import numpy as np
-        import librosa
-        import tempfile
-
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(suffix=".webm", delete=False) as f:
-            f.write(audio_bytes)
-            temp_path = f.name
-
+    audio_features = extract_audio_features(audio_bytes)
+    if audio_features is not None:
         try:
-            # librosa로 로드
-            y, sr = librosa.load(temp_path, sr=None)
-
-            if len(y) == 0:
-                return features
-
-            # 피치 추출
-            pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
-            pitch_values = []
-            for t in range(pitches.shape[1]):
-                index = magnitudes[:, t].argmax()
-                pitch = pitches[index, t]
-                if pitch > 0:
-                    pitch_values.append(pitch)
-
-            if len(pitch_values) > 0:
-                pitch_array = np.array(pitch_values)
-                features["pitch_mean"] = float(np.mean(pitch_array))
-                features["pitch_std"] = float(np.std(pitch_array))
-                features["pitch_range"] = float(np.max(pitch_array) - np.min(pitch_array))
-
-                # Jitter 계산
-                if len(pitch_values) > 1:
-                    pitch_diff = np.abs(np.diff(pitch_array))
-                    features["jitter"] = float(np.mean(pitch_diff) / (np.mean(pitch_array) + 1e-6))
-
-            # RMS 에너지 계산
-            rms = librosa.feature.rms(y=y)[0]
-            if len(rms) > 0:
-                features["energy_mean"] = float(np.mean(rms))
-                features["energy_std"] = float(np.std(rms))
-
-                # Shimmer 계산 (에너지 변동성)
-                if len(rms) > 1:
-                    rms_diff = np.abs(np.diff(rms))
-                    features["shimmer"] = float(np.mean(rms_diff) / (np.mean(rms) + 1e-6))
-
-            # Spectral centroid
-            spec_cent = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
-            if len(spec_cent) > 0:
-                features["spectral_centroid"] = float(np.mean(spec_cent))
-
-            # 음성 구간 감지로 휴지 비율 추정
-            intervals = librosa.effects.split(y, top_db=30)
-            if len(intervals) > 0:
-                voiced_frames = sum(end - start for start, end in intervals)
-                total_frames = len(y)
-                features["pause_ratio"] = 1.0 - (voiced_frames / total_frames) if total_frames > 0 else 0.2
-
-        finally:
-            # 임시 파일 삭제
-            import os
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
-
-    except ImportError:
-        logger.warning("librosa가 설치되지 않아 기본 특성값을 사용합니다.")
-    except Exception as e:
-        logger.warning(f"음성 특성 추출 실패: {e}")
+            features.update(audio_features.emotion_features())
+        except Exception as e:
+            logger.warning(f"음성 특성 변환 실패: {e}")
 
     return features
 
@@ -2198,6 +2694,7 @@ def analyze_interview_emotion(
     audio_bytes: bytes,
     transcribed_text: str = "",
     question_context: str = "",
+    voice_features: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     면접 답변의 감정을 종합 분석
@@ -2206,6 +2703,7 @@ def analyze_interview_emotion(
         audio_bytes: 오디오 바이트 데이터
         transcribed_text: 인식된 텍스트
         question_context: 질문 맥락
+        voice_features: 이미 추출한 음성 특성 (없으면 추출)
 
     Returns:
         {
@@ -2222,7 +2720,8 @@ def analyze_interview_emotion(
     """
     try:
         # 음성 특성 추출
-        voice_features = extract_voice_features_for_emotion(audio_bytes)
+        if voice_features is None:
+            voice_features = extract_voice_features_for_emotion(audio_bytes)
 
         # 간단한 감정 분석 로직 (EmotionDetector의 핵심 로직 적용)
         scores = {}
@@ -2407,6 +2906,7 @@ UNCERTAIN_KEYWORDS = [
 ]
 
 
+@traced("voice_analysis")
 def analyze_voice_advanced(
     audio_bytes: bytes,
     transcribed_text: str = "",
@@ -2494,16 +2994,22 @@ def analyze_voice_advanced(
         "overall": {},
     }
 
+    current_span().set(audio_bytes=len(audio_bytes) if audio_bytes else 0, text_chars=len(transcribed_text or ""))
+
     try:
         # 기본 음성 특성 추출
         voice_features = extract_voice_features_for_emotion(audio_bytes)
 
-        # 오디오 duration 계산 (없으면 추정)
+        # 오디오 duration 계산 (없으면 디코딩된 길이, 그래도 없으면 추정)
         if audio_duration <= 0:
-            audio_duration = voice_features.get("duration", 60.0)
+            audio_features = extract_audio_features(audio_bytes)
+            audio_duration = audio_features.duration if audio_features else voice_features.get("duration", 60.0)
 
         # 1. 기존 감정 분석
-        emotion_result = analyze_interview_emotion(audio_bytes, transcribed_text, question_context)
+        with trace_span("voice_analysis.emotion"):
+            emotion_result = analyze_interview_emotion(
+                audio_bytes, transcribed_text, question_context, voice_features=voice_features
+            )
         result["emotion"] = emotion_result
 
         # 2. 말 속도 분석
@@ -2673,33 +3179,17 @@ def _analyze_pauses(voice_features: Dict, duration: float) -> Dict[str, Any]:
 def _analyze_energy_pattern(voice_features: Dict, audio_bytes: bytes) -> Dict[str, Any]:
     """에너지/톤 변화 분석"""
     try:
-        import numpy as np
-        import io
-        import wave
-
         # 피치와 에너지 정보
         pitch_std = voice_features.get("pitch_std", 30)
         energy_mean = voice_features.get("energy_mean", 0.5)
 
-        # 간단한 에너지 분석 (librosa 있으면 더 정교하게)
-        try:
-            import librosa
-
-            # 오디오 로드
-            audio_io = io.BytesIO(audio_bytes)
-            y, sr = librosa.load(audio_io, sr=16000)
-
-            # 3구간으로 나누기
-            segment_len = len(y) // 3
-            if segment_len > 0:
-                start_energy = float(np.mean(np.abs(y[:segment_len])))
-                mid_energy = float(np.mean(np.abs(y[segment_len:2*segment_len])))
-                end_energy = float(np.mean(np.abs(y[2*segment_len:])))
-            else:
-                start_energy = mid_energy = end_energy = energy_mean
-
-        except:
-            # librosa 없으면 추정값
+        # 3구간 평균 진폭 (공용 음향 특성, librosa 없으면 추정값)
+        audio_features = extract_audio_features(audio_bytes)
+        if audio_features is not None and audio_features.segment_energy is not None:
+            start_energy, mid_energy, end_energy = audio_features.segment_energy
+        elif audio_features is not None:
+            start_energy = mid_energy = end_energy = energy_mean
+        else:
             start_energy = energy_mean * 1.1
             mid_energy = energy_mean
             end_energy = energy_mean * 0.9
@@ -45,6 +45,9 @@ try:
 except ImportError:
     np = None
 
+# 분석 프로세스 풀 응답 대기 시간 (초) - 넘으면 해당 프레임은 건너뜀
+FRAME_ANALYSIS_TIMEOUT_SECONDS = 2.0
+
 
 class FeedbackType(str, Enum):
     POSTURE = "posture"
@@ -104,6 +107,9 @@ class WebcamAnalyzer:
         self._tilt_hist = deque(maxlen=5)
         self._face_size_hist = deque(maxlen=5)
 
+        # 프로세스 풀이 포화되어 프레임을 건너뛸 때 재사용할 직전 결과
+        self._last_result: Optional[Dict[str, Any]] = None
+
     def initialize(self) -> bool:
         """분석기 초기화"""
         if not MEDIAPIPE_AVAILABLE or not OPENCV_AVAILABLE:
@@ -164,13 +170,16 @@ class WebcamAnalyzer:
             # BGR -> RGB 변환
             rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
-            # MediaPipe Image 생성
-            mp_image = MpImage(image_format=ImageFormat.SRGB, data=rgb)
+            # 랜드마크 추론 (프로세스 풀 또는 현재 스레드)
+            detections = self._detect_offloaded(rgb)
+            if detections is None:
+                return self._last_result or self._fallback()
+            face_result, pose_result, hand_result = detections
 
-            # 각 분석 수행
-            face = self._analyze_face(mp_image)
-            pose = self._analyze_pose(mp_image)
-            hands = self._analyze_hands(mp_image, face)
+            # 각 분석 수행 (스무딩 히스토리는 이 인스턴스에 유지)
+            face = self._analyze_face(face_result)
+            pose = self._analyze_pose(pose_result)
+            hands = self._analyze_hands(hand_result, face)
 
             # 피드백 생성
             feedback = self._gen_feedback(face, pose, hands)
@@ -178,13 +187,14 @@ class WebcamAnalyzer:
             # 점수 계산
             score = self._calc_score(face, pose, hands)
 
-            return {
+            self._last_result = {
                 "face": face,
                 "pose": pose,
                 "hands": hands,
                 "feedback": feedback,
                 "overall_score": score
             }
+            return self._last_result
 
         except Exception as e:
             logger.warning(f"Frame analysis error: {e}")
@@ -192,14 +202,67 @@ class WebcamAnalyzer:
             traceback.print_exc()
             return self._fallback()
 
-    def _analyze_face(self, mp_image: MpImage) -> Dict[str, Any]:
-        """얼굴 분석"""
-        if not self.face_landmarker:
+    def detect(self, rgb: np.ndarray) -> Tuple[Any, Any, Any]:
+        """
+        MediaPipe 랜드마크 추론 (얼굴/자세/손)
+
+        CPU 부하의 대부분이 여기서 발생하며, 분석 프로세스 풀 워커에서도 실행됩니다.
+        실패했거나 모델이 없는 항목은 None.
+        """
+        mp_image = MpImage(image_format=ImageFormat.SRGB, data=rgb)
+        results = []
+        for name, landmarker in (
+            ("face", self.face_landmarker),
+            ("pose", self.pose_landmarker),
+            ("hand", self.hand_landmarker),
+        ):
+            result = None
+            if landmarker:
+                try:
+                    result = landmarker.detect(mp_image)
+                except Exception as e:
+                    logger.warning(f"{name} detection error: {e}")
+            results.append(result)
+        return tuple(results)
+
+    def _detect_offloaded(self, rgb: np.ndarray) -> Optional[Tuple[Any, Any, Any]]:
+        """
+        분석 프로세스 풀에서 랜드마크 추론
+
+        풀이 포화되었거나 응답이 늦으면 None (프레임 건너뜀),
+        풀을 쓸 수 없으면 현재 스레드에서 추론합니다.
+        """
+        try:
+            from concurrent.futures import TimeoutError as FutureTimeoutError
+            from analysis_pool import analysis_pool, PoolSaturated
+        except ImportError:
+            return self.detect(rgb)
+
+        if analysis_pool.is_enabled():
+            try:
+                future = analysis_pool.submit(detect_landmarks, rgb)
+            except PoolSaturated:
+                return None
+            except Exception as e:
+                logger.warning(f"Analysis pool unavailable, detecting inline: {e}")
+            else:
+                try:
+                    detections = future.result(timeout=FRAME_ANALYSIS_TIMEOUT_SECONDS)
+                    if detections is not None:
+                        return detections
+                except FutureTimeoutError:
+                    future.cancel()
+                    return None
+                except Exception as e:
+                    logger.warning(f"Pooled detection failed, detecting inline: {e}")
+        return self.detect(rgb)
+
+    def _analyze_face(self, result) -> Dict[str, Any]:
+        """얼굴 분석 (FaceLandmarker 결과 해석)"""
+        if result is None:
             return {"detected": False}
 
         try:
-            result = self.face_landmarker.detect(mp_image)
-
             if not result.face_landmarks:
                 return {"detected": False, "reason": "얼굴 미감지"}
 
@@ -341,14 +404,12 @@ class WebcamAnalyzer:
         except Exception:
             return "neutral"
 
-    def _analyze_pose(self, mp_image: MpImage) -> Dict[str, Any]:
-        """자세 분석"""
-        if not self.pose_landmarker:
+    def _analyze_pose(self, result) -> Dict[str, Any]:
+        """자세 분석 (PoseLandmarker 결과 해석)"""
+        if result is None:
             return {"detected": False}
 
         try:
-            result = self.pose_landmarker.detect(mp_image)
-
             if not result.pose_landmarks:
                 return {"detected": False}
 
@@ -405,14 +466,12 @@ class WebcamAnalyzer:
             logger.warning(f"Pose analysis error: {e}")
             return {"detected": False}
 
-    def _analyze_hands(self, mp_image: MpImage, face: Dict) -> Dict[str, Any]:
-        """손 분석"""
-        if not self.hand_landmarker:
+    def _analyze_hands(self, result, face: Dict) -> Dict[str, Any]:
+        """손 분석 (HandLandmarker 결과 해석)"""
+        if result is None:
             return {"detected": False, "count": 0, "touching_face": False}
 
         try:
-            result = self.hand_landmarker.detect(mp_image)
-
             if not result.hand_landmarks:
                 return {"detected": False, "count": 0, "touching_face": False}
 
@@ -657,3 +716,22 @@ def get_webcam_analyzer() -> WebcamAnalyzer:
 def is_webcam_analysis_available() -> bool:
     """웹캠 분석 기능 사용 가능 여부"""
     return MEDIAPIPE_AVAILABLE and OPENCV_AVAILABLE
+
+
+def detect_landmarks(rgb: np.ndarray) -> Optional[Tuple[Any, Any, Any]]:
+    """
+    분석 프로세스 풀 작업 - 워커 프로세스의 분석기로 랜드마크 추론
+
+    워커에서는 추론만 하고, 스무딩/피드백은 호출한 프로세스의 분석기가 처리합니다.
+    모델을 로드할 수 없으면 None.
+    """
+    analyzer = get_webcam_analyzer()
+    if not analyzer._initialized:
+        return None
+    return analyzer.detect(rgb)
+
+
+def warm_analysis_worker() -> None:
+    """분석 프로세스 풀 워커 예열 - MediaPipe 모델 미리 로드"""
+    if is_webcam_analysis_available():
+        get_webcam_analyzer()
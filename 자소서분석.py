@@ -82,7 +82,7 @@ from analysis import (
 from llm_utils import (
     _ensure_llm_state_boxes, _llm_gc, _calc_llm_hash_from_qa_sets,
     _llm_try_extract_or_reuse, _llm_type_to_internal,
-    _llm_extract_for_slot, generate_q3_from_answer,
+    _llm_extract_for_slot, generate_q3_from_answer, stream_q3_from_answer,
     generate_resume_questions,
 )
 from extraction_verifier import is_complete_sentence
@@ -2034,15 +2034,25 @@ if st.session_state.questions:
                     if q2_answer and len(q2_answer) >= 20:
                         st.info("Q2 답변을 기반으로 맞춤형 꼬리질문을 생성할 수 있습니다.")
                         if st.button("Q3 꼬리질문 생성", key="gen_q3_btn", type="primary"):
-                            with st.spinner("Q3 생성 중..."):
+                            # 생성되는 대로 바로 표시 (첫 토큰까지의 대기만 체감)
+                            q3_placeholder = st.empty()
+                            q3_placeholder.caption("Q3 생성 중...")
+                            q3_stream = stream_q3_from_answer(q2_question, q2_answer)
+                            for _ in q3_stream:
+                                q3_placeholder.markdown(q3_stream.text)
+                            new_q3 = q3_stream.result
+                            if not new_q3:
+                                # 스트림이 실패하거나 중간에 끊기면 비스트리밍 호출로 다시 생성
+                                q3_placeholder.caption("Q3 다시 생성 중...")
                                 new_q3 = generate_q3_from_answer(q2_question, q2_answer)
-                                if new_q3:
-                                    st.session_state.questions["q3"]["question"] = new_q3
-                                    st.session_state.questions["q3"]["basis"] = "Q2 답변 기반 AI 동적 생성"
-                                    st.session_state.q3_generated = True
-                                    st.rerun()
-                                else:
-                                    st.error("Q3 생성에 실패했습니다. 기존 질문을 사용합니다.")
+                            if new_q3:
+                                st.session_state.questions["q3"]["question"] = new_q3
+                                st.session_state.questions["q3"]["basis"] = "Q2 답변 기반 AI 동적 생성"
+                                st.session_state.q3_generated = True
+                                st.rerun()
+                            else:
+                                q3_placeholder.empty()
+                                st.error("Q3 생성에 실패했습니다. 기존 질문을 사용합니다.")
                     elif q2_answer:
                         st.warning("Q2 답변을 조금 더 입력하세요. (최소 20자)")
                     else: